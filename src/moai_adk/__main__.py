@@ -127,12 +127,39 @@ def init(
 
 
 @cli.command()
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="Show detailed tool versions and language detection",
+)
+@click.option("--fix", is_flag=True, help="Suggest fixes for missing tools")
+@click.option("--export", type=click.Path(), help="Export diagnostics to JSON file")
+@click.option("--check", type=str, help="Check specific tool only")
+@click.option("--check-commands", is_flag=True, help="Diagnose slash command loading issues")
+@click.option("--refresh", is_flag=True, help="Ignore cached tool versions and probe again")
 @click.pass_context
-def doctor(ctx: click.Context, **kwargs) -> None:
+def doctor(
+    ctx: click.Context,
+    verbose: bool,
+    fix: bool,
+    export: str | None,
+    check: str | None,
+    check_commands: bool,
+    refresh: bool,
+) -> None:
     """Run system diagnostics"""
     from moai_adk.cli.commands.doctor import doctor as _doctor
 
-    ctx.invoke(_doctor, **kwargs)
+    ctx.invoke(
+        _doctor,
+        verbose=verbose,
+        fix=fix,
+        export=export,
+        check=check,
+        check_commands=check_commands,
+        refresh=refresh,
+    )
 
 
 @cli.command()
@@ -153,6 +180,77 @@ def update(ctx: click.Context, **kwargs) -> None:
     ctx.invoke(_update, **kwargs)
 
 
+@cli.command()
+@click.argument("path", type=click.Path(exists=True, file_okay=False), default=".")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Worker processes for file analysis (0 = number of CPUs)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Re-analyze only files changed according to git; reuse cached results for the rest",
+)
+@click.option("--base", type=str, default=None, help="With --incremental, also re-analyze files changed since REF")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), help="Write the report to a Markdown file")
+@click.pass_context
+def trust(
+    ctx: click.Context,
+    path: str,
+    jobs: int,
+    incremental: bool,
+    base: str | None,
+    output: str | None,
+) -> None:
+    """Assess the project against the TRUST 4 principles"""
+    from moai_adk.cli.commands.trust import trust as _trust
+
+    ctx.invoke(_trust, path=path, jobs=jobs, incremental=incremental, base=base, output=output)
+
+
+@cli.command()
+@click.option("--days", "-d", default=7, help="Number of days to analyze (default: 7)")
+@click.option("--output", "-o", type=click.Path(), help="Output file path")
+@click.option("--verbose", "-v", is_flag=True, help="Verbose output")
+@click.option("--report-only", "-r", is_flag=True, help="Generate report only (no console output)")
+@click.option(
+    "--project-path",
+    "-p",
+    type=click.Path(),
+    help="Project root path (default: current directory)",
+)
+@click.option("--jobs", "-j", type=int, default=None, help="Worker processes for analysis (default: CPU count)")
+@click.option("--full", is_flag=True, help="Ignore the incremental checkpoint and re-read all session files")
+@click.pass_context
+def analyze(
+    ctx: click.Context,
+    days: int,
+    output: str | None,
+    verbose: bool,
+    report_only: bool,
+    project_path: str | None,
+    jobs: int | None,
+    full: bool,
+) -> None:
+    """Analyze Claude Code sessions and suggest improvements"""
+    from moai_adk.cli.commands.analyze import analyze as _analyze
+
+    ctx.invoke(
+        _analyze,
+        days=days,
+        output=output,
+        verbose=verbose,
+        report_only=report_only,
+        project_path=project_path,
+        jobs=jobs,
+        full=full,
+    )
+
+
 # statusline command (for Claude Code statusline rendering)
 @cli.command(name="statusline")
 def statusline() -> None:
@@ -28,12 +28,16 @@ console = Console()
     type=click.Path(),
     help="Project root path (default: current directory)",
 )
+@click.option("--jobs", "-j", type=int, default=None, help="Worker processes for analysis (default: CPU count)")
+@click.option("--full", is_flag=True, help="Ignore the incremental checkpoint and re-read all session files")
 def analyze(
     days: int,
     output: Optional[Path],
     verbose: bool,
     report_only: bool,
     project_path: Optional[Path],
+    jobs: Optional[int] = None,
+    full: bool = False,
 ):
     """
     Analyze Claude Code sessions from the last N days
@@ -42,12 +46,14 @@ def analyze(
     error frequencies, and generate improvement suggestions.
 
     Examples:
-        moai-adk analyze session
-        moai-adk analyze session --days 14 --verbose
-        moai-adk analyze session --output /path/to/report.md
+        moai-adk analyze
+        moai-adk analyze --days 14 --verbose
+        moai-adk analyze --output /path/to/report.md
+        moai-adk analyze --jobs 4 --full
     """
     if project_path is None:
         project_path = Path.cwd()
+    project_path = Path(project_path)
 
     # Validate project path
     if not (project_path / ".moai").exists():
@@ -61,8 +67,11 @@ def analyze(
     if not report_only:
         console.print(f"[blue]📊 Analyzing sessions from last {days} days...[/blue]")
 
-    # Parse sessions
-    patterns = analyzer.parse_sessions()
+    # Parse sessions (incremental: only bytes appended since the last run are read)
+    checkpoint_path = project_path / ".moai" / "cache" / "session-analyzer-checkpoint.json"
+    if full and checkpoint_path.exists():
+        checkpoint_path.unlink()
+    patterns = analyzer.parse_sessions(checkpoint_path=checkpoint_path, max_workers=jobs)
 
     if not report_only:
         console.print(f"[green]✅ Analyzed {patterns['total_sessions']} sessions[/green]")
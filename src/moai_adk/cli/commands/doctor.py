@@ -57,12 +57,14 @@ console = Console()
 @click.option("--export", type=click.Path(), help="Export diagnostics to JSON file")
 @click.option("--check", type=str, help="Check specific tool only")
 @click.option("--check-commands", is_flag=True, help="Diagnose slash command loading issues")
+@click.option("--refresh", is_flag=True, help="Ignore cached tool versions and probe again")
 def doctor(
     verbose: bool,
     fix: bool,
     export: str | None,
     check: str | None,
     check_commands: bool,
+    refresh: bool,
 ) -> None:
     """Check system requirements and project health
 
@@ -98,11 +100,16 @@ def doctor(
                 diagnostics_data["language_tools"] = language_tools
 
                 if verbose:
+                    # Probe all installed tools concurrently before rendering the table
+                    checker.prefetch_tool_versions(
+                        [tool for tool, available in language_tools.items() if available],
+                        refresh=refresh,
+                    )
                     _display_language_tools(language, language_tools, checker)
 
         # Specific tool check
         if check:
-            _check_specific_tool(check)
+            _check_specific_tool(check, refresh=refresh)
             return
 
         # Build the base results table
@@ -159,10 +166,12 @@ def _display_language_tools(language: str, tools: dict[str, bool], checker: Syst
     console.print()
 
 
-def _check_specific_tool(tool: str) -> None:
+def _check_specific_tool(tool: str, refresh: bool = False) -> None:
     """Check only a specific tool (helper)"""
     checker = SystemChecker()
     available = checker._is_tool_available(tool)
+    if available:
+        checker.prefetch_tool_versions([tool], refresh=refresh)
     version = checker.get_tool_version(tool) if available else None
 
     if available:
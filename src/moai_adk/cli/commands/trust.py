@@ -0,0 +1,64 @@
+"""MoAI-ADK trust command
+
+TRUST 4 principles assessment:
+- Score Test First, Readable, Unified and Secured for a project
+- Analyze files across worker processes (--jobs)
+- Re-analyze only files changed according to git (--incremental, --base)
+- Print or export the Markdown assessment report
+
+Per-file analysis results are cached in .moai/cache/trust-analysis.json, so
+unchanged files are not re-analyzed by the next run.
+"""
+
+import os
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.markdown import Markdown
+
+from moai_adk.foundation.trust.trust_principles import TrustPrinciplesValidator
+from moai_adk.utils.code_analysis import get_analysis_session
+
+console = Console()
+
+
+@click.command()
+@click.argument("path", type=click.Path(exists=True, file_okay=False), default=".")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Worker processes for file analysis (0 = number of CPUs)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Re-analyze only files changed according to git; reuse cached results for the rest",
+)
+@click.option("--base", type=str, default=None, help="With --incremental, also re-analyze files changed since REF")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), help="Write the report to a Markdown file")
+def trust(path: str, jobs: int, incremental: bool, base: str | None, output: str | None) -> None:
+    """Assess a project against the TRUST 4 principles
+
+    Results are identical for any --jobs value and with --incremental;
+    both only change how long the per-file analysis takes.
+    """
+    project_path = str(Path(path).resolve())
+    max_workers = jobs or os.cpu_count() or 1
+
+    if incremental and not get_analysis_session(project_path).sync_git_changes(base):
+        console.print("[dim]No usable analysis cache for an incremental run; analyzing all files[/dim]")
+
+    validator = TrustPrinciplesValidator()
+    with console.status("[cyan]Analyzing project...[/cyan]"):
+        assessment = validator.assess_project(project_path, max_workers=max_workers)
+    report = validator.generate_report(assessment)
+
+    if output:
+        Path(output).write_text(report, encoding="utf-8")
+        console.print(f"[green]✓ Report written to {output}[/green]")
+    else:
+        console.print(Markdown(report))
@@ -56,7 +56,7 @@ from packaging import version
 from rich.console import Console
 
 from moai_adk import __version__
-from moai_adk.core.merge import MergeAnalyzer
+from moai_adk.core.merge import MergeAnalyzer, compare_trees
 from moai_adk.core.migration import VersionMigrator
 from moai_adk.core.migration.alfred_to_moai_migrator import AlfredToMoaiMigrator
 
@@ -1120,6 +1120,45 @@ def _detect_custom_hooks(project_path: Path, template_hooks: set[str]) -> list[s
     return sorted(custom_hooks)
 
 
+# Custom element locations under .claude/: (directory, directories instead of files, file suffix)
+CUSTOM_ELEMENT_DIRS: dict[str, tuple[str, bool, str | None]] = {
+    "skills": ("skills", True, None),
+    "commands": ("commands/moai", False, ".md"),
+    "agents": ("agents", False, None),
+    "hooks": ("hooks/moai", False, ".py"),
+}
+
+
+def _detect_custom_elements(project_path: Path, template_path: Path | None = None) -> dict[str, list[str]]:
+    """Detect custom skills, commands, agents and hooks in a single pass.
+
+    Lists the project and template element directories once with a lockstep
+    tree walk instead of scanning each element type separately.
+
+    Args:
+        project_path: Project path (absolute)
+        template_path: Template root (default: installed package templates)
+
+    Returns:
+        Dictionary mapping element type to sorted custom element names.
+    """
+    if template_path is None:
+        template_path = Path(__file__).parent.parent.parent / "templates"
+
+    comparison = compare_trees(
+        project_path / ".claude",
+        template_path / ".claude",
+        paths=[directory for directory, _, _ in CUSTOM_ELEMENT_DIRS.values()],
+        compare=False,
+        recursive=False,
+    )
+
+    return {
+        element_type: comparison.only_in_backup(directory, dirs=dirs, suffix=suffix)
+        for element_type, (directory, dirs, suffix) in CUSTOM_ELEMENT_DIRS.items()
+    }
+
+
 def _group_custom_files_by_type(
     custom_commands: list[str],
     custom_agents: list[str],
@@ -1477,19 +1516,8 @@ def _sync_templates(project_path: Path, force: bool = False, yes: bool = False)
 
     backup_path = None
     try:
-        # NEW: Detect custom files and skills BEFORE backup/sync
-        template_skills = _get_template_skill_names()
-        _detect_custom_skills(project_path, template_skills)
-
-        # Detect custom commands, agents, and hooks
-        template_commands = _get_template_command_names()
-        _detect_custom_commands(project_path, template_commands)
-
-        template_agents = _get_template_agent_names()
-        _detect_custom_agents(project_path, template_agents)
-
-        template_hooks = _get_template_hook_names()
-        _detect_custom_hooks(project_path, template_hooks)
+        # NEW: Detect custom skills, commands, agents, and hooks BEFORE backup/sync
+        _detect_custom_elements(project_path)
 
         processor = TemplateProcessor(project_path)
 
@@ -10,13 +10,14 @@ from moai_adk.cli.worktree.exceptions import (
     WorktreeNotFoundError,
 )
 from moai_adk.cli.worktree.manager import WorktreeManager
-from moai_adk.cli.worktree.models import WorktreeInfo
+from moai_adk.cli.worktree.models import SyncResult, WorktreeInfo
 from moai_adk.cli.worktree.registry import WorktreeRegistry
 
 __all__ = [
     "WorktreeManager",
     "WorktreeRegistry",
     "WorktreeInfo",
+    "SyncResult",
     "WorktreeError",
     "WorktreeExistsError",
     "WorktreeNotFoundError",
@@ -9,7 +9,6 @@ from rich.table import Table
 
 from moai_adk.cli.worktree.exceptions import (
     GitOperationError,
-    MergeConflictError,
     UncommittedChangesError,
     WorktreeExistsError,
     WorktreeNotFoundError,
@@ -336,12 +335,16 @@ def remove_worktree(spec_id: str, force: bool, repo: str | None, worktree_root:
 
 
 @worktree.command(name="status")
+@click.option("--conflicts", is_flag=True, help="Predict merge conflicts with the base branch")
+@click.option("--base", default="main", help="Base branch for --conflicts")
 @click.option("--repo", type=click.Path(), default=None, help="Repository path")
 @click.option("--worktree-root", type=click.Path(), default=None, help="Worktree root directory")
-def status_worktrees(repo: str | None, worktree_root: str | None) -> None:
+def status_worktrees(conflicts: bool, base: str, repo: str | None, worktree_root: str | None) -> None:
     """Show worktree status and sync registry.
 
     Args:
+        conflicts: Predict merge conflicts with the base branch (no checkout is touched)
+        base: Base branch for conflict prediction (default: main)
         repo: Repository path (optional)
         worktree_root: Worktree root directory (optional)
     """
@@ -360,6 +363,8 @@ def status_worktrees(repo: str | None, worktree_root: str | None) -> None:
             console.print("[yellow]No worktrees found[/yellow]")
             return
 
+        predictions = manager.predict_conflicts(base_branch=base) if conflicts else {}
+
         console.print(f"[cyan]Total worktrees: {len(worktrees)}[/cyan]")
         console.print()
 
@@ -369,6 +374,16 @@ def status_worktrees(repo: str | None, worktree_root: str | None) -> None:
             console.print(f"  Branch: {info.branch}")
             console.print(f"  Path:   {info.path}")
             console.print(f"  Status: {info.status}")
+            prediction = predictions.get(info.spec_id)
+            if prediction is not None:
+                if prediction.error:
+                    console.print(f"  Merge:  [red]check failed: {prediction.error}[/red]")
+                elif prediction.conflicts:
+                    console.print(f"  Merge:  [red]{len(prediction.conflicts)} conflict(s) with {base}[/red]")
+                    for conflict in prediction.conflicts:
+                        console.print(f"    - {conflict.path} ({conflict.kind})")
+                else:
+                    console.print(f"  Merge:  [green]clean with {base}[/green]")
             console.print()
 
     except Exception as e:
@@ -383,6 +398,10 @@ def status_worktrees(repo: str | None, worktree_root: str | None) -> None:
 @click.option("--ff-only", is_flag=True, help="Only sync if fast-forward is possible")
 @click.option("--all", "sync_all", is_flag=True, help="Sync all worktrees")
 @click.option("--auto-resolve", is_flag=True, help="Automatically resolve conflicts")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=None, help="Parallel syncs with --all")
+@click.option(
+    "--skip-conflicts", is_flag=True, help="With --all, skip worktrees predicted to conflict (git merge-tree)"
+)
 @click.option("--repo", type=click.Path(), default=None, help="Repository path")
 @click.option("--worktree-root", type=click.Path(), default=None, help="Worktree root directory")
 def sync_worktree(
@@ -392,6 +411,8 @@ def sync_worktree(
     ff_only: bool,
     sync_all: bool,
     auto_resolve: bool,
+    jobs: int | None,
+    skip_conflicts: bool,
     repo: str | None,
     worktree_root: str | None,
 ) -> None:
@@ -404,6 +425,8 @@ def sync_worktree(
         ff_only: Only sync if fast-forward is possible
         sync_all: Sync all worktrees
         auto_resolve: Automatically resolve conflicts
+        jobs: Maximum parallel syncs with --all (default: CPU count, at most 8)
+        skip_conflicts: Skip worktrees whose merge is predicted to conflict (--all only)
         repo: Repository path (optional)
         worktree_root: Worktree root directory (optional)
     """
@@ -429,42 +452,53 @@ def sync_worktree(
                 return
 
             console.print(f"[cyan]Syncing {len(worktrees)} worktrees...[/cyan]")
+            sync_method = "rebase" if rebase else ("fast-forward" if ff_only else "merge")
+            paths = {info.spec_id: info.path for info in worktrees}
             success_count = 0
             conflict_count = 0
+            skipped_count = 0
 
-            for info in worktrees:
-                try:
-                    manager.sync(
-                        spec_id=info.spec_id,
-                        base_branch=base,
-                        rebase=rebase,
-                        ff_only=ff_only,
-                        auto_resolve=auto_resolve,
-                    )
-                    sync_method = "rebase" if rebase else ("fast-forward" if ff_only else "merge")
-                    console.print(f"[green]✓[/green] {info.spec_id} ({sync_method})")
+            # One fetch, parallel merges; results are printed as each worktree finishes
+            for result in manager.sync_all(
+                base_branch=base,
+                rebase=rebase,
+                ff_only=ff_only,
+                auto_resolve=auto_resolve,
+                skip_conflicts=skip_conflicts,
+                max_workers=jobs,
+            ):
+                if result.status == "synced":
+                    console.print(f"[green]✓[/green] {result.spec_id} ({sync_method})")
                     success_count += 1
-                except MergeConflictError:
+                elif result.status == "skipped":
+                    console.print(
+                        f"[yellow]-[/yellow] {result.spec_id} (skipped: {len(result.conflicts)} predicted conflict(s))"
+                    )
+                    skipped_count += 1
+                elif result.status == "conflict":
                     if auto_resolve:
                         # Try to auto-resolve conflicts
                         try:
-                            worktree_repo = Repo(info.path)
-                            conflicted_files = [info.spec_id]  # This will be handled by the method
-                            manager.auto_resolve_conflicts(worktree_repo, info.spec_id, conflicted_files)
-                            console.print(f"[yellow]![/yellow] {info.spec_id} (auto-resolved)")
+                            worktree_repo = Repo(paths[result.spec_id])
+                            conflicted_files = [result.spec_id]  # This will be handled by the method
+                            manager.auto_resolve_conflicts(worktree_repo, result.spec_id, conflicted_files)
+                            console.print(f"[yellow]![/yellow] {result.spec_id} (auto-resolved)")
                             success_count += 1
                         except Exception as e:
-                            console.print(f"[red]✗[/red] {info.spec_id} (auto-resolve failed: {e})")
+                            console.print(f"[red]✗[/red] {result.spec_id} (auto-resolve failed: {e})")
                             conflict_count += 1
                     else:
-                        console.print(f"[red]✗[/red] {info.spec_id} (conflicts)")
+                        console.print(f"[red]✗[/red] {result.spec_id} (conflicts)")
                         conflict_count += 1
-                except Exception as e:
-                    console.print(f"[red]✗[/red] {info.spec_id} (failed: {e})")
+                else:
+                    console.print(f"[red]✗[/red] {result.spec_id} (failed: {result.error})")
                     conflict_count += 1
 
             console.print()
-            console.print(f"[green]Summary:[/green] {success_count} synced, {conflict_count} failed")
+            summary = f"{success_count} synced, {conflict_count} failed"
+            if skipped_count:
+                summary += f", {skipped_count} skipped"
+            console.print(f"[green]Summary:[/green] {summary}")
         else:
             # Sync single worktree
             manager.sync(
@@ -1,8 +1,10 @@
 """Core manager for Git worktree operations."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from git import Repo
 
@@ -13,8 +15,9 @@ from moai_adk.cli.worktree.exceptions import (
     WorktreeExistsError,
     WorktreeNotFoundError,
 )
-from moai_adk.cli.worktree.models import WorktreeInfo
+from moai_adk.cli.worktree.models import SyncResult, WorktreeInfo
 from moai_adk.cli.worktree.registry import WorktreeRegistry
+from moai_adk.core.git.merge_prediction import MergePrediction, predict_merges
 
 
 class WorktreeManager:
@@ -197,6 +200,39 @@ class WorktreeManager:
         """
         return self.registry.list_all(project_name=self.project_name)
 
+    def predict_conflicts(
+        self, base_branch: str = "main", max_workers: int | None = None
+    ) -> dict[str, MergePrediction]:
+        """Predict which worktrees would conflict when synced with the base branch.
+
+        Merges are computed in the object database only (git merge-tree), in
+        parallel, without fetching or touching any worktree checkout.
+
+        Args:
+            base_branch: Branch to sync from (defaults to 'main'; origin/<base> is preferred if present).
+            max_workers: Maximum concurrent merge predictions.
+
+        Returns:
+            Merge prediction per SPEC ID.
+        """
+        worktrees = self.list()
+        if not worktrees:
+            return {}
+
+        target_branch = base_branch
+        try:
+            self.repo.git.rev_parse("--verify", "--quiet", f"origin/{base_branch}")
+            target_branch = f"origin/{base_branch}"
+        except Exception:
+            pass
+
+        predictions = predict_merges(
+            str(self.repo.working_dir),
+            [(info.branch, target_branch) for info in worktrees],
+            max_workers=max_workers,
+        )
+        return {info.spec_id: prediction for info, prediction in zip(worktrees, predictions)}
+
     def sync(
         self,
         spec_id: str,
@@ -235,120 +271,140 @@ class WorktreeManager:
             except Exception:
                 pass
 
-            # Sync with preferred strategy
+            self._sync_checkout(info, worktree_repo, base_branch, rebase, ff_only, auto_resolve)
+
+            # Update last accessed time
+            info.last_accessed = datetime.now().isoformat() + "Z"
+            self.registry.register(info, project_name=self.project_name)
+
+        except (WorktreeNotFoundError, MergeConflictError):
+            raise
+        except GitOperationError:
+            raise
+        except Exception as e:
+            raise GitOperationError(f"Failed to sync worktree: {e}")
+
+    @staticmethod
+    def _resolve_base_ref(repo: Repo, base_branch: str) -> str:
+        """Resolve the ref to sync from, preferring the remote-tracking branch.
+
+        Raises:
+            GitOperationError: If neither origin/<base> nor <base> exists.
+        """
+        for candidate in [f"origin/{base_branch}", base_branch]:
             try:
-                # Determine target branch (try remote first, then local)
-                target_branch = None
-                for candidate in [f"origin/{base_branch}", base_branch]:
-                    try:
-                        worktree_repo.git.rev_parse(candidate)
-                        target_branch = candidate
-                        break
-                    except Exception:
-                        continue
+                repo.git.rev_parse(candidate)
+                return candidate
+            except Exception:
+                continue
 
-                if not target_branch:
-                    raise GitOperationError(
-                        f"Base branch '{base_branch}' not found (tried origin/{base_branch}, {base_branch})"
-                    )
+        raise GitOperationError(f"Base branch '{base_branch}' not found (tried origin/{base_branch}, {base_branch})")
 
-                if ff_only:
-                    # Fast-forward only
-                    worktree_repo.git.merge(target_branch, "--ff-only")
-                elif rebase:
-                    # Rebase strategy
-                    worktree_repo.git.rebase(target_branch)
-                else:
-                    # Default merge strategy with conflict handling
-                    worktree_repo.git.merge(target_branch)
-            except Exception as e:
-                # Handle merge conflicts and provide auto-abort/auto-resolve
-                try:
-                    status = worktree_repo.git.status("--porcelain")
-                    conflicted = [
-                        line.split()[-1]
-                        for line in status.split("\n")
-                        if line.startswith("UU")
-                        or line.startswith("DD")
-                        or line.startswith("AA")
-                        or line.startswith("DU")
-                    ]
-
-                    if conflicted:
-                        if auto_resolve:
-                            # Attempt auto-resolution of conflicts
-                            try:
-                                # Try common conflict resolution strategies
-                                for file_path in conflicted:
+    def _sync_checkout(
+        self,
+        info: WorktreeInfo,
+        worktree_repo: Repo,
+        base_branch: str,
+        rebase: bool,
+        ff_only: bool,
+        auto_resolve: bool,
+        target_branch: str | None = None,
+    ) -> None:
+        """Merge, rebase or fast-forward one worktree checkout onto the base branch.
+
+        Conflicts are auto-resolved or aborted so the checkout is never left mid-merge.
+
+        Raises:
+            MergeConflictError: If merge conflict occurs and auto_resolve is False.
+            GitOperationError: If Git operation fails.
+        """
+        spec_id = info.spec_id
+
+        try:
+            if target_branch is None:
+                target_branch = self._resolve_base_ref(worktree_repo, base_branch)
+
+            if ff_only:
+                # Fast-forward only
+                worktree_repo.git.merge(target_branch, "--ff-only")
+            elif rebase:
+                # Rebase strategy
+                worktree_repo.git.rebase(target_branch)
+            else:
+                # Default merge strategy with conflict handling
+                worktree_repo.git.merge(target_branch)
+        except Exception as e:
+            # Handle merge conflicts and provide auto-abort/auto-resolve
+            try:
+                status = worktree_repo.git.status("--porcelain")
+                conflicted = [
+                    line.split()[-1]
+                    for line in status.split("\n")
+                    if line.startswith("UU") or line.startswith("DD") or line.startswith("AA") or line.startswith("DU")
+                ]
+
+                if conflicted:
+                    if auto_resolve:
+                        # Attempt auto-resolution of conflicts
+                        try:
+                            # Try common conflict resolution strategies
+                            for file_path in conflicted:
+                                try:
+                                    # Strategy 1: Accept current changes (ours)
+                                    worktree_repo.git.checkout("--ours", file_path)
+                                    worktree_repo.git.add(file_path)
+                                except Exception:
+                                    # Strategy 2: Accept incoming changes (theirs) if ours fails
                                     try:
-                                        # Strategy 1: Accept current changes (ours)
-                                        worktree_repo.git.checkout("--ours", file_path)
+                                        worktree_repo.git.checkout("--theirs", file_path)
                                         worktree_repo.git.add(file_path)
                                     except Exception:
-                                        # Strategy 2: Accept incoming changes (theirs) if ours fails
+                                        # Strategy 3: Remove conflict markers and keep both
                                         try:
-                                            worktree_repo.git.checkout("--theirs", file_path)
-                                            worktree_repo.git.add(file_path)
+                                            # Simple conflict marker removal - keep both versions
+                                            file_full_path = info.path / file_path
+                                            if file_full_path.exists():
+                                                with open(file_full_path, "r") as f:
+                                                    content = f.read()
+
+                                                # Remove conflict markers and keep both versions
+                                                lines = content.split("\n")
+                                                cleaned_lines = []
+                                                skip_next = False
+                                                in_conflict = False
+
+                                                for line in lines:
+                                                    if "<<<<<<<" in line or ">>>>>>>" in line:
+                                                        in_conflict = True
+                                                        continue
+                                                    elif "======" in line:
+                                                        skip_next = True
+                                                        in_conflict = False
+                                                        continue
+                                                    elif skip_next:
+                                                        skip_next = False
+                                                        continue
+                                                    elif not in_conflict:
+                                                        cleaned_lines.append(line)
+
+                                                with open(file_full_path, "w") as f:
+                                                    f.write("\n".join(cleaned_lines))
+
+                                                worktree_repo.git.add(file_path)
                                         except Exception:
-                                            # Strategy 3: Remove conflict markers and keep both
-                                            try:
-                                                # Simple conflict marker removal - keep both versions
-                                                file_full_path = info.path / file_path
-                                                if file_full_path.exists():
-                                                    with open(file_full_path, "r") as f:
-                                                        content = f.read()
-
-                                                    # Remove conflict markers and keep both versions
-                                                    lines = content.split("\n")
-                                                    cleaned_lines = []
-                                                    skip_next = False
-                                                    in_conflict = False
-
-                                                    for line in lines:
-                                                        if "<<<<<<<" in line or ">>>>>>>" in line:
-                                                            in_conflict = True
-                                                            continue
-                                                        elif "======" in line:
-                                                            skip_next = True
-                                                            in_conflict = False
-                                                            continue
-                                                        elif skip_next:
-                                                            skip_next = False
-                                                            continue
-                                                        elif not in_conflict:
-                                                            cleaned_lines.append(line)
-
-                                                    with open(file_full_path, "w") as f:
-                                                        f.write("\n".join(cleaned_lines))
-
-                                                    worktree_repo.git.add(file_path)
-                                            except Exception:
-                                                pass
-
-                                # Stage resolved files
-                                worktree_repo.git.add(".")
-
-                                # Commit the merge resolution
-                                worktree_repo.git.commit(
-                                    "-m",
-                                    f"Auto-resolved conflicts during sync of {spec_id}",
-                                )
-
-                            except Exception as resolve_error:
-                                # Auto-resolution failed, fall back to manual conflict
-                                try:
-                                    worktree_repo.git.merge("--abort")
-                                except Exception:
-                                    pass
-                                try:
-                                    worktree_repo.git.rebase("--abort")
-                                except Exception:
-                                    pass
-                                conflict_list = conflicted if isinstance(conflicted, list) else [str(conflicted)]
-                                error_msg = f"auto-resolve failed: {resolve_error}"
-                                raise MergeConflictError(spec_id, conflict_list + [error_msg])
-                        else:
-                            # Auto-abort merge/rebase on conflicts
+                                            pass
+
+                            # Stage resolved files
+                            worktree_repo.git.add(".")
+
+                            # Commit the merge resolution
+                            worktree_repo.git.commit(
+                                "-m",
+                                f"Auto-resolved conflicts during sync of {spec_id}",
+                            )
+
+                        except Exception as resolve_error:
+                            # Auto-resolution failed, fall back to manual conflict
                             try:
                                 worktree_repo.git.merge("--abort")
                             except Exception:
@@ -357,36 +413,126 @@ class WorktreeManager:
                                 worktree_repo.git.rebase("--abort")
                             except Exception:
                                 pass
+                            conflict_list = conflicted if isinstance(conflicted, list) else [str(conflicted)]
+                            error_msg = f"auto-resolve failed: {resolve_error}"
+                            raise MergeConflictError(spec_id, conflict_list + [error_msg])
+                    else:
+                        # Auto-abort merge/rebase on conflicts
+                        try:
+                            worktree_repo.git.merge("--abort")
+                        except Exception:
+                            pass
+                        try:
+                            worktree_repo.git.rebase("--abort")
+                        except Exception:
+                            pass
 
-                            raise MergeConflictError(spec_id, conflicted)
+                        raise MergeConflictError(spec_id, conflicted)
 
-                    # If no conflicts but sync failed, raise general error
-                    raise GitOperationError(f"Failed to sync worktree: {e}")
+                # If no conflicts but sync failed, raise general error
+                raise GitOperationError(f"Failed to sync worktree: {e}")
 
-                except MergeConflictError:
-                    raise
+            except MergeConflictError:
+                raise
+            except Exception:
+                # If conflict detection fails, still try to clean up
+                try:
+                    worktree_repo.git.merge("--abort")
                 except Exception:
-                    # If conflict detection fails, still try to clean up
-                    try:
-                        worktree_repo.git.merge("--abort")
-                    except Exception:
-                        pass
-                    try:
-                        worktree_repo.git.rebase("--abort")
-                    except Exception:
-                        pass
-                    raise GitOperationError(f"Failed to sync worktree: {e}")
+                    pass
+                try:
+                    worktree_repo.git.rebase("--abort")
+                except Exception:
+                    pass
+                raise GitOperationError(f"Failed to sync worktree: {e}")
 
-            # Update last accessed time
-            info.last_accessed = datetime.now().isoformat() + "Z"
-            self.registry.register(info, project_name=self.project_name)
+    def sync_all(
+        self,
+        base_branch: str = "main",
+        rebase: bool = False,
+        ff_only: bool = False,
+        auto_resolve: bool = False,
+        skip_conflicts: bool = False,
+        max_workers: int | None = None,
+    ) -> Iterator[SyncResult]:
+        """Sync every worktree with the base branch in parallel.
 
-        except (WorktreeNotFoundError, MergeConflictError):
-            raise
-        except GitOperationError:
-            raise
-        except Exception as e:
-            raise GitOperationError(f"Failed to sync worktree: {e}")
+        Linked worktrees share the main repository's object store and remote
+        refs, so origin is fetched once and the base ref is resolved once.
+        Each checkout is then merged, rebased or fast-forwarded in a bounded
+        worker pool, and results are yielded as they complete.
+
+        Args:
+            base_branch: Branch to sync from (defaults to 'main').
+            rebase: Use rebase instead of merge.
+            ff_only: Only sync if fast-forward is possible.
+            auto_resolve: Automatically attempt to resolve conflicts.
+            skip_conflicts: Predict merges with git merge-tree first and skip
+                worktrees that would conflict, leaving their checkouts untouched.
+            max_workers: Maximum concurrent syncs (default: CPU count, at most 8).
+
+        Yields:
+            One SyncResult per worktree, in completion order.
+
+        Raises:
+            GitOperationError: If the base branch cannot be found.
+        """
+        worktrees = self.list()
+        if not worktrees:
+            return
+
+        try:
+            self.repo.remotes.origin.fetch()
+        except Exception:
+            pass
+
+        target_branch = self._resolve_base_ref(self.repo, base_branch)
+
+        if skip_conflicts:
+            predictions = predict_merges(
+                str(self.repo.working_dir),
+                [(info.branch, target_branch) for info in worktrees],
+                max_workers=max_workers,
+            )
+            pending = []
+            for info, prediction in zip(worktrees, predictions):
+                # A failed prediction is not a conflict; let the real sync decide
+                if prediction.conflicts:
+                    yield SyncResult(
+                        spec_id=info.spec_id,
+                        status="skipped",
+                        conflicts=[conflict.path for conflict in prediction.conflicts],
+                    )
+                else:
+                    pending.append(info)
+            worktrees = pending
+
+        if not worktrees:
+            return
+
+        def sync_one(info: WorktreeInfo) -> SyncResult:
+            try:
+                worktree_repo = Repo(info.path)
+                self._sync_checkout(info, worktree_repo, base_branch, rebase, ff_only, auto_resolve, target_branch)
+                return SyncResult(spec_id=info.spec_id, status="synced")
+            except MergeConflictError as e:
+                return SyncResult(spec_id=info.spec_id, status="conflict", conflicts=e.conflicted_files)
+            except Exception as e:
+                return SyncResult(spec_id=info.spec_id, status="failed", error=str(e))
+
+        workers = max(1, min(max_workers or min(os.cpu_count() or 1, 8), len(worktrees)))
+        infos = {info.spec_id: info for info in worktrees}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(sync_one, info) for info in worktrees]
+            for future in as_completed(futures):
+                result = future.result()
+                if result.status == "synced":
+                    # Registry writes stay on the calling thread
+                    info = infos[result.spec_id]
+                    info.last_accessed = datetime.now().isoformat() + "Z"
+                    self.registry.register(info, project_name=self.project_name)
+                yield result
 
     def clean_merged(self) -> List[str]:
         """Clean up worktrees for merged branches.
@@ -1,6 +1,6 @@
 """Data models for Git Worktree CLI."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -63,3 +63,20 @@ class WorktreeInfo:
             last_accessed=data["last_accessed"],
             status=data["status"],
         )
+
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing one worktree with its base branch."""
+
+    spec_id: str
+    """The SPEC ID of the synced worktree."""
+
+    status: str
+    """'synced', 'conflict', 'skipped' (conflict predicted, checkout untouched) or 'failed'."""
+
+    conflicts: list[str] = field(default_factory=list)
+    """Conflicted (or predicted conflicting) file paths."""
+
+    error: str | None = None
+    """Error message when the sync failed."""
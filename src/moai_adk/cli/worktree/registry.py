@@ -1,10 +1,20 @@
 """Registry for managing Git worktree metadata."""
 
 import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Iterator
 
 from moai_adk.cli.worktree.models import WorktreeInfo
 
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
 
 class WorktreeRegistry:
     """Manages Git worktree metadata persistence.
@@ -12,8 +22,19 @@ class WorktreeRegistry:
     This class handles storing and retrieving worktree information from
     a JSON registry file. It ensures registry consistency and provides
     CRUD operations for worktree metadata.
+
+    Several terminals or agents may manage worktrees at once, so every
+    modification is a locked read-modify-write: the registry file is
+    re-read if another process replaced it, the change is applied, and the
+    file is replaced atomically. Lookups by project and path use in-memory
+    indexes that are updated per spec_id instead of rescanning all entries.
     """
 
+    # Disk state the in-memory data was last loaded from or saved as
+    _signature: tuple[int, int, int] | None = None
+    # (entries by project then spec_id, spec_id by path); None until first needed
+    _index: tuple[dict[str | None, dict[str, dict]], dict[str, str]] | None = None
+
     def __init__(self, worktree_root: Path) -> None:
         """Initialize the registry.
 
@@ -27,6 +48,100 @@ class WorktreeRegistry:
         self._data: dict[str, dict | list[dict]] = {}
         self._load()
 
+    @property
+    def _data(self) -> dict[str, dict | list[dict]]:
+        return self._store
+
+    @_data.setter
+    def _data(self, value: dict[str, dict | list[dict]]) -> None:
+        self._store = value
+        self._index = None
+
+    @property
+    def lock_path(self) -> Path:
+        """Lock file guarding read-modify-write cycles on the registry file."""
+        return self.registry_path.with_name(self.registry_path.name + ".lock")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive inter-process lock on the registry."""
+        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a+") as lock_file:
+            if sys.platform == "win32":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if sys.platform == "win32":
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _disk_signature(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.registry_path.stat()
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self) -> None:
+        """Reload the registry if another process replaced the file since we last read or wrote it."""
+        if self._signature is not None and self._disk_signature() != self._signature:
+            self._load()
+
+    def _modify(self, change: Callable[[], bool]) -> bool:
+        """Apply a change to the latest registry state and save it if anything changed.
+
+        Args:
+            change: Mutates the in-memory data and returns whether anything changed.
+
+        Returns:
+            Whether the registry was changed.
+        """
+        with self._locked():
+            self._refresh()
+            changed = change()
+            if changed:
+                self._save()
+        return changed
+
+    def _get_index(self) -> tuple[dict[str | None, dict[str, dict]], dict[str, str]]:
+        if self._index is None:
+            self._index = ({}, {})
+            for spec_id in self._data:
+                self._index_entries(spec_id, [], self._entries_for_spec(spec_id))
+        return self._index
+
+    def _index_entries(self, spec_id: str, old_entries: list[dict], new_entries: list[dict]) -> None:
+        """Move the index entries of one spec_id from its old to its new entries."""
+        if self._index is None:
+            return
+        by_project, by_path = self._index
+
+        new_projects = {self._entry_project_name(entry) for entry in new_entries}
+        for entry in old_entries:
+            project_name = self._entry_project_name(entry)
+            if project_name not in new_projects:
+                by_project.get(project_name, {}).pop(spec_id, None)
+            path_value = entry.get("path")
+            if isinstance(path_value, str) and by_path.get(path_value) == spec_id:
+                del by_path[path_value]
+
+        seen_projects: set[str | None] = set()
+        for entry in new_entries:
+            project_name = self._entry_project_name(entry)
+            # Like get(), the first entry of a project wins; assigning in place keeps list order stable
+            if project_name not in seen_projects:
+                by_project.setdefault(project_name, {})[spec_id] = entry
+                seen_projects.add(project_name)
+            path_value = entry.get("path")
+            if isinstance(path_value, str):
+                by_path.setdefault(path_value, spec_id)
+
     def _is_valid_entry(self, entry: dict) -> bool:
         """Check if a registry entry has the required fields and types."""
         required_fields = {
@@ -90,6 +205,8 @@ class WorktreeRegistry:
 
     def _set_entries(self, spec_id: str, entries: list[dict]) -> None:
         """Set normalized entries for a spec_id in the registry."""
+        self._index_entries(spec_id, self._entries_for_spec(spec_id), entries)
+
         if not entries:
             self._data.pop(spec_id, None)
             return
@@ -112,12 +229,12 @@ class WorktreeRegistry:
             entry["project_name"] = project_name
 
         if project_name is None:
-            self._data[spec_id] = entry
+            self._set_entries(spec_id, [entry])
             return
 
         entries = self._entries_for_spec(spec_id)
         if not entries:
-            self._data[spec_id] = entry
+            self._set_entries(spec_id, [entry])
             return
 
         for index, existing in enumerate(entries):
@@ -150,6 +267,7 @@ class WorktreeRegistry:
         Validates data structure and removes invalid entries.
         """
         if self.registry_path.exists():
+            signature = self._disk_signature()
             try:
                 with open(self.registry_path, "r") as f:
                     content = f.read().strip()
@@ -161,11 +279,17 @@ class WorktreeRegistry:
                         self._data = {}
             except (json.JSONDecodeError, IOError):
                 self._data = {}
+            self._signature = signature
         else:
             # Create parent directory if needed
             self.registry_path.parent.mkdir(parents=True, exist_ok=True)
             self._data = {}
-            self._save()
+            with self._locked():
+                # Another process may have created it meanwhile
+                if self.registry_path.exists():
+                    self._load()
+                else:
+                    self._save()
 
     def _validate_data(self, raw_data: dict) -> dict[str, dict | list[dict]]:
         """Validate registry data structure.
@@ -199,10 +323,26 @@ class WorktreeRegistry:
         return validated
 
     def _save(self) -> None:
-        """Save registry to disk."""
+        """Save registry to disk.
+
+        Writes to a temporary file and atomically replaces the registry, so
+        readers never see a partially written file.
+        """
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.registry_path, "w") as f:
-            json.dump(self._data, f, indent=2)
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.registry_path.parent, prefix=".moai-worktree-registry.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._data, f, indent=2)
+            os.replace(temp_path, self.registry_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        self._signature = self._disk_signature()
 
     def register(self, info: WorktreeInfo, project_name: str | None = None) -> None:
         """Register a new worktree.
@@ -211,8 +351,12 @@ class WorktreeRegistry:
             info: WorktreeInfo instance to register.
             project_name: Project name for namespace organization.
         """
-        self._upsert_entry(info.spec_id, info.to_dict(), project_name=project_name, path=info.path)
-        self._save()
+
+        def change() -> bool:
+            self._upsert_entry(info.spec_id, info.to_dict(), project_name=project_name, path=info.path)
+            return True
+
+        self._modify(change)
 
     def unregister(self, spec_id: str, project_name: str | None = None) -> None:
         """Unregister a worktree.
@@ -221,22 +365,23 @@ class WorktreeRegistry:
             spec_id: SPEC ID to unregister.
             project_name: Project name for namespace organization.
         """
-        if project_name is None:
-            if spec_id in self._data:
-                del self._data[spec_id]
-                self._save()
-            return
 
-        entries = self._entries_for_spec(spec_id)
-        if not entries:
-            return
+        def change() -> bool:
+            if project_name is None:
+                if spec_id not in self._data:
+                    return False
+                self._set_entries(spec_id, [])
+                return True
 
-        remaining = [entry for entry in entries if not self._entry_matches_project(entry, project_name)]
-        if len(remaining) == len(entries):
-            return
+            entries = self._entries_for_spec(spec_id)
+            remaining = [entry for entry in entries if not self._entry_matches_project(entry, project_name)]
+            if len(remaining) == len(entries):
+                return False
+
+            self._set_entries(spec_id, remaining)
+            return True
 
-        self._set_entries(spec_id, remaining)
-        self._save()
+        self._modify(change)
 
     def get(self, spec_id: str, project_name: str | None = None) -> WorktreeInfo | None:
         """Get worktree information by SPEC ID.
@@ -248,20 +393,36 @@ class WorktreeRegistry:
         Returns:
             WorktreeInfo if found, None otherwise.
         """
-        entries = self._entries_for_spec(spec_id)
-        if not entries:
-            return None
+        self._refresh()
 
         if project_name:
-            for entry in entries:
-                if self._entry_matches_project(entry, project_name):
-                    return WorktreeInfo.from_dict(entry)
-            return None
+            entry = self._get_index()[0].get(project_name, {}).get(spec_id)
+            return WorktreeInfo.from_dict(entry) if entry is not None else None
 
+        entries = self._entries_for_spec(spec_id)
         if len(entries) == 1:
             return WorktreeInfo.from_dict(entries[0])
         return None
 
+    def find_by_path(self, path: Path) -> WorktreeInfo | None:
+        """Get worktree information by worktree path.
+
+        Args:
+            path: Worktree directory.
+
+        Returns:
+            WorktreeInfo if a worktree is registered at this path, None otherwise.
+        """
+        self._refresh()
+
+        spec_id = self._get_index()[1].get(str(path))
+        if spec_id is None:
+            return None
+        for entry in self._entries_for_spec(spec_id):
+            if self._entry_matches_path(entry, path):
+                return WorktreeInfo.from_dict(entry)
+        return None
+
     def list_all(self, project_name: str | None = None) -> list[WorktreeInfo]:
         """List all registered worktrees.
 
@@ -271,18 +432,19 @@ class WorktreeRegistry:
         Returns:
             List of WorktreeInfo instances.
         """
-        items: list[WorktreeInfo] = []
-        for spec_id in self._data:
-            for entry in self._entries_for_spec(spec_id):
-                if project_name and not self._entry_matches_project(entry, project_name):
-                    continue
-                items.append(WorktreeInfo.from_dict(entry))
-        return items
+        self._refresh()
+
+        if project_name:
+            return [WorktreeInfo.from_dict(entry) for entry in self._get_index()[0].get(project_name, {}).values()]
+
+        return [WorktreeInfo.from_dict(entry) for spec_id in self._data for entry in self._entries_for_spec(spec_id)]
 
     def sync_with_git(self, repo) -> None:
         """Synchronize registry with actual Git worktree state.
 
-        Removes entries for worktrees that no longer exist on disk.
+        Removes entries for worktrees that no longer exist on disk. Only the
+        affected spec_ids are rewritten, against the latest registry state,
+        and nothing is written when every entry is still valid.
 
         Args:
             repo: GitPython Repo instance.
@@ -299,99 +461,69 @@ class WorktreeRegistry:
                     if path:
                         actual_paths.add(path)
 
-            # Remove registry entries for non-existent worktrees
-            changed = False
-            for spec_id in list(self._data.keys()):
-                entries = self._entries_for_spec(spec_id)
-                if not entries:
-                    self._data.pop(spec_id, None)
-                    changed = True
-                    continue
-
-                kept_entries = []
-                for entry in entries:
-                    path_value = entry.get("path")
-                    if not isinstance(path_value, str):
-                        changed = True
-                        continue
-                    if path_value in actual_paths:
-                        kept_entries.append(entry)
-                    else:
-                        changed = True
-
-                if kept_entries:
+            def change() -> bool:
+                changed = False
+                for spec_id, value in list(self._data.items()):
+                    entries = self._entries_for_spec(spec_id)
+                    kept_entries = [
+                        entry
+                        for entry in entries
+                        if isinstance(entry.get("path"), str) and entry["path"] in actual_paths
+                    ]
                     normalized = kept_entries[0] if len(kept_entries) == 1 else kept_entries
-                    if self._data.get(spec_id) != normalized:
-                        self._data[spec_id] = normalized
-                        changed = True
-                else:
-                    self._data.pop(spec_id, None)
+                    if kept_entries and value == normalized:
+                        continue
+                    # Remove registry entries for non-existent worktrees (and malformed rows)
+                    self._set_entries(spec_id, kept_entries)
                     changed = True
+                return changed
 
-            if changed:
-                self._save()
+            self._modify(change)
 
         except Exception:
             # If sync fails, just continue
             pass
 
+    def _read_worktree_branch(self, worktree_path: Path, spec_id: str) -> str:
+        """Detect the branch checked out in a worktree, defaulting to feature/<spec_id>."""
+        branch = f"feature/{spec_id}"
+        git_path = worktree_path / ".git"
+        try:
+            if git_path.is_file():
+                # It's a worktree - read the gitdir to find HEAD
+                with open(git_path, "r") as f:
+                    for line in f:
+                        if line.startswith("gitdir:"):
+                            gitdir = Path(line[8:].strip())
+                            head_file = gitdir / "HEAD"
+                            if head_file.exists():
+                                with open(head_file, "r") as hf:
+                                    head_content = hf.read().strip()
+                                    if head_content.startswith("ref: refs/heads/"):
+                                        branch = head_content[16:]
+                            break
+        except Exception:
+            pass
+        return branch
+
     def recover_from_disk(self) -> int:
         """Recover worktree registry from existing worktree directories.
 
         Scans the worktree_root directory for existing worktrees and
-        registers them if they have valid Git structure.
+        registers them if they have valid Git structure. The scan runs
+        without holding the registry lock; only missing entries are added
+        to the latest registry state.
 
         Returns:
             Number of worktrees recovered.
         """
         from datetime import datetime
 
-        recovered = 0
-
         if not self.worktree_root.exists():
             return 0
 
-        def register_candidate(worktree_path: Path, spec_id: str, project_name: str | None) -> None:
-            nonlocal recovered
-
-            if self._has_entry(spec_id, project_name, worktree_path):
-                return
-
-            git_path = worktree_path / ".git"
-            if not git_path.exists():
-                return
-
-            # Try to detect branch name
-            branch = f"feature/{spec_id}"
-            try:
-                if git_path.is_file():
-                    # It's a worktree - read the gitdir to find HEAD
-                    with open(git_path, "r") as f:
-                        for line in f:
-                            if line.startswith("gitdir:"):
-                                gitdir = Path(line[8:].strip())
-                                head_file = gitdir / "HEAD"
-                                if head_file.exists():
-                                    with open(head_file, "r") as hf:
-                                        head_content = hf.read().strip()
-                                        if head_content.startswith("ref: refs/heads/"):
-                                            branch = head_content[16:]
-                                break
-            except Exception:
-                pass
-
-            now = datetime.now().isoformat() + "Z"
-            info_dict = {
-                "spec_id": spec_id,
-                "path": str(worktree_path),
-                "branch": branch,
-                "created_at": now,
-                "last_accessed": now,
-                "status": "recovered",
-            }
-            self._upsert_entry(spec_id, info_dict, project_name=project_name, path=worktree_path)
-            recovered += 1
-
+        # (worktree path, spec_id, project_name) for every directory with a .git entry
+        candidates: list[tuple[Path, str, str | None]] = []
         for item in self.worktree_root.iterdir():
             # Skip registry file and hidden files
             if item.name.startswith("."):
@@ -403,7 +535,7 @@ class WorktreeRegistry:
 
             # Legacy layout: worktree directly under root
             if (item / ".git").exists():
-                register_candidate(item, item.name, None)
+                candidates.append((item, item.name, None))
                 continue
 
             # Namespaced layout: /worktrees/{project}/{spec_id}
@@ -414,9 +546,32 @@ class WorktreeRegistry:
                     continue
                 if not (child / ".git").exists():
                     continue
-                register_candidate(child, child.name, item.name)
+                candidates.append((child, child.name, item.name))
+
+        if not candidates:
+            return 0
+
+        recovered = 0
+
+        def change() -> bool:
+            nonlocal recovered
+            for worktree_path, spec_id, project_name in candidates:
+                if self._has_entry(spec_id, project_name, worktree_path):
+                    continue
 
-        if recovered > 0:
-            self._save()
+                now = datetime.now().isoformat() + "Z"
+                info_dict = {
+                    "spec_id": spec_id,
+                    "path": str(worktree_path),
+                    "branch": self._read_worktree_branch(worktree_path, spec_id),
+                    "created_at": now,
+                    "last_accessed": now,
+                    "status": "recovered",
+                }
+                self._upsert_entry(spec_id, info_dict, project_name=project_name, path=worktree_path)
+                recovered += 1
+            return recovered > 0
+
+        self._modify(change)
 
         return recovered
@@ -5,13 +5,205 @@ Analyzes Claude Code session logs to generate data-driven improvement suggestion
 
 This module provides the SessionAnalyzer class for analyzing Claude Code session logs
 and generating improvement suggestions based on usage patterns.
+
+Session files are analyzed as a map/reduce: each file is streamed line by line
+into a partial counter set (optionally in a process pool), and partials are
+merged in file order. An optional checkpoint stores per-file byte offsets and
+partials, so repeated runs only read bytes appended since the last run.
 """
 
 import json
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+# Counter-valued pattern keys merged by summing per key
+COUNTER_KEYS = (
+    "tool_usage",
+    "tool_failures",
+    "error_patterns",
+    "permission_requests",
+    "hook_failures",
+    "command_frequency",
+)
+
+# Scalar pattern keys merged by addition
+SCALAR_KEYS = ("total_sessions", "total_events", "failed_sessions")
+
+CHECKPOINT_VERSION = 1
+
+# Files per worker below which a process pool is not worth its startup cost
+MIN_FILES_PER_WORKER = 4
+
+
+def _new_partial() -> Dict[str, Any]:
+    """Create an empty partial counter set for one file."""
+    partial: Dict[str, Any] = {key: 0 for key in SCALAR_KEYS}
+    for key in COUNTER_KEYS:
+        partial[key] = defaultdict(int)
+    return partial
+
+
+def _merge_partial(patterns: Dict[str, Any], partial: Dict[str, Any]) -> None:
+    """
+    Merge a partial counter set into accumulated patterns (reduce step).
+
+    Args:
+        patterns: Accumulated patterns (modified in place)
+        partial: Partial counters from one file
+    """
+    for key in SCALAR_KEYS:
+        patterns[key] = cast(int, patterns[key]) + partial.get(key, 0)
+    for key in COUNTER_KEYS:
+        counter = cast(defaultdict[str, int], patterns[key])
+        for name, count in partial.get(key, {}).items():
+            counter[name] += count
+
+
+def _partial_to_json(partial: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a partial counter set to plain JSON-serializable dicts."""
+    return {key: dict(value) if key in COUNTER_KEYS else value for key, value in partial.items()}
+
+
+def _analyze_session_into(patterns: Dict[str, Any], session: Dict[str, Any]) -> None:
+    """
+    Accumulate a single session's signals into a pattern/partial dictionary
+
+    Args:
+        patterns: Pattern or partial dictionary (modified in place)
+        session: Session data dictionary from Claude Code
+    """
+    # Handle session summary format (current JSONL format)
+    if session.get("type") == "summary":
+        # Count session types by summary content
+        summary = cast(str, session.get("summary", "")).lower()
+
+        # Simple analysis of session summaries
+        if any(keyword in summary for keyword in ["error", "fail", "issue", "problem"]):
+            patterns["failed_sessions"] = cast(int, patterns["failed_sessions"]) + 1
+            tool_failures = cast(defaultdict[str, int], patterns["tool_failures"])
+            tool_failures["session_error_in_summary"] += 1
+
+        # Extract potential tool usage from summary
+        tool_keywords = [
+            "test",
+            "build",
+            "deploy",
+            "analyze",
+            "create",
+            "update",
+            "fix",
+            "check",
+        ]
+        tool_usage = cast(defaultdict[str, int], patterns["tool_usage"])
+        for keyword in tool_keywords:
+            if keyword in summary:
+                tool_usage[f"summary_{keyword}"] += 1
+
+        # Track session summaries as events
+        patterns["total_events"] = cast(int, patterns["total_events"]) + 1
+        return
+
+    # Handle detailed event format (legacy session-*.json format)
+    events = cast(list[Dict[str, Any]], session.get("events", []))
+    patterns["total_events"] = cast(int, patterns["total_events"]) + len(events)
+
+    has_error = False
+
+    for event in events:
+        event_type = event.get("type", "unknown")
+
+        # Extract tool usage patterns
+        if event_type == "tool_call":
+            tool_name = cast(str, event.get("toolName", "unknown")).split("(")[0]
+            tool_usage = cast(defaultdict[str, int], patterns["tool_usage"])
+            tool_usage[tool_name] += 1
+
+        # Tool error patterns
+        elif event_type == "tool_error":
+            error_msg = cast(str, event.get("error", "unknown error"))
+            tool_failures = cast(defaultdict[str, int], patterns["tool_failures"])
+            tool_failures[error_msg[:50]] += 1  # First 50 characters
+            has_error = True
+
+        # Permission requests
+        elif event_type == "permission_request":
+            perm_type = cast(str, event.get("permission_type", "unknown"))
+            perm_requests = cast(defaultdict[str, int], patterns["permission_requests"])
+            perm_requests[perm_type] += 1
+
+        # Hook failures
+        elif event_type == "hook_failure":
+            hook_name = cast(str, event.get("hook_name", "unknown"))
+            hook_failures = cast(defaultdict[str, int], patterns["hook_failures"])
+            hook_failures[hook_name] += 1
+            has_error = True
+
+        # Command usage
+        if "command" in event:
+            cmd_str = cast(str, event.get("command", "")).split()
+            if cmd_str:
+                cmd = cmd_str[0]
+                cmd_freq = cast(defaultdict[str, int], patterns["command_frequency"])
+                cmd_freq[cmd] += 1
+
+    if has_error:
+        patterns["failed_sessions"] = cast(int, patterns["failed_sessions"]) + 1
+
+
+def _analyze_file(task: Tuple[str, int]) -> Dict[str, Any]:
+    """
+    Analyze one session file from a byte offset (map step).
+
+    Runs in worker processes, so it only takes and returns picklable data.
+    JSONL files are streamed line by line; a trailing line that is not yet
+    complete (session still being written) is left for the next run.
+
+    Args:
+        task: Tuple of (file path, starting byte offset)
+
+    Returns:
+        Dictionary with the partial counters, the new offset and any warnings
+    """
+    path_str, offset = task
+    partial = _new_partial()
+    warnings: List[str] = []
+
+    try:
+        if not path_str.endswith(".jsonl"):
+            # JSON format: single session per file
+            with open(path_str, encoding="utf-8") as f:
+                session = json.load(f)
+            _analyze_session_into(partial, session)
+            partial["total_sessions"] += 1
+            return {"partial": partial, "offset": os.path.getsize(path_str), "warnings": warnings}
+
+        with open(path_str, "rb") as f:
+            f.seek(offset)
+            line_num = 0
+            for raw_line in f:
+                line_num += 1
+                complete = raw_line.endswith(b"\n")
+                line = raw_line.strip()
+                if line:
+                    try:
+                        session = json.loads(line.decode("utf-8"))
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        if not complete:
+                            # Partially written trailing line; re-read next run
+                            break
+                        warnings.append(f"⚠️ Error reading line {line_num} in {path_str}: {e}")
+                    else:
+                        _analyze_session_into(partial, session)
+                        partial["total_sessions"] += 1
+                offset += len(raw_line)
+    except (json.JSONDecodeError, IOError) as e:
+        warnings.append(f"⚠️ Error reading {path_str}: {e}")
+
+    return {"partial": partial, "offset": offset, "warnings": warnings}
 
 
 class SessionAnalyzer:
@@ -43,12 +235,26 @@ class SessionAnalyzer:
             "failed_sessions": 0,
         }
 
-        self.sessions_data: list[Dict[str, Any]] = []
-
-    def parse_sessions(self) -> Dict[str, Any]:
+    def parse_sessions(
+        self,
+        checkpoint_path: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
         Parse all session logs from the last N days
 
+        Files older than the analysis window are skipped by mtime before they
+        are opened. Remaining files are analyzed in a process pool and their
+        partial counters merged in path order, so results are deterministic.
+
+        Args:
+            checkpoint_path: Optional checkpoint file storing per-file offsets
+                            and partial counters; when given, unchanged files
+                            are not re-read and appended JSONL files are read
+                            from their last offset only
+            max_workers: Worker processes for analysis (default: CPU count,
+                        1 disables the process pool)
+
         Returns:
             Dictionary containing analysis patterns and metrics
         """
@@ -57,54 +263,149 @@ class SessionAnalyzer:
                 print(f"⚠️ Claude projects directory not found: {self.claude_projects}")
             return self.patterns
 
-        cutoff_date = datetime.now() - timedelta(days=self.days_back)
+        cutoff_timestamp = (datetime.now() - timedelta(days=self.days_back)).timestamp()
 
         # Look for both session-*.json and UUID.jsonl files
         session_files: list[Path] = []
         session_files.extend(self.claude_projects.glob("*/session-*.json"))
         session_files.extend(self.claude_projects.glob("*/*.jsonl"))
+        session_files.sort()
 
         if self.verbose:
             print(f"Found {len(session_files)} session files")
 
+        previous = self._load_checkpoint(checkpoint_path)
+        checkpoint: Dict[str, Dict[str, Any]] = {}
+        cached_partials: Dict[str, Dict[str, Any]] = {}
+        tasks: list[Tuple[str, int]] = []
+
         for session_file in session_files:
-            # Check file modification time
-            if datetime.fromtimestamp(session_file.stat().st_mtime) < cutoff_date:
+            try:
+                stat = session_file.stat()
+            except OSError:
                 continue
 
-            try:
-                # Handle both JSON and JSONL formats
-                if session_file.suffix == ".jsonl":
-                    # JSONL format: read line by line
-                    sessions = []
-                    with open(session_file, encoding="utf-8") as f:
-                        for line_num, line in enumerate(f, 1):
-                            line = line.strip()
-                            if line:
-                                try:
-                                    session = json.loads(line)
-                                    sessions.append(session)
-                                except json.JSONDecodeError as e:
-                                    if self.verbose:
-                                        print(f"⚠️ Error reading line {line_num} in {session_file}: {e}")
-
-                    # Analyze each session from the JSONL file
-                    for session in sessions:
-                        self._analyze_session(session)
-                        self.sessions_data.append(session)
-                else:
-                    # JSON format: single session per file
-                    with open(session_file, encoding="utf-8") as f:
-                        session = json.load(f)
-                        self._analyze_session(session)
-                        self.sessions_data.append(session)
-            except (json.JSONDecodeError, IOError) as e:
+            # Skip by modification time before opening
+            if stat.st_mtime < cutoff_timestamp:
+                continue
+
+            key = str(session_file)
+            entry = previous.get(key)
+            offset = 0
+
+            if entry is not None:
+                unchanged = entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime
+                appended = key.endswith(".jsonl") and stat.st_size > entry.get("offset", 0)
+                if unchanged:
+                    checkpoint[key] = entry
+                    cached_partials[key] = entry["partial"]
+                    continue
+                if appended:
+                    # Only the bytes written since the last run are read
+                    offset = entry.get("offset", 0)
+                    cached_partials[key] = entry["partial"]
+
+            checkpoint[key] = {"size": stat.st_size, "mtime": stat.st_mtime}
+            tasks.append((key, offset))
+
+        results = self._run_tasks(tasks, max_workers)
+
+        for key in sorted(checkpoint):
+            partial = _new_partial()
+            if key in cached_partials:
+                _merge_partial(partial, cached_partials[key])
+            if key in results:
+                result = results[key]
+                _merge_partial(partial, result["partial"])
+                checkpoint[key]["offset"] = result["offset"]
                 if self.verbose:
-                    print(f"⚠️ Error reading {session_file}: {e}")
+                    for warning in result["warnings"]:
+                        print(warning)
+            checkpoint[key]["partial"] = _partial_to_json(partial)
+            _merge_partial(self.patterns, partial)
+
+        if checkpoint_path is not None:
+            self._save_checkpoint(checkpoint_path, checkpoint)
+
+        if self.verbose and cached_partials:
+            print(f"Reused checkpoint for {len(cached_partials)} session files")
 
-        self.patterns["total_sessions"] = len(self.sessions_data)
         return self.patterns
 
+    def _run_tasks(self, tasks: list[Tuple[str, int]], max_workers: Optional[int]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run per-file analysis tasks, in a process pool when worthwhile
+
+        Args:
+            tasks: List of (file path, starting byte offset)
+            max_workers: Maximum worker processes (None for CPU count)
+
+        Returns:
+            Mapping of file path to analysis result
+        """
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        workers = max(1, min(workers, len(tasks) // MIN_FILES_PER_WORKER))
+
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunksize = max(1, len(tasks) // (workers * 4))
+                    results = executor.map(_analyze_file, tasks, chunksize=chunksize)
+                    return {path: result for (path, _), result in zip(tasks, results)}
+            except (OSError, RuntimeError) as e:
+                # Process pools are unavailable in some sandboxes; fall back to serial
+                if self.verbose:
+                    print(f"⚠️ Parallel analysis unavailable, running serially: {e}")
+
+        return {path: _analyze_file((path, offset)) for path, offset in tasks}
+
+    def _load_checkpoint(self, checkpoint_path: Optional[Path]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load per-file analysis checkpoint
+
+        Args:
+            checkpoint_path: Checkpoint file path (None disables checkpointing)
+
+        Returns:
+            Mapping of file path to checkpoint entry
+        """
+        if checkpoint_path is None or not checkpoint_path.exists():
+            return {}
+
+        try:
+            with open(checkpoint_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            if self.verbose:
+                print(f"⚠️ Ignoring unreadable checkpoint {checkpoint_path}: {e}")
+            return {}
+
+        # Checkpoints depend on the analysis window; mismatches force a full run
+        if data.get("version") != CHECKPOINT_VERSION or data.get("days_back") != self.days_back:
+            return {}
+
+        return cast(Dict[str, Dict[str, Any]], data.get("files", {}))
+
+    def _save_checkpoint(self, checkpoint_path: Path, files: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Save per-file analysis checkpoint atomically
+
+        Args:
+            checkpoint_path: Checkpoint file path
+            files: Mapping of file path to checkpoint entry
+        """
+        data = {"version": CHECKPOINT_VERSION, "days_back": self.days_back, "files": files}
+        temp_path = checkpoint_path.with_name(f".{checkpoint_path.name}.tmp")
+
+        try:
+            checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, checkpoint_path)
+        except IOError as e:
+            if self.verbose:
+                print(f"⚠️ Failed to save checkpoint {checkpoint_path}: {e}")
+
     def _analyze_session(self, session: Dict[str, Any]):
         """
         Analyze individual session
@@ -112,82 +413,7 @@ class SessionAnalyzer:
         Args:
             session: Session data dictionary from Claude Code
         """
-        # Handle session summary format (current JSONL format)
-        if session.get("type") == "summary":
-            # Count session types by summary content
-            summary = cast(str, session.get("summary", "")).lower()
-
-            # Simple analysis of session summaries
-            if any(keyword in summary for keyword in ["error", "fail", "issue", "problem"]):
-                self.patterns["failed_sessions"] = cast(int, self.patterns["failed_sessions"]) + 1
-                tool_failures = cast(defaultdict[str, int], self.patterns["tool_failures"])
-                tool_failures["session_error_in_summary"] += 1
-
-            # Extract potential tool usage from summary
-            tool_keywords = [
-                "test",
-                "build",
-                "deploy",
-                "analyze",
-                "create",
-                "update",
-                "fix",
-                "check",
-            ]
-            tool_usage = cast(defaultdict[str, int], self.patterns["tool_usage"])
-            for keyword in tool_keywords:
-                if keyword in summary:
-                    tool_usage[f"summary_{keyword}"] += 1
-
-            # Track session summaries as events
-            self.patterns["total_events"] = cast(int, self.patterns["total_events"]) + 1
-            return
-
-        # Handle detailed event format (legacy session-*.json format)
-        events = cast(list[Dict[str, Any]], session.get("events", []))
-        self.patterns["total_events"] = cast(int, self.patterns["total_events"]) + len(events)
-
-        has_error = False
-
-        for event in events:
-            event_type = event.get("type", "unknown")
-
-            # Extract tool usage patterns
-            if event_type == "tool_call":
-                tool_name = cast(str, event.get("toolName", "unknown")).split("(")[0]
-                tool_usage = cast(defaultdict[str, int], self.patterns["tool_usage"])
-                tool_usage[tool_name] += 1
-
-            # Tool error patterns
-            elif event_type == "tool_error":
-                error_msg = cast(str, event.get("error", "unknown error"))
-                tool_failures = cast(defaultdict[str, int], self.patterns["tool_failures"])
-                tool_failures[error_msg[:50]] += 1  # First 50 characters
-                has_error = True
-
-            # Permission requests
-            elif event_type == "permission_request":
-                perm_type = cast(str, event.get("permission_type", "unknown"))
-                perm_requests = cast(defaultdict[str, int], self.patterns["permission_requests"])
-                perm_requests[perm_type] += 1
-
-            # Hook failures
-            elif event_type == "hook_failure":
-                hook_name = cast(str, event.get("hook_name", "unknown"))
-                hook_failures = cast(defaultdict[str, int], self.patterns["hook_failures"])
-                hook_failures[hook_name] += 1
-                has_error = True
-
-            # Command usage
-            if "command" in event:
-                cmd_str = cast(str, event.get("command", "")).split()
-                if cmd_str:
-                    cmd = cmd_str[0]
-                    cmd_freq = cast(defaultdict[str, int], self.patterns["command_frequency"])
-                    cmd_freq[cmd] += 1
-
-        if has_error:
-            self.patterns["failed_sessions"] = cast(int, self.patterns["failed_sessions"]) + 1
+        _analyze_session_into(self.patterns, session)
 
     def generate_report(self) -> str:
         """
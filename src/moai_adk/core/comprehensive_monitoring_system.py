@@ -19,7 +19,7 @@ import logging
 import statistics
 import threading
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -28,6 +28,8 @@ from typing import Any, Callable, Dict, List, Optional, Union
 
 import psutil
 
+from moai_adk.core.performance.metrics_store import TimeSortedBuffer, merge_newest
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -162,7 +164,9 @@ class MetricsCollector:
     def __init__(self, buffer_size: int = 10000, retention_hours: int = 24):
         self.buffer_size = buffer_size
         self.retention_hours = retention_hours
-        self.metrics_buffer: Dict[MetricType, deque] = defaultdict(lambda: deque(maxlen=buffer_size))
+        self.metrics_buffer: Dict[MetricType, TimeSortedBuffer[MetricData]] = defaultdict(
+            lambda: TimeSortedBuffer(maxlen=buffer_size)
+        )
         self.aggregated_metrics: Dict[MetricType, Dict[str, Any]] = defaultdict(dict)
         self._lock = threading.Lock()
         self._last_cleanup = datetime.now()
@@ -206,9 +210,8 @@ class MetricsCollector:
 
         cutoff_time = now - timedelta(hours=self.retention_hours)
 
-        for metric_type in self.metrics_buffer:
-            while self.metrics_buffer[metric_type] and self.metrics_buffer[metric_type][0].timestamp < cutoff_time:
-                self.metrics_buffer[metric_type].popleft()
+        for buffer in self.metrics_buffer.values():
+            buffer.evict_before(cutoff_time)
 
         self._last_cleanup = now
 
@@ -219,29 +222,19 @@ class MetricsCollector:
         end_time: Optional[datetime] = None,
         limit: Optional[int] = None,
     ) -> List[MetricData]:
-        """Get metrics with optional filtering"""
+        """
+        Get metrics with optional filtering
+
+        Buffers are time-sorted, so the range is found by binary search and
+        buffers are merged newest-first up to ``limit`` without a full sort.
+        """
         with self._lock:
             if metric_type:
-                metrics = list(self.metrics_buffer[metric_type])
+                buffers = [self.metrics_buffer[metric_type]] if metric_type in self.metrics_buffer else []
             else:
-                metrics = []
-                for mlist in self.metrics_buffer.values():
-                    metrics.extend(mlist)
-
-            # Filter by time range
-            if start_time:
-                metrics = [m for m in metrics if m.timestamp >= start_time]
-            if end_time:
-                metrics = [m for m in metrics if m.timestamp <= end_time]
-
-            # Sort by timestamp (newest first)
-            metrics.sort(key=lambda m: m.timestamp, reverse=True)
-
-            # Apply limit
-            if limit:
-                metrics = metrics[:limit]
+                buffers = list(self.metrics_buffer.values())
 
-            return metrics
+            return merge_newest(buffers, start=start_time, end=end_time, limit=limit)
 
     def get_statistics(self, metric_type: MetricType, minutes: int = 60) -> Dict[str, Any]:
         """Get statistical summary for a metric type"""
@@ -7,6 +7,8 @@ patterns from across the codebase into a single, robust implementation.
 Features:
 - Thread-safe singleton with double-checked locking
 - Lazy loading with in-memory caching
+- Stat-throttled change detection and memoized key lookups
+- Parsed snapshot in `.moai/cache/config/` for fast cold starts
 - Atomic writes with backup creation
 - Schema validation support
 - Smart defaults with auto-detection
@@ -28,14 +30,19 @@ Usage:
     >>> config.save()
 """
 
+import hashlib
 import json
 import logging
+import marshal
+import os
 import shutil
+import tempfile
 import threading
+import time
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union, cast
 
 try:
     import yaml
@@ -46,6 +53,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between stat() calls when checking the config file for changes
+CONFIG_STAT_INTERVAL = 1.0
+CONFIG_STAT_INTERVAL_ENV = "MOAI_CONFIG_STAT_INTERVAL"
+
+# Bump when the snapshot layout changes; marshal.version covers the interpreter format
+SNAPSHOT_FORMAT = 1
+
+_MISSING = object()
+
 
 class UnifiedConfigManager:
     """
@@ -62,14 +78,20 @@ class UnifiedConfigManager:
         _config: Cached configuration dictionary
         _lock: Thread lock for singleton pattern
         _config_path: Path to configuration file
-        _last_modified: Last modification timestamp for cache invalidation
+        _signature: (mtime_ns, size) of the loaded file for cache invalidation
+        _last_checked: Monotonic time of the last change check
+        _lookup_cache: Memoized results of dot-notation lookups
+        stat_interval: Minimum seconds between change checks
     """
 
     _instance: Optional["UnifiedConfigManager"] = None
     _config: Dict[str, Any] = {}
     _lock = threading.Lock()
     _config_path: Optional[Path] = None
-    _last_modified: Optional[float] = None
+    _signature: Optional[Tuple[int, int]] = None
+    _last_checked: float = 0.0
+    _lookup_cache: Dict[str, Any] = {}
+    stat_interval: float = CONFIG_STAT_INTERVAL
 
     def __new__(cls, config_path: Optional[Union[str, Path]] = None):
         """
@@ -114,6 +136,15 @@ class UnifiedConfigManager:
                 # Default to YAML for new projects
                 self._config_path = yaml_path if YAML_AVAILABLE else json_path
 
+        interval = os.environ.get(CONFIG_STAT_INTERVAL_ENV)
+        if interval:
+            try:
+                self.stat_interval = float(interval)
+            except ValueError:
+                logger.warning(f"Ignoring invalid {CONFIG_STAT_INTERVAL_ENV}: {interval}")
+
+        self._lookup_cache = {}
+
         # Load configuration
         self._load_config()
 
@@ -121,34 +152,41 @@ class UnifiedConfigManager:
         """
         Load configuration from file with caching.
 
-        Implements cache invalidation based on file modification time.
+        Implements cache invalidation based on file modification time and size.
         Falls back to default configuration if file doesn't exist.
         Supports both YAML (preferred) and JSON (legacy) formats.
+
+        The parsed configuration is also written to a snapshot (see
+        ``snapshot_path``), so other processes can skip parsing while the file
+        is unchanged.
         """
+        self._last_checked = time.monotonic()
         try:
-            # Check if file exists
-            if not self._config_path.exists():
+            try:
+                stat = self._config_path.stat()
+            except FileNotFoundError:
                 logger.warning(f"Config file not found: {self._config_path}")
-                self._config = self._get_default_config()
+                self._set_config(self._get_default_config(), None)
                 return
 
             # Check cache validity
-            current_mtime = self._config_path.stat().st_mtime
-            if self._last_modified and current_mtime == self._last_modified:
-                # Cache is still valid
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._signature == signature:
                 return
 
-            # Load from file (auto-detect format)
-            with open(self._config_path, "r", encoding="utf-8") as f:
-                if self._config_path.suffix == ".yaml" or self._config_path.suffix == ".yml":
-                    if not YAML_AVAILABLE:
-                        raise ImportError("PyYAML is required for YAML config files. Install with: pip install pyyaml")
-                    self._config = yaml.safe_load(f) or {}
-                else:
-                    self._config = json.load(f)
+            config = self._load_snapshot(signature)
+            if config is None:
+                # Load from file (auto-detect format)
+                with open(self._config_path, "rb") as f:
+                    raw = f.read()
+                digest = hashlib.sha256(raw).hexdigest()
 
-            # Update cache timestamp
-            self._last_modified = current_mtime
+                config = self._load_snapshot(signature, digest)
+                if config is None:
+                    config = self._parse(raw.decode("utf-8"))
+                    self._write_snapshot(signature, digest, config)
+
+            self._set_config(config, signature)
 
             logger.debug(f"Loaded config from {self._config_path}")
 
@@ -159,7 +197,87 @@ class UnifiedConfigManager:
             UnicodeDecodeError,
         ) as e:
             logger.error(f"Failed to load config: {e}")
-            self._config = self._get_default_config()
+            self._set_config(self._get_default_config(), None)
+
+    def _parse(self, text: str) -> Dict[str, Any]:
+        """Parse config file contents according to the file extension."""
+        if self._config_path.suffix == ".yaml" or self._config_path.suffix == ".yml":
+            if not YAML_AVAILABLE:
+                raise ImportError("PyYAML is required for YAML config files. Install with: pip install pyyaml")
+            return yaml.safe_load(text) or {}
+        return json.loads(text)
+
+    def _set_config(self, config: Dict[str, Any], signature: Optional[Tuple[int, int]]) -> None:
+        self._config = config
+        self._signature = signature
+        self._lookup_cache = {}
+
+    @property
+    def snapshot_path(self) -> Path:
+        """
+        Path of the parsed-config snapshot.
+
+        For `.moai/config/<file>` this is `.moai/cache/config/<file>.snapshot`,
+        which project .gitignore files already exclude; config files outside
+        a `.moai/config` directory keep a hidden snapshot next to them.
+        """
+        config_path = cast(Path, self._config_path)
+        config_dir = config_path.parent
+        if config_dir.name == "config" and config_dir.parent.name == ".moai":
+            return config_dir.parent / "cache" / "config" / f"{config_path.name}.snapshot"
+        return config_path.with_name(f".{config_path.name}.snapshot")
+
+    def _load_snapshot(self, signature: Tuple[int, int], digest: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the snapshotted config if it matches the source file.
+
+        Without a digest the snapshot must match (mtime_ns, size); with one,
+        a matching content hash is enough (e.g. the file was only touched).
+        """
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                header, config = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(config, dict) or not isinstance(header, tuple) or len(header) != 5:
+            return None
+        if header[:2] != (SNAPSHOT_FORMAT, marshal.version):
+            return None
+        if digest is None:
+            return config if header[2:4] == signature else None
+        if header[4] != digest:
+            return None
+
+        self._write_snapshot(signature, digest, config)
+        return config
+
+    def _write_snapshot(self, signature: Tuple[int, int], digest: str, config: Dict[str, Any]) -> None:
+        """Atomically write the parsed config snapshot; failures only cost the next parse."""
+        try:
+            payload = marshal.dumps(((SNAPSHOT_FORMAT, marshal.version, *signature, digest), config))
+        except ValueError:
+            # Values marshal cannot encode (e.g. YAML timestamps); keep parsing instead
+            logger.debug("Config contains values that cannot be snapshotted")
+            return
+
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.snapshot_path.parent, prefix=self.snapshot_path.name)
+        except OSError as e:
+            logger.debug(f"Failed to write config snapshot: {e}")
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(temp_path, self.snapshot_path)
+        except OSError as e:
+            logger.debug(f"Failed to write config snapshot: {e}")
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -181,19 +299,26 @@ class UnifiedConfigManager:
         # Reload if file changed
         self._reload_if_modified()
 
-        # Navigate nested dict with dot notation
-        keys = key.split(".")
+        value = self._lookup_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._lookup(key)
+            self._lookup_cache[key] = value
+
+        return value if value is not None else default
+
+    def _lookup(self, key: str) -> Any:
+        """Navigate nested dicts with dot notation; None when the key is missing."""
         value = self._config
 
-        for k in keys:
+        for k in key.split("."):
             if isinstance(value, dict):
                 value = value.get(k)
                 if value is None:
-                    return default
+                    return None
             else:
-                return default
+                return None
 
-        return value if value is not None else default
+        return value
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -218,6 +343,7 @@ class UnifiedConfigManager:
 
         # Set value
         target[keys[-1]] = value
+        self._lookup_cache = {}
 
     def update(self, updates: Dict[str, Any], deep_merge: bool = True) -> None:
         """
@@ -235,6 +361,7 @@ class UnifiedConfigManager:
             self._config = self._deep_merge(self._config, updates)
         else:
             self._config.update(updates)
+        self._lookup_cache = {}
 
     def save(self, backup: bool = True) -> bool:
         """
@@ -274,8 +401,10 @@ class UnifiedConfigManager:
             # Atomic rename
             temp_path.replace(self._config_path)
 
-            # Update cache timestamp
-            self._last_modified = self._config_path.stat().st_mtime
+            # Update cache signature
+            stat = self._config_path.stat()
+            self._signature = (stat.st_mtime_ns, stat.st_size)
+            self._last_checked = time.monotonic()
 
             logger.info(f"Saved config to {self._config_path}")
             return True
@@ -300,14 +429,18 @@ class UnifiedConfigManager:
             logger.warning(f"Failed to create backup: {e}")
 
     def _reload_if_modified(self) -> None:
-        """Reload config if file has been modified."""
+        """Reload config if file has been modified, checking at most once per stat_interval."""
+        now = time.monotonic()
+        if now - self._last_checked < self.stat_interval:
+            return
+        self._last_checked = now
+
         try:
-            if self._config_path.exists():
-                current_mtime = self._config_path.stat().st_mtime
-                if self._last_modified is None or current_mtime != self._last_modified:
-                    self._load_config()
+            stat = self._config_path.stat()
         except OSError:
-            pass
+            return
+        if (stat.st_mtime_ns, stat.st_size) != self._signature:
+            self._load_config()
 
     @staticmethod
     def _deep_merge(base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -360,6 +493,7 @@ class UnifiedConfigManager:
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults without saving."""
         self._config = self._get_default_config()
+        self._lookup_cache = {}
 
 
 # Module-level singleton instance
@@ -17,15 +17,19 @@ Key Features:
 import asyncio
 import json
 import logging
+import sqlite3
 import time
 import uuid
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
+
+from .event_journal import EventJournal, ProcessedEventWindow
 
 # Import existing systems
 from .jit_enhanced_hook_manager import (
@@ -76,6 +80,7 @@ class MessageBrokerType(Enum):
     RABBITMQ = "rabbitmq"  # RabbitMQ message broker
     KAFKA = "kafka"  # Apache Kafka
     AWS_SQS = "aws_sqs"  # AWS SQS
+    SQLITE = "sqlite"  # Local SQLite database (WAL mode)
 
 
 @dataclass
@@ -172,6 +177,13 @@ class MessageBroker(ABC):
         """Publish event to topic"""
         pass
 
+    async def publish_nowait(self, topic: str, event: Event) -> bool:
+        """Publish event to topic without waiting for queue space
+
+        Brokers that never wait for space publish as usual.
+        """
+        return await self.publish(topic, event)
+
     @abstractmethod
     async def subscribe(self, topic: str, callback: Callable[[Event], None]) -> str:
         """Subscribe to topic with callback"""
@@ -198,48 +210,188 @@ class MessageBroker(ABC):
         pass
 
 
+class OverflowPolicy(Enum):
+    """What a publisher does when a bounded queue is full"""
+
+    BLOCK = "block"  # Wait for space (up to the publish timeout), then reject
+    REJECT = "reject"  # Fail the publish immediately
+
+
 class InMemoryMessageBroker(MessageBroker):
-    """In-memory message broker for development and testing"""
+    """In-memory message broker for development and testing
 
-    def __init__(self, max_queue_size: int = 10000):
+    Events published to a topic without subscribers stay in the topic queue
+    until a consumer takes them (see ``take``). Topics with subscribers are
+    delivered through one bounded buffer per subscription, drained by at most
+    one task per subscription. Full queues and buffers apply backpressure to
+    publishers instead of dropping events.
+    """
+
+    # Only this process publishes, so consumers never need to poll
+    poll_interval: Optional[float] = None
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        publish_timeout: float = 5.0,
+    ):
         self.max_queue_size = max_queue_size
-        self.queues: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_queue_size))
+        self.overflow_policy = overflow_policy
+        self.publish_timeout = publish_timeout
+        self.queues: Dict[str, deque] = defaultdict(deque)
         self.subscribers: Dict[str, List[tuple[str, Callable[[Event], None]]]] = defaultdict(list)
         self._lock = asyncio.Lock()
+        self._capacities: Dict[str, int] = {}
+        # Publishers waiting for space, per topic (FIFO)
+        self._space_waiters: Dict[str, deque] = defaultdict(deque)
+        # Per-subscription delivery buffer and its drain task
+        self._deliveries: Dict[str, asyncio.Queue] = {}
+        self._delivery_tasks: Dict[str, asyncio.Task] = {}
+        self._publish_listeners: List[Callable[[str], None]] = []
         self._stats = {
             "messages_published": 0,
             "messages_delivered": 0,
             "queues_created": 0,
             "active_subscriptions": 0,
             "failed_publishes": 0,
+            "blocked_publishes": 0,
+            "rejected_publishes": 0,
         }
 
+    def capacity(self, topic: str) -> int:
+        """Maximum number of queued events for a topic"""
+        return self._capacities.get(topic, self.max_queue_size)
+
+    def add_publish_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(topic)`` whenever an event is queued (wake-on-publish for consumers)"""
+        self._publish_listeners.append(listener)
+
+    def remove_publish_listener(self, listener: Callable[[str], None]) -> None:
+        """Remove a listener added with ``add_publish_listener``"""
+        if listener in self._publish_listeners:
+            self._publish_listeners.remove(listener)
+
+    async def _wait_for_space(self, topic: str, block: bool) -> bool:
+        """Wait (if allowed) until the topic queue has room"""
+        if len(self.queues[topic]) < self.capacity(topic):
+            return True
+        if not block:
+            return False
+
+        self._stats["blocked_publishes"] += 1
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.publish_timeout
+        while len(self.queues[topic]) >= self.capacity(topic):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            waiter = loop.create_future()
+            self._space_waiters[topic].append(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                if waiter in self._space_waiters[topic]:
+                    self._space_waiters[topic].remove(waiter)
+        return True
+
+    def _wake_space_waiter(self, topic: str) -> None:
+        waiters = self._space_waiters.get(topic)
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
     async def publish(self, topic: str, event: Event) -> bool:
-        """Publish event to topic"""
-        try:
-            async with self._lock:
-                if len(self.queues[topic]) >= self.max_queue_size:
-                    # Remove oldest message if queue is full
-                    self.queues[topic].popleft()
+        """Publish event to topic
 
-                self.queues[topic].append(event)
-                self._stats["messages_published"] += 1
+        Returns:
+            False if the event was rejected because the queue (or a
+            subscriber's buffer) stayed full
+        """
+        return await self._publish(topic, event, block=self.overflow_policy == OverflowPolicy.BLOCK)
 
-                # Notify subscribers
-                for sub_id, callback in self.subscribers[topic]:
-                    try:
-                        # Create task for async callback
-                        asyncio.create_task(self._safe_callback(callback, event))
-                        self._stats["messages_delivered"] += 1
-                    except Exception as e:
-                        logger.error(f"Error in subscriber callback: {e}")
+    async def publish_nowait(self, topic: str, event: Event) -> bool:
+        """Publish event to topic, rejecting it at once if the queue is full
+
+        For follow-up events published from event handlers: a handler waiting
+        for space holds the dispatcher slot that the queue's consumer needs.
+        """
+        return await self._publish(topic, event, block=False)
 
+    async def _publish(self, topic: str, event: Event, block: bool) -> bool:
+        try:
+            subscribers = list(self.subscribers[topic])
+            if subscribers:
+                delivered = [await self._deliver(sub_id, callback, event, block) for sub_id, callback in subscribers]
+                accepted = any(delivered)
+            else:
+                accepted = await self._wait_for_space(topic, block)
+                if accepted:
+                    self.queues[topic].append(event)
+                    for listener in list(self._publish_listeners):
+                        listener(topic)
+
+            if not accepted:
+                logger.warning(f"Queue {topic} is full; rejected event {event.event_id}")
+                self._stats["rejected_publishes"] += 1
+                self._stats["failed_publishes"] += 1
+                return False
+
+            self._stats["messages_published"] += 1
             return True
         except Exception as e:
             logger.error(f"Error publishing event to {topic}: {e}")
             self._stats["failed_publishes"] += 1
             return False
 
+    def take(self, topic: str) -> Optional[Event]:
+        """Remove and return the oldest queued event of a topic, or None if it is empty"""
+        queue = self.queues.get(topic)
+        if not queue:
+            return None
+        event = queue.popleft()
+        self._stats["messages_delivered"] += 1
+        self._wake_space_waiter(topic)
+        return event
+
+    async def _deliver(
+        self, subscription_id: str, callback: Callable[[Event], None], event: Event, block: bool
+    ) -> bool:
+        """Buffer an event for a subscriber and make sure its drain task runs"""
+        buffer = self._deliveries.get(subscription_id)
+        if buffer is None:
+            buffer = self._deliveries[subscription_id] = asyncio.Queue(maxsize=self.max_queue_size)
+
+        if buffer.full():
+            if not block:
+                return False
+            self._stats["blocked_publishes"] += 1
+            try:
+                await asyncio.wait_for(buffer.put(event), self.publish_timeout)
+            except asyncio.TimeoutError:
+                return False
+        else:
+            buffer.put_nowait(event)
+
+        task = self._delivery_tasks.get(subscription_id)
+        if task is None or task.done():
+            self._delivery_tasks[subscription_id] = asyncio.create_task(self._drain_deliveries(callback, buffer))
+        return True
+
+    async def _drain_deliveries(self, callback: Callable[[Event], None], buffer: asyncio.Queue) -> None:
+        """Run a subscriber's callback for each buffered event; exits when the buffer is empty"""
+        while True:
+            try:
+                event = buffer.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await self._safe_callback(callback, event)
+            self._stats["messages_delivered"] += 1
+
     async def _safe_callback(self, callback: Callable[[Event], None], event: Event) -> None:
         """Safely execute callback with error handling"""
         try:
@@ -260,6 +412,12 @@ class InMemoryMessageBroker(MessageBroker):
             self._stats["active_subscriptions"] += 1
         return subscription_id
 
+    def _drop_subscription(self, subscription_id: str) -> None:
+        self._deliveries.pop(subscription_id, None)
+        task = self._delivery_tasks.pop(subscription_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+
     async def unsubscribe(self, subscription_id: str) -> bool:
         """Unsubscribe from topic"""
         async with self._lock:
@@ -270,6 +428,7 @@ class InMemoryMessageBroker(MessageBroker):
                     (sub_id, callback) for sub_id, callback in subscribers if sub_id != subscription_id
                 ]
                 if len(self.subscribers[topic]) < original_len:
+                    self._drop_subscription(subscription_id)
                     self._stats["active_subscriptions"] -= 1
                     return True
         return False
@@ -277,8 +436,9 @@ class InMemoryMessageBroker(MessageBroker):
     async def create_queue(self, queue_name: str, config: Dict[str, Any]) -> bool:
         """Create message queue with configuration"""
         async with self._lock:
-            # Queue is created automatically on first use
-            self.queues[queue_name] = deque(maxlen=config.get("max_size", self.max_queue_size))
+            # Queue is created automatically on first use; keep events already queued
+            self._capacities[queue_name] = config.get("max_size", self.max_queue_size)
+            self.queues.setdefault(queue_name, deque())
             self._stats["queues_created"] += 1
         return True
 
@@ -287,8 +447,12 @@ class InMemoryMessageBroker(MessageBroker):
         async with self._lock:
             if queue_name in self.queues:
                 del self.queues[queue_name]
-            if queue_name in self.subscribers:
-                del self.subscribers[queue_name]
+            self._capacities.pop(queue_name, None)
+            for sub_id, _ in self.subscribers.pop(queue_name, []):
+                self._drop_subscription(sub_id)
+            for waiter in self._space_waiters.pop(queue_name, ()):
+                if not waiter.done():
+                    waiter.set_result(None)
         return True
 
     def get_stats(self) -> Dict[str, Any]:
@@ -437,6 +601,443 @@ class RedisMessageBroker(MessageBroker):
         return self._stats
 
 
+def _event_to_record(event: Event) -> Dict[str, Any]:
+    """Serialize an event including the fields of its specialized subclass"""
+    data = event.to_dict()
+    if isinstance(event, HookExecutionEvent):
+        data["kind"] = "hook_execution"
+        data["hook_path"] = event.hook_path
+        data["hook_event_type"] = event.hook_event_type.value if event.hook_event_type else None
+        data["execution_context"] = event.execution_context
+        data["isolation_level"] = event.isolation_level.value
+    elif isinstance(event, WorkflowEvent):
+        data["kind"] = "workflow"
+        data["workflow_id"] = event.workflow_id
+        data["step_id"] = event.step_id
+        data["workflow_definition"] = event.workflow_definition
+        data["execution_state"] = event.execution_state
+    return data
+
+
+def _event_from_record(data: Dict[str, Any]) -> Event:
+    """Inverse of ``_event_to_record``"""
+    event = Event.from_dict(data)
+    base_fields = {f.name: getattr(event, f.name) for f in fields(Event)}
+    kind = data.get("kind")
+    if kind == "hook_execution":
+        return HookExecutionEvent(
+            **base_fields,
+            hook_path=data.get("hook_path", ""),
+            hook_event_type=HookEvent(data["hook_event_type"]) if data.get("hook_event_type") else None,
+            execution_context=data.get("execution_context", {}),
+            isolation_level=ResourceIsolationLevel(data.get("isolation_level", ResourceIsolationLevel.SHARED.value)),
+        )
+    if kind == "workflow":
+        return WorkflowEvent(
+            **base_fields,
+            workflow_id=data.get("workflow_id", ""),
+            step_id=data.get("step_id", ""),
+            workflow_definition=data.get("workflow_definition", {}),
+            execution_state=data.get("execution_state", {}),
+        )
+    return event
+
+
+# SQLite lock waits run on the event loop thread, so they are kept short and
+# locked writes are retried asynchronously instead (seconds)
+SQLITE_BUSY_TIMEOUT = 0.05
+SQLITE_BUSY_RETRY_INTERVAL = 0.02
+
+
+def _is_busy(error: Exception) -> bool:
+    """Whether an SQLite error means another connection holds the database lock"""
+    return isinstance(error, sqlite3.OperationalError) and "locked" in str(error)
+
+
+class SQLiteMessageBroker(MessageBroker):
+    """Durable message broker on a local SQLite database in WAL mode
+
+    A single-host alternative to ``RedisMessageBroker``: queued events survive
+    crashes and several processes can share one database file.
+
+    - Publishes issued in the same event loop iteration are written in one
+      transaction.
+    - Delivery is at-least-once: ``take`` leases the next event (ordered by
+      priority, then enqueue time) for ``visibility_timeout`` seconds, and the
+      consumer must ``ack`` it. Unacknowledged events become visible again,
+      so events held by a crashed consumer are redelivered.
+    - Subscribers compete for the events of a topic, also across processes,
+      and are acked automatically when the callback returns.
+    - Lock waits never stall the event loop for long: a locked publish batch
+      is retried asynchronously for up to ``publish_timeout`` seconds, a
+      locked ``take`` reports no event (consumers retry on their next poll)
+      and locked acknowledgements are retried by the next ``take``.
+    """
+
+    # Other processes may enqueue events; consumers re-check this often (seconds)
+    poll_interval = 0.5
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_queue_size: int = 100000,
+        visibility_timeout: float = 60.0,
+        busy_timeout: float = SQLITE_BUSY_TIMEOUT,
+        publish_timeout: float = 30.0,
+    ):
+        self.db_path = Path(db_path)
+        self.max_queue_size = max_queue_size
+        self.visibility_timeout = visibility_timeout
+        self.publish_timeout = publish_timeout
+        self.subscribers: Dict[str, List[tuple[str, Callable[[Event], None]]]] = defaultdict(list)
+        self._capacities: Dict[str, int] = {}
+        # id(leased event) -> (message row id, event); every take returns a new
+        # Event object, so deliveries sharing an event id keep separate leases
+        self._leases: Dict[int, tuple[int, Event]] = {}
+        self._pending_acks: List[int] = []  # acked row ids not yet deleted (database was locked)
+        self._batch: List[tuple[str, Event, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._consumer_tasks: Dict[str, asyncio.Task] = {}
+        self._consumer_wakeups: Dict[str, asyncio.Event] = {}
+        self._publish_listeners: List[Callable[[str], None]] = []
+        self._stats = {
+            "messages_published": 0,
+            "messages_delivered": 0,
+            "messages_acked": 0,
+            "messages_redelivered": 0,
+            "queues_created": 0,
+            "active_subscriptions": 0,
+            "failed_publishes": 0,
+            "rejected_publishes": 0,
+            "publish_batches": 0,
+        }
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                queue TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                enqueued_at REAL NOT NULL,
+                visible_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                event_id TEXT NOT NULL,
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_messages_dequeue ON messages (queue, priority, enqueued_at);
+            CREATE TABLE IF NOT EXISTS queues (
+                name TEXT PRIMARY KEY,
+                max_size INTEGER NOT NULL
+            );
+            """
+        )
+        for name, max_size in self._conn.execute("SELECT name, max_size FROM queues"):
+            self._capacities[name] = max_size
+        # Setup above may wait for other processes; later calls run on the event loop
+        self._conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout * 1000)}")
+
+    def capacity(self, topic: str) -> int:
+        """Maximum number of stored events for a topic"""
+        return self._capacities.get(topic, self.max_queue_size)
+
+    def add_publish_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(topic)`` whenever this process stores an event"""
+        self._publish_listeners.append(listener)
+
+    def remove_publish_listener(self, listener: Callable[[str], None]) -> None:
+        """Remove a listener added with ``add_publish_listener``"""
+        if listener in self._publish_listeners:
+            self._publish_listeners.remove(listener)
+
+    async def publish(self, topic: str, event: Event) -> bool:
+        """Publish event to topic (batched with other publishes of the same loop iteration)"""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._batch.append((topic, event, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_burst())
+        return await future
+
+    async def publish_many(self, topic: str, events: List[Event]) -> List[bool]:
+        """Publish several events in one transaction"""
+        return list(await asyncio.gather(*(self.publish(topic, event) for event in events)))
+
+    async def _flush_after_burst(self) -> None:
+        # Let every publisher scheduled in this iteration join the batch
+        await asyncio.sleep(0)
+        # Publishes issued while a locked batch is retried form the next batch
+        while self._batch:
+            batch, self._batch = self._batch, []
+            results = await self._write_batch_when_unlocked([(topic, event) for topic, event, _ in batch])
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+            for topic in {topic for (topic, _, _), result in zip(batch, results) if result}:
+                for listener in list(self._publish_listeners):
+                    listener(topic)
+                self._wake_consumers(topic)
+
+    async def _write_batch_when_unlocked(self, batch: List[tuple[str, Event]]) -> List[bool]:
+        """Write a batch, retrying without blocking the event loop while the database is locked"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.publish_timeout
+        while True:
+            results = self._write_batch(batch)
+            if results is not None:
+                return results
+            if loop.time() >= deadline:
+                logger.error(f"SQLite broker database stayed locked; failed {len(batch)} publishes")
+                self._stats["failed_publishes"] += len(batch)
+                return [False] * len(batch)
+            await asyncio.sleep(SQLITE_BUSY_RETRY_INTERVAL)
+
+    def _write_batch(self, batch: List[tuple[str, Event]]) -> Optional[List[bool]]:
+        """Insert events in a single transaction, rejecting those that overflow their queue
+
+        Returns:
+            Per-event results, or None if the database is locked and nothing was written
+        """
+        if not batch:
+            return []
+        results: List[bool] = []
+        now = time.time()
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            sizes: Dict[str, int] = {}
+            rows = []
+            for topic, event in batch:
+                if topic not in sizes:
+                    count = self._conn.execute("SELECT COUNT(*) FROM messages WHERE queue = ?", (topic,))
+                    sizes[topic] = count.fetchone()[0]
+                if sizes[topic] >= self.capacity(topic):
+                    logger.warning(f"Queue {topic} is full; rejected event {event.event_id}")
+                    results.append(False)
+                    continue
+                sizes[topic] += 1
+                rows.append(
+                    (topic, event.priority.value, now, now, event.event_id, json.dumps(_event_to_record(event)))
+                )
+                results.append(True)
+            self._conn.executemany(
+                "INSERT INTO messages (queue, priority, enqueued_at, visible_at, event_id, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute("COMMIT")
+        except Exception as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            if _is_busy(e):
+                return None
+            logger.error(f"Error publishing events to SQLite broker: {e}")
+            self._stats["failed_publishes"] += len(batch)
+            return [False] * len(batch)
+
+        accepted = sum(results)
+        self._stats["messages_published"] += accepted
+        self._stats["rejected_publishes"] += len(results) - accepted
+        self._stats["failed_publishes"] += len(results) - accepted
+        self._stats["publish_batches"] += 1
+        return results
+
+    def take(self, topic: str) -> Optional[Event]:
+        """Lease the next visible event of a topic, or return None if there is none
+
+        The event must be acknowledged with ``ack`` within the visibility
+        timeout, otherwise it is delivered again.
+        """
+        self._flush_acks()
+        now = time.time()
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            row = self._conn.execute(
+                "SELECT id, attempts, payload FROM messages WHERE queue = ? AND visible_at <= ? "
+                "ORDER BY priority, enqueued_at LIMIT 1",
+                (topic, now),
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE messages SET visible_at = ?, attempts = attempts + 1 WHERE id = ?",
+                    (now + self.visibility_timeout, row[0]),
+                )
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            if not _is_busy(e):
+                logger.error(f"Error taking event from {topic}: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        message_id, attempts, payload = row
+        event = _event_from_record(json.loads(payload))
+        self._leases[id(event)] = (message_id, event)
+        self._stats["messages_delivered"] += 1
+        if attempts:
+            self._stats["messages_redelivered"] += 1
+        return event
+
+    def _release_lease(self, event: Event) -> Optional[int]:
+        """Drop the lease of an event returned by ``take`` and get its message row id"""
+        lease = self._leases.pop(id(event), None)
+        return None if lease is None else lease[0]
+
+    def ack(self, event: Event) -> bool:
+        """Acknowledge a leased event so it is not delivered again"""
+        message_id = self._release_lease(event)
+        if message_id is None:
+            return False
+        self._pending_acks.append(message_id)
+        self._flush_acks()
+        self._stats["messages_acked"] += 1
+        return True
+
+    def _flush_acks(self) -> None:
+        """Delete acknowledged events, keeping them for the next attempt while the database is locked"""
+        if not self._pending_acks:
+            return
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.executemany("DELETE FROM messages WHERE id = ?", [(row_id,) for row_id in self._pending_acks])
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            if _is_busy(e):
+                return
+            # The leases expire, so these events are delivered again
+            logger.error(f"Error acknowledging events: {e}")
+        self._pending_acks.clear()
+
+    def nack(self, event: Event) -> bool:
+        """Release a leased event for immediate redelivery"""
+        message_id = self._release_lease(event)
+        if message_id is None:
+            return False
+        try:
+            self._conn.execute("UPDATE messages SET visible_at = ? WHERE id = ?", (time.time(), message_id))
+        except sqlite3.Error as e:
+            # The lease expires, so the event is still delivered again
+            if not _is_busy(e):
+                logger.error(f"Error releasing event {event.event_id}: {e}")
+            return False
+        return True
+
+    def _wake_consumers(self, topic: str) -> None:
+        for sub_id, _ in self.subscribers.get(topic, ()):
+            wakeup = self._consumer_wakeups.get(sub_id)
+            if wakeup is not None:
+                wakeup.set()
+
+    async def _consume(self, topic: str, callback: Callable[[Event], None], wakeup: asyncio.Event) -> None:
+        """Deliver events of a topic to one subscriber until unsubscribed"""
+        while True:
+            event = self.take(topic)
+            if event is None:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+                continue
+            try:
+                result = callback(event)  # type: ignore[func-returns-value]
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error in event callback: {e}")
+                self.nack(event)
+            else:
+                self.ack(event)
+
+    async def subscribe(self, topic: str, callback: Callable[[Event], None]) -> str:
+        """Subscribe to topic with callback (competing consumers)"""
+        subscription_id = str(uuid.uuid4())
+        wakeup = asyncio.Event()
+        wakeup.set()
+        self._consumer_wakeups[subscription_id] = wakeup
+        self.subscribers[topic].append((subscription_id, callback))
+        self._consumer_tasks[subscription_id] = asyncio.create_task(self._consume(topic, callback, wakeup))
+        self._stats["active_subscriptions"] += 1
+        return subscription_id
+
+    async def unsubscribe(self, subscription_id: str) -> bool:
+        """Unsubscribe from topic"""
+        for topic, subscribers in self.subscribers.items():
+            remaining = [(sub_id, callback) for sub_id, callback in subscribers if sub_id != subscription_id]
+            if len(remaining) < len(subscribers):
+                self.subscribers[topic] = remaining
+                await self._stop_consumer(subscription_id)
+                self._stats["active_subscriptions"] -= 1
+                return True
+        return False
+
+    async def _stop_consumer(self, subscription_id: str) -> None:
+        self._consumer_wakeups.pop(subscription_id, None)
+        task = self._consumer_tasks.pop(subscription_id, None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def create_queue(self, queue_name: str, config: Dict[str, Any]) -> bool:
+        """Create message queue with configuration"""
+        try:
+            max_size = config.get("max_size", self.max_queue_size)
+            self._conn.execute(
+                "INSERT INTO queues (name, max_size) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET max_size = excluded.max_size",
+                (queue_name, max_size),
+            )
+            self._capacities[queue_name] = max_size
+            self._stats["queues_created"] += 1
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error creating SQLite queue {queue_name}: {e}")
+            return False
+
+    async def delete_queue(self, queue_name: str) -> bool:
+        """Delete message queue and its stored events"""
+        try:
+            for sub_id, _ in self.subscribers.pop(queue_name, []):
+                await self._stop_consumer(sub_id)
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM messages WHERE queue = ?", (queue_name,))
+            self._conn.execute("DELETE FROM queues WHERE name = ?", (queue_name,))
+            self._conn.execute("COMMIT")
+            self._capacities.pop(queue_name, None)
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting SQLite queue {queue_name}: {e}")
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            return False
+
+    async def close(self) -> None:
+        """Stop subscribers, flush pending publishes and acks and close the database"""
+        for subscription_id in list(self._consumer_tasks):
+            await self._stop_consumer(subscription_id)
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+        self._flush_acks()
+        self._conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get message broker statistics"""
+        queued = dict(self._conn.execute("SELECT queue, COUNT(*) FROM messages GROUP BY queue").fetchall())
+        return {
+            **self._stats,
+            "queue_count": len(set(queued) | set(self._capacities)),
+            "total_queued_messages": sum(queued.values()),
+            "leased_messages": len(self._leases),
+        }
+
+
 class ResourcePool:
     """Resource pool for hook execution with isolation"""
 
@@ -632,6 +1233,160 @@ class EventProcessor:
         }
 
 
+# Queue per priority class, in dispatch order
+PRIORITY_QUEUES: Dict[EventPriority, str] = {
+    EventPriority.CRITICAL: "system_events",
+    EventPriority.HIGH: "hook_execution_high",
+    EventPriority.NORMAL: "hook_execution_normal",
+    EventPriority.LOW: "hook_execution_low",
+    EventPriority.BULK: "analytics",
+}
+
+# Events taken from each class per dispatch round (weighted fair draining)
+DISPATCH_WEIGHTS: Dict[EventPriority, int] = {
+    EventPriority.CRITICAL: 8,
+    EventPriority.HIGH: 4,
+    EventPriority.NORMAL: 2,
+    EventPriority.LOW: 1,
+    EventPriority.BULK: 1,
+}
+
+# Maximum events in flight per class (NORMAL follows max_concurrent_hooks)
+PRIORITY_CONCURRENCY_LIMITS: Dict[EventPriority, int] = {
+    EventPriority.CRITICAL: 4,
+    EventPriority.HIGH: 4,
+    EventPriority.NORMAL: 10,
+    EventPriority.LOW: 2,
+    EventPriority.BULK: 1,
+}
+
+# Journal records appended within this window share one write + fsync (seconds)
+JOURNAL_FLUSH_DELAY = 0.05
+
+
+class PriorityDispatcher:
+    """Event-driven dispatcher draining the priority queues of a local broker
+
+    Sleeps until an event is published or an in-flight event finishes, then
+    drains the queues in weighted rounds from CRITICAL to BULK so that lower
+    classes still make progress under sustained high-priority load. Each class
+    has its own concurrency limit; events beyond it stay queued, which in turn
+    makes publishers wait once the queue is full.
+
+    Brokers with acknowledgements (SQLite) get each event acked after its
+    handler succeeds and released for redelivery when it raises. Brokers
+    shared with other processes are also re-checked every ``poll_interval``.
+    """
+
+    def __init__(
+        self,
+        broker: Union[InMemoryMessageBroker, SQLiteMessageBroker],
+        handler: Callable[[Event], Any],
+        queues: Optional[Dict[EventPriority, str]] = None,
+        weights: Optional[Dict[EventPriority, int]] = None,
+        concurrency_limits: Optional[Dict[EventPriority, int]] = None,
+    ):
+        self.broker = broker
+        self.handler = handler
+        self.queues = queues or dict(PRIORITY_QUEUES)
+        self.weights = {**DISPATCH_WEIGHTS, **(weights or {})}
+        self.concurrency_limits = {**PRIORITY_CONCURRENCY_LIMITS, **(concurrency_limits or {})}
+        self._wakeup = asyncio.Event()
+        self._in_flight: Dict[EventPriority, int] = defaultdict(int)
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats: Dict[str, Any] = {
+            "events_dispatched": 0,
+            "dispatch_rounds": 0,
+            "by_priority": defaultdict(int),
+            "max_in_flight": 0,
+        }
+
+    def _on_publish(self, topic: str) -> None:
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        """Dispatch events until cancelled"""
+        self.broker.add_publish_listener(self._on_publish)
+        self._wakeup.set()  # Drain anything queued before the dispatcher started
+        poll_interval = self.broker.poll_interval
+        try:
+            while True:
+                if poll_interval is None:
+                    await self._wakeup.wait()
+                else:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                self._wakeup.clear()
+                self.dispatch_ready()
+        finally:
+            self.broker.remove_publish_listener(self._on_publish)
+            for task in list(self._tasks):
+                task.cancel()
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def dispatch_ready(self) -> int:
+        """Start handlers for every queued event that fits the concurrency limits
+
+        Returns:
+            Number of events dispatched
+        """
+        dispatched = 0
+        progress = True
+        while progress:
+            progress = False
+            self._stats["dispatch_rounds"] += 1
+            for priority, queue_name in self.queues.items():
+                limit = self.concurrency_limits.get(priority, 1)
+                for _ in range(self.weights.get(priority, 1)):
+                    if self._in_flight[priority] >= limit:
+                        break
+                    event = self.broker.take(queue_name)
+                    if event is None:
+                        break
+                    self._start(priority, event)
+                    dispatched += 1
+                    progress = True
+        return dispatched
+
+    def _start(self, priority: EventPriority, event: Event) -> None:
+        self._in_flight[priority] += 1
+        self._stats["events_dispatched"] += 1
+        self._stats["by_priority"][priority.name] += 1
+        self._stats["max_in_flight"] = max(self._stats["max_in_flight"], sum(self._in_flight.values()))
+
+        task = asyncio.create_task(self._run_handler(priority, event))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_handler(self, priority: EventPriority, event: Event) -> None:
+        try:
+            result = self.handler(event)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            logger.error(f"Error dispatching event {event.event_id}: {e}")
+            if isinstance(self.broker, SQLiteMessageBroker):
+                self.broker.nack(event)
+        else:
+            if isinstance(self.broker, SQLiteMessageBroker):
+                self.broker.ack(event)
+        finally:
+            self._in_flight[priority] -= 1
+            # A slot freed up; queued events of this class may now run
+            self._wakeup.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get dispatcher statistics"""
+        return {
+            **self._stats,
+            "by_priority": dict(self._stats["by_priority"]),
+            "in_flight": {priority.name: count for priority, count in self._in_flight.items() if count},
+        }
+
+
 class EventDrivenHookSystem:
     """
     Event-Driven Hook System Architecture
@@ -675,14 +1430,30 @@ class EventDrivenHookSystem:
         # Initialize event processor
         self.event_processor = EventProcessor(self.resource_pool)
 
+        # Wake-on-publish dispatcher (brokers with consumable queues only)
+        self._dispatcher: Optional[PriorityDispatcher] = None
+        if isinstance(self.message_broker, (InMemoryMessageBroker, SQLiteMessageBroker)):
+            self._dispatcher = PriorityDispatcher(
+                self.message_broker,
+                self._dispatch_event,
+                concurrency_limits={EventPriority.NORMAL: max_concurrent_hooks},
+            )
+
         # System state
         self._running = False
         self._startup_time = datetime.now()
         self._event_loops: List[asyncio.Task] = []
+        self._dispatched_events = 0
 
-        # Event persistence
+        # Event persistence: in-memory state backed by an append-only journal
         self._pending_events: Dict[str, Event] = {}
-        self._processed_events: Set[str] = set()
+        self._processed_events = ProcessedEventWindow()
+        self._journal: Optional[EventJournal] = None
+        self._journal_flush_handle: Optional[asyncio.TimerHandle] = None
+        # Journal writes and fsyncs run in order on one thread, off the event loop
+        self._journal_writer: Optional[ThreadPoolExecutor] = None
+        self._journal_write: Optional[asyncio.Future] = None
+        self._duplicate_events_skipped = 0
 
         # System metrics
         self._system_metrics = {
@@ -697,6 +1468,8 @@ class EventDrivenHookSystem:
         # Setup persistence directory
         if self.enable_persistence:
             self.persistence_path.mkdir(parents=True, exist_ok=True)
+            self._journal = EventJournal(self.persistence_path / "journal")
+            self._journal_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-journal")
 
     def _create_message_broker(self) -> MessageBroker:
         """Create message broker based on type"""
@@ -704,6 +1477,8 @@ class EventDrivenHookSystem:
             return InMemoryMessageBroker()
         elif self.message_broker_type == MessageBrokerType.REDIS:
             return RedisMessageBroker(self.redis_url)
+        elif self.message_broker_type == MessageBrokerType.SQLITE:
+            return SQLiteMessageBroker(self.persistence_path / "broker.db")
         else:
             logger.warning(f"Message broker {self.message_broker_type} not implemented, using in-memory")
             return InMemoryMessageBroker()
@@ -726,6 +1501,10 @@ class EventDrivenHookSystem:
             # Create message queues for different event types
             await self._setup_message_queues()
 
+            # Hand recovered events back to a broker that does not keep them itself
+            if self.enable_persistence and isinstance(self.message_broker, InMemoryMessageBroker):
+                await self._requeue_recovered_events()
+
             # Start event processing loops
             await self._start_event_loops()
 
@@ -755,6 +1534,15 @@ class EventDrivenHookSystem:
             # Persist pending events if enabled
             if self.enable_persistence:
                 await self._persist_events()
+                if self._journal:
+                    self._journal.close()
+
+            # Release broker resources (e.g. the SQLite connection)
+            close = getattr(self.message_broker, "close", None)
+            if close is not None:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
 
             self._running = False
             logger.info("Event-Driven Hook System stopped")
@@ -831,39 +1619,32 @@ class EventDrivenHookSystem:
 
     async def _event_processing_loop(self) -> None:
         """Main event processing loop"""
-        logger.info("Starting event processing loop")
-
-        while self._running:
-            try:
-                # Process events from different queues based on priority
-                await self._process_events_by_priority()
-                await asyncio.sleep(0.1)  # Prevent busy waiting
-            except Exception as e:
-                logger.error(f"Error in event processing loop: {e}")
-                await asyncio.sleep(1)
-
-    async def _process_events_by_priority(self) -> None:
-        """Process events by priority order"""
-        # Process critical system events first
-        await self._process_queue_events("system_events", EventPriority.CRITICAL)
-
-        # Then process high priority hook executions
-        await self._process_queue_events("hook_execution_high", EventPriority.HIGH)
-
-        # Then normal priority
-        await self._process_queue_events("hook_execution_normal", EventPriority.NORMAL)
+        if self._dispatcher is None:
+            # Other brokers push events to subscribers; there is no queue to drain
+            logger.info(f"Event dispatch handled by {self.message_broker_type.value} broker subscriptions")
+            return
 
-        # Then low priority
-        await self._process_queue_events("hook_execution_low", EventPriority.LOW)
+        logger.info("Starting event processing loop")
+        await self._dispatcher.run()
+
+    async def _dispatch_event(self, event: Event) -> None:
+        """Process one dequeued event and record its queueing latency"""
+        if event.event_id in self._processed_events:
+            # Redelivery after recovery or a broker retry
+            self._duplicate_events_skipped += 1
+            logger.debug(f"Skipping already processed event {event.event_id}")
+            return
 
-        # Finally bulk analytics events
-        await self._process_queue_events("analytics", EventPriority.BULK)
+        latency_ms = (datetime.now() - event.timestamp).total_seconds() * 1000
+        self._dispatched_events += 1
+        average = self._system_metrics["average_event_latency_ms"]
+        self._system_metrics["average_event_latency_ms"] = average + (latency_ms - average) / self._dispatched_events
 
-    async def _process_queue_events(self, queue_name: str, priority: EventPriority) -> None:
-        """Process events from a specific queue"""
-        # This is a simplified implementation
-        # In a real implementation, you would poll the message broker
-        pass
+        await self.event_processor.process_event(event)
+        # Only events journaled on publish need a completion record; follow-up
+        # events (completion, failure, alerts) were never journaled
+        if self.enable_persistence and event.event_id in self._pending_events:
+            self._record_processed(event.event_id)
 
     async def _metrics_collection_loop(self) -> None:
         """Collect system metrics"""
@@ -900,13 +1681,13 @@ class EventDrivenHookSystem:
                 await asyncio.sleep(300)
 
     async def _persistence_loop(self) -> None:
-        """Persist events for recovery"""
+        """Snapshot metrics and compact the event journal periodically"""
         logger.info("Starting persistence loop")
 
         while self._running:
             try:
                 await self._persist_events()
-                await asyncio.sleep(60)  # Persist every minute
+                await asyncio.sleep(60)  # Checkpoint every minute
             except Exception as e:
                 logger.error(f"Error in persistence loop: {e}")
                 await asyncio.sleep(60)
@@ -934,7 +1715,7 @@ class EventDrivenHookSystem:
                     correlation_id=event.correlation_id,
                     causation_id=event.event_id,
                 )
-                await self.message_broker.publish("system_events", failure_event)
+                await self.message_broker.publish_nowait("system_events", failure_event)
                 return
 
             try:
@@ -956,7 +1737,8 @@ class EventDrivenHookSystem:
                     correlation_id=event.correlation_id,
                     causation_id=event.event_id,
                 )
-                await self.message_broker.publish("hook_execution_normal", completion_event)
+                # Never wait for space here: this handler holds a NORMAL dispatcher slot
+                await self.message_broker.publish_nowait("hook_execution_normal", completion_event)
 
                 self._system_metrics["hook_executions"] += 1
 
@@ -983,7 +1765,7 @@ class EventDrivenHookSystem:
                 correlation_id=event.correlation_id,
                 causation_id=event.event_id,
             )
-            await self.message_broker.publish("system_events", failure_event)
+            await self.message_broker.publish_nowait("system_events", failure_event)
 
     async def _execute_hook_event(self, event: HookExecutionEvent) -> None:
         """Execute hook event (integration point with existing hook system)"""
@@ -1059,59 +1841,133 @@ class EventDrivenHookSystem:
             if event_id in self._pending_events:
                 del self._pending_events[event_id]
 
+        # Ids outside the deduplication window can no longer be redelivered
+        self._processed_events.prune()
+
     async def _cleanup_completed_workflows(self) -> None:
         """Clean up completed workflow executions"""
         # Implementation would clean up completed workflow state
         pass
 
-    async def _persist_events(self) -> None:
-        """Persist events to disk for recovery"""
-        if not self.enable_persistence:
+    def _journal_append(self, record: Dict[str, Any]) -> None:
+        """Append a journal record, group-committing records of the same burst"""
+        if self._journal is None:
             return
+        if self._journal.buffer(record):
+            self._flush_journal()
+            return
+
+        if self._journal_flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._flush_journal()
+                return
+            self._journal_flush_handle = loop.call_later(JOURNAL_FLUSH_DELAY, self._flush_journal)
 
+    def _flush_journal(self) -> None:
+        """Hand buffered journal records to the writer thread
+
+        Without a running event loop the records are written synchronously.
+        Use ``_wait_for_journal`` to wait until they are durable.
+        """
+        if self._journal_flush_handle is not None:
+            self._journal_flush_handle.cancel()
+            self._journal_flush_handle = None
+        if self._journal is None:
+            return
+
+        data = self._journal.take_batch()
+        if data is None:
+            return
         try:
-            # Persist pending events
-            pending_file = self.persistence_path / "pending_events.json"
-            pending_data = {event_id: event.to_dict() for event_id, event in self._pending_events.items()}
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_journal_batch(data)
+            return
+        self._journal_write = loop.run_in_executor(self._journal_writer, self._write_journal_batch, data)
 
-            with open(pending_file, "w") as f:
-                json.dump(pending_data, f, indent=2)
+    def _write_journal_batch(self, data: str) -> None:
+        """Write and fsync one batch of journal records (runs on the writer thread)"""
+        if self._journal is None:
+            return
+        try:
+            self._journal.write_batch(data)
+        except OSError as e:
+            logger.error(f"Error writing event journal: {e}")
+
+    async def _wait_for_journal(self) -> None:
+        """Flush buffered journal records and wait until every write has completed"""
+        self._flush_journal()
+        # The writer runs batches in order, so the last one finishes last
+        write = self._journal_write
+        if write is not None:
+            await write
+            if self._journal_write is write:
+                self._journal_write = None
+
+    def _record_pending(self, event: Event) -> None:
+        """Track an accepted event until it has been processed"""
+        self._pending_events[event.event_id] = event
+        self._journal_append({"op": "enqueue", "event": _event_to_record(event)})
+
+    def _record_processed(self, event_id: str) -> None:
+        """Mark an event as processed"""
+        processed_at = time.time()
+        self._pending_events.pop(event_id, None)
+        self._processed_events.add(event_id, processed_at)
+        self._journal_append({"op": "complete", "event_id": event_id, "at": processed_at})
+
+    def _journal_live_records(self) -> Iterator[Dict[str, Any]]:
+        """Records reconstructing the current state, used for compaction"""
+        for event_id, processed_at in list(self._processed_events.items()):
+            yield {"op": "complete", "event_id": event_id, "at": processed_at}
+        for event in list(self._pending_events.values()):
+            yield {"op": "enqueue", "event": _event_to_record(event)}
 
-            # Persist processed events
-            processed_file = self.persistence_path / "processed_events.json"
-            with open(processed_file, "w") as f:
-                json.dump(list(self._processed_events), f, indent=2)
+    async def _persist_events(self) -> None:
+        """Flush the event journal, snapshot metrics and compact when due"""
+        if not self.enable_persistence or self._journal is None:
+            return
+
+        try:
+            await self._wait_for_journal()
 
-            # Persist system metrics
+            if self._journal.needs_compaction():
+                self._journal.compact(self._journal_live_records)
+
+            # Metrics are a small fixed-size snapshot rather than event state
             metrics_file = self.persistence_path / "system_metrics.json"
-            with open(metrics_file, "w") as f:
+            temp_file = metrics_file.with_suffix(".tmp")
+            with open(temp_file, "w") as f:
                 json.dump(self._system_metrics, f, indent=2)
+            temp_file.replace(metrics_file)
 
         except Exception as e:
             logger.error(f"Error persisting events: {e}")
 
     async def _load_persisted_events(self) -> None:
-        """Load persisted events for recovery"""
-        if not self.enable_persistence:
+        """Rebuild pending and processed state by replaying the event journal"""
+        if not self.enable_persistence or self._journal is None:
             return
 
         try:
-            # Load pending events
-            pending_file = self.persistence_path / "pending_events.json"
-            if pending_file.exists():
-                with open(pending_file, "r") as f:
-                    pending_data = json.load(f)
-
-                self._pending_events = {
-                    event_id: Event.from_dict(event_data) for event_id, event_data in pending_data.items()
-                }
-
-            # Load processed events
-            processed_file = self.persistence_path / "processed_events.json"
-            if processed_file.exists():
-                with open(processed_file, "r") as f:
-                    processed_data = json.load(f)
-                self._processed_events = set(processed_data)
+            await self._wait_for_journal()
+
+            for record in self._journal.replay():
+                op = record.get("op")
+                if op == "enqueue":
+                    event = _event_from_record(record["event"])
+                    if event.event_id not in self._processed_events:
+                        self._pending_events[event.event_id] = event
+                elif op == "complete":
+                    event_id = record["event_id"]
+                    self._pending_events.pop(event_id, None)
+                    self._processed_events.add(event_id, record.get("at"))
+                elif op == "drop":
+                    self._pending_events.pop(record["event_id"], None)
+
+            self._processed_events.prune()
 
             # Load system metrics
             metrics_file = self.persistence_path / "system_metrics.json"
@@ -1119,9 +1975,18 @@ class EventDrivenHookSystem:
                 with open(metrics_file, "r") as f:
                     self._system_metrics = json.load(f)
 
+            logger.info(f"Recovered {len(self._pending_events)} pending events from the event journal")
+
         except Exception as e:
             logger.error(f"Error loading persisted events: {e}")
 
+    async def _requeue_recovered_events(self) -> None:
+        """Publish recovered pending events back to their priority queues"""
+        for event in list(self._pending_events.values()):
+            queue_name = self._get_queue_name_by_priority(event.priority)
+            if not await self.message_broker.publish(queue_name, event):
+                logger.warning(f"Could not requeue recovered event {event.event_id}")
+
     async def publish_hook_execution_event(
         self,
         hook_path: str,
@@ -1154,28 +2019,24 @@ class EventDrivenHookSystem:
         # Determine queue based on priority
         queue_name = self._get_queue_name_by_priority(priority)
 
+        # Journal the event before the broker can hand it to the dispatcher
+        if self.enable_persistence:
+            self._record_pending(event)
+
         # Publish event
         success = await self.message_broker.publish(queue_name, event)
 
         if success:
             self._system_metrics["events_published"] += 1
-            if self.enable_persistence:
-                self._pending_events[event.event_id] = event
+        elif self.enable_persistence:
+            self._pending_events.pop(event.event_id, None)
+            self._journal_append({"op": "drop", "event_id": event.event_id})
 
         return event.event_id
 
     def _get_queue_name_by_priority(self, priority: EventPriority) -> str:
         """Get queue name based on event priority"""
-        if priority == EventPriority.CRITICAL:
-            return "system_events"
-        elif priority == EventPriority.HIGH:
-            return "hook_execution_high"
-        elif priority == EventPriority.NORMAL:
-            return "hook_execution_normal"
-        elif priority == EventPriority.LOW:
-            return "hook_execution_low"
-        else:
-            return "analytics"
+        return PRIORITY_QUEUES.get(priority, "analytics")
 
     async def publish_system_alert(
         self,
@@ -1217,8 +2078,11 @@ class EventDrivenHookSystem:
             "message_broker_stats": self.message_broker.get_stats(),
             "resource_pool_stats": self.resource_pool.get_stats(),
             "event_processor_stats": self.event_processor.get_stats(),
+            "dispatcher_stats": self._dispatcher.get_stats() if self._dispatcher else {},
             "pending_events_count": len(self._pending_events),
             "processed_events_count": len(self._processed_events),
+            "duplicate_events_skipped": self._duplicate_events_skipped,
+            "journal_stats": self._journal.get_stats() if self._journal else {},
         }
 
     def get_event_flow_diagram(self) -> Dict[str, Any]:
@@ -0,0 +1,298 @@
+"""
+Append-only event journal for the event-driven hook system
+
+Replaces periodic full JSON dumps of the pending/processed event state with a
+write-ahead log: every state change is appended as one JSON line, so the cost
+of persistence follows the event rate instead of the backlog size.
+
+- Records are buffered and written with a single write + fsync per batch.
+  ``take_batch``/``write_batch`` split buffering from I/O so the write can
+  run on a writer thread while records keep being buffered.
+- The journal is split into numbered segments; once the journal grows past a
+  threshold it is compacted into a single segment holding only live state.
+- Recovery streams the segments line by line; a torn last line from a crash
+  is skipped, and cut off when the journal is reopened so that new records
+  start on a line of their own.
+
+Also provides ``ProcessedEventWindow``, a bounded, time-windowed set used to
+deduplicate redelivered events.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_MAX_BYTES = 4 * 1024 * 1024  # Start a new segment after 4 MiB
+COMPACT_THRESHOLD_BYTES = 16 * 1024 * 1024  # Compact once the journal exceeds 16 MiB
+FLUSH_BATCH_SIZE = 256  # Records buffered before a flush is forced
+TAIL_SCAN_BYTES = 64 * 1024  # Block size when searching a segment for its last newline
+
+PROCESSED_WINDOW_SECONDS = 24 * 60 * 60
+PROCESSED_WINDOW_MAX_SIZE = 100_000
+
+
+class ProcessedEventWindow:
+    """Set of recently processed event ids, bounded by age and size
+
+    Ids older than ``window_seconds`` are pruned, and the oldest ids are
+    evicted once ``max_size`` is exceeded, so memory stays bounded no matter
+    how many events flow through the system.
+    """
+
+    def __init__(self, window_seconds: float = PROCESSED_WINDOW_SECONDS, max_size: int = PROCESSED_WINDOW_MAX_SIZE):
+        self.window_seconds = window_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+
+    def add(self, event_id: str, processed_at: Optional[float] = None) -> None:
+        """Record an id as processed"""
+        self._entries[event_id] = time.time() if processed_at is None else processed_at
+        self._entries.move_to_end(event_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, event_id: str) -> None:
+        self._entries.pop(event_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop ids older than the window
+
+        Returns:
+            Number of ids removed
+        """
+        cutoff = (time.time() if now is None else now) - self.window_seconds
+        removed = 0
+        while self._entries:
+            event_id, processed_at = next(iter(self._entries.items()))
+            if processed_at >= cutoff:
+                break
+            del self._entries[event_id]
+            removed += 1
+        return removed
+
+    def items(self) -> Iterable[tuple[str, float]]:
+        return self._entries.items()
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class EventJournal:
+    """Segmented, append-only journal of JSON records"""
+
+    def __init__(
+        self,
+        directory: Path,
+        segment_max_bytes: int = SEGMENT_MAX_BYTES,
+        compact_threshold_bytes: int = COMPACT_THRESHOLD_BYTES,
+        flush_batch_size: int = FLUSH_BATCH_SIZE,
+        fsync: bool = True,
+    ):
+        self.directory = Path(directory)
+        self.segment_max_bytes = segment_max_bytes
+        self.compact_threshold_bytes = compact_threshold_bytes
+        self.flush_batch_size = flush_batch_size
+        self.fsync = fsync
+        self._buffer: List[str] = []
+        self._file: Optional[TextIO] = None
+        self._segment_id = 0
+        self._stats = {
+            "records_appended": 0,
+            "flushes": 0,
+            "compactions": 0,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        segments = self._segment_ids()
+        self._segment_id = segments[-1] if segments else 1
+        if segments:
+            self._truncate_torn_tail(self._segment_path(self._segment_id))
+
+    def _truncate_torn_tail(self, path: Path) -> None:
+        """Cut a partial last line (a write interrupted by a crash) off a segment"""
+        try:
+            with open(path, "r+b") as f:
+                end = f.seek(0, os.SEEK_END)
+                if end == 0:
+                    return
+                f.seek(end - 1)
+                if f.read(1) == b"\n":
+                    return
+                position = end
+                while position > 0:
+                    start = max(0, position - TAIL_SCAN_BYTES)
+                    f.seek(start)
+                    newline = f.read(position - start).rfind(b"\n")
+                    if newline != -1:
+                        position = start + newline + 1
+                        break
+                    position = start
+                f.truncate(position)
+        except OSError as e:
+            logger.error(f"Error repairing journal segment {path.name}: {e}")
+            return
+        logger.warning(f"Truncated torn record at the end of journal segment {path.name}")
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.directory / f"segment-{segment_id:06d}.jsonl"
+
+    def _segment_ids(self) -> List[int]:
+        ids = []
+        for path in self.directory.glob("segment-*.jsonl"):
+            try:
+                ids.append(int(path.stem.split("-", 1)[1]))
+            except ValueError:
+                continue
+        return sorted(ids)
+
+    def size_bytes(self) -> int:
+        """Total size of all segments on disk"""
+        total = 0
+        for segment_id in self._segment_ids():
+            try:
+                total += self._segment_path(segment_id).stat().st_size
+            except OSError:
+                continue
+        return total
+
+    @property
+    def pending_records(self) -> int:
+        """Records appended but not yet flushed"""
+        return len(self._buffer)
+
+    def buffer(self, record: Dict[str, Any]) -> bool:
+        """Buffer a record without writing it
+
+        Returns:
+            True when the buffer reached ``flush_batch_size`` and should be flushed
+        """
+        self._buffer.append(json.dumps(record, separators=(",", ":")))
+        self._stats["records_appended"] += 1
+        return len(self._buffer) >= self.flush_batch_size
+
+    def append(self, record: Dict[str, Any]) -> bool:
+        """Buffer a record for the next flush
+
+        Returns:
+            True when the buffer reached ``flush_batch_size`` and was flushed
+        """
+        if self.buffer(record):
+            self.flush()
+            return True
+        return False
+
+    def take_batch(self) -> Optional[str]:
+        """Remove buffered records and return them as one block of lines, or None if empty"""
+        if not self._buffer:
+            return None
+        data = "\n".join(self._buffer) + "\n"
+        self._buffer = []
+        return data
+
+    def flush(self) -> None:
+        """Write buffered records with one write and one fsync"""
+        data = self.take_batch()
+        if data is not None:
+            self.write_batch(data)
+
+    def write_batch(self, data: str) -> None:
+        """Write a block from ``take_batch`` with one write and one fsync
+
+        Batches must be written in the order they were taken, and not
+        concurrently with ``compact`` or ``close``.
+        """
+        if self._file is None:
+            self._file = open(self._segment_path(self._segment_id), "a", encoding="utf-8")
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._stats["flushes"] += 1
+
+        if self._file.tell() >= self.segment_max_bytes:
+            self._file.close()
+            self._file = None
+            self._segment_id += 1
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """Stream all records in append order, skipping torn or corrupt lines"""
+        for segment_id in self._segment_ids():
+            try:
+                with open(self._segment_path(segment_id), "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            yield json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning(f"Skipping corrupt journal record in segment {segment_id}")
+            except OSError as e:
+                logger.error(f"Error reading journal segment {segment_id}: {e}")
+
+    def needs_compaction(self) -> bool:
+        return self.size_bytes() >= self.compact_threshold_bytes
+
+    def compact(self, live_records: Callable[[], Iterable[Dict[str, Any]]]) -> None:
+        """Rewrite the journal as a single segment containing only live state
+
+        Args:
+            live_records: Produces the records that reconstruct the current state
+        """
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        old_segments = self._segment_ids()
+        compacted_id = (old_segments[-1] if old_segments else 0) + 1
+        compacted_path = self._segment_path(compacted_id)
+        temp_path = compacted_path.with_suffix(".tmp")
+
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for record in live_records():
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(temp_path, compacted_path)
+
+        # Older segments are only removed once the compacted one is durable;
+        # replaying both after a crash in between yields the same state
+        for segment_id in old_segments:
+            try:
+                self._segment_path(segment_id).unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove journal segment {segment_id}: {e}")
+
+        self._segment_id = compacted_id
+        self._stats["compactions"] += 1
+
+    def close(self) -> None:
+        """Flush and close the current segment"""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "segments": len(self._segment_ids()),
+            "size_bytes": self.size_bytes(),
+            "buffered_records": len(self._buffer),
+        }
@@ -9,6 +9,7 @@ SPEC: .moai/specs/SPEC-CORE-GIT-001/spec.md
 from moai_adk.core.git.branch import generate_branch_name
 from moai_adk.core.git.branch_manager import BranchManager
 from moai_adk.core.git.checkpoint import CheckpointManager
+from moai_adk.core.git.checkpoint_store import RefCheckpointStore
 from moai_adk.core.git.commit import format_commit_message
 from moai_adk.core.git.conflict_detector import (
     ConflictFile,
@@ -17,6 +18,12 @@ from moai_adk.core.git.conflict_detector import (
 )
 from moai_adk.core.git.event_detector import EventDetector
 from moai_adk.core.git.manager import GitManager
+from moai_adk.core.git.merge_prediction import (
+    MergePrediction,
+    PredictedConflict,
+    predict_merge,
+    predict_merges,
+)
 
 __all__ = [
     "GitManager",
@@ -24,8 +31,13 @@ __all__ = [
     "format_commit_message",
     "BranchManager",
     "CheckpointManager",
+    "RefCheckpointStore",
     "EventDetector",
     "GitConflictDetector",
     "ConflictFile",
     "ConflictSeverity",
+    "MergePrediction",
+    "PredictedConflict",
+    "predict_merge",
+    "predict_merges",
 ]
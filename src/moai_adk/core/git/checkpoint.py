@@ -1,6 +1,9 @@
 """
 Checkpoint Manager - Event-driven checkpoint system.
 
+Checkpoints are stored as commits under ``refs/moai/checkpoints/*`` (see
+``RefCheckpointStore``) rather than as ``before-*`` branches.
+
 SPEC: .moai/specs/SPEC-CHECKPOINT-EVENT-001/spec.md
 """
 
@@ -10,7 +13,7 @@ from typing import Optional
 
 import git
 
-from moai_adk.core.git.branch_manager import BranchManager
+from moai_adk.core.git.checkpoint_store import RefCheckpointStore
 from moai_adk.core.git.event_detector import EventDetector
 
 
@@ -28,8 +31,8 @@ class CheckpointManager:
         self.repo = repo
         self.project_root = project_root
         self.event_detector = EventDetector()
-        self.branch_manager = BranchManager(repo)
         self.log_file = project_root / ".moai" / "checkpoints.log"
+        self.store = RefCheckpointStore(repo, exclude=self._untracked_excludes())
 
         # Ensure the log directory exists
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -53,7 +56,7 @@ class CheckpointManager:
             modified_files: Files that will be modified.
 
         Returns:
-            Created checkpoint ID (branch name) or None when the operation is safe.
+            Created checkpoint ID or None when the operation is safe.
         """
         is_risky = False
 
@@ -76,7 +79,7 @@ class CheckpointManager:
             return None
 
         # Create a checkpoint
-        checkpoint_id = self.branch_manager.create_checkpoint_branch(operation)
+        checkpoint_id = self.store.create(operation)
 
         # Record checkpoint metadata
         self._log_checkpoint(checkpoint_id, operation)
@@ -89,15 +92,21 @@ class CheckpointManager:
 
         SPEC requirement: capture the current state as a new checkpoint before restoring.
 
+        Only files that differ from the checkpoint are rewritten; HEAD stays on
+        the current branch.
+
         Args:
-            checkpoint_id: Target checkpoint ID (branch name).
+            checkpoint_id: Target checkpoint ID.
         """
-        # Save current state as a safety checkpoint before restoring
-        safety_checkpoint = self.branch_manager.create_checkpoint_branch("restore")
+        # Save current state as a safety checkpoint before restoring. Pruning
+        # now could delete the target checkpoint, so it waits for the restore.
+        safety_checkpoint = self.store.create("restore", prune=False)
         self._log_checkpoint(safety_checkpoint, "restore", is_safety=True)
 
-        # Check out the checkpoint branch
-        self.repo.git.checkout(checkpoint_id)
+        try:
+            self.store.restore(checkpoint_id, current=safety_checkpoint)
+        finally:
+            self.store.prune()
 
     def list_checkpoints(self) -> list[str]:
         """
@@ -106,7 +115,14 @@ class CheckpointManager:
         Returns:
             List of checkpoint IDs.
         """
-        return self.branch_manager.list_checkpoint_branches()
+        return self.store.list_checkpoints()
+
+    def _untracked_excludes(self) -> list[str]:
+        """Keep the checkpoint log out of checkpoints so restoring never rewinds it."""
+        try:
+            return [self.log_file.resolve().relative_to(Path(self.repo.working_dir).resolve()).as_posix()]
+        except ValueError:
+            return []
 
     def _log_checkpoint(self, checkpoint_id: str, operation: str, is_safety: bool = False) -> None:
         """
@@ -0,0 +1,340 @@
+"""
+Ref Checkpoint Store - Lightweight checkpoints under a private ref namespace.
+
+Checkpoints are stored as commit objects under ``refs/moai/checkpoints/*``
+instead of local branches, like ``git stash create`` but including untracked
+files:
+
+- The index is written as a tree and committed on top of HEAD.
+- The working tree (tracked and untracked, respecting .gitignore) is staged
+  into a temporary copy of the index, so unchanged files reuse the stat
+  cache, and committed with HEAD and the index commit as parents.
+
+The user's branch list and pushes stay clean, creating a checkpoint does not
+depend on how many branches exist, and restoring rewrites only the paths
+that differ from the checkpoint without moving HEAD. Paths are passed to git
+through a pathspec file on git 2.26 and later, and in chunks on older git.
+
+SPEC: .moai/specs/SPEC-CHECKPOINT-EVENT-001/spec.md
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+import git
+from git.exc import GitCommandError
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_REF_PREFIX = "refs/moai/checkpoints/"
+CHECKPOINT_ID_PREFIX = "before-"
+
+MAX_CHECKPOINTS = 10
+CHECKPOINT_EXPIRE_SECONDS = 90 * 24 * 60 * 60  # Same default as gc.reflogExpire
+
+# Checkpoint commits never leave the private namespace, so they do not need the
+# user's identity (which may not be configured)
+_CHECKPOINT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "MoAI Checkpoint",
+    "GIT_AUTHOR_EMAIL": "checkpoint@moai-adk.local",
+    "GIT_COMMITTER_NAME": "MoAI Checkpoint",
+    "GIT_COMMITTER_EMAIL": "checkpoint@moai-adk.local",
+}
+
+# Pathspecs are passed through a file and must match file names literally
+_LITERAL_PATHSPECS = {"GIT_LITERAL_PATHSPECS": "1"}
+
+# First git release whose restore command accepts --pathspec-from-file
+PATHSPEC_FROM_FILE_GIT_VERSION = (2, 26)
+
+# Paths per command line when --pathspec-from-file is unavailable
+PATHS_PER_COMMAND = 500
+
+
+class RefCheckpointStore:
+    """Create, list, restore and prune checkpoints stored as private refs."""
+
+    def __init__(
+        self,
+        repo: git.Repo,
+        max_checkpoints: int = MAX_CHECKPOINTS,
+        expire_seconds: Optional[float] = CHECKPOINT_EXPIRE_SECONDS,
+        exclude: Iterable[str] = (),
+    ):
+        """
+        Initialize the RefCheckpointStore.
+
+        Args:
+            repo: GitPython Repo instance.
+            max_checkpoints: Number of most recent checkpoints to retain.
+            expire_seconds: Checkpoints older than this are pruned (None keeps them).
+            exclude: Untracked paths, relative to the working tree, never captured.
+        """
+        self.repo = repo
+        self.max_checkpoints = max_checkpoints
+        self.expire_seconds = expire_seconds
+        self.exclude = list(exclude)
+
+    def create(self, operation: str, prune: bool = True) -> str:
+        """
+        Capture the index and working tree as a checkpoint.
+
+        Args:
+            operation: Operation name (delete, refactor, merge, etc.).
+            prune: Prune old checkpoints afterwards. Pass False when an existing
+                checkpoint is still needed (e.g. before restoring it).
+
+        Returns:
+            Checkpoint ID in the before-{operation}-{timestamp} format.
+        """
+        message = f"moai checkpoint: {operation}"
+        head = self._rev_parse("HEAD")
+        parents = ["-p", head] if head else []
+
+        try:
+            index_tree = self.repo.git.write_tree()
+        except GitCommandError:
+            # Unmerged entries cannot be written as a tree; keep the working tree only
+            logger.warning("Index has unmerged entries; checkpoint will not record the staged state")
+            index_tree = None
+
+        if index_tree is not None:
+            index_commit = self.repo.git.commit_tree(
+                index_tree, *parents, "-m", f"index on {message}", env=_CHECKPOINT_IDENTITY
+            )
+            parents = [*parents, "-p", index_commit]
+
+        worktree_tree = self._write_worktree_tree()
+        commit = self.repo.git.commit_tree(worktree_tree, *parents, "-m", message, env=_CHECKPOINT_IDENTITY)
+
+        checkpoint_id = self._new_checkpoint_id(operation, commit, message)
+        if prune:
+            self.prune()
+        return checkpoint_id
+
+    def list_checkpoints(self) -> list[str]:
+        """
+        List checkpoint IDs, oldest first.
+
+        Returns:
+            Checkpoint IDs.
+        """
+        return [checkpoint_id for checkpoint_id, _ in self._refs_by_age()]
+
+    def exists(self, checkpoint_id: str) -> bool:
+        return self._rev_parse(self._ref_name(checkpoint_id)) is not None
+
+    def restore(self, checkpoint_id: str, current: Optional[str] = None) -> list[str]:
+        """
+        Restore the working tree and index to a checkpoint.
+
+        Only paths that differ from the checkpoint are rewritten; HEAD and the
+        current branch are left untouched. Paths absent from the checkpoint
+        are deleted, untracked files included.
+
+        Checkpoint IDs that are not in the private namespace are resolved as
+        plain revisions, so legacy ``before-*`` branches can still be restored
+        (working tree only; their tip is a regular commit, not a checkpoint
+        with an index parent). Legacy branches never recorded untracked
+        files, so restoring one deletes every untracked file that is not in
+        the branch; those paths are logged as a warning.
+
+        Args:
+            checkpoint_id: Checkpoint to restore.
+            current: Checkpoint holding the current state, if one was just taken.
+
+        Returns:
+            Paths rewritten in the working tree.
+
+        Raises:
+            ValueError: If the checkpoint does not exist.
+        """
+        target = self._rev_parse(self._ref_name(checkpoint_id))
+        is_checkpoint = target is not None
+        if target is None:
+            target = self._rev_parse(checkpoint_id)
+        if target is None:
+            raise ValueError(f"Checkpoint not found: {checkpoint_id}")
+
+        if current is not None:
+            current_tree = f"{self._ref_name(current)}^{{tree}}"
+        else:
+            current_tree = self._write_worktree_tree()
+
+        changed, removed = self._diff_trees(current_tree, f"{target}^{{tree}}")
+        work_tree = Path(self.repo.working_dir)
+
+        if removed and not is_checkpoint:
+            untracked = set(self._split_z(self.repo.git.ls_files("--others", "--exclude-standard", "-z")))
+            deleted_untracked = [path for path in removed if path in untracked]
+            if deleted_untracked:
+                logger.warning(
+                    f"Restoring legacy checkpoint {checkpoint_id} deletes {len(deleted_untracked)} untracked "
+                    f"file(s) it does not contain: {', '.join(deleted_untracked)}"
+                )
+
+        if changed:
+            self._restore_worktree(changed, target)
+        for path in removed:
+            try:
+                (work_tree / path).unlink()
+            except FileNotFoundError:
+                pass
+
+        # Only checkpoint commits have the index commit as second parent
+        index_commit = self._rev_parse(f"{target}^2") if is_checkpoint else None
+        if index_commit is not None:
+            staged = self._split_z(
+                self.repo.git.diff_index("--cached", "--name-only", "--no-renames", "-z", index_commit)
+            )
+            if staged:
+                self._restore_index(staged, index_commit)
+
+        return sorted(changed + removed)
+
+    def prune(self) -> list[str]:
+        """
+        Delete checkpoints beyond the retention count or older than the expiry.
+
+        Returns:
+            IDs of the deleted checkpoints.
+        """
+        refs = self._refs_by_age()
+        cutoff = time.time() - self.expire_seconds if self.expire_seconds is not None else None
+        excess = max(len(refs) - self.max_checkpoints, 0)
+
+        deleted = []
+        for position, (checkpoint_id, created_at) in enumerate(refs):
+            if position < excess or (cutoff is not None and created_at < cutoff):
+                self.repo.git.update_ref("-d", self._ref_name(checkpoint_id))
+                deleted.append(checkpoint_id)
+        return deleted
+
+    def delete(self, checkpoint_id: str) -> None:
+        self.repo.git.update_ref("-d", self._ref_name(checkpoint_id))
+
+    @staticmethod
+    def _ref_name(checkpoint_id: str) -> str:
+        return f"{CHECKPOINT_REF_PREFIX}{checkpoint_id}"
+
+    @staticmethod
+    def _split_z(output: str) -> list[str]:
+        return [item for item in output.split("\0") if item]
+
+    def _rev_parse(self, revision: str) -> Optional[str]:
+        try:
+            return self.repo.git.rev_parse("--verify", "--quiet", f"{revision}^{{commit}}") or None
+        except GitCommandError:
+            return None
+
+    def _new_checkpoint_id(self, operation: str, commit: str, message: str) -> str:
+        """Point a new, not yet existing ref at ``commit`` and return its ID."""
+        base_id = f"{CHECKPOINT_ID_PREFIX}{operation}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        checkpoint_id = base_id
+        suffix = 1
+        while True:
+            try:
+                # An empty old value makes the update fail if the ref already exists
+                self.repo.git.update_ref("-m", message, self._ref_name(checkpoint_id), commit, "")
+                return checkpoint_id
+            except GitCommandError:
+                if not self.exists(checkpoint_id):
+                    raise
+                suffix += 1
+                checkpoint_id = f"{base_id}-{suffix}"
+
+    def _write_worktree_tree(self) -> str:
+        """Write the whole working tree, including untracked files, as a tree object."""
+        index_path = Path(self.repo.git_dir) / "index"
+        fd, temp_index = tempfile.mkstemp(prefix="moai-checkpoint-", suffix=".index", dir=self.repo.git_dir)
+        os.close(fd)
+        try:
+            if index_path.exists():
+                shutil.copyfile(index_path, temp_index)
+            else:
+                os.unlink(temp_index)
+            env = {"GIT_INDEX_FILE": temp_index}
+            excludes = [f":(exclude,literal){path}" for path in self.exclude]
+            self.repo.git.add("--all", "--", ".", *excludes, env=env)
+            return self.repo.git.write_tree(env=env)
+        finally:
+            try:
+                os.unlink(temp_index)
+            except FileNotFoundError:
+                pass
+
+    def _diff_trees(self, current_tree: str, target_tree: str) -> tuple[list[str], list[str]]:
+        """Split paths that differ between two trees into (restore from target, remove)."""
+        entries = self._split_z(
+            self.repo.git.diff_tree("-r", "-z", "--no-renames", "--name-status", current_tree, target_tree)
+        )
+        changed: list[str] = []
+        removed: list[str] = []
+        for status, path in zip(entries[::2], entries[1::2]):
+            (removed if status == "D" else changed).append(path)
+        return changed, removed
+
+    def _supports_pathspec_file(self) -> bool:
+        return tuple(self.repo.git.version_info[:2]) >= PATHSPEC_FROM_FILE_GIT_VERSION
+
+    def _restore_worktree(self, paths: list[str], source: str) -> None:
+        """Write ``paths`` from ``source`` into the working tree, leaving the index alone."""
+        if self._supports_pathspec_file():
+            self._with_pathspec_file(paths, "restore", f"--source={source}", "--worktree")
+            return
+
+        # Older git: check the paths out of a temporary index holding ``source``
+        fd, temp_index = tempfile.mkstemp(prefix="moai-restore-", suffix=".index", dir=self.repo.git_dir)
+        os.close(fd)
+        os.unlink(temp_index)
+        try:
+            env = {"GIT_INDEX_FILE": temp_index}
+            self.repo.git.read_tree(source, env=env)
+            for start in range(0, len(paths), PATHS_PER_COMMAND):
+                self.repo.git.checkout_index("-f", "--", *paths[start : start + PATHS_PER_COMMAND], env=env)
+        finally:
+            try:
+                os.unlink(temp_index)
+            except FileNotFoundError:
+                pass
+
+    def _restore_index(self, paths: list[str], source: str) -> None:
+        """Reset the index entries of ``paths`` to ``source``, leaving the working tree alone."""
+        if self._supports_pathspec_file():
+            self._with_pathspec_file(paths, "restore", f"--source={source}", "--staged")
+            return
+
+        for start in range(0, len(paths), PATHS_PER_COMMAND):
+            self.repo.git.reset("-q", source, "--", *paths[start : start + PATHS_PER_COMMAND], env=_LITERAL_PATHSPECS)
+
+    def _with_pathspec_file(self, paths: Iterable[str], command: str, *args: str) -> None:
+        """Run a git command on many paths without hitting command-line length limits."""
+        fd, pathspec_file = tempfile.mkstemp(prefix="moai-pathspec-", dir=self.repo.git_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"\0".join(os.fsencode(path) for path in paths))
+            getattr(self.repo.git, command)(
+                *args,
+                f"--pathspec-from-file={pathspec_file}",
+                "--pathspec-file-nul",
+                env=_LITERAL_PATHSPECS,
+            )
+        finally:
+            os.unlink(pathspec_file)
+
+    def _refs_by_age(self) -> list[tuple[str, float]]:
+        """Checkpoint IDs with their creation time, oldest first."""
+        output = self.repo.git.for_each_ref(
+            "--sort=refname", "--sort=creatordate", "--format=%(creatordate:unix) %(refname)", CHECKPOINT_REF_PREFIX
+        )
+        refs = []
+        for line in output.splitlines():
+            created_at, _, ref_name = line.partition(" ")
+            refs.append((ref_name[len(CHECKPOINT_REF_PREFIX) :], float(created_at)))
+        return refs
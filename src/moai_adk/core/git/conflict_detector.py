@@ -14,6 +14,8 @@ from pathlib import Path
 
 from git import GitCommandError, InvalidGitRepositoryError, Repo
 
+from moai_adk.core.git.merge_prediction import MergePrediction, predict_merge, predict_merges
+
 
 class ConflictSeverity(Enum):
     """Enum for conflict severity levels."""
@@ -76,8 +78,8 @@ class GitConflictDetector:
     def can_merge(self, feature_branch: str, base_branch: str) -> dict[str, bool | list | str]:
         """Check if merge is possible without conflicts.
 
-        Uses git merge --no-commit --no-ff for safe detection without
-        modifying the working tree.
+        Predicts the merge with git merge-tree, in the object database only:
+        the working tree, index and current branch are left untouched.
 
         Args:
             feature_branch: Feature branch name to merge from
@@ -90,43 +92,64 @@ class GitConflictDetector:
                 - error (str, optional): Error message if merge check failed
         """
         try:
-            # First, check if we're on the base branch
-            current_branch = self.repo.active_branch.name
-            if current_branch != base_branch:
-                self.git.checkout(base_branch)
-
-            # Try merge with --no-commit --no-ff to detect conflicts
-            # but don't actually commit
-            try:
-                self.git.merge("--no-commit", "--no-ff", feature_branch)
-                # If we reach here, merge succeeded
-                self.cleanup_merge_state()
-                return {"can_merge": True, "conflicts": []}
-            except Exception as e:
-                # Merge failed, likely due to conflicts
-                error_output = str(e)
-
-                # Check for actual conflict markers in files
-                conflicted_files = self._detect_conflicted_files()
-
-                if conflicted_files:
-                    conflicts = self.analyze_conflicts(conflicted_files)
-                    return {"can_merge": False, "conflicts": conflicts}
-                else:
-                    # Some other error
-                    self.cleanup_merge_state()
-                    return {
-                        "can_merge": False,
-                        "conflicts": [],
-                        "error": error_output,
-                    }
-
+            prediction = predict_merge(self.repo_path, base_branch, feature_branch)
         except Exception as e:
             return {
                 "can_merge": False,
                 "conflicts": [],
                 "error": f"Error during merge check: {str(e)}",
             }
+        return self._prediction_result(prediction)
+
+    def can_merge_many(
+        self, feature_branches: list[str], base_branch: str, max_workers: int | None = None
+    ) -> dict[str, dict[str, bool | list | str]]:
+        """Check several branches against a base branch in parallel.
+
+        Args:
+            feature_branches: Feature branch names to merge from
+            base_branch: Base branch name to merge into
+            max_workers: Maximum concurrent merge predictions
+
+        Returns:
+            can_merge() result per feature branch, in input order
+        """
+        branches = list(dict.fromkeys(feature_branches))
+        predictions = predict_merges(
+            self.repo_path, [(base_branch, branch) for branch in branches], max_workers=max_workers
+        )
+        return {branch: self._prediction_result(prediction) for branch, prediction in zip(branches, predictions)}
+
+    def _prediction_result(self, prediction: MergePrediction) -> dict[str, bool | list | str]:
+        """Convert a merge prediction into a can_merge() result.
+
+        Args:
+            prediction: Predicted merge outcome
+
+        Returns:
+            Dictionary in the can_merge() format
+        """
+        if prediction.error is not None:
+            return {
+                "can_merge": False,
+                "conflicts": [],
+                "error": f"Error during merge check: {prediction.error}",
+            }
+
+        conflicts = []
+        for predicted in prediction.conflicts:
+            conflict_type = self._classify_file_type(predicted.path)
+            conflicts.append(
+                ConflictFile(
+                    path=predicted.path,
+                    severity=self._determine_severity(predicted.path, conflict_type),
+                    conflict_type=conflict_type,
+                    lines_conflicting=predicted.markers,
+                    description=f"Merge conflict ({predicted.kind}) in {predicted.path}",
+                )
+            )
+
+        return {"can_merge": not conflicts, "conflicts": self.analyze_conflicts(conflicts)}
 
     def _detect_conflicted_files(self) -> list[ConflictFile]:
         """Detect files with merge conflict markers.
@@ -0,0 +1,339 @@
+"""Side-effect-free merge conflict prediction.
+
+Predicts whether merging one branch into another would conflict without
+checking anything out: ``git merge-tree --write-tree`` (git >= 2.38) performs
+the merge in the object database only. Older git falls back to a three-way
+``read-tree`` into a temporary index plus ``git merge-file`` per file changed
+on both sides. Neither touches the working tree, the real index or HEAD, so
+predictions for many branches can run concurrently.
+
+Only subprocess ``git`` is used, so predictions do not depend on GitPython.
+
+SPEC: SPEC-GIT-CONFLICT-AUTO-001
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+GIT_COMMAND_TIMEOUT = 60  # seconds
+
+# git merge-tree --write-tree is available from this version on
+MERGE_TREE_MIN_VERSION = (2, 38)
+
+CONFLICT_MARKER = b"<<<<<<<"
+
+_OID_PATTERN = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+_VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)")
+
+
+@dataclass(frozen=True)
+class PredictedConflict:
+    """A path that would conflict when merging."""
+
+    path: str
+    kind: str  # git conflict type, e.g. 'contents', 'add/add', 'modify/delete', 'binary'
+    markers: int  # Number of conflict hunks ('<<<<<<<' markers) in the merged file
+
+
+@dataclass
+class MergePrediction:
+    """Predicted outcome of merging ``branch`` into ``base``."""
+
+    base: str
+    branch: str
+    conflicts: list[PredictedConflict] = field(default_factory=list)
+    tree: str | None = None  # Merged tree id (merge-tree only)
+    error: str | None = None
+
+    @property
+    def can_merge(self) -> bool:
+        """Whether the merge would complete without conflicts."""
+        return self.error is None and not self.conflicts
+
+
+def _run_git(
+    cwd: Path | str,
+    args: list[str],
+    env: dict[str, str] | None = None,
+    input: bytes | None = None,
+) -> subprocess.CompletedProcess | None:
+    """Run git and return the completed process (bytes output), or None if git could not run."""
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=str(cwd),
+            env=env,
+            input=input,
+            capture_output=True,
+            timeout=GIT_COMMAND_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"git {' '.join(args)} failed: {e}")
+        return None
+
+
+def _decode(output: bytes) -> str:
+    return output.decode("utf-8", errors="surrogateescape")
+
+
+def _error_message(result: subprocess.CompletedProcess | None, action: str) -> str:
+    if result is None:
+        return f"git is not available to {action}"
+    return _decode(result.stderr).strip() or f"git failed to {action} (exit {result.returncode})"
+
+
+@lru_cache(maxsize=1)
+def git_supports_write_tree() -> bool:
+    """Check whether the installed git supports ``merge-tree --write-tree``."""
+    result = _run_git(".", ["--version"])
+    if result is None or result.returncode != 0:
+        return False
+    match = _VERSION_PATTERN.search(_decode(result.stdout))
+    if match is None:
+        return False
+    return (int(match.group(1)), int(match.group(2))) >= MERGE_TREE_MIN_VERSION
+
+
+def _count_markers(cwd: Path | str, object_specs: list[str]) -> dict[str, int]:
+    """Count conflict markers in several blobs with a single ``git cat-file --batch``.
+
+    Args:
+        cwd: Repository directory
+        object_specs: Object names, e.g. ``<tree>:<path>``
+
+    Returns:
+        Marker count per object name; missing objects are omitted
+    """
+    if not object_specs:
+        return {}
+
+    result = _run_git(cwd, ["cat-file", "--batch"], input="".join(f"{spec}\n" for spec in object_specs).encode())
+    if result is None or result.returncode != 0:
+        return {}
+
+    counts: dict[str, int] = {}
+    output = result.stdout
+    position = 0
+    for spec in object_specs:
+        header_end = output.find(b"\n", position)
+        if header_end < 0:
+            break
+        header = output[position:header_end].split()
+        position = header_end + 1
+        if len(header) != 3 or header[-1] == b"missing":
+            continue
+        size = int(header[2])
+        counts[spec] = output.count(CONFLICT_MARKER, position, position + size)
+        position += size + 1
+
+    return counts
+
+
+def _parse_merge_tree_output(output: str) -> tuple[str, dict[str, set[int]], dict[str, str]]:
+    """Parse ``git merge-tree --write-tree -z`` output.
+
+    Returns:
+        Tuple of (merged tree id, stages per conflicted path, conflict type per path)
+    """
+    tokens = output.split("\0")
+    tree = tokens[0]
+
+    stages: dict[str, set[int]] = {}
+    index = 1
+    while index < len(tokens) and tokens[index]:
+        info, _, path = tokens[index].partition("\t")
+        stages.setdefault(path, set()).add(int(info.rsplit(" ", 1)[-1]))
+        index += 1
+
+    # Informational messages: <path count>, <paths...>, <type>, <message>
+    kinds: dict[str, str] = {}
+    index += 1
+    while index < len(tokens) and tokens[index].isdigit():
+        path_count = int(tokens[index])
+        paths = tokens[index + 1 : index + 1 + path_count]
+        conflict_type = tokens[index + 1 + path_count] if index + 1 + path_count < len(tokens) else ""
+        if conflict_type.startswith("CONFLICT (") and conflict_type.endswith(")"):
+            for path in paths:
+                kinds.setdefault(path, conflict_type[len("CONFLICT (") : -1])
+        index += path_count + 3
+
+    return tree, stages, kinds
+
+
+def _kind_from_stages(stages: set[int]) -> str:
+    if 2 in stages and 3 in stages:
+        return "contents" if 1 in stages else "add/add"
+    return "modify/delete"
+
+
+def _predict_with_merge_tree(cwd: Path | str, base: str, branch: str) -> MergePrediction:
+    prediction = MergePrediction(base=base, branch=branch)
+
+    result = _run_git(cwd, ["merge-tree", "--write-tree", "-z", base, branch])
+    stdout = _decode(result.stdout) if result is not None else ""
+    tree = stdout.split("\0", 1)[0]
+    # Exit status 0 means clean, 1 means conflicts; anything else (or no tree) is an error
+    if result is None or result.returncode not in (0, 1) or not _OID_PATTERN.fullmatch(tree):
+        prediction.error = _error_message(result, f"merge {branch} into {base}")
+        return prediction
+
+    tree, stages, kinds = _parse_merge_tree_output(stdout)
+    prediction.tree = tree
+
+    markers = _count_markers(cwd, [f"{tree}:{path}" for path in stages])
+    for path, path_stages in stages.items():
+        kind = kinds.get(path) or _kind_from_stages(path_stages)
+        if kind == "contents" and 1 not in path_stages:
+            kind = "add/add"
+        prediction.conflicts.append(PredictedConflict(path=path, kind=kind, markers=markers.get(f"{tree}:{path}", 0)))
+
+    return prediction
+
+
+def _write_blobs(cwd: Path | str, oids: set[str], directory: Path) -> dict[str, Path]:
+    """Write blobs to files in directory with a single ``git cat-file --batch``."""
+    ordered = sorted(oids)
+    result = _run_git(cwd, ["cat-file", "--batch"], input="".join(f"{oid}\n" for oid in ordered).encode())
+    if result is None or result.returncode != 0:
+        return {}
+
+    files: dict[str, Path] = {}
+    output = result.stdout
+    position = 0
+    for oid in ordered:
+        header_end = output.find(b"\n", position)
+        header = output[position:header_end].split()
+        position = header_end + 1
+        if len(header) != 3:
+            continue
+        size = int(header[2])
+        files[oid] = directory / oid
+        files[oid].write_bytes(output[position : position + size])
+        position += size + 1
+
+    return files
+
+
+def _predict_with_read_tree(cwd: Path | str, base: str, branch: str) -> MergePrediction:
+    """Fallback for git < 2.38: three-way read-tree into a temporary index.
+
+    Rename detection is not available on this path; renamed files show up as
+    modify/delete or add/add conflicts.
+    """
+    prediction = MergePrediction(base=base, branch=branch)
+
+    merge_base = _run_git(cwd, ["merge-base", base, branch])
+    if merge_base is None or merge_base.returncode != 0:
+        prediction.error = _error_message(merge_base, f"find a merge base of {base} and {branch}")
+        return prediction
+
+    with tempfile.TemporaryDirectory(prefix="moai-merge-") as temp_dir:
+        temp_path = Path(temp_dir)
+        env = {**os.environ, "GIT_INDEX_FILE": str(temp_path / "index")}
+
+        read_tree = _run_git(
+            cwd, ["read-tree", "-i", "-m", "--aggressive", _decode(merge_base.stdout).strip(), base, branch], env=env
+        )
+        if read_tree is None or read_tree.returncode != 0:
+            prediction.error = _error_message(read_tree, f"merge {branch} into {base}")
+            return prediction
+
+        unmerged = _run_git(cwd, ["ls-files", "-u", "-z"], env=env)
+        if unmerged is None or unmerged.returncode != 0:
+            prediction.error = _error_message(unmerged, "list unmerged paths")
+            return prediction
+
+        entries: dict[str, dict[int, str]] = {}
+        for entry in _decode(unmerged.stdout).split("\0"):
+            if not entry:
+                continue
+            info, _, path = entry.partition("\t")
+            _, oid, stage = info.split(" ")
+            entries.setdefault(path, {})[int(stage)] = oid
+
+        blobs = _write_blobs(cwd, {oid for stages in entries.values() for oid in stages.values()}, temp_path)
+        empty = temp_path / "empty"
+        empty.write_bytes(b"")
+
+        for path, stages in entries.items():
+            kind = _kind_from_stages(set(stages))
+            markers = 0
+            if 2 in stages and 3 in stages:
+                merge_file = _run_git(
+                    cwd,
+                    [
+                        "merge-file",
+                        "-p",
+                        str(blobs.get(stages[2], empty)),
+                        str(blobs.get(stages[1], empty)) if 1 in stages else str(empty),
+                        str(blobs.get(stages[3], empty)),
+                    ],
+                )
+                if merge_file is not None and merge_file.returncode == 0:
+                    continue  # Changed on both sides but merges cleanly
+                if merge_file is not None and 0 < merge_file.returncode < 128:
+                    markers = merge_file.returncode
+                else:
+                    kind = "binary"
+            prediction.conflicts.append(PredictedConflict(path=path, kind=kind, markers=markers))
+
+    return prediction
+
+
+def predict_merge(repo_path: Path | str, base: str, branch: str) -> MergePrediction:
+    """Predict the result of merging ``branch`` into ``base`` without touching the worktree.
+
+    Args:
+        repo_path: Path inside the repository (a linked worktree also works)
+        base: Branch or commit that would receive the merge
+        branch: Branch or commit that would be merged
+
+    Returns:
+        MergePrediction with conflicted paths and their conflict types,
+        or with ``error`` set if the merge could not be computed
+    """
+    if git_supports_write_tree():
+        return _predict_with_merge_tree(repo_path, base, branch)
+    return _predict_with_read_tree(repo_path, base, branch)
+
+
+def predict_merges(
+    repo_path: Path | str,
+    merges: Iterable[tuple[str, str]],
+    max_workers: int | None = None,
+) -> list[MergePrediction]:
+    """Predict several merges in parallel.
+
+    Each prediction only reads the object database, so they run
+    concurrently in worker threads (one git process each).
+
+    Args:
+        repo_path: Path inside the repository
+        merges: (base, branch) pairs, each merging ``branch`` into ``base``
+        max_workers: Maximum concurrent git processes (default: CPU count, at most 8)
+
+    Returns:
+        Predictions in input order
+    """
+    merge_list = list(merges)
+    if not merge_list:
+        return []
+
+    workers = max(1, min(max_workers or min(os.cpu_count() or 1, 8), len(merge_list)))
+    if workers == 1:
+        return [predict_merge(repo_path, base, branch) for base, branch in merge_list]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda merge: predict_merge(repo_path, *merge), merge_list))
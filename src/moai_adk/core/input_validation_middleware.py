@@ -11,6 +11,7 @@ Version: 1.0.0
 
 import json
 import logging
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
@@ -79,6 +80,152 @@ class ToolParameter:
     deprecated_aliases: List[str] = field(default_factory=list)
 
 
+# Parameter names whose string values are normalized as paths
+PATH_PARAMETER_NAMES = frozenset({"file_path", "path", "directory"})
+
+# Upper bound on memoized suggestions for unrecognized parameter names per tool
+FUZZY_MATCH_CACHE_SIZE = 256
+
+
+def _is_float(value: Any) -> bool:
+    try:
+        float(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+TYPE_VALIDATORS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) or (isinstance(v, str) and v.isdigit()),
+    "boolean": lambda v: isinstance(v, bool) or str(v).lower() in ["true", "false", "1", "0"],
+    "dict": lambda v: isinstance(v, dict),
+    "list": lambda v: isinstance(v, list),
+    "float": lambda v: isinstance(v, float) or (isinstance(v, (int, str)) and _is_float(v)),
+}
+
+
+def _is_normalized_path(value: Any) -> bool:
+    return "\\" not in value and not value.endswith("/")
+
+
+def _compile_exact_check(param: ToolParameter) -> Callable[[Any], bool]:
+    """Build a predicate for values that need no conversion or normalization
+
+    A value accepted by the predicate passes the type validator unchanged and
+    is left as-is by _normalize_parameter_formats; anything else goes through
+    the full validation path.
+    """
+    is_path = param.name in PATH_PARAMETER_NAMES
+    param_type = param.param_type
+
+    if param_type == "string":
+        if is_path:
+            return lambda v: isinstance(v, str) and _is_normalized_path(v)
+        return lambda v: isinstance(v, str)
+    if param_type == "integer":
+        return lambda v: isinstance(v, int)
+    if param_type == "boolean":
+        return lambda v: isinstance(v, bool)
+    if param_type == "dict":
+        return lambda v: isinstance(v, dict)
+    if param_type == "list":
+        return lambda v: isinstance(v, list)
+    if param_type == "float":
+        return lambda v: isinstance(v, (int, float))
+    if is_path:
+        return lambda v: not isinstance(v, str) or _is_normalized_path(v)
+    return lambda v: True
+
+
+class _CompiledToolSchema:
+    """Lookup tables and value checks compiled from a tool's parameter definitions
+
+    Built once per tool and reused until the tool's parameters or the global
+    parameter mappings change.
+    """
+
+    __slots__ = (
+        "source",
+        "param_count",
+        "mappings",
+        "mapping_count",
+        "valid_names",
+        "alias_mapping",
+        "deprecated_names",
+        "required_names",
+        "default_names",
+        "exact_checks",
+        "suggestions",
+    )
+
+    def __init__(self, tool_name: str, tool_params: List[ToolParameter], parameter_mappings: Dict[str, str]):
+        self.source = tool_params
+        self.param_count = len(tool_params)
+        self.mappings = parameter_mappings
+        self.mapping_count = len(parameter_mappings)
+
+        valid_names: Set[str] = set()
+        alias_mapping: Dict[str, str] = {}
+        deprecated_names: Set[str] = set()
+        for param in tool_params:
+            valid_names.add(param.name)
+            for alias in param.aliases + param.deprecated_aliases:
+                alias_mapping[alias] = param.name
+            deprecated_names.update(param.deprecated_aliases)
+
+        global_mapping_prefix = f"{tool_name.lower()}_"
+        for global_key, canonical_key in parameter_mappings.items():
+            if global_key.startswith(global_mapping_prefix):
+                alias_mapping[global_key[len(global_mapping_prefix) :]] = canonical_key
+
+        self.valid_names = frozenset(valid_names)
+        self.alias_mapping = alias_mapping
+        self.deprecated_names = frozenset(deprecated_names)
+        self.required_names = tuple(param.name for param in tool_params if param.required)
+        self.default_names = tuple(
+            param.name for param in tool_params if not param.required and param.default_value is not None
+        )
+        self.exact_checks = tuple(
+            (param.name, _compile_exact_check(param), param.validation_function) for param in tool_params
+        )
+        self.suggestions: Dict[str, Optional[str]] = {}
+
+    def is_current(self, tool_params: List[ToolParameter], parameter_mappings: Dict[str, str]) -> bool:
+        return (
+            self.source is tool_params
+            and self.param_count == len(tool_params)
+            and self.mappings is parameter_mappings
+            and self.mapping_count == len(parameter_mappings)
+        )
+
+    def matches_exactly(self, input_data: Dict[str, Any]) -> bool:
+        """Whether input_data needs no mapping, defaults, conversion or normalization"""
+        keys = input_data.keys()
+        if not keys <= self.valid_names or not keys.isdisjoint(self.deprecated_names):
+            return False
+        for name in self.required_names:
+            if name not in input_data:
+                return False
+        for name in self.default_names:
+            if name not in input_data:
+                return False
+
+        for name, is_exact, validation_function in self.exact_checks:
+            if name not in input_data:
+                continue
+            value = input_data[name]
+            if not is_exact(value):
+                return False
+            if validation_function:
+                try:
+                    if not validation_function(value):
+                        return False
+                except Exception:
+                    return False
+        return True
+
+
 class EnhancedInputValidationMiddleware:
     """
     Production-ready input validation middleware that addresses tool input validation
@@ -105,6 +252,9 @@ class EnhancedInputValidationMiddleware:
         # Validation cache
         self.validation_cache: Optional[Dict[str, Any]] = {} if enable_caching else None
 
+        # Per-tool schemas compiled from tool_parameters and parameter_mappings
+        self._compiled_schemas: Dict[str, _CompiledToolSchema] = {}
+
         # Statistics
         self.stats = {
             "validations_performed": 0,
@@ -400,25 +550,44 @@ class EnhancedInputValidationMiddleware:
         valid_modes = ["content", "files_with_matches", "count"]
         return mode in valid_modes
 
+    def _get_compiled_schema(self, tool_name: str, tool_params: List[ToolParameter]) -> _CompiledToolSchema:
+        """Get the compiled schema for a tool, recompiling it if its definitions changed"""
+        schema = self._compiled_schemas.get(tool_name)
+        if schema is None or not schema.is_current(tool_params, self.parameter_mappings):
+            schema = _CompiledToolSchema(tool_name, tool_params, self.parameter_mappings)
+            self._compiled_schemas[tool_name] = schema
+        return schema
+
     def validate_and_normalize_input(self, tool_name: str, input_data: Dict[str, Any]) -> ValidationResult:
         """
         Validate and normalize tool input data.
 
         This is the main method that addresses the tool input validation failures
         from the debug logs (Lines 476-495).
-        """
-        import time
 
+        Input that already matches the tool schema exactly is returned without
+        copying: normalized_input is then input_data itself.
+        """
         start_time = time.time()
 
         self.stats["validations_performed"] += 1
 
+        tool_params = self.tool_parameters.get(tool_name, [])
+        if tool_params:
+            try:
+                exact = self._get_compiled_schema(tool_name, tool_params).matches_exactly(input_data)
+            except Exception:
+                exact = False
+            if exact:
+                return ValidationResult(
+                    valid=True,
+                    normalized_input=input_data,
+                    processing_time_ms=(time.time() - start_time) * 1000,
+                )
+
         result = ValidationResult(valid=True, normalized_input=input_data.copy())
 
         try:
-            # Get tool parameters
-            tool_params = self.tool_parameters.get(tool_name, [])
-
             if not tool_params:
                 # Unknown tool - perform basic validation only
                 result.warnings.append(f"Unknown tool: {tool_name}")
@@ -500,24 +669,10 @@ class EnhancedInputValidationMiddleware:
         mapped_input = input_data.copy()
         errors = []
 
-        # Get tool-specific parameters
-        tool_params = self.tool_parameters.get(tool_name, [])
-
-        # Create mapping of all valid parameter names and aliases
-        valid_names = set()
-        alias_mapping = {}
-
-        for param in tool_params:
-            valid_names.add(param.name)
-            for alias in param.aliases + param.deprecated_aliases:
-                alias_mapping[alias] = param.name
-
-        # Add global parameter mappings
-        global_mapping_prefix = f"{tool_name.lower()}_"
-        for global_key, canonical_key in self.parameter_mappings.items():
-            if global_key.startswith(global_mapping_prefix):
-                short_key = global_key[len(global_mapping_prefix) :]
-                alias_mapping[short_key] = canonical_key
+        # Valid parameter names and aliases (including global mappings) come precompiled
+        schema = self._get_compiled_schema(tool_name, self.tool_parameters.get(tool_name, []))
+        valid_names = schema.valid_names
+        alias_mapping = schema.alias_mapping
 
         # Check each input parameter
         for param_name in list(mapped_input.keys()):
@@ -550,8 +705,14 @@ class EnhancedInputValidationMiddleware:
                 # Unknown parameter - create error
                 original_value = mapped_input[param_name]
 
-                # Suggest closest match
-                suggestion = self._find_closest_parameter_match(param_name, valid_names)
+                # Suggest closest match (memoized per schema)
+                if param_name in schema.suggestions:
+                    suggestion = schema.suggestions[param_name]
+                else:
+                    suggestion = self._find_closest_parameter_match(param_name, set(valid_names))
+                    if len(schema.suggestions) >= FUZZY_MATCH_CACHE_SIZE:
+                        schema.suggestions.clear()
+                    schema.suggestions[param_name] = suggestion
 
                 errors.append(
                     ValidationError(
@@ -697,17 +858,7 @@ class EnhancedInputValidationMiddleware:
         """Validate parameter value against expected type"""
         errors: List[ValidationError] = []
 
-        # Type mapping
-        type_validators = {
-            "string": lambda v: isinstance(v, str),
-            "integer": lambda v: isinstance(v, int) or (isinstance(v, str) and v.isdigit()),
-            "boolean": lambda v: isinstance(v, bool) or str(v).lower() in ["true", "false", "1", "0"],
-            "dict": lambda v: isinstance(v, dict),
-            "list": lambda v: isinstance(v, list),
-            "float": lambda v: isinstance(v, float) or (isinstance(v, (int, str)) and self._is_float(v)),
-        }
-
-        validator = type_validators.get(param.param_type)
+        validator = TYPE_VALIDATORS.get(param.param_type)
         if not validator:
             return errors
 
@@ -780,11 +931,7 @@ class EnhancedInputValidationMiddleware:
 
     def _is_float(self, value) -> bool:
         """Check if value can be converted to float"""
-        try:
-            float(value)
-            return True
-        except (ValueError, TypeError):
-            return False
+        return _is_float(value)
 
     def _normalize_parameter_formats(self, tool_params: List[ToolParameter], input_data: Dict[str, Any]) -> List[str]:
         """Normalize parameter formats for consistency"""
@@ -807,7 +954,7 @@ class EnhancedInputValidationMiddleware:
                         )
 
             # Normalize file paths
-            elif param.name in ["file_path", "path", "directory"] and isinstance(value, str):
+            elif param.name in PATH_PARAMETER_NAMES and isinstance(value, str):
                 # Convert to forward slashes and remove trailing slash
                 normalized_path = value.replace("\\", "/").rstrip("/")
                 if value != normalized_path:
@@ -866,10 +1013,12 @@ class EnhancedInputValidationMiddleware:
     def register_tool_parameters(self, tool_name: str, parameters: List[ToolParameter]) -> None:
         """Register custom tool parameters"""
         self.tool_parameters[tool_name] = parameters
+        self._compiled_schemas.pop(tool_name, None)
 
     def add_parameter_mapping(self, from_key: str, to_key: str) -> None:
         """Add custom parameter mapping"""
         self.parameter_mappings[from_key] = to_key
+        self._compiled_schemas.clear()
 
     def export_validation_report(self, output_path: str) -> None:
         """Export validation report to file"""
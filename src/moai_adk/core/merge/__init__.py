@@ -5,5 +5,6 @@ for comparing backup vs new template configurations.
 """
 
 from .analyzer import MergeAnalyzer
+from .tree_compare import FileComparison, TreeComparison, compare_trees
 
-__all__ = ["MergeAnalyzer"]
+__all__ = ["MergeAnalyzer", "FileComparison", "TreeComparison", "compare_trees"]
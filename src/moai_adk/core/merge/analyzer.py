@@ -8,7 +8,6 @@ import json
 import logging
 import re
 import subprocess
-from difflib import unified_diff
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +17,8 @@ from rich.live import Live
 from rich.spinner import Spinner
 from rich.table import Table
 
+from .tree_compare import compare_trees
+
 console = Console()
 logger = logging.getLogger(__name__)
 
@@ -138,42 +139,27 @@ class MergeAnalyzer:
     def _collect_diff_files(self, backup_path: Path, template_path: Path) -> dict[str, dict[str, Any]]:
         """Collect differences between backup and template files
 
+        Files are compared by size and hash first; diffs are only built for
+        files that actually changed.
+
         Returns:
             Dictionary with diff information per file
         """
-        diff_files = {}
+        comparison = compare_trees(backup_path, template_path, paths=self.ANALYZED_FILES)
 
+        diff_files = {}
         for file_name in self.ANALYZED_FILES:
-            backup_file = backup_path / file_name
-            template_file = template_path / file_name
-
-            if not backup_file.exists() and not template_file.exists():
+            info = comparison.files.get(file_name)
+            if info is None:
                 continue
 
-            diff_info = {
-                "backup_exists": backup_file.exists(),
-                "template_exists": template_file.exists(),
-                "has_diff": False,
-                "diff_lines": 0,
+            diff_files[file_name] = {
+                "backup_exists": info.backup_exists,
+                "template_exists": info.template_exists,
+                "has_diff": info.has_diff,
+                "diff_lines": info.diff_lines,
             }
 
-            if backup_file.exists() and template_file.exists():
-                backup_content = backup_file.read_text(encoding="utf-8")
-                template_content = template_file.read_text(encoding="utf-8")
-
-                if backup_content != template_content:
-                    diff = list(
-                        unified_diff(
-                            backup_content.splitlines(),
-                            template_content.splitlines(),
-                            lineterm="",
-                        )
-                    )
-                    diff_info["has_diff"] = True
-                    diff_info["diff_lines"] = len(diff)
-
-            diff_files[file_name] = diff_info
-
         return diff_files
 
     def _create_analysis_prompt(
@@ -0,0 +1,240 @@
+"""Single-pass comparison of a backup tree against a template tree.
+
+Walks both directory trees in lockstep, so each directory is listed exactly
+once per side, and classifies every file as added, removed, identical or
+modified. Files present on both sides are compared by size first and by a
+streaming hash only when the sizes match; unified diffs are computed only for
+changed text files. Content comparisons run in a thread pool.
+
+The resulting ``TreeComparison`` also keeps the directory listings, so
+custom-element detection can reuse the same walk instead of rescanning.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from difflib import unified_diff
+from pathlib import Path
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# File status values
+ADDED = "added"  # Only in the template
+REMOVED = "removed"  # Only in the backup
+IDENTICAL = "identical"
+MODIFIED = "modified"
+PRESENT = "present"  # On both sides, contents not compared
+
+
+@dataclass
+class FileComparison:
+    """Comparison result for a single file."""
+
+    path: str  # POSIX path relative to the compared roots
+    status: str
+    backup_size: int | None = None
+    template_size: int | None = None
+    diff_lines: int = 0  # Unified diff length (changed text files only)
+    is_text: bool = True
+
+    @property
+    def backup_exists(self) -> bool:
+        return self.status != ADDED
+
+    @property
+    def template_exists(self) -> bool:
+        return self.status != REMOVED
+
+    @property
+    def has_diff(self) -> bool:
+        return self.status == MODIFIED
+
+
+@dataclass
+class TreeComparison:
+    """Result of comparing a backup tree with a template tree."""
+
+    backup_root: Path
+    template_root: Path
+    files: dict[str, FileComparison] = field(default_factory=dict)
+    # Directory listings per side: relative directory -> {entry name: is_dir}
+    backup_dirs: dict[str, dict[str, bool]] = field(default_factory=dict)
+    template_dirs: dict[str, dict[str, bool]] = field(default_factory=dict)
+
+    def names(
+        self,
+        side: str,
+        directory: str,
+        dirs: bool = False,
+        suffix: str | None = None,
+    ) -> set[str]:
+        """Entry names of a walked directory.
+
+        Args:
+            side: "backup" or "template"
+            directory: Directory relative to the compared roots
+            dirs: Return subdirectory names instead of file names
+            suffix: Only include files with this suffix (e.g. ".md")
+
+        Returns:
+            Set of entry names (empty if the directory does not exist)
+        """
+        listings = self.backup_dirs if side == "backup" else self.template_dirs
+        entries = listings.get(directory.strip("/"), {})
+        if dirs:
+            return {name for name, is_dir in entries.items() if is_dir}
+        return {name for name, is_dir in entries.items() if not is_dir and (suffix is None or name.endswith(suffix))}
+
+    def only_in_backup(self, directory: str, dirs: bool = False, suffix: str | None = None) -> list[str]:
+        """Sorted names present in the backup directory but not in the template."""
+        return sorted(self.names("backup", directory, dirs, suffix) - self.names("template", directory, dirs, suffix))
+
+    def changed(self) -> list[FileComparison]:
+        """Files that differ between the two trees."""
+        return [info for info in self.files.values() if info.status in (ADDED, REMOVED, MODIFIED)]
+
+
+def _list_dir(path: Path) -> dict[str, bool]:
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    except OSError as e:
+        logger.debug(f"Cannot list {path}: {e}")
+        return {}
+
+
+def _file_size(path: Path) -> int | None:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+def _file_hash(path: Path) -> bytes:
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except (UnicodeDecodeError, OSError):
+        return None
+
+
+def _compare_file(backup_file: Path, template_file: Path, info: FileComparison, diff: bool) -> None:
+    """Fill in status and diff size for a file present on both sides."""
+    try:
+        if info.backup_size == info.template_size and _file_hash(backup_file) == _file_hash(template_file):
+            info.status = IDENTICAL
+            return
+    except OSError as e:
+        logger.debug(f"Cannot hash {info.path}: {e}")
+
+    info.status = MODIFIED
+    if not diff:
+        return
+
+    backup_text = _read_text(backup_file)
+    template_text = _read_text(template_file)
+    if backup_text is None or template_text is None:
+        info.is_text = False
+        return
+    info.diff_lines = sum(1 for _ in unified_diff(backup_text.splitlines(), template_text.splitlines(), lineterm=""))
+
+
+def compare_trees(
+    backup_root: Path,
+    template_root: Path,
+    paths: Iterable[str] | None = None,
+    compare: bool = True,
+    diff: bool = True,
+    recursive: bool = True,
+    max_workers: int | None = None,
+) -> TreeComparison:
+    """Compare a backup tree with a template tree in one lockstep walk.
+
+    Args:
+        backup_root: Root of the backed-up (or current project) tree
+        template_root: Root of the template tree
+        paths: Relative files or directories to compare (default: everything)
+        compare: Compare contents of files present on both sides; when False
+            such files get status ``present`` and only listings are collected
+        diff: Count unified diff lines for modified text files
+        recursive: Descend into subdirectories of the given paths; when False
+            only their direct entries are listed
+        max_workers: Threads for content comparison (default: CPU count, at most 8)
+
+    Returns:
+        TreeComparison with per-file results and the directory listings
+    """
+    result = TreeComparison(backup_root=backup_root, template_root=template_root)
+    pending: list[FileComparison] = []
+
+    def add_file(relative: str, in_backup: bool, in_template: bool) -> None:
+        if relative in result.files:
+            return
+        info = FileComparison(
+            path=relative,
+            status=PRESENT if in_backup and in_template else (REMOVED if in_backup else ADDED),
+            backup_size=_file_size(backup_root / relative) if in_backup else None,
+            template_size=_file_size(template_root / relative) if in_template else None,
+        )
+        result.files[relative] = info
+        if in_backup and in_template and compare:
+            pending.append(info)
+
+    def walk(relative: str) -> None:
+        backup_entries = _list_dir(backup_root / relative)
+        template_entries = _list_dir(template_root / relative)
+        result.backup_dirs[relative] = backup_entries
+        result.template_dirs[relative] = template_entries
+
+        for name in sorted(backup_entries.keys() | template_entries.keys()):
+            child = f"{relative}/{name}" if relative else name
+            backup_is_dir = backup_entries.get(name)
+            template_is_dir = template_entries.get(name)
+            if backup_is_dir or template_is_dir:
+                if recursive:
+                    walk(child)
+                # A file on one side and a directory on the other is reported as the file
+                if backup_is_dir is False or template_is_dir is False:
+                    add_file(child, backup_is_dir is False, template_is_dir is False)
+            else:
+                add_file(child, backup_is_dir is not None, template_is_dir is not None)
+
+    for relative in paths if paths is not None else [""]:
+        relative = relative.strip("/")
+        backup_path = backup_root / relative
+        template_path = template_root / relative
+        if (not relative or backup_path.is_dir() or template_path.is_dir()) and relative not in result.backup_dirs:
+            walk(relative)
+        elif backup_path.is_file() or template_path.is_file():
+            add_file(relative, backup_path.is_file(), template_path.is_file())
+
+    if pending:
+        workers = max(1, min(max_workers or min(os.cpu_count() or 1, 8), len(pending)))
+
+        def compare_one(info: FileComparison) -> None:
+            _compare_file(backup_root / info.path, template_root / info.path, info, diff)
+
+        if workers == 1:
+            for info in pending:
+                compare_one(info)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(compare_one, pending))
+
+    return result
@@ -0,0 +1,509 @@
+"""
+Metrics Store
+
+Time-bucketed metric series with mergeable quantile sketches for the
+monitoring dashboard.
+
+Each series keeps fixed-width time buckets (count, sum, sum of squares, min,
+max and a DDSketch), allocated only for buckets that received samples. Range
+statistics and percentiles are computed by merging the occupied buckets that
+overlap the range, so their cost is O(occupied buckets) instead of
+O(samples) or O(retention window).
+
+Raw samples are kept in ``TimeSortedBuffer`` instances so time-range queries
+can binary search instead of scanning, and newest-first queries across many
+buffers can be heap-merged lazily.
+"""
+
+import heapq
+import math
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Values with a magnitude below this are counted in the sketch's zero bucket
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class DDSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees.
+
+    Values are mapped to logarithmic buckets of ratio gamma = (1 + a) / (1 - a),
+    so any reported quantile is within relative accuracy ``a`` of a value at
+    the requested rank. Quantiles report the upper bound of the matching
+    bucket clamped to the observed range, so they never under-estimate
+    (the conservative side for latency and threshold alerting).
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_buckets",
+        "_gamma",
+        "_log_gamma",
+        "_positive",
+        "_negative",
+        "_zero",
+        "count",
+        "min",
+        "max",
+    )
+
+    def __init__(self, relative_accuracy: float = 0.005, max_buckets: int = 2048):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Relative accuracy of reported quantiles (0 < a < 1)
+            max_buckets: Bucket limit per sign; lowest buckets collapse beyond it
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def add(self, value: float) -> None:
+        """Add a value to the sketch."""
+        if value > MIN_INDEXABLE_VALUE:
+            store = self._positive
+            index = self._index(value)
+        elif value < -MIN_INDEXABLE_VALUE:
+            store = self._negative
+            index = self._index(-value)
+        else:
+            self._zero += 1
+            store = None
+
+        if store is not None:
+            store[index] = store.get(index, 0) + 1
+            if len(store) > self.max_buckets:
+                self._collapse(store)
+
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def _collapse(self, store: Dict[int, int]) -> None:
+        """Fold the lowest-magnitude buckets together to respect max_buckets."""
+        indexes = sorted(store)
+        excess = len(indexes) - self.max_buckets
+        target = indexes[excess]
+        for index in indexes[:excess]:
+            store[target] += store.pop(index)
+
+    def merge(self, other: "DDSketch") -> None:
+        """Merge another sketch with the same relative accuracy into this one."""
+        if other.count == 0:
+            return
+        if other._gamma != self._gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+
+        for index, count in other._positive.items():
+            self._positive[index] = self._positive.get(index, 0) + count
+        for index, count in other._negative.items():
+            self._negative[index] = self._negative.get(index, 0) + count
+        if len(self._positive) > self.max_buckets:
+            self._collapse(self._positive)
+        if len(self._negative) > self.max_buckets:
+            self._collapse(self._negative)
+
+        self._zero += other._zero
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the value at quantile q.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        cumulative = 0
+
+        # Negative values: largest magnitude first
+        for index in sorted(self._negative, reverse=True):
+            cumulative += self._negative[index]
+            if cumulative > rank:
+                return self._clamp(-(self._gamma ** (index - 1)))
+
+        cumulative += self._zero
+        if cumulative > rank:
+            return self._clamp(0.0)
+
+        for index in sorted(self._positive):
+            cumulative += self._positive[index]
+            if cumulative > rank:
+                return self._clamp(self._gamma**index)
+
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+
+class _Bucket:
+    """Aggregates for one occupied time bucket."""
+
+    __slots__ = ("count", "sum", "sum_squares", "min", "max", "sketch")
+
+    def __init__(self, relative_accuracy: float):
+        self.count = 0.0
+        self.sum = 0.0
+        self.sum_squares = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = DDSketch(relative_accuracy)
+
+
+class TimeBucketedSeries:
+    """
+    Fixed-width time buckets for one metric series, stored sparsely.
+
+    Only occupied buckets are allocated: a dict maps bucket id to its
+    aggregates and a sorted list of bucket ids serves range lookups by binary
+    search. Buckets older than ``capacity`` widths behind the newest one are
+    dropped as the series advances, so memory and query cost follow the
+    number of occupied buckets rather than the retention window.
+    """
+
+    def __init__(self, bucket_seconds: int = 60, capacity: int = 1440, relative_accuracy: float = 0.005):
+        """
+        Initialize an empty series.
+
+        Args:
+            bucket_seconds: Width of each time bucket in seconds
+            capacity: Number of bucket widths retained (retention = width x capacity)
+            relative_accuracy: Relative accuracy of per-bucket sketches
+        """
+        self.bucket_seconds = bucket_seconds
+        self.capacity = capacity
+        self.relative_accuracy = relative_accuracy
+
+        self._buckets: Dict[int, _Bucket] = {}
+        self._bucket_ids: List[int] = []
+        self._latest_bucket = -1
+
+    def add(self, timestamp: float, value: float) -> bool:
+        """
+        Add a sample.
+
+        Args:
+            timestamp: Sample time as a POSIX timestamp
+            value: Numeric sample value
+
+        Returns:
+            False if the sample is older than the retained window
+        """
+        bucket_id = int(timestamp // self.bucket_seconds)
+        if bucket_id <= self._latest_bucket - self.capacity:
+            return False
+
+        bucket = self._buckets.get(bucket_id)
+        if bucket is None:
+            bucket = self._buckets[bucket_id] = _Bucket(self.relative_accuracy)
+            if not self._bucket_ids or bucket_id > self._bucket_ids[-1]:
+                self._bucket_ids.append(bucket_id)
+            else:
+                insort(self._bucket_ids, bucket_id)
+        if bucket_id > self._latest_bucket:
+            self._latest_bucket = bucket_id
+            self._expire(bucket_id - self.capacity)
+
+        bucket.count += 1
+        bucket.sum += value
+        bucket.sum_squares += value * value
+        if value < bucket.min:
+            bucket.min = value
+        if value > bucket.max:
+            bucket.max = value
+        bucket.sketch.add(value)
+        return True
+
+    def _expire(self, cutoff: int) -> None:
+        """Drop buckets with id <= cutoff."""
+        ids = self._bucket_ids
+        if not ids or ids[0] > cutoff:
+            return
+        index = bisect_right(ids, cutoff)
+        for bucket_id in ids[:index]:
+            del self._buckets[bucket_id]
+        del ids[:index]
+
+    def _range(self, start: Optional[float], end: Optional[float]) -> Iterator[Tuple[int, _Bucket]]:
+        """Yield (bucket_id, bucket) pairs overlapping [start, end] in time order."""
+        ids = self._bucket_ids
+        lo = 0 if start is None else bisect_left(ids, int(start // self.bucket_seconds))
+        hi = len(ids) if end is None else bisect_right(ids, int(end // self.bucket_seconds))
+        buckets = self._buckets
+        for bucket_id in islice(ids, lo, hi):
+            yield bucket_id, buckets[bucket_id]
+
+    def summarize(self, start: Optional[float] = None, end: Optional[float] = None) -> "SeriesSummary":
+        """Merge all buckets overlapping [start, end] into one summary."""
+        summary = SeriesSummary(self.relative_accuracy)
+        for _, bucket in self._range(start, end):
+            summary.add_bucket(bucket.count, bucket.sum, bucket.sum_squares, bucket.min, bucket.max, bucket.sketch)
+        return summary
+
+    def points(self, start: Optional[float] = None, end: Optional[float] = None) -> List[Dict[str, float]]:
+        """
+        Get per-bucket aggregates overlapping [start, end].
+
+        Returns:
+            List of dictionaries with bucket start time, count, average, min and max
+        """
+        return [
+            {
+                "timestamp": float(bucket_id * self.bucket_seconds),
+                "count": bucket.count,
+                "average": bucket.sum / bucket.count,
+                "min": bucket.min,
+                "max": bucket.max,
+            }
+            for bucket_id, bucket in self._range(start, end)
+        ]
+
+
+class SeriesSummary:
+    """Mergeable summary of one or more series buckets."""
+
+    def __init__(self, relative_accuracy: float = 0.005):
+        self.count = 0.0
+        self.sum = 0.0
+        self.sum_squares = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = DDSketch(relative_accuracy)
+
+    def add_bucket(
+        self,
+        count: float,
+        total: float,
+        sum_squares: float,
+        minimum: float,
+        maximum: float,
+        sketch: Optional[DDSketch],
+    ) -> None:
+        """Fold one bucket into the summary."""
+        self.count += count
+        self.sum += total
+        self.sum_squares += sum_squares
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+        if sketch is not None:
+            self.sketch.merge(sketch)
+
+    def merge(self, other: "SeriesSummary") -> None:
+        """Merge another summary into this one."""
+        if other.count:
+            self.add_bucket(other.count, other.sum, other.sum_squares, other.min, other.max, other.sketch)
+
+    def to_statistics(self) -> Dict[str, Any]:
+        """
+        Convert to the monitoring statistics dictionary.
+
+        Returns:
+            Dictionary with count, average, median, min, max, std_dev, p95 and p99
+        """
+        count = int(self.count)
+        if count == 0:
+            return {
+                "count": 0,
+                "average": None,
+                "min": None,
+                "max": None,
+                "median": None,
+                "std_dev": None,
+            }
+
+        mean = self.sum / count
+        if count > 1:
+            variance = max(self.sum_squares - count * mean * mean, 0.0) / (count - 1)
+            std_dev = math.sqrt(variance)
+        else:
+            std_dev = 0
+
+        return {
+            "count": count,
+            "average": mean,
+            "median": self.sketch.quantile(0.5),
+            "min": self.min,
+            "max": self.max,
+            "std_dev": std_dev,
+            "p95": self.sketch.quantile(0.95),
+            "p99": self.sketch.quantile(0.99),
+        }
+
+
+class TimeSortedBuffer(Generic[T]):
+    """
+    Bounded buffer of items kept sorted by timestamp.
+
+    A drop-in replacement for the ``deque(maxlen=...)`` sample buffers: in-order
+    appends are O(1), late samples are inserted in place, and time-range lookups
+    use binary search. When ``maxlen`` is exceeded the oldest item is evicted.
+    """
+
+    __slots__ = ("maxlen", "_key", "_times", "_items", "_head")
+
+    def __init__(self, maxlen: Optional[int] = None, key: Callable[[T], Any] = attrgetter("timestamp")):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            maxlen: Maximum number of items retained (None for unbounded)
+            key: Function returning the sort timestamp of an item
+        """
+        self.maxlen = maxlen
+        self._key = key
+        self._times: List[Any] = []
+        self._items: List[T] = []
+        # Index of the first live item; popped items are compacted lazily
+        self._head = 0
+
+    def __len__(self) -> int:
+        return len(self._items) - self._head
+
+    def __bool__(self) -> bool:
+        return len(self._items) > self._head
+
+    def __iter__(self) -> Iterator[T]:
+        return islice(self._items, self._head, None)
+
+    def __reversed__(self) -> Iterator[T]:
+        return self.iter_newest()
+
+    def __getitem__(self, index: int) -> T:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("buffer index out of range")
+        return self._items[self._head + index]
+
+    def append(self, item: T) -> Optional[T]:
+        """
+        Insert an item in timestamp order.
+
+        Returns:
+            The evicted item if maxlen was exceeded, otherwise None
+        """
+        timestamp = self._key(item)
+        if not self._times or timestamp >= self._times[-1]:
+            self._times.append(timestamp)
+            self._items.append(item)
+        else:
+            index = bisect_right(self._times, timestamp, lo=self._head)
+            self._times.insert(index, timestamp)
+            self._items.insert(index, item)
+
+        if self.maxlen is not None and len(self) > self.maxlen:
+            return self.popleft()
+        return None
+
+    def popleft(self) -> T:
+        """Remove and return the oldest item."""
+        if not self:
+            raise IndexError("pop from an empty buffer")
+        item = self._items[self._head]
+        self._items[self._head] = None  # type: ignore[assignment]
+        self._head += 1
+        if self._head > 1024 and self._head * 2 > len(self._items):
+            del self._times[: self._head]
+            del self._items[: self._head]
+            self._head = 0
+        return item
+
+    def evict_before(self, cutoff: Any) -> List[T]:
+        """
+        Remove all items older than cutoff.
+
+        Returns:
+            The evicted items, oldest first
+        """
+        index = bisect_left(self._times, cutoff, lo=self._head)
+        evicted = self._items[self._head : index]
+        for _ in range(len(evicted)):
+            self.popleft()
+        return evicted
+
+    def _bounds(self, start: Any, end: Any) -> Tuple[int, int]:
+        lo = self._head if start is None else bisect_left(self._times, start, lo=self._head)
+        hi = len(self._times) if end is None else bisect_right(self._times, end, lo=self._head)
+        return lo, hi
+
+    def iter_range(self, start: Any = None, end: Any = None) -> Iterator[T]:
+        """Iterate items with start <= timestamp <= end, oldest first."""
+        lo, hi = self._bounds(start, end)
+        return islice(self._items, lo, hi)
+
+    def iter_newest(self, start: Any = None, end: Any = None) -> Iterator[T]:
+        """Iterate items with start <= timestamp <= end, newest first."""
+        lo, hi = self._bounds(start, end)
+        items = self._items
+        return (items[i] for i in range(hi - 1, lo - 1, -1))
+
+
+def merge_newest(
+    buffers: Iterable[TimeSortedBuffer[T]],
+    start: Any = None,
+    end: Any = None,
+    limit: Optional[int] = None,
+    predicate: Optional[Callable[[T], bool]] = None,
+    key: Callable[[T], Any] = attrgetter("timestamp"),
+) -> List[T]:
+    """
+    Collect items from several buffers in newest-first order.
+
+    Each buffer is already time-sorted, so the buffers are heap-merged lazily:
+    a limit-N query touches roughly N items plus one per buffer instead of
+    sorting every matching sample.
+
+    Args:
+        buffers: Buffers to merge
+        start: Inclusive lower timestamp bound
+        end: Inclusive upper timestamp bound
+        limit: Maximum number of items returned
+        predicate: Optional per-item filter applied before the limit
+
+    Returns:
+        Items sorted by timestamp, newest first
+    """
+    streams = [buffer.iter_newest(start, end) for buffer in buffers if buffer]
+    if len(streams) == 1:
+        merged: Iterator[T] = streams[0]
+    else:
+        merged = heapq.merge(*streams, key=key, reverse=True)
+    if predicate is not None:
+        merged = filter(predicate, merged)
+    if limit:
+        merged = islice(merged, limit)
+    return list(merged)
@@ -14,6 +14,8 @@ Key Features:
 """
 
 import asyncio
+import heapq
+import logging
 import threading
 import time
 from dataclasses import dataclass, field
@@ -29,6 +31,8 @@ from .jit_enhanced_hook_manager import (
     Phase,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class SchedulingStrategy(Enum):
     """Hook scheduling strategies"""
@@ -142,6 +146,7 @@ class PhaseOptimizedHookScheduler:
 
         # Performance tracking
         self._scheduling_history: List[Dict[str, Any]] = []
+        self._dependency_cycles: List[List[str]] = []  # Cycles found by the last dependency resolution
         self._performance_cache: Dict[str, Dict[str, float]] = {}
         self._scheduling_lock = threading.Lock()
 
@@ -251,7 +256,7 @@ class PhaseOptimizedHookScheduler:
         Returns:
             Scheduling result with execution plan
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Select optimal strategy
         selected_strategy = strategy or self._select_optimal_strategy(event_type, context)
@@ -275,8 +280,8 @@ class PhaseOptimizedHookScheduler:
         # Optimize execution order
         optimized_groups = self._optimize_execution_order(execution_groups, context)
 
-        # Calculate estimates
-        total_time_ms = sum(group.estimated_time_ms for group in optimized_groups)
+        # Calculate estimates (groups run one after another; a group takes its max wait time)
+        total_time_ms = sum(group.max_wait_time_ms for group in optimized_groups)
         total_tokens = sum(group.estimated_tokens for group in optimized_groups)
 
         # Create execution plan
@@ -310,7 +315,7 @@ class PhaseOptimizedHookScheduler:
         )
 
         # Update scheduling history and performance
-        self._update_scheduling_history(result, time.time() - start_time)
+        self._update_scheduling_history(result, (time.perf_counter() - start_time) * 1000)
         self._update_strategy_performance(selected_strategy, result, context)
 
         return result
@@ -552,98 +557,170 @@ class PhaseOptimizedHookScheduler:
         return execute_hooks + other_hooks
 
     def _resolve_dependencies(self, hooks: List[ScheduledHook]) -> List[ScheduledHook]:
-        """Resolve hook dependencies and adjust execution order"""
+        """Order hooks so that every hook follows its dependencies
+
+        Kahn's algorithm with a max-heap on priority score: among the hooks
+        whose dependencies are satisfied, the highest priority one goes next.
+        Dependencies on hooks outside ``hooks`` are ignored. Cycles are
+        reported and broken at their highest priority member.
+        """
+        by_path = {hook.hook_path: hook for hook in hooks}
+        position = {id(hook): index for index, hook in enumerate(hooks)}
+        in_degree = {id(hook): 0 for hook in hooks}
+
         # Build dependency graph
         for hook in hooks:
             for dep_path in hook.dependencies:
-                # Find dependent hook
-                for other_hook in hooks:
-                    if other_hook.hook_path == dep_path:
-                        other_hook.dependents.add(hook.hook_path)
-                        break
-
-        # Topological sort considering dependencies
-        resolved_hooks = []
-        remaining_hooks = hooks.copy()
-
-        while remaining_hooks:
-            # Find hooks with no unresolved dependencies
-            ready_hooks = [
-                h
-                for h in remaining_hooks
-                if not any(dep in [rh.hook_path for rh in remaining_hooks] for dep in h.dependencies)
-            ]
-
-            if not ready_hooks:
-                # Circular dependency - break by priority
-                ready_hooks = sorted(remaining_hooks, key=lambda h: h.priority_score, reverse=True)
-                ready_hooks = [ready_hooks[0]]
-
-            # Add highest priority ready hook
-            next_hook = max(ready_hooks, key=lambda h: h.priority_score)
+                dependency = by_path.get(dep_path)
+                if dependency is not None and dependency is not hook:
+                    dependency.dependents.add(hook.hook_path)
+                    in_degree[id(hook)] += 1
+
+        def heap_entry(hook: ScheduledHook) -> tuple:
+            return (-hook.priority_score, position[id(hook)], hook)
+
+        ready = [heap_entry(hook) for hook in hooks if in_degree[id(hook)] == 0]
+        heapq.heapify(ready)
+        resolved_hooks: List[ScheduledHook] = []
+        placed: Set[int] = set()
+        self._dependency_cycles = []
+
+        while len(resolved_hooks) < len(hooks):
+            if not ready:
+                # Every remaining hook waits on another one: report the cycle and
+                # release its highest priority member
+                remaining = [hook for hook in hooks if id(hook) not in placed]
+                cycle = self._find_dependency_cycle(remaining, by_path, placed)
+                self._dependency_cycles.append(cycle)
+                logger.warning(f"Circular hook dependency: {' -> '.join(cycle)}")
+                cycle_hooks = [by_path[path] for path in cycle[:-1]] or remaining
+                heapq.heappush(ready, heap_entry(max(cycle_hooks, key=lambda h: h.priority_score)))
+
+            _, _, next_hook = heapq.heappop(ready)
+            if id(next_hook) in placed:
+                continue
+            placed.add(id(next_hook))
             resolved_hooks.append(next_hook)
-            remaining_hooks.remove(next_hook)
+
+            for dependent_path in next_hook.dependents:
+                dependent = by_path.get(dependent_path)
+                if dependent is None or id(dependent) in placed:
+                    continue
+                in_degree[id(dependent)] -= 1
+                if in_degree[id(dependent)] == 0:
+                    heapq.heappush(ready, heap_entry(dependent))
 
         return resolved_hooks
 
+    @staticmethod
+    def _find_dependency_cycle(
+        remaining: List[ScheduledHook], by_path: Dict[str, ScheduledHook], placed: Set[int]
+    ) -> List[str]:
+        """Follow unresolved dependencies from a blocked hook until a path repeats"""
+        path: List[str] = []
+        seen: Dict[str, int] = {}
+        hook = remaining[0]
+        while hook.hook_path not in seen:
+            seen[hook.hook_path] = len(path)
+            path.append(hook.hook_path)
+            blocking = next(
+                (
+                    by_path[dep]
+                    for dep in sorted(hook.dependencies)
+                    if dep in by_path and id(by_path[dep]) not in placed and by_path[dep] is not hook
+                ),
+                None,
+            )
+            if blocking is None:
+                return path
+            hook = blocking
+        return path[seen[hook.hook_path] :] + [hook.hook_path]
+
     def _create_execution_groups(
         self,
         hooks: List[ScheduledHook],
         context: HookSchedulingContext,
         strategy: SchedulingStrategy,
     ) -> List[ExecutionGroup]:
-        """Create execution groups for optimal performance"""
-        groups = []
-        current_group = None
-        group_id = 0
-
+        """Create dependency-respecting execution groups along the critical path
+
+        List scheduling in the spirit of HEFT: each hook is ranked by the
+        longest estimated time from its start to the end of the plan (its own
+        time plus that of its slowest chain of dependents). Groups run one
+        after another, so a group only takes hooks whose dependencies ran in
+        earlier groups. The ready hook with the highest rank opens the next
+        group; a parallel group is filled with up to ``max_parallel_groups``
+        ready parallel-safe hooks in rank order, so long chains start early
+        and short hooks run alongside them.
+        """
         # Get phase preferences
         phase_params = self._phase_parameters.get(context.current_phase, {})
         prefer_parallel = phase_params.get("prefer_parallel", True)
 
-        for hook in hooks:
-            if hook.scheduling_decision != SchedulingDecision.EXECUTE:
-                continue
+        execute_hooks = [hook for hook in hooks if hook.scheduling_decision == SchedulingDecision.EXECUTE]
+        if not execute_hooks:
+            return []
+
+        by_path = {hook.hook_path: hook for hook in execute_hooks}
+        order = {id(hook): index for index, hook in enumerate(execute_hooks)}
+
+        def dependencies_of(hook: ScheduledHook) -> List[ScheduledHook]:
+            return [
+                by_path[dep]
+                for dep in hook.dependencies
+                if dep in by_path and by_path[dep] is not hook and order[id(by_path[dep])] < order[id(hook)]
+            ]
 
-            # Determine execution type
-            execution_type = (
-                SchedulingDecision.PARALLEL
-                if (prefer_parallel and hook.metadata.parallel_safe)
-                else SchedulingDecision.SEQUENTIAL
+        # Upward rank, computed in reverse dependency order (hooks arrive resolved)
+        dependents: Dict[int, List[ScheduledHook]] = {id(hook): [] for hook in execute_hooks}
+        waiting: Dict[int, int] = {}
+        for hook in execute_hooks:
+            deps = dependencies_of(hook)
+            waiting[id(hook)] = len(deps)
+            for dependency in deps:
+                dependents[id(dependency)].append(hook)
+
+        rank: Dict[int, float] = {}
+        for hook in reversed(execute_hooks):
+            rank[id(hook)] = hook.estimated_time_ms + max(
+                (rank[id(dependent)] for dependent in dependents[id(hook)]), default=0.0
             )
 
-            # Create new group if needed
-            if (
-                current_group is None
-                or current_group.execution_type != execution_type
-                or len(current_group.hooks) >= self.max_parallel_groups
-            ):
-                current_group = ExecutionGroup(
-                    group_id=group_id,
-                    execution_type=execution_type,
-                    hooks=[],
-                    estimated_time_ms=0.0,
-                    estimated_tokens=0,
-                    max_wait_time_ms=0.0,
-                    dependencies=set(),
-                )
-                groups.append(current_group)
-                group_id += 1
-
-            # Add hook to current group
-            current_group.hooks.append(hook)
-            current_group.estimated_time_ms += hook.estimated_time_ms
-            current_group.estimated_tokens += hook.estimated_cost
-            current_group.dependencies.update(hook.dependencies)
-
-        # Set max wait time for parallel groups
-        for group in groups:
-            if group.execution_type == SchedulingDecision.PARALLEL:
-                # For parallel groups, wait time is determined by slowest hook
-                group.max_wait_time_ms = max(h.estimated_time_ms for h in group.hooks)
-            else:
-                # For sequential groups, sum all hook times
-                group.max_wait_time_ms = group.estimated_time_ms
+        def is_parallel(hook: ScheduledHook) -> bool:
+            return bool(prefer_parallel and hook.metadata.parallel_safe)
+
+        ready = [hook for hook in execute_hooks if waiting[id(hook)] == 0]
+        groups: List[ExecutionGroup] = []
+        width = max(1, self.max_parallel_groups)
+
+        while ready:
+            ready.sort(key=lambda h: (-rank[id(h)], order[id(h)]))
+            parallel = is_parallel(ready[0])
+            members = [hook for hook in ready if is_parallel(hook) == parallel][:width]
+            chosen = {id(hook) for hook in members}
+            ready = [hook for hook in ready if id(hook) not in chosen]
+
+            group = ExecutionGroup(
+                group_id=len(groups),
+                execution_type=SchedulingDecision.PARALLEL if parallel else SchedulingDecision.SEQUENTIAL,
+                hooks=members,
+                estimated_time_ms=sum(hook.estimated_time_ms for hook in members),
+                estimated_tokens=sum(hook.estimated_cost for hook in members),
+                # Parallel groups wait for their slowest hook, sequential ones for all hooks
+                max_wait_time_ms=(
+                    max(hook.estimated_time_ms for hook in members)
+                    if parallel
+                    else sum(hook.estimated_time_ms for hook in members)
+                ),
+                dependencies=set().union(*(hook.dependencies for hook in members)),
+            )
+            groups.append(group)
+
+            for hook in members:
+                for dependent in dependents[id(hook)]:
+                    waiting[id(dependent)] -= 1
+                    if waiting[id(dependent)] == 0:
+                        ready.append(dependent)
 
         return groups
 
@@ -654,7 +731,7 @@ class PhaseOptimizedHookScheduler:
         if len(groups) <= 1:
             return groups
 
-        # Sort groups by priority and execution type
+        # Rank groups by priority and execution type
         def group_score(group: ExecutionGroup) -> float:
             # Calculate average priority of hooks in group
             avg_priority = sum(h.priority_score for h in group.hooks) / len(group.hooks)
@@ -667,8 +744,32 @@ class PhaseOptimizedHookScheduler:
 
             return avg_priority + parallel_bonus + size_bonus
 
-        # Sort by score (descending)
-        optimized_groups = sorted(groups, key=group_score, reverse=True)
+        # Highest score first, but never ahead of a group providing one of its dependencies
+        providers = {hook.hook_path: index for index, group in enumerate(groups) for hook in group.hooks}
+        blockers: List[Set[int]] = [
+            {providers[dep] for dep in group.dependencies if dep in providers and providers[dep] != index}
+            for index, group in enumerate(groups)
+        ]
+        unblocks: List[List[int]] = [[] for _ in groups]
+        for index, blocked_by in enumerate(blockers):
+            for provider in blocked_by:
+                unblocks[provider].append(index)
+
+        ready = [(-group_score(group), index) for index, group in enumerate(groups) if not blockers[index]]
+        heapq.heapify(ready)
+        optimized_groups: List[ExecutionGroup] = []
+        while ready:
+            _, index = heapq.heappop(ready)
+            optimized_groups.append(groups[index])
+            for blocked in unblocks[index]:
+                blockers[blocked].discard(index)
+                if not blockers[blocked]:
+                    heapq.heappush(ready, (-group_score(groups[blocked]), blocked))
+
+        # Mutually dependent groups (only possible with cyclic hooks) keep their order
+        if len(optimized_groups) < len(groups):
+            placed = {id(group) for group in optimized_groups}
+            optimized_groups.extend(group for group in groups if id(group) not in placed)
 
         return optimized_groups
 
@@ -760,6 +861,7 @@ class PhaseOptimizedHookScheduler:
                 "total_schedules": total_schedules,
                 "strategy_performance": strategy_stats,
                 "recent_performance": recent_performance,
+                "dependency_cycles": [list(cycle) for cycle in self._dependency_cycles],
                 "recommended_strategy": (
                     max(
                         strategy_stats.keys(),
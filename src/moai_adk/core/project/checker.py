@@ -9,6 +9,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+from moai_adk.core.project.tool_probe import probe_tool_versions
+
 
 class SystemChecker:
     """Validate system requirements."""
@@ -126,6 +128,18 @@ class SystemChecker:
         },
     }
 
+    def __init__(self) -> None:
+        # shutil.which results per tool name; PATH lookups are repeated across checks
+        self._which_cache: dict[str, str | None] = {}
+        # Versions gathered by prefetch_tool_versions()
+        self._versions: dict[str, str | None] = {}
+
+    def _which(self, tool: str) -> str | None:
+        """Resolve a tool on PATH once per checker (helper)."""
+        if tool not in self._which_cache:
+            self._which_cache[tool] = shutil.which(tool)
+        return self._which_cache[tool]
+
     def check_all(self) -> dict[str, bool]:
         """Validate every tool.
 
@@ -160,7 +174,7 @@ class SystemChecker:
             # Extract the tool name (first token)
             tool_name = command.split()[0]
             # Determine availability via shutil.which
-            return shutil.which(tool_name) is not None
+            return self._which(tool_name) is not None
         except Exception:
             return False
 
@@ -204,7 +218,30 @@ class SystemChecker:
         Returns:
             True when the tool is available.
         """
-        return shutil.which(tool) is not None
+        return self._which(tool) is not None
+
+    def prefetch_tool_versions(self, tools: list[str], refresh: bool = False) -> dict[str, str | None]:
+        """Probe the versions of several tools concurrently.
+
+        Results are cached in ~/.moai/cache keyed by executable path and
+        mtime, and later get_tool_version() calls are answered from memory.
+
+        Args:
+            tools: Tool names; unavailable tools are skipped.
+            refresh: Ignore cached versions and probe every tool again.
+
+        Returns:
+            Dictionary mapping available tool names to version strings.
+        """
+        executables = {}
+        for tool in dict.fromkeys(tools):
+            path = self._which(tool) if tool else None
+            if path:
+                executables[tool] = path
+
+        versions = probe_tool_versions(executables, refresh=refresh)
+        self._versions.update(versions)
+        return versions
 
     def get_tool_version(self, tool: str | None) -> str | None:
         """Retrieve tool version information.
@@ -219,6 +256,9 @@ class SystemChecker:
         if not tool or not self._is_tool_available(tool):
             return None
 
+        if tool in self._versions:
+            return self._versions[tool]
+
         try:
             # Call the tool with --version to obtain the version string
             result = subprocess.run(
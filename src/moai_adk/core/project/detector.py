@@ -12,6 +12,8 @@ Extended detection supports:
 
 from pathlib import Path
 
+from moai_adk.utils.file_index import get_file_index
+
 
 class LanguageDetector:
     """Automatically detect up to 20 programming languages.
@@ -109,9 +111,10 @@ class LanguageDetector:
             True when any pattern matches.
         """
         for pattern in patterns:
-            # Extension pattern (e.g., *.py)
+            # Extension pattern (e.g., *.py): shared, ignore-aware index that
+            # stops walking at the first match
             if pattern.startswith("*."):
-                if list(path.rglob(pattern)):
+                if get_file_index(path).has_extension(pattern):
                     return True
             # Specific file name (e.g., pyproject.toml)
             else:
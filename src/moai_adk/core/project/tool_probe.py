@@ -0,0 +1,178 @@
+"""Concurrent, cached tool version probing.
+
+Runs ``<tool> --version`` for many executables at once with asyncio
+subprocesses instead of one blocking call after another, and remembers the
+results in ``~/.moai/cache/tool-versions.json``. A cached version is reused
+while the executable at the same path still resolves to the same target with
+the same mtime and size, so upgrading a tool invalidates its entry
+automatically. Version-manager shims (pyenv, asdf) never change on disk when
+the selected version does, so entries also expire after ``CACHE_TTL``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROBE_TIMEOUT = 2.0  # seconds per probe, as for a single --version call
+
+# Upper bound on concurrently running probes
+MAX_CONCURRENT_PROBES = 16
+
+CACHE_VERSION = 2
+
+# Seconds a cached version stays valid even if the executable looks unchanged
+CACHE_TTL = 24 * 60 * 60
+
+
+def default_cache_path() -> Path:
+    """Location of the persistent tool version cache."""
+    return Path.home() / ".moai" / "cache" / "tool-versions.json"
+
+
+def _signature(executable: str) -> list[str | int] | None:
+    target = os.path.realpath(executable)
+    try:
+        stat = os.stat(target)
+    except OSError:
+        return None
+    return [target, stat.st_mtime_ns, stat.st_size]
+
+
+def _is_fresh(entry: dict, signature: list[str | int], now: float, ttl: float) -> bool:
+    probed_at = entry.get("probed_at")
+    return entry.get("signature") == signature and isinstance(probed_at, (int, float)) and 0 <= now - probed_at < ttl
+
+
+def _first_line(output: bytes) -> str:
+    return output.decode("utf-8", errors="replace").strip().split("\n")[0]
+
+
+async def _probe(executable: str, timeout: float, semaphore: asyncio.Semaphore) -> str | None:
+    async with semaphore:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                executable,
+                "--version",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return None
+
+    if process.returncode == 0 and stdout.strip():
+        return _first_line(stdout)
+    return None
+
+
+async def _probe_all(executables: list[str], timeout: float) -> list[str | None]:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+    return await asyncio.gather(*(_probe(executable, timeout, semaphore) for executable in executables))
+
+
+def _run_probes(executables: list[str], timeout: float) -> list[str | None]:
+    """Run the probes on a fresh event loop (in a helper thread if one is already running)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_probe_all(executables, timeout))
+
+    results: list[str | None] = []
+
+    def runner() -> None:
+        results.extend(asyncio.run(_probe_all(executables, timeout)))
+
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+    return results
+
+
+def _load_cache(cache_path: Path) -> dict[str, dict]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    entries = data.get("tools")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_cache(cache_path: Path, entries: dict[str, dict]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=".tool-versions-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "tools": entries}, f, indent=2)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write tool version cache {cache_path}: {e}")
+
+
+def probe_tool_versions(
+    executables: dict[str, str],
+    refresh: bool = False,
+    timeout: float = PROBE_TIMEOUT,
+    cache_path: Path | None = None,
+    ttl: float = CACHE_TTL,
+) -> dict[str, str | None]:
+    """Get ``--version`` output for several tools, probing uncached ones concurrently.
+
+    Args:
+        executables: Tool name to resolved executable path
+        refresh: Ignore cached results and probe every tool again
+        timeout: Seconds to wait for each probe
+        cache_path: Cache file (default: ~/.moai/cache/tool-versions.json)
+        ttl: Seconds a cached version is reused before probing again
+
+    Returns:
+        First line of each tool's version output, or None when the probe
+        failed or timed out
+    """
+    if not executables:
+        return {}
+
+    cache_path = cache_path or default_cache_path()
+    entries = _load_cache(cache_path)
+
+    versions: dict[str, str | None] = {}
+    pending: dict[str, list[str | int] | None] = {}
+    now = time.time()
+    for tool, executable in executables.items():
+        signature = _signature(executable)
+        entry = entries.get(executable)
+        if not refresh and signature is not None and isinstance(entry, dict) and _is_fresh(entry, signature, now, ttl):
+            versions[tool] = entry.get("version")
+        else:
+            pending[tool] = signature
+
+    if pending:
+        paths = [executables[tool] for tool in pending]
+        for (tool, signature), version in zip(pending.items(), _run_probes(paths, timeout)):
+            versions[tool] = version
+            if signature is not None:
+                entries[executables[tool]] = {"signature": signature, "version": version, "probed_at": now}
+        _save_cache(cache_path, entries)
+
+    return {tool: versions[tool] for tool in executables}
@@ -13,9 +13,15 @@ TRUST 4 principles:
 import ast
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from moai_adk.core.quality.validators.base_validator import ValidationResult
+from moai_adk.utils.code_analysis import (
+    AnalysisSession,
+    FunctionMetrics,
+    cyclomatic_complexity,
+    get_analysis_session,
+)
 
 # ========================================
 # Constants (descriptive names)
@@ -35,9 +41,21 @@ DEFAULT_FILE_ENCODING = "utf-8"
 class TrustChecker:
     """Integrated TRUST principle validator"""
 
-    def __init__(self):
-        """Initialize TrustChecker"""
+    def __init__(self, incremental: bool = False, base_ref: str | None = None):
+        """
+        Initialize TrustChecker
+
+        Args:
+            incremental: Re-check only files git reports as changed and reuse
+                cached per-file results for the rest (falls back to a full
+                scan when there is no usable cache). Results match a full run.
+            base_ref: In incremental mode, also re-check files changed on the
+                branch since this ref (``git diff base...HEAD``), e.g. 'origin/main'
+        """
         self.results: dict[str, ValidationResult] = {}
+        self.incremental = incremental
+        self.base_ref = base_ref
+        self._synced_roots: set[Path] = set()
 
     # ========================================
     # T: Test First - Coverage Validation
@@ -106,22 +124,22 @@ class TrustChecker:
             )
 
         violations = []
+        session = self._session(src_path)
 
-        for py_file in src_path.rglob("*.py"):
+        for py_file in session.files(".py"):
             # Apply guard clause (improves readability)
             if py_file.name.startswith("test_"):
                 continue
 
-            try:
-                lines = py_file.read_text(encoding="utf-8").splitlines()
-                loc = len(lines)
-
-                if loc > MAX_FILE_LINES_OF_CODE:
-                    violations.append(f"{py_file.name}: {loc} LOC (Limit: {MAX_FILE_LINES_OF_CODE})")
-            except (UnicodeDecodeError, PermissionError):
-                # Security: handle file access errors
+            # Security: unreadable or undecodable files yield no metrics
+            metrics = session.metrics(py_file)
+            if metrics is None:
                 continue
 
+            if metrics.line_count > MAX_FILE_LINES_OF_CODE:
+                violations.append(f"{py_file.name}: {metrics.line_count} LOC (Limit: {MAX_FILE_LINES_OF_CODE})")
+        session.save()
+
         if not violations:
             return ValidationResult(passed=True, message="All files within 300 LOC")
 
@@ -146,31 +164,12 @@ class TrustChecker:
         """
         violations = []
 
-        for py_file in src_path.rglob("*.py"):
-            if py_file.name.startswith("test_"):
-                continue
-
-            try:
-                content = py_file.read_text()
-                tree = ast.parse(content)
-                lines = content.splitlines()
-
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        # AST line numbers are 1-based
-                        start_line = node.lineno
-                        end_line = node.end_lineno if node.end_lineno else start_line  # type: ignore
-
-                        # Compute actual function lines of code (decorators excluded)
-                        func_lines = lines[start_line - 1 : end_line]
-                        func_loc = len(func_lines)
-
-                        if func_loc > MAX_FUNCTION_LINES_OF_CODE:
-                            violations.append(
-                                f"{py_file.name}::{node.name}(): {func_loc} LOC (Limit: {MAX_FUNCTION_LINES_OF_CODE})"
-                            )
-            except SyntaxError:
-                continue
+        for py_file, func in self._iter_functions(src_path):
+            # Function lines of code (decorators excluded)
+            if func.length > MAX_FUNCTION_LINES_OF_CODE:
+                violations.append(
+                    f"{py_file.name}::{func.name}(): {func.length} LOC (Limit: {MAX_FUNCTION_LINES_OF_CODE})"
+                )
 
         if not violations:
             return ValidationResult(passed=True, message="All functions within 50 LOC")
@@ -196,22 +195,11 @@ class TrustChecker:
         """
         violations = []
 
-        for py_file in src_path.rglob("*.py"):
-            if py_file.name.startswith("test_"):
-                continue
-
-            try:
-                tree = ast.parse(py_file.read_text())
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        param_count = len(node.args.args)
-                        if param_count > MAX_FUNCTION_PARAMETERS:
-                            violations.append(
-                                f"{py_file.name}::{node.name}(): {param_count} parameters "
-                                f"(Limit: {MAX_FUNCTION_PARAMETERS})"
-                            )
-            except SyntaxError:
-                continue
+        for py_file, func in self._iter_functions(src_path):
+            if func.params > MAX_FUNCTION_PARAMETERS:
+                violations.append(
+                    f"{py_file.name}::{func.name}(): {func.params} parameters (Limit: {MAX_FUNCTION_PARAMETERS})"
+                )
 
         if not violations:
             return ValidationResult(passed=True, message="All functions within 5 parameters")
@@ -237,22 +225,11 @@ class TrustChecker:
         """
         violations = []
 
-        for py_file in src_path.rglob("*.py"):
-            if py_file.name.startswith("test_"):
-                continue
-
-            try:
-                tree = ast.parse(py_file.read_text())
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        complexity = self._calculate_complexity(node)
-                        if complexity > MAX_CYCLOMATIC_COMPLEXITY:
-                            violations.append(
-                                f"{py_file.name}::{node.name}(): complexity {complexity} "
-                                f"(Limit: {MAX_CYCLOMATIC_COMPLEXITY})"
-                            )
-            except SyntaxError:
-                continue
+        for py_file, func in self._iter_functions(src_path):
+            if func.complexity > MAX_CYCLOMATIC_COMPLEXITY:
+                violations.append(
+                    f"{py_file.name}::{func.name}(): complexity {func.complexity} (Limit: {MAX_CYCLOMATIC_COMPLEXITY})"
+                )
 
         if not violations:
             return ValidationResult(passed=True, message="All functions within complexity 10")
@@ -276,16 +253,45 @@ class TrustChecker:
         Returns:
             int: Cyclomatic complexity
         """
-        complexity = 1
-        for child in ast.walk(node):
-            # Add 1 for each branching statement
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler, ast.With)):
-                complexity += 1
-            # Add 1 for each and/or operator
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-            # elif is already counted as ast.If, no extra handling needed
-        return complexity
+        return cyclomatic_complexity(node)
+
+    def _session(self, src_path: Path) -> AnalysisSession:
+        """
+        Get the shared analysis session for a source directory
+
+        In incremental mode, the session is synced with git once per checker,
+        so unchanged files are served from the cache without being stat-ed.
+        """
+        session = get_analysis_session(src_path)
+        if not self.incremental:
+            if session.incremental:
+                session.reset_incremental()
+        elif src_path not in self._synced_roots:
+            session.sync_git_changes(self.base_ref)
+            self._synced_roots.add(src_path)
+        return session
+
+    def _iter_functions(self, src_path: Path) -> Iterator[tuple[Path, FunctionMetrics]]:
+        """
+        Iterate (file, function metrics) for non-test source files
+
+        Metrics come from the shared analysis session, so each file is read
+        and parsed once for all function-level checks. Files with syntax
+        errors have no functions and are skipped.
+        """
+        session = self._session(src_path)
+        for py_file in session.files(".py"):
+            if py_file.name.startswith("test_"):
+                continue
+
+            metrics = session.metrics(py_file)
+            if metrics is None:
+                continue
+
+            for func in metrics.functions:
+                if not func.is_async:
+                    yield py_file, func
+        session.save()
 
     # ========================================
     # T: Trackable - Code Traceability
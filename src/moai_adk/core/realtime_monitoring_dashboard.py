@@ -19,15 +19,21 @@ Key Features:
 
 import asyncio
 import logging
-import statistics
 import threading
 import time
 import uuid
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from moai_adk.core.performance.metrics_store import (
+    SeriesSummary,
+    TimeBucketedSeries,
+    TimeSortedBuffer,
+    merge_newest,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -200,14 +206,39 @@ class Dashboard:
 
 
 class MetricsCollector:
-    """Advanced metrics collection with multi-tenant support"""
+    """
+    Advanced metrics collection with multi-tenant support
+
+    Numeric samples are also folded into per-series (metric type, component,
+    tenant) time-bucketed ring buffers, so statistics and chart series are
+    computed from O(buckets) aggregates instead of copying and sorting raw samples.
+    """
 
-    def __init__(self, buffer_size: int = 100000, retention_hours: int = 168):  # 7 days
+    def __init__(
+        self,
+        buffer_size: int = 100000,
+        retention_hours: int = 168,  # 7 days
+        bucket_seconds: int = 60,
+    ):
         self.buffer_size = buffer_size
         self.retention_hours = retention_hours
-        self.metrics_buffer: Dict[str, deque] = defaultdict(lambda: deque(maxlen=buffer_size))
+        self.bucket_seconds = bucket_seconds
+        self.metrics_buffer: Dict[str, TimeSortedBuffer[MetricData]] = defaultdict(
+            lambda: TimeSortedBuffer(maxlen=buffer_size)
+        )
         self.aggregated_metrics: Dict[str, Dict[str, Any]] = defaultdict(dict)
-        self.tenant_metrics: Dict[str, Dict[str, deque]] = defaultdict(lambda: defaultdict(deque))
+        self.tenant_metrics: Dict[str, Dict[str, TimeSortedBuffer[MetricData]]] = defaultdict(
+            lambda: defaultdict(TimeSortedBuffer)
+        )
+        # Secondary indexes over "type:component" buffer keys
+        self._type_index: Dict[str, Set[str]] = defaultdict(set)
+        self._component_index: Dict[str, Set[str]] = defaultdict(set)
+        # Inverted tag index: (tag, value) → buffer keys that have seen it.
+        # Entries may outlive evicted samples; samples are still checked exactly.
+        self._tag_index: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        # (metric_type, component, tenant_id) → bucketed series
+        self.series: Dict[Tuple[str, str, Optional[str]], TimeBucketedSeries] = {}
+        self._series_capacity = max(1, retention_hours * 3600 // bucket_seconds)
         self._lock = threading.RLock()
         self._last_cleanup = datetime.now()
 
@@ -217,6 +248,7 @@ class MetricsCollector:
             # Global metrics buffer
             key = f"{metric.metric_type.value}:{metric.component}"
             self.metrics_buffer[key].append(metric)
+            self._index_metric(key, metric)
 
             # Tenant-specific metrics
             if metric.tenant_id:
@@ -225,8 +257,16 @@ class MetricsCollector:
 
             # Update aggregated statistics
             self._update_aggregated_metrics(metric)
+            self._update_series(metric)
             self._cleanup_old_metrics()
 
+    def _index_metric(self, key: str, metric: MetricData) -> None:
+        """Register a buffer key in the type, component and tag indexes"""
+        self._type_index[metric.metric_type.value].add(key)
+        self._component_index[metric.component].add(key)
+        for tag in metric.tags.items():
+            self._tag_index[tag].add(key)
+
     def _update_aggregated_metrics(self, metric: MetricData) -> None:
         """Update aggregated statistics for a metric type"""
         key = f"{metric.metric_type.value}:{metric.component}"
@@ -237,7 +277,6 @@ class MetricsCollector:
                 "sum": 0,
                 "min": float("inf"),
                 "max": float("-inf"),
-                "values": [],
                 "last_updated": datetime.now(),
             }
 
@@ -248,12 +287,69 @@ class MetricsCollector:
             agg["sum"] += metric.value
             agg["min"] = min(agg["min"], metric.value)
             agg["max"] = max(agg["max"], metric.value)
-            agg["values"].append(metric.value)
             agg["last_updated"] = datetime.now()
 
-            # Keep only recent values for statistics
-            if len(agg["values"]) > 10000:
-                agg["values"] = agg["values"][-10000:]
+    def _update_series(self, metric: MetricData) -> None:
+        """Fold a numeric sample into its time-bucketed series"""
+        if not isinstance(metric.value, (int, float)) or isinstance(metric.value, bool):
+            return
+
+        series_key = (metric.metric_type.value, metric.component, metric.tenant_id)
+        series = self.series.get(series_key)
+        if series is None:
+            series = self.series[series_key] = TimeBucketedSeries(self.bucket_seconds, self._series_capacity)
+        series.add(metric.timestamp.timestamp(), float(metric.value))
+
+    def _matching_series(
+        self,
+        metric_type: MetricType,
+        component: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+    ) -> List[TimeBucketedSeries]:
+        """Get series for a metric type, optionally narrowed by component and tenant"""
+        return [
+            series
+            for (type_value, series_component, series_tenant), series in self.series.items()
+            if type_value == metric_type.value
+            and (component is None or series_component == component)
+            and (tenant_id is None or series_tenant == tenant_id)
+        ]
+
+    def get_series(
+        self,
+        metric_type: MetricType,
+        component: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get per-bucket aggregates for a metric in a time range
+
+        Buckets from matching series (e.g. several components) are merged by
+        bucket start time.
+
+        Returns:
+            Time-ordered list of bucket points with timestamp, count, average, min and max
+        """
+        start = start_time.timestamp() if start_time else None
+        end = end_time.timestamp() if end_time else None
+
+        with self._lock:
+            merged: Dict[float, Dict[str, float]] = {}
+            for series in self._matching_series(metric_type, component, tenant_id):
+                for point in series.points(start, end):
+                    existing = merged.get(point["timestamp"])
+                    if existing is None:
+                        merged[point["timestamp"]] = point
+                        continue
+                    total = existing["average"] * existing["count"] + point["average"] * point["count"]
+                    existing["count"] += point["count"]
+                    existing["average"] = total / existing["count"]
+                    existing["min"] = min(existing["min"], point["min"])
+                    existing["max"] = max(existing["max"], point["max"])
+
+            return [merged[timestamp] for timestamp in sorted(merged)]
 
     def _cleanup_old_metrics(self) -> None:
         """Remove metrics older than retention period"""
@@ -265,14 +361,12 @@ class MetricsCollector:
 
         # Cleanup global metrics
         for key, buffer in self.metrics_buffer.items():
-            while buffer and buffer[0].timestamp < cutoff_time:
-                buffer.popleft()
+            buffer.evict_before(cutoff_time)
 
         # Cleanup tenant metrics
         for tenant_id, tenant_buffers in self.tenant_metrics.items():
             for key, buffer in tenant_buffers.items():
-                while buffer and buffer[0].timestamp < cutoff_time:
-                    buffer.popleft()
+                buffer.evict_before(cutoff_time)
 
         self._last_cleanup = now
 
@@ -286,46 +380,65 @@ class MetricsCollector:
         limit: Optional[int] = None,
         tags: Optional[Dict[str, str]] = None,
     ) -> List[MetricData]:
-        """Get metrics with comprehensive filtering"""
+        """
+        Get metrics with comprehensive filtering
+
+        Type, component and tag filters are resolved through the secondary
+        indexes to a set of buffers; each buffer is time-sorted, so the time
+        range is located by binary search and the buffers are heap-merged
+        newest-first, stopping as soon as ``limit`` samples are collected.
+
+        Returns:
+            Matching metrics sorted by timestamp, newest first
+        """
         with self._lock:
+            keys = self._candidate_keys(metric_type, component, tags)
+
             # Choose the right metrics source
-            source_metrics: List[MetricData] = []
             if tenant_id:
-                for buffer in self.tenant_metrics.get(tenant_id, {}).values():
-                    source_metrics.extend(buffer)
+                tenant_buffers = self.tenant_metrics.get(tenant_id, {})
+                buffers = [tenant_buffers.get(f"{key}:{tenant_id}") for key in keys]
             else:
-                for buffer in self.metrics_buffer.values():
-                    source_metrics.extend(buffer)
-
-            # Apply filters
-            metrics = source_metrics
-
-            # Filter by metric type
-            if metric_type:
-                metrics = [m for m in metrics if m.metric_type == metric_type]
-
-            # Filter by component
-            if component:
-                metrics = [m for m in metrics if m.component == component]
-
-            # Filter by time range
-            if start_time:
-                metrics = [m for m in metrics if m.timestamp >= start_time]
-            if end_time:
-                metrics = [m for m in metrics if m.timestamp <= end_time]
+                buffers = [self.metrics_buffer.get(key) for key in keys]
 
-            # Filter by tags
+            predicate = None
             if tags:
-                metrics = [m for m in metrics if all(m.tags.get(k) == v for k, v in tags.items())]
+                tag_items = tags.items()
 
-            # Sort by timestamp (newest first)
-            metrics.sort(key=lambda m: m.timestamp, reverse=True)
+                def predicate(m: MetricData) -> bool:
+                    return all(m.tags.get(k) == v for k, v in tag_items)
 
-            # Apply limit
-            if limit:
-                metrics = metrics[:limit]
+            return merge_newest(
+                (buffer for buffer in buffers if buffer),
+                start=start_time,
+                end=end_time,
+                limit=limit,
+                predicate=predicate,
+            )
 
-            return metrics
+    def _candidate_keys(
+        self,
+        metric_type: Optional[MetricType],
+        component: Optional[str],
+        tags: Optional[Dict[str, str]],
+    ) -> List[str]:
+        """Intersect the secondary indexes into the buffer keys that can match"""
+        postings: List[Set[str]] = []
+        if metric_type:
+            postings.append(self._type_index.get(metric_type.value, set()))
+        if component:
+            postings.append(self._component_index.get(component, set()))
+        if tags:
+            postings.extend(self._tag_index.get(tag, set()) for tag in tags.items())
+
+        if not postings:
+            return list(self.metrics_buffer)
+
+        postings.sort(key=len)
+        keys = set(postings[0])
+        for posting in postings[1:]:
+            keys &= posting
+        return list(keys)
 
     def get_statistics(
         self,
@@ -334,97 +447,24 @@ class MetricsCollector:
         minutes: int = 60,
         tenant_id: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get statistical summary for a metric type"""
-        with self._lock:
-            key = f"{metric_type.value}:{component}" if component else metric_type.value
-
-            # Choose the right aggregated metrics
-            if tenant_id:
-                agg: Dict[str, Any] = {}
-                # Calculate tenant-specific stats
-                tenant_metrics = self.get_metrics(metric_type, component, tenant_id)
-                if tenant_metrics:
-                    values: List[float] = [float(m.value) for m in tenant_metrics if isinstance(m.value, (int, float))]
-                    if values:
-                        agg = {
-                            "count": len(values),
-                            "average": statistics.mean(values),
-                            "median": statistics.median(values),
-                            "min": min(values),
-                            "max": max(values),
-                            "std_dev": (statistics.stdev(values) if len(values) > 1 else 0),
-                            "p95": self._percentile(values, 95),
-                            "p99": self._percentile(values, 99),
-                        }
-            else:
-                agg = self.aggregated_metrics.get(key, {})
-
-            if not agg or agg.get("count", 0) == 0:
-                return {
-                    "count": 0,
-                    "average": None,
-                    "min": None,
-                    "max": None,
-                    "median": None,
-                    "std_dev": None,
-                }
+        """
+        Get statistical summary for a metric type over the last N minutes
 
-            agg_values_raw = agg.get("values", [])
-            values_list: List[float] = agg_values_raw if isinstance(agg_values_raw, list) else []
-            if not values_list:
-                return {
-                    "count": agg.get("count", 0),
-                    "average": agg.get("sum", 0) / max(agg.get("count", 1), 1),
-                    "min": agg.get("min"),
-                    "max": agg.get("max"),
-                    "median": None,
-                    "std_dev": 0,
-                    "p95": agg.get("max"),
-                    "p99": agg.get("max"),
-                }
+        Statistics are merged from bucket aggregates and DDSketch percentile
+        sketches, so the cost depends on the number of buckets in the window,
+        not on the number of samples.
+        """
+        start = (datetime.now() - timedelta(minutes=minutes)).timestamp()
 
-            try:
-                last_updated_raw = agg.get("last_updated", datetime.now())
-                if isinstance(last_updated_raw, datetime):
-                    last_updated_str = last_updated_raw.isoformat()
-                else:
-                    last_updated_str = datetime.now().isoformat()
-                return {
-                    "count": len(values_list),
-                    "average": statistics.mean(values_list),
-                    "median": statistics.median(values_list),
-                    "min": min(values_list),
-                    "max": max(values_list),
-                    "std_dev": (statistics.stdev(values_list) if len(values_list) > 1 else 0),
-                    "p95": self._percentile(values_list, 95),
-                    "p99": self._percentile(values_list, 99),
-                    "last_updated": last_updated_str,
-                }
-            except (statistics.StatisticsError, IndexError):
-                return {
-                    "count": len(values_list),
-                    "average": statistics.mean(values_list),
-                    "median": statistics.median(values_list),
-                    "min": min(values_list),
-                    "max": max(values_list),
-                    "std_dev": 0,
-                    "p95": max(values_list),
-                    "p99": max(values_list),
-                    "last_updated": datetime.now().isoformat(),
-                }
+        with self._lock:
+            summary = SeriesSummary()
+            for series in self._matching_series(metric_type, component, tenant_id):
+                summary.merge(series.summarize(start))
 
-    def _percentile(self, values: List[float], percentile: int) -> float:
-        """Calculate percentile value"""
-        if not values:
-            return 0.0
-        sorted_values = sorted(values)
-        index = (percentile / 100) * (len(sorted_values) - 1)
-        if index.is_integer():
-            return sorted_values[int(index)]
-        else:
-            lower = sorted_values[int(index)]
-            upper = sorted_values[int(index) + 1]
-            return lower + (upper - lower) * (index - int(index))
+            stats = summary.to_statistics()
+            if stats["count"]:
+                stats["last_updated"] = datetime.now().isoformat()
+            return stats
 
 
 class AlertManager:
@@ -1377,20 +1417,23 @@ class RealtimeMonitoringDashboard:
             # Map metric names to MetricType
             metric_type = self._map_metric_name(metric_name)
             if metric_type:
-                metric_data = self.metrics_collector.get_metrics(
+                # Served from time buckets: O(buckets in range), not O(samples)
+                buckets = self.metrics_collector.get_series(
                     metric_type=metric_type,
                     tenant_id=tenant_id,
                     start_time=start_time,
                     end_time=end_time,
-                    limit=100,
                 )
 
                 series_data = []
-                for metric in metric_data:
+                for bucket in buckets:
                     series_data.append(
                         {
-                            "timestamp": metric.timestamp.isoformat(),
-                            "value": metric.value,
+                            "timestamp": datetime.fromtimestamp(bucket["timestamp"]).isoformat(),
+                            "value": bucket["average"],
+                            "min": bucket["min"],
+                            "max": bucket["max"],
+                            "count": int(bucket["count"]),
                         }
                     )
 
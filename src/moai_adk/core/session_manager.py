@@ -13,16 +13,55 @@ Key Principles:
 - Results flow through main conversation thread (Alfred)
 - Resume preserves full conversation history
 - Each execution gets unique agentId
+
+Persistence Model:
+- Every mutation appends one record to a write-ahead journal
+  (agent-sessions.journal.jsonl) so write cost is O(1) per event
+- The journal is periodically compacted into the JSON snapshot
+  (agent-sessions.json) via atomic rename
+- Agent results are stored one file per agentId and loaded lazily
 """
 
 import json
 import logging
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Number of journal records accumulated before compacting into the snapshot
+DEFAULT_COMPACT_THRESHOLD = 500
+
+
+def _atomic_write_json(data: Any, target_path: Path, indent: Optional[int] = 2) -> None:
+    """
+    Atomically write JSON data using a temporary file and rename.
+
+    Args:
+        data: JSON-serializable data
+        target_path: Destination file path
+        indent: JSON indentation (None for compact output)
+
+    Raises:
+        OSError: If the write or rename fails
+    """
+    temp_fd, temp_path = tempfile.mkstemp(dir=target_path.parent, prefix=f".{target_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, target_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
 
 class SessionManager:
     """
@@ -37,7 +76,9 @@ class SessionManager:
         _sessions: Mapping of agent_name to current agentId
         _results: Storage of agent execution results (agentId → result data)
         _chains: Workflow chains tracking (chain_name → [agentIds])
-        _session_file: Persistent storage location
+        _session_file: Persistent snapshot location
+        _journal_file: Append-only write-ahead journal next to the snapshot
+        _results_dir: Directory holding one result file per agentId
         _transcript_dir: Directory for conversation transcripts
     """
 
@@ -45,6 +86,7 @@ class SessionManager:
         self,
         session_file: Optional[Path] = None,
         transcript_dir: Optional[Path] = None,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
     ):
         """
         Initialize SessionManager.
@@ -54,11 +96,16 @@ class SessionManager:
                          (default: .moai/memory/agent-sessions.json)
             transcript_dir: Directory for agent transcripts
                            (default: .moai/logs/agent-transcripts/)
+            compact_threshold: Journal records accumulated before the journal
+                              is compacted into the snapshot
         """
         # Default paths
         project_root = Path.cwd()
         self._session_file = session_file or project_root / ".moai" / "memory" / "agent-sessions.json"
         self._transcript_dir = transcript_dir or project_root / ".moai" / "logs" / "agent-transcripts"
+        self._journal_file = self._session_file.with_name(f"{self._session_file.stem}.journal.jsonl")
+        self._results_dir = self._session_file.with_name(f"{self._session_file.stem}-results")
+        self._compact_threshold = max(1, compact_threshold)
 
         # Ensure directories exist
         self._session_file.parent.mkdir(parents=True, exist_ok=True)
@@ -66,15 +113,19 @@ class SessionManager:
 
         # In-memory storage
         self._sessions: Dict[str, str] = {}  # agent_name → current agentId
-        self._results: Dict[str, Any] = {}  # agentId → result data
+        self._results: Dict[str, Any] = {}  # agentId → result data (lazy cache)
         self._chains: Dict[str, List[str]] = {}  # chain_name → [agentIds]
         self._metadata: Dict[str, Dict[str, Any]] = {}  # agentId → metadata
 
+        # Journal state
+        self._journal_seq = 0  # Sequence number of the last applied record
+        self._journal_records = 0  # Records in the journal since last compaction
+
         # Load existing sessions
         self._load_sessions()
 
     def _load_sessions(self) -> None:
-        """Load session data from persistent storage."""
+        """Load the snapshot, then replay journal records written after it."""
         if self._session_file.exists():
             try:
                 with open(self._session_file, "r", encoding="utf-8") as f:
@@ -82,29 +133,220 @@ class SessionManager:
                     self._sessions = data.get("sessions", {})
                     self._chains = data.get("chains", {})
                     self._metadata = data.get("metadata", {})
+                    self._journal_seq = data.get("journal_seq", 0)
                 logger.info(f"Loaded {len(self._sessions)} sessions from {self._session_file}")
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to load sessions: {e}")
                 self._sessions = {}
                 self._chains = {}
                 self._metadata = {}
+                self._journal_seq = 0
+
+        self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        """
+        Apply journal records newer than the snapshot.
+
+        Records already covered by the snapshot (seq <= journal_seq) are skipped,
+        so a crash between snapshot rename and journal truncation is harmless.
+        A torn trailing record from a crash mid-append is discarded and the
+        journal is compacted so later appends are not stranded behind it.
+        """
+        if not self._journal_file.exists():
+            return
+
+        torn = False
+        replayed = 0
+        try:
+            with open(self._journal_file, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Discarding torn journal record at {self._journal_file}:{line_number}")
+                        torn = True
+                        break
+
+                    self._journal_records += 1
+                    seq = record.get("seq", 0)
+                    if seq <= self._journal_seq:
+                        continue
+                    self._apply_record(record)
+                    self._journal_seq = seq
+                    replayed += 1
+        except IOError as e:
+            logger.warning(f"Failed to replay session journal: {e}")
+            return
+
+        if replayed:
+            logger.info(f"Replayed {replayed} journal records from {self._journal_file}")
+
+        if torn or self._journal_records >= self._compact_threshold:
+            self._save_sessions()
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """
+        Apply a single journal record to in-memory state.
+
+        Used both for live mutations and for journal replay, so both paths
+        always produce identical state.
+
+        Args:
+            record: Journal record with an "op" field
+        """
+        op = record.get("op")
+
+        if op == "register":
+            agent_id = record["agent_id"]
+            chain_id = record.get("chain_id")
+            self._sessions[record["agent_name"]] = agent_id
+            if chain_id:
+                self._chains.setdefault(chain_id, []).append(agent_id)
+            self._metadata[agent_id] = record["metadata"]
+
+        elif op == "resume":
+            agent_id = record["agent_id"]
+            if agent_id in self._metadata:
+                self._metadata[agent_id]["resume_count"] = record["resume_count"]
+                self._metadata[agent_id]["last_resumed_at"] = record["last_resumed_at"]
+
+        elif op == "clear_agent":
+            agent_id = self._sessions.pop(record["agent_name"], None)
+            if agent_id:
+                self._results.pop(agent_id, None)
+                self._metadata.pop(agent_id, None)
+
+        elif op == "clear_chain":
+            for agent_id in self._chains.pop(record["chain_id"], []):
+                self._results.pop(agent_id, None)
+                self._metadata.pop(agent_id, None)
+
+        elif op == "create_chain":
+            self._chains[record["chain_id"]] = []
+
+        else:
+            logger.warning(f"Unknown session journal op: {op}")
+
+    def _append_record(self, record: Dict[str, Any]) -> bool:
+        """
+        Append a mutation to the write-ahead journal and apply it.
+
+        Each append is a single unbuffered, fsynced line, so the cost per
+        event is independent of how many sessions exist. The journal is
+        compacted into the snapshot once it reaches the compaction threshold.
+
+        The record is applied in memory only after it is durably appended,
+        so a failed append leaves memory, sequence number and journal in
+        agreement.
+
+        Args:
+            record: Journal record with an "op" field
+
+        Returns:
+            True if the record was journaled and applied
+        """
+        seq = self._journal_seq + 1
+        line = json.dumps({**record, "seq": seq}, ensure_ascii=False, separators=(",", ":"))
+
+        try:
+            with open(self._journal_file, "ab", buffering=0) as f:
+                offset = f.tell()
+                try:
+                    f.write((line + "\n").encode("utf-8"))
+                    os.fsync(f.fileno())
+                except OSError:
+                    # Drop a line that may have reached the file, so the
+                    # sequence number can be reused by the next append
+                    f.truncate(offset)
+                    raise
+        except IOError as e:
+            logger.error(f"Failed to append session journal: {e}")
+            return False
+
+        self._journal_seq = seq
+        self._apply_record(record)
+        self._journal_records += 1
+        if self._journal_records >= self._compact_threshold:
+            self._save_sessions()
+        return True
 
     def _save_sessions(self) -> None:
-        """Save session data to persistent storage."""
+        """
+        Compact session data into the snapshot and truncate the journal.
+
+        The snapshot is written to a temporary file and atomically renamed,
+        so a crash mid-write never leaves a partially written snapshot.
+        """
         data = {
             "sessions": self._sessions,
             "chains": self._chains,
             "metadata": self._metadata,
+            "journal_seq": self._journal_seq,
             "last_updated": datetime.now().isoformat(),
         }
 
         try:
-            with open(self._session_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _atomic_write_json(data, self._session_file)
+            # Snapshot now covers every journaled record
+            self._journal_file.unlink(missing_ok=True)
+            self._journal_records = 0
             logger.debug(f"Saved sessions to {self._session_file}")
         except IOError as e:
             logger.error(f"Failed to save sessions: {e}")
 
+    def _result_path(self, agent_id: str) -> Path:
+        """Get the per-agent result file path."""
+        return self._results_dir / f"{agent_id}.json"
+
+    def _save_result(self, agent_id: str, result_data: Dict[str, Any]) -> None:
+        """Persist a single agent result atomically."""
+        try:
+            self._results_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write_json(result_data, self._result_path(agent_id), indent=None)
+        except (IOError, TypeError, ValueError) as e:
+            logger.error(f"Failed to save result for {agent_id}: {e}")
+
+    def _delete_result(self, agent_id: str) -> None:
+        """Remove a persisted agent result."""
+        try:
+            self._result_path(agent_id).unlink(missing_ok=True)
+        except IOError as e:
+            logger.warning(f"Failed to delete result for {agent_id}: {e}")
+
+    def _load_result(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get result data for an agent, loading it from disk on first access.
+
+        Args:
+            agent_id: Agent session ID
+
+        Returns:
+            Result record, or None if not found
+        """
+        if agent_id in self._results:
+            return self._results[agent_id]
+
+        if agent_id not in self._metadata:
+            return None
+
+        result_file = self._result_path(agent_id)
+        if not result_file.exists():
+            return None
+
+        try:
+            with open(result_file, "r", encoding="utf-8") as f:
+                result_data = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to load result for {agent_id}: {e}")
+            return None
+
+        self._results[agent_id] = result_data
+        return result_data
+
     def register_agent_result(
         self,
         agent_name: str,
@@ -124,33 +366,31 @@ class SessionManager:
             result: Result data from agent execution
             chain_id: Optional workflow chain identifier (e.g., "SPEC-AUTH-001-implementation")
         """
-        # Store agent ID mapping
-        self._sessions[agent_name] = agent_id
-
-        # Store result data
-        self._results[agent_id] = {
+        # Store result data (persisted separately, loaded lazily)
+        result_data = {
             "agent_name": agent_name,
             "result": result,
             "timestamp": datetime.now().isoformat(),
             "chain_id": chain_id,
         }
-
-        # Track in workflow chain
-        if chain_id:
-            if chain_id not in self._chains:
-                self._chains[chain_id] = []
-            self._chains[chain_id].append(agent_id)
-
-        # Store metadata
-        self._metadata[agent_id] = {
-            "agent_name": agent_name,
-            "created_at": datetime.now().isoformat(),
-            "chain_id": chain_id,
-            "resume_count": 0,
-        }
-
-        # Persist to disk
-        self._save_sessions()
+        self._results[agent_id] = result_data
+        self._save_result(agent_id, result_data)
+
+        # Store agent ID mapping, chain membership and metadata
+        self._append_record(
+            {
+                "op": "register",
+                "agent_name": agent_name,
+                "agent_id": agent_id,
+                "chain_id": chain_id,
+                "metadata": {
+                    "agent_name": agent_name,
+                    "created_at": datetime.now().isoformat(),
+                    "chain_id": chain_id,
+                    "resume_count": 0,
+                },
+            }
+        )
 
         logger.info(f"Registered agent result: {agent_name} (agentId: {agent_id[:8]}..., chain: {chain_id})")
 
@@ -249,9 +489,14 @@ class SessionManager:
             agent_id: Agent session ID
         """
         if agent_id in self._metadata:
-            self._metadata[agent_id]["resume_count"] += 1
-            self._metadata[agent_id]["last_resumed_at"] = datetime.now().isoformat()
-            self._save_sessions()
+            self._append_record(
+                {
+                    "op": "resume",
+                    "agent_id": agent_id,
+                    "resume_count": self._metadata[agent_id].get("resume_count", 0) + 1,
+                    "last_resumed_at": datetime.now().isoformat(),
+                }
+            )
 
     def get_agent_result(self, agent_id: str) -> Optional[Any]:
         """
@@ -263,7 +508,7 @@ class SessionManager:
         Returns:
             Stored result data, or None if not found
         """
-        result_data = self._results.get(agent_id)
+        result_data = self._load_result(agent_id)
         if result_data:
             return result_data["result"]
         return None
@@ -285,8 +530,9 @@ class SessionManager:
         results = []
 
         for agent_id in agent_ids:
-            if agent_id in self._results:
-                results.append(self._results[agent_id])
+            result_data = self._load_result(agent_id)
+            if result_data:
+                results.append(result_data)
 
         return results
 
@@ -325,16 +571,9 @@ class SessionManager:
         """
         if agent_name in self._sessions:
             agent_id = self._sessions[agent_name]
-            del self._sessions[agent_name]
-
-            if agent_id in self._results:
-                del self._results[agent_id]
-
-            if agent_id in self._metadata:
-                del self._metadata[agent_id]
-
-            self._save_sessions()
-            logger.info(f"Cleared session for {agent_name}")
+            if self._append_record({"op": "clear_agent", "agent_name": agent_name}):
+                self._delete_result(agent_id)
+                logger.info(f"Cleared session for {agent_name}")
 
     def clear_chain(self, chain_id: str) -> None:
         """
@@ -344,16 +583,13 @@ class SessionManager:
             chain_id: Workflow chain identifier
         """
         if chain_id in self._chains:
-            agent_ids = self._chains[chain_id]
+            agent_ids = list(self._chains[chain_id])
+            if not self._append_record({"op": "clear_chain", "chain_id": chain_id}):
+                return
 
             for agent_id in agent_ids:
-                if agent_id in self._results:
-                    del self._results[agent_id]
-                if agent_id in self._metadata:
-                    del self._metadata[agent_id]
+                self._delete_result(agent_id)
 
-            del self._chains[chain_id]
-            self._save_sessions()
             logger.info(f"Cleared chain: {chain_id}")
 
     def get_all_sessions(self) -> Dict[str, Any]:
@@ -366,7 +602,7 @@ class SessionManager:
         return {
             "sessions": self._sessions,
             "chains": list(self._chains.keys()),
-            "total_results": len(self._results),
+            "total_results": len(self._metadata),
         }
 
     def export_transcript(self, agent_id: str) -> Optional[Path]:
@@ -405,7 +641,7 @@ class SessionManager:
             agent_sequence: Expected agent execution order
             metadata: Optional metadata for the chain
         """
-        self._chains[chain_id] = []
+        self._append_record({"op": "create_chain", "chain_id": chain_id})
 
         chain_metadata = {
             "created_at": datetime.now().isoformat(),
@@ -424,8 +660,7 @@ class SessionManager:
 
         chains_data[chain_id] = chain_metadata
 
-        with open(chains_file, "w", encoding="utf-8") as f:
-            json.dump(chains_data, f, indent=2, ensure_ascii=False)
+        _atomic_write_json(chains_data, chains_file)
 
         logger.info(f"Created workflow chain: {chain_id} with {len(agent_sequence)} agents")
 
@@ -4,12 +4,161 @@ import ast
 import logging
 import re
 import time
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+# Technical vocabulary counted by analyze_domain_relevance
+_TECHNICAL_WORDS_PATTERN = re.compile(
+    r"\b(?:api|endpoint|service|controller|model|entity|schema|database|cache|auth|login|password|token|session|user|admin|customer|product|order|payment|billing|subscription|plan|feature|function|method|class|interface|abstract|extends|implements|override|virtual|static|dynamic|async|await|promise|callback|event|handler|middleware|filter|validator|transformer|processor|worker|thread|queue|job|task|cron|scheduler|config|setting|env|variable|constant|property|attribute|field|column|table|index|constraint|foreign|primary|unique|notnull|default|check|trigger|procedure|function|stored|view|materialized|temp|temporary|permanent|persistent|volatile|in-memory|file-based|disk-based|cloud|distributed|clustered|load-balanced|scalable|high-availability|fault-tolerant|redundant|backup|restore|migration|version|branch|merge|conflict|resolve|commit|push|pull|fork|clone|repository|github|gitlab|bitbucket|ci|cd|pipeline|workflow|deployment|staging|production|development|testing|unit|integration|e2e|performance|load|stress|security|vulnerability|attack|breach|authentication|authorization|encryption|decryption|hash|salt|pepper|session|cookie|jwt|oauth|ldap|saml|rbac|abac|detection|prevention|monitoring|logging|tracing|metrics|analytics|dashboard|report|chart|graph|visualization|ui|ux|frontend|backend|fullstack|mobile|web|desktop|cross-platform|native|hybrid|responsive|adaptive|progressive|spa|pwa|ssr|csr|mvc|mvvm|riot|angular|react|vue|ember|backbone|knockout|jquery|vanilla|plain|pure|framework|library|package|module|bundle|dependency|require|import|export|include|extend|inherit|compose|aggregate|delegate|proxy|facade|adapter|bridge|decorator|singleton|factory|builder|prototype|command|observer|strategy|state|chain|iterator|visitor|mediator|composite|flyweight|proxy|interpreter|template|method|abstract|factory|builder|prototype|singleton|adapter|bridge|composite|decorator|facade|flyweight|proxy|chain|command|iterator|mediator|memento|observer|state|strategy|template|visitor)\b"
+)
+_EXAMPLE_PATTERN = re.compile(r">>>|Example:|example:|\b\d+\.\s")
+_SNAKE_CASE_PATTERN = re.compile(r"^[a-z]+(?:_[a-z]+)*$")
+_CAMEL_CASE_PATTERN = re.compile(r"^[A-Z][a-zA-Z0-9]*$")
+
+
+def _read_file(file_path: str) -> str:
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class _CodeSignals(ast.NodeVisitor):
+    """
+    Collect structure and documentation signals in a single AST traversal.
+
+    The enclosing node and class depth are tracked while visiting, so methods
+    are recognized (and counted once per enclosing class) without searching
+    the tree again for each function.
+    """
+
+    def __init__(self) -> None:
+        self.class_count = 0
+        self.function_count = 0
+        self.method_count = 0
+        self.import_count = 0
+        self.complexity = 1  # Base complexity
+        self.max_depth = 0
+        self.names: List[str] = []
+        self.docstring_coverage = 0.0
+        self.total_functions = 0
+        self.documented_functions = 0
+        self.total_classes = 0
+        self.documented_classes = 0
+        self.parameters_documented = False
+        self.returns_documented = False
+        self.exceptions_documented = False
+        self.module_docstring = ""
+        self._parent: Optional[ast.AST] = None
+        self._class_depth = 0
+        self._depth = 0
+
+    def generic_visit(self, node: ast.AST) -> None:
+        parent = self._parent
+        self._parent = node
+        super().generic_visit(node)
+        self._parent = parent
+
+    def visit_Module(self, node: ast.Module) -> None:
+        self.module_docstring = ast.get_docstring(node) or ""
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.class_count += 1
+        self.total_classes += 1
+        self.names.append(node.name)
+        if ast.get_docstring(node):
+            self.docstring_coverage += 0.1
+            self.documented_classes += 1
+
+        self._class_depth += 1
+        self.generic_visit(node)
+        self._class_depth -= 1
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.total_functions += 1
+        self.names.append(node.name)
+        # Each enclosing class counts the function as one of its methods
+        self.method_count += self._class_depth
+        if not isinstance(self._parent, ast.ClassDef):
+            self.function_count += 1
+
+        docstring = ast.get_docstring(node)
+        if docstring:
+            self.docstring_coverage += 0.1
+            self.documented_functions += 1
+            if ":" in docstring or "param" in docstring:
+                self.parameters_documented = True
+            if "return" in docstring or "->" in docstring:
+                self.returns_documented = True
+            if "raise" in docstring or "exception" in docstring:
+                self.exceptions_documented = True
+
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        self.import_count += 1
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self.import_count += 1
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        self.names.append(node.id)
+        self.generic_visit(node)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        self.complexity += len(node.values) - 1
+        self.generic_visit(node)
+
+    def _visit_control_flow(self, node: ast.AST) -> None:
+        self.complexity += 1
+        self._depth += 1
+        self.max_depth = max(self.max_depth, self._depth)
+        self.generic_visit(node)
+        self._depth -= 1
+
+    visit_If = _visit_control_flow
+    visit_For = _visit_control_flow
+    visit_While = _visit_control_flow
+    visit_Try = _visit_control_flow
+    visit_With = _visit_control_flow
+
+
+def _collect_signals(tree: ast.AST) -> _CodeSignals:
+    signals = _CodeSignals()
+    signals.visit(tree)
+    return signals
+
+
+def _naming_consistency(names: List[str]) -> float:
+    """Score how consistently names follow one convention (snake_case or CamelCase)."""
+    total_names = len(names)
+    if total_names == 0:
+        return 1.0
+
+    snake_case_count = 0
+    camel_case_count = 0
+    for name in names:
+        if _SNAKE_CASE_PATTERN.match(name):
+            snake_case_count += 1
+        elif _CAMEL_CASE_PATTERN.match(name):
+            camel_case_count += 1
+
+    snake_case_ratio = snake_case_count / total_names
+    camel_case_ratio = camel_case_count / total_names
+
+    # Favor consistency over specific style
+    if snake_case_ratio > 0.7 or camel_case_ratio > 0.7:
+        return 0.9
+    elif snake_case_ratio > 0.5 or camel_case_ratio > 0.5:
+        return 0.7
+    else:
+        return 0.5
+
+
 # SpecGenerator: Placeholder for spec generation functionality
 class SpecGenerator:
     """Placeholder SpecGenerator class for confidence scoring."""
@@ -92,159 +241,44 @@ class ConfidenceScoringSystem:
             Dictionary with structure scores
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                code_content = f.read()
-
-            # Parse AST
-            tree = ast.parse(code_content)
-
-            structure_scores = {
-                "class_count": 0,
-                "function_count": 0,
-                "method_count": 0,
-                "import_count": 0,
-                "complexity_score": 0.0,
-                "nesting_depth": 0,
-                "docstring_coverage": 0.0,
-                "naming_consistency": 0.0,
-            }
-
-            # Analyze AST nodes
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    structure_scores["class_count"] += 1
-                    # Check if class has docstring
-                    if ast.get_docstring(node):
-                        structure_scores["docstring_coverage"] += 0.1
-                    # Count methods
-                    for child in ast.walk(node):
-                        if isinstance(child, ast.FunctionDef):
-                            structure_scores["method_count"] += 1
-
-                elif isinstance(node, ast.FunctionDef):
-                    # Check if function is not a method (not inside a class)
-                    is_method = False
-                    for parent in ast.walk(tree):
-                        if isinstance(parent, ast.ClassDef):
-                            for child in parent.body:
-                                if child == node:
-                                    is_method = True
-                                    break
-
-                    if not is_method:
-                        structure_scores["function_count"] += 1
-
-                    # Check if function has docstring
-                    if ast.get_docstring(node):
-                        structure_scores["docstring_coverage"] += 0.1
-
-                elif isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
-                    structure_scores["import_count"] += 1
-
-            # Calculate complexity score (cyclomatic complexity approximation)
-            structure_scores["complexity_score"] = self._calculate_complexity(tree)
-
-            # Calculate nesting depth
-            structure_scores["nesting_depth"] = self._calculate_nesting_depth(tree)
-
-            # Calculate naming consistency
-            structure_scores["naming_consistency"] = self._calculate_naming_consistency(tree)
-
-            # Normalize scores (0-1 range)
-            max_classes = 5  # Reasonable upper bound
-            max_functions = 20
-            max_methods = 50
-            max_imports = 15
-            max_complexity = 10
-            max_nesting = 5
-            max_docstring = 1.0
-
-            normalized_scores = {
-                "class_ratio": min(structure_scores["class_count"] / max_classes, 1.0),
-                "function_ratio": min(structure_scores["function_count"] / max_functions, 1.0),
-                "method_ratio": min(structure_scores["method_count"] / max_methods, 1.0),
-                "import_ratio": min(structure_scores["import_count"] / max_imports, 1.0),
-                "complexity_ratio": max(0, 1.0 - structure_scores["complexity_score"] / max_complexity),
-                "nesting_ratio": max(0, 1.0 - structure_scores["nesting_depth"] / max_nesting),
-                "docstring_score": min(structure_scores["docstring_coverage"] / max_docstring, 1.0),
-                "naming_score": structure_scores["naming_consistency"],
-            }
-
-            return normalized_scores
-
+            signals = _collect_signals(ast.parse(_read_file(file_path)))
+            return self._score_structure(signals)
         except Exception as e:
             logger.error(f"Error analyzing code structure: {e}")
             return self._get_default_structure_scores()
 
-    def _calculate_complexity(self, tree: ast.AST) -> float:
-        """Calculate approximate cyclomatic complexity."""
-        complexity = 1  # Base complexity
+    def _score_structure(self, signals: "_CodeSignals") -> Dict[str, float]:
+        """Normalize collected structure signals to scores (0-1 range)."""
+        max_classes = 5  # Reasonable upper bound
+        max_functions = 20
+        max_methods = 50
+        max_imports = 15
+        max_complexity = 10
+        max_nesting = 5
+        max_docstring = 1.0
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.For, ast.While, ast.Try, ast.With)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
+        return {
+            "class_ratio": min(signals.class_count / max_classes, 1.0),
+            "function_ratio": min(signals.function_count / max_functions, 1.0),
+            "method_ratio": min(signals.method_count / max_methods, 1.0),
+            "import_ratio": min(signals.import_count / max_imports, 1.0),
+            "complexity_ratio": max(0, 1.0 - signals.complexity / max_complexity),
+            "nesting_ratio": max(0, 1.0 - signals.max_depth / max_nesting),
+            "docstring_score": min(signals.docstring_coverage / max_docstring, 1.0),
+            "naming_score": _naming_consistency(signals.names),
+        }
 
-        return complexity
+    def _calculate_complexity(self, tree: ast.AST) -> float:
+        """Calculate approximate cyclomatic complexity."""
+        return _collect_signals(tree).complexity
 
     def _calculate_nesting_depth(self, tree: ast.AST) -> int:
         """Calculate maximum nesting depth."""
-        max_depth = 0
-
-        def _visit(node, depth):
-            nonlocal max_depth
-            max_depth = max(max_depth, depth)
-
-            for child in ast.iter_child_nodes(node):
-                if isinstance(child, (ast.If, ast.For, ast.While, ast.Try, ast.With)):
-                    _visit(child, depth + 1)
-                else:
-                    _visit(child, depth)
-
-        _visit(tree, 0)
-        return max_depth
+        return _collect_signals(tree).max_depth
 
     def _calculate_naming_consistency(self, tree: ast.AST) -> float:
         """Calculate naming consistency score."""
-        names = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name):
-                names.append(node.id)
-            elif isinstance(node, ast.FunctionDef):
-                names.append(node.name)
-            elif isinstance(node, ast.ClassDef):
-                names.append(node.name)
-
-        if not names:
-            return 1.0
-
-        # Check naming patterns
-        snake_case_count = 0
-        camel_case_count = 0
-
-        for name in names:
-            if re.match(r"^[a-z]+(?:_[a-z]+)*$", name):
-                snake_case_count += 1
-            elif re.match(r"^[A-Z][a-zA-Z0-9]*$", name):
-                camel_case_count += 1
-
-        # Calculate consistency
-        total_names = len(names)
-        if total_names == 0:
-            return 1.0
-
-        snake_case_ratio = snake_case_count / total_names
-        camel_case_ratio = camel_case_count / total_names
-
-        # Favor consistency over specific style
-        if snake_case_ratio > 0.7 or camel_case_ratio > 0.7:
-            return 0.9
-        elif snake_case_ratio > 0.5 or camel_case_ratio > 0.5:
-            return 0.7
-        else:
-            return 0.5
+        return _naming_consistency(_collect_signals(tree).names)
 
     def _get_default_structure_scores(self) -> Dict[str, float]:
         """Get default structure scores for error cases."""
@@ -270,60 +304,56 @@ class ConfidenceScoringSystem:
             Dictionary with domain relevance scores
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Normalize content
-            content = content.lower()
-
-            # Check for domain-specific patterns
-            domain_scores = {}
-
-            for domain, patterns in self.word_patterns.items():
-                matches = 0
-                for pattern in patterns:
-                    if pattern in content:
-                        matches += 1
-                # Normalize by number of patterns
-                domain_scores[f"{domain}_coverage"] = matches / len(patterns)
-
-            # Calculate overall domain relevance
-            total_relevance = sum(domain_scores.values())
-            domain_scores["overall_relevance"] = min(total_relevance / len(self.word_patterns), 1.0)
-
-            # Calculate domain specificity (how focused the code is)
-            max_domain = max(domain_scores.values()) if domain_scores.values() else 0
-            domain_scores["specificity"] = max_domain
-
-            # Calculate technical vocabulary density
-            technical_words = len(
-                re.findall(
-                    r"\b(?:api|endpoint|service|controller|model|entity|schema|database|cache|auth|login|password|token|session|user|admin|customer|product|order|payment|billing|subscription|plan|feature|function|method|class|interface|abstract|extends|implements|override|virtual|static|dynamic|async|await|promise|callback|event|handler|middleware|filter|validator|transformer|processor|worker|thread|queue|job|task|cron|scheduler|config|setting|env|variable|constant|property|attribute|field|column|table|index|constraint|foreign|primary|unique|notnull|default|check|trigger|procedure|function|stored|view|materialized|temp|temporary|permanent|persistent|volatile|in-memory|file-based|disk-based|cloud|distributed|clustered|load-balanced|scalable|high-availability|fault-tolerant|redundant|backup|restore|migration|version|branch|merge|conflict|resolve|commit|push|pull|fork|clone|repository|github|gitlab|bitbucket|ci|cd|pipeline|workflow|deployment|staging|production|development|testing|unit|integration|e2e|performance|load|stress|security|vulnerability|attack|breach|authentication|authorization|encryption|decryption|hash|salt|pepper|session|cookie|jwt|oauth|ldap|saml|rbac|abac|detection|prevention|monitoring|logging|tracing|metrics|analytics|dashboard|report|chart|graph|visualization|ui|ux|frontend|backend|fullstack|mobile|web|desktop|cross-platform|native|hybrid|responsive|adaptive|progressive|spa|pwa|ssr|csr|mvc|mvvm|riot|angular|react|vue|ember|backbone|knockout|jquery|vanilla|plain|pure|framework|library|package|module|bundle|dependency|require|import|export|include|extend|inherit|compose|aggregate|delegate|proxy|facade|adapter|bridge|decorator|singleton|factory|builder|prototype|command|observer|strategy|state|chain|iterator|visitor|mediator|composite|flyweight|proxy|interpreter|template|method|abstract|factory|builder|prototype|singleton|adapter|bridge|composite|decorator|facade|flyweight|proxy|chain|command|iterator|mediator|memento|observer|state|strategy|template|visitor)\b",
-                    content,
-                )
-            )
-            total_words = len(content.split())
+            return self._score_domain(_read_file(file_path))
+        except Exception as e:
+            logger.error(f"Error analyzing domain relevance: {e}")
+            return self._get_default_domain_scores()
 
-            if total_words > 0:
-                domain_scores["technical_density"] = min(technical_words / total_words, 1.0)
-            else:
-                domain_scores["technical_density"] = 0.0
+    def _score_domain(self, content: str) -> Dict[str, float]:
+        """Score domain keyword coverage and technical vocabulary of file content."""
+        # Normalize content
+        content = content.lower()
 
-            return domain_scores
+        # Check for domain-specific patterns
+        domain_scores = {}
 
-        except Exception as e:
-            logger.error(f"Error analyzing domain relevance: {e}")
-            return {
-                "security_coverage": 0.0,
-                "data_coverage": 0.0,
-                "api_coverage": 0.0,
-                "ui_coverage": 0.0,
-                "business_coverage": 0.0,
-                "testing_coverage": 0.0,
-                "overall_relevance": 0.5,
-                "specificity": 0.5,
-                "technical_density": 0.3,
-            }
+        for domain, patterns in self.word_patterns.items():
+            matches = sum(1 for pattern in patterns if pattern in content)
+            # Normalize by number of patterns
+            domain_scores[f"{domain}_coverage"] = matches / len(patterns)
+
+        # Calculate overall domain relevance
+        total_relevance = sum(domain_scores.values())
+        domain_scores["overall_relevance"] = min(total_relevance / len(self.word_patterns), 1.0)
+
+        # Calculate domain specificity (how focused the code is)
+        max_domain = max(domain_scores.values()) if domain_scores.values() else 0
+        domain_scores["specificity"] = max_domain
+
+        # Calculate technical vocabulary density
+        technical_words = len(_TECHNICAL_WORDS_PATTERN.findall(content))
+        total_words = len(content.split())
+
+        if total_words > 0:
+            domain_scores["technical_density"] = min(technical_words / total_words, 1.0)
+        else:
+            domain_scores["technical_density"] = 0.0
+
+        return domain_scores
+
+    def _get_default_domain_scores(self) -> Dict[str, float]:
+        """Get default domain scores for error cases."""
+        return {
+            "security_coverage": 0.0,
+            "data_coverage": 0.0,
+            "api_coverage": 0.0,
+            "ui_coverage": 0.0,
+            "business_coverage": 0.0,
+            "testing_coverage": 0.0,
+            "overall_relevance": 0.5,
+            "specificity": 0.5,
+            "technical_density": 0.3,
+        }
 
     def analyze_documentation_quality(self, file_path: str) -> Dict[str, float]:
         """
@@ -336,102 +366,113 @@ class ConfidenceScoringSystem:
             Dictionary with documentation scores
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            doc_scores = {
-                "docstring_coverage": 0.0,
-                "comment_density": 0.0,
-                "explanation_quality": 0.0,
-                "examples_present": 0.0,
-                "parameter_documentation": 0.0,
-                "return_documentation": 0.0,
-                "exception_documentation": 0.0,
-            }
-
-            # Parse AST for docstring analysis
-            tree = ast.parse(content)
-
-            total_functions = 0
-            documented_functions = 0
-            documented_classes = 0
-            total_classes = 0
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    total_functions += 1
-                    if ast.get_docstring(node):
-                        documented_functions += 1
-                        # Check for parameter documentation
-                        if ":" in ast.get_docstring(node) or "param" in ast.get_docstring(node):
-                            doc_scores["parameter_documentation"] = 0.8
-                        if "return" in ast.get_docstring(node) or "->" in ast.get_docstring(node):
-                            doc_scores["return_documentation"] = 0.8
-                        if "raise" in ast.get_docstring(node) or "exception" in ast.get_docstring(node):
-                            doc_scores["exception_documentation"] = 0.8
-
-                elif isinstance(node, ast.ClassDef):
-                    total_classes += 1
-                    if ast.get_docstring(node):
-                        documented_classes += 1
-
-            # Calculate docstring coverage
-            if total_functions > 0:
-                doc_scores["docstring_coverage"] = documented_functions / total_functions
-            if total_classes > 0:
-                class_coverage = documented_classes / total_classes
-                doc_scores["docstring_coverage"] = max(doc_scores["docstring_coverage"], class_coverage)
-
-            # Calculate comment density
-            lines = content.split("\n")
-            comment_lines = 0
-            code_lines = 0
-
-            for line in lines:
-                stripped = line.strip()
-                if stripped.startswith("#"):
-                    comment_lines += 1
-                elif stripped and not stripped.startswith('"""') and not stripped.startswith("'''"):
-                    code_lines += 1
-
-            if code_lines > 0:
-                doc_scores["comment_density"] = min(comment_lines / code_lines, 1.0)
+            content = _read_file(file_path)
+            return self._score_documentation(_collect_signals(ast.parse(content)), content)
+        except Exception as e:
+            logger.error(f"Error analyzing documentation quality: {e}")
+            return self._get_default_documentation_scores()
+
+    def _score_documentation(self, signals: "_CodeSignals", content: str) -> Dict[str, float]:
+        """Score docstrings, comments and examples from collected signals and file content."""
+        doc_scores = {
+            "docstring_coverage": 0.0,
+            "comment_density": 0.0,
+            "explanation_quality": 0.0,
+            "examples_present": 0.0,
+            "parameter_documentation": 0.8 if signals.parameters_documented else 0.0,
+            "return_documentation": 0.8 if signals.returns_documented else 0.0,
+            "exception_documentation": 0.8 if signals.exceptions_documented else 0.0,
+        }
 
+        # Calculate docstring coverage
+        if signals.total_functions > 0:
+            doc_scores["docstring_coverage"] = signals.documented_functions / signals.total_functions
+        if signals.total_classes > 0:
+            class_coverage = signals.documented_classes / signals.total_classes
+            doc_scores["docstring_coverage"] = max(doc_scores["docstring_coverage"], class_coverage)
+
+        # Calculate comment density
+        comment_lines = 0
+        code_lines = 0
+
+        for line in content.split("\n"):
+            stripped = line.strip()
+            if stripped.startswith("#"):
+                comment_lines += 1
+            elif stripped and not stripped.startswith('"""') and not stripped.startswith("'''"):
+                code_lines += 1
+
+        if code_lines > 0:
+            doc_scores["comment_density"] = min(comment_lines / code_lines, 1.0)
+
+        docstring_content = signals.module_docstring
+        if docstring_content:
             # Check for examples in docstrings
-            total_docstring_length = len(ast.get_docstring(tree) or "")
-            if total_docstring_length > 0:
-                example_count = len(re.findall(r">>>|Example:|example:|\b\d+\.\s", content))
-                doc_scores["examples_present"] = min(example_count / 3, 1.0)
+            example_count = len(_EXAMPLE_PATTERN.findall(content))
+            doc_scores["examples_present"] = min(example_count / 3, 1.0)
 
             # Calculate explanation quality based on docstring content
-            docstring_content = ast.get_docstring(tree) or ""
-            if docstring_content:
-                # Check for good explanation indicators
-                explanation_indicators = [
-                    "provides",
-                    "allows",
-                    "enables",
-                    "implements",
-                    "handles",
-                    "processes",
-                    "manages",
-                ]
-                explanation_count = sum(1 for indicator in explanation_indicators if indicator in docstring_content)
-                doc_scores["explanation_quality"] = min(explanation_count / len(explanation_indicators), 1.0)
-
-            return doc_scores
+            explanation_indicators = [
+                "provides",
+                "allows",
+                "enables",
+                "implements",
+                "handles",
+                "processes",
+                "manages",
+            ]
+            explanation_count = sum(1 for indicator in explanation_indicators if indicator in docstring_content)
+            doc_scores["explanation_quality"] = min(explanation_count / len(explanation_indicators), 1.0)
+
+        return doc_scores
+
+    def _get_default_documentation_scores(self) -> Dict[str, float]:
+        """Get default documentation scores for error cases."""
+        return {
+            "docstring_coverage": 0.3,
+            "comment_density": 0.2,
+            "explanation_quality": 0.3,
+            "examples_present": 0.0,
+            "parameter_documentation": 0.2,
+            "return_documentation": 0.2,
+            "exception_documentation": 0.1,
+        }
+
+    def _analyze_file(self, file_path: str) -> Tuple[Dict[str, float], Dict[str, float], Dict[str, float]]:
+        """
+        Run structure, domain and documentation analysis on one read and parse.
+
+        Error handling matches the individual analyze_* methods: an unreadable
+        file yields default scores everywhere, a syntax error only affects the
+        AST-based structure and documentation scores.
 
+        Returns:
+            Tuple of (structure, domain, documentation) scores
+        """
+        try:
+            content = _read_file(file_path)
         except Exception as e:
+            logger.error(f"Error analyzing code structure: {e}")
+            logger.error(f"Error analyzing domain relevance: {e}")
             logger.error(f"Error analyzing documentation quality: {e}")
-            return {
-                "docstring_coverage": 0.3,
-                "comment_density": 0.2,
-                "explanation_quality": 0.3,
-                "examples_present": 0.0,
-                "parameter_documentation": 0.2,
-                "return_documentation": 0.2,
-                "exception_documentation": 0.1,
-            }
+            return (
+                self._get_default_structure_scores(),
+                self._get_default_domain_scores(),
+                self._get_default_documentation_scores(),
+            )
+
+        try:
+            signals = _collect_signals(ast.parse(content))
+        except Exception as e:
+            logger.error(f"Error analyzing code structure: {e}")
+            logger.error(f"Error analyzing documentation quality: {e}")
+            return (
+                self._get_default_structure_scores(),
+                self._score_domain(content),
+                self._get_default_documentation_scores(),
+            )
+
+        return self._score_structure(signals), self._score_domain(content), self._score_documentation(signals, content)
 
     def calculate_confidence_score(
         self,
@@ -489,9 +530,7 @@ class ConfidenceScoringSystem:
         doc_weights = doc_weights or default_doc_weights
 
         # Analyze code
-        structure_analysis = self.analyze_code_structure(file_path)
-        domain_analysis = self.analyze_domain_relevance(file_path)
-        doc_analysis = self.analyze_documentation_quality(file_path)
+        structure_analysis, domain_analysis, doc_analysis = self._analyze_file(file_path)
 
         # Calculate weighted scores
         structure_score = sum(structure_analysis[key] * structure_weights.get(key, 0) for key in structure_analysis)
@@ -6,15 +6,212 @@ through /moai:0-project command or other configuration management operations.
 
 This module ensures that when language or user settings change, all template
 variables in the system are properly updated to reflect the new configuration.
+
+A persisted index (.moai/cache/template-variable-index.json) records which
+variables each tracked file references, keyed by mtime/size and content hash,
+plus the directory mtimes behind every glob. A config change then only reads
+and rewrites files that still reference a variable or changed on disk, instead
+of re-globbing and re-reading the whole tracked tree.
 """
 
+import hashlib
 import json
+import os
 import re
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from .language_config_resolver import get_resolver
 
+INDEX_VERSION = 1
+INDEX_RELATIVE_PATH = Path(".moai") / "cache" / "template-variable-index.json"
+
+# Files modified this close to when they were indexed may change again without
+# a visible mtime change, so their content hash is re-checked
+RACY_WINDOW_NS = 2_000_000_000
+
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{([A-Za-z0-9_]+)\}\}")
+_GLOB_CHARS = set("*?[")
+
+
+@lru_cache(maxsize=32)
+def _compile_variables(names: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile one alternation matching {{NAME}} for every given variable name."""
+    return re.compile(r"\{\{(" + "|".join(re.escape(name) for name in names) + r")\}\}")
+
+
+def substitute_template_variables(content: str, template_vars: Dict[str, str]) -> Tuple[str, List[str]]:
+    """
+    Replace every {{VAR}} placeholder in a single pass.
+
+    Args:
+        content: Text containing placeholders
+        template_vars: Variable names mapped to their values
+
+    Returns:
+        Tuple of (substituted content, names of variables found, in template_vars order)
+    """
+    if not template_vars or "{{" not in content:
+        return content, []
+
+    found: Set[str] = set()
+
+    def replace(match: "re.Match[str]") -> str:
+        found.add(match.group(1))
+        return template_vars[match.group(1)]
+
+    content = _compile_variables(tuple(template_vars)).sub(replace, content)
+    return content, [name for name in template_vars if name in found]
+
+
+class TemplateVariableIndex:
+    """
+    Persisted index of template variable references and glob results.
+
+    File entries are reused while (mtime_ns, size) match, or while the content
+    hash matches when the stat changed (e.g. the file was only touched). Glob
+    results are reused while none of the directories they depend on changed.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.path = project_root / INDEX_RELATIVE_PATH
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.globs: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        self.files = data.get("files", {})
+        self.globs = data.get("globs", {})
+
+    def save(self) -> None:
+        """Atomically write the index if anything changed."""
+        if not self._dirty:
+            return
+
+        data = {"version": INDEX_VERSION, "files": self.files, "globs": self.globs}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(data, ensure_ascii=False))
+                os.replace(temp_path, self.path)
+                self._dirty = False
+            except OSError:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            # The index is only a cache; the next sync rebuilds it
+            pass
+
+    def needs_update(self, file_path: Path, variables: Iterable[str]) -> bool:
+        """
+        Whether a file must be re-read and substituted.
+
+        True when the file is not indexed, its content changed since it was
+        indexed, or it still references one of the given variables.
+        """
+        entry = self.files.get(self._key(file_path))
+        if entry is None:
+            return True
+
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return True
+
+        if (stat.st_mtime_ns, stat.st_size) != (entry["mtime_ns"], entry["size"]) or self._is_racy(entry):
+            try:
+                digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            except OSError:
+                return True
+            if digest != entry["sha256"]:
+                return True
+            entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size, indexed_ns=time.time_ns())
+            self._dirty = True
+
+        return not set(entry["variables"]).isdisjoint(variables)
+
+    def record(self, file_path: Path) -> None:
+        """Index the current content of a file."""
+        key = self._key(file_path)
+        self._dirty = True
+        try:
+            stat = file_path.stat()
+            raw = file_path.read_bytes()
+        except OSError:
+            self.files.pop(key, None)
+            return
+
+        self.files[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(raw).hexdigest(),
+            "variables": sorted(set(_PLACEHOLDER_PATTERN.findall(raw.decode("utf-8", errors="replace")))),
+            "indexed_ns": time.time_ns(),
+        }
+
+    def glob(self, pattern: str, globber: Callable[[str], List[Path]]) -> List[Path]:
+        """Return cached glob results unless a directory the pattern depends on changed."""
+        cached = self.globs.get(pattern)
+        if cached is not None and self._directory_mtimes(cached["directories"]) == cached["directories"]:
+            return [self.project_root / relative for relative in cached["files"]]
+
+        files = globber(pattern)
+        self._dirty = True
+        self.globs[pattern] = {
+            "files": [self._key(path) for path in files],
+            "directories": self._directory_mtimes(self._watched_directories(pattern)),
+        }
+        return files
+
+    def _key(self, file_path: Path) -> str:
+        try:
+            return file_path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return str(file_path)
+
+    @staticmethod
+    def _is_racy(entry: Dict[str, Any]) -> bool:
+        return entry["mtime_ns"] >= entry.get("indexed_ns", 0) - RACY_WINDOW_NS
+
+    def _watched_directories(self, pattern: str) -> List[str]:
+        """Directories whose entries determine the result of a glob pattern."""
+        parts = PurePosixPath(pattern).parts
+        literal = 0
+        while literal < len(parts) and _GLOB_CHARS.isdisjoint(parts[literal]):
+            literal += 1
+
+        if literal >= len(parts) - 1:
+            # Literal path or wildcard in the last component only
+            return [PurePosixPath(*parts[: len(parts) - 1]).as_posix() if len(parts) > 1 else "."]
+
+        base = self.project_root.joinpath(*parts[:literal])
+        directories = [self._key(base) if literal else "."]
+        for root, dirnames, _ in os.walk(base):
+            directories.extend(self._key(Path(root) / name) for name in dirnames)
+        return directories
+
+    def _directory_mtimes(self, directories: Iterable[str]) -> Dict[str, Optional[int]]:
+        mtimes: Dict[str, Optional[int]] = {}
+        for directory in directories:
+            try:
+                mtimes[directory] = (self.project_root / directory).stat().st_mtime_ns
+            except OSError:
+                mtimes[directory] = None
+        return mtimes
+
 
 class TemplateVariableSynchronizer:
     """
@@ -59,6 +256,14 @@ class TemplateVariableSynchronizer:
         """
         self.project_root = Path(project_root)
         self.language_resolver = get_resolver(project_root)
+        self._index: Optional[TemplateVariableIndex] = None
+
+    @property
+    def index(self) -> TemplateVariableIndex:
+        """Persisted reference index, loaded on first use."""
+        if self._index is None:
+            self._index = TemplateVariableIndex(self.project_root)
+        return self._index
 
     def synchronize_after_config_change(self, changed_config_path: Optional[Path] = None) -> Dict[str, Any]:
         """
@@ -73,6 +278,7 @@ class TemplateVariableSynchronizer:
         """
         results: Dict[str, Any] = {
             "files_updated": 0,
+            "files_skipped": 0,
             "variables_updated": [],
             "errors": [],
             "sync_status": "completed",
@@ -86,10 +292,15 @@ class TemplateVariableSynchronizer:
             # Find files that need updating
             files_to_update = self._find_files_with_template_variables(changed_config_path)
 
-            # Update each file
+            # Only files that changed on disk or still hold placeholders for these variables
             for file_path in files_to_update:
+                if not self.index.needs_update(file_path, template_vars):
+                    results["files_skipped"] += 1
+                    continue
+
                 try:
                     updated_vars = self._update_file_template_variables(file_path, template_vars)
+                    self.index.record(file_path)
                     if updated_vars:
                         files_updated: int = results["files_updated"]  # type: ignore[assignment]
                         results["files_updated"] = files_updated + 1
@@ -104,6 +315,8 @@ class TemplateVariableSynchronizer:
             # Special handling for certain file types
             self._handle_special_file_updates(template_vars, results)
 
+            self.index.save()
+
         except Exception as e:
             results["sync_status"] = "failed"
             errors_list: List[str] = results["errors"]  # type: ignore[assignment]
@@ -137,7 +350,7 @@ class TemplateVariableSynchronizer:
             config_key = str(changed_config_path.relative_to(self.project_root))
             if config_key in dependency_map:
                 for pattern in dependency_map[config_key]:
-                    files_with_variables.extend(self._glob_files(pattern))
+                    files_with_variables.extend(self.index.glob(pattern, self._glob_files))
 
         # Always check common template files
         common_patterns = [
@@ -148,7 +361,7 @@ class TemplateVariableSynchronizer:
         ]
 
         for pattern in common_patterns:
-            files_with_variables.extend(self._glob_files(pattern))
+            files_with_variables.extend(self.index.glob(pattern, self._glob_files))
 
         # Remove duplicates and sort
         files_with_variables = list(set(files_with_variables))
@@ -186,20 +399,10 @@ class TemplateVariableSynchronizer:
             return []
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            original_content = content
-
-            # Track which variables were updated
-            updated_vars = []
-
-            # Apply each template variable substitution
-            for var_name, var_value in template_vars.items():
-                # Look for {{VARIABLE_NAME}} pattern
-                pattern = re.compile(r"\{\{" + re.escape(var_name) + r"\}\}")
+            original_content = file_path.read_text(encoding="utf-8")
 
-                if pattern.search(content):
-                    content = pattern.sub(var_value, content)
-                    updated_vars.append(var_name)
+            # Substitute all {{VARIABLE_NAME}} placeholders in one pass
+            content, updated_vars = substitute_template_variables(original_content, template_vars)
 
             # Only write if content changed
             if content != original_content:
@@ -9,13 +9,15 @@ Author: MoAI-ADK Core Team
 Version: 1.0.0
 """
 
+import copy
 import json
 import logging
 import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -89,6 +91,147 @@ class PermissionAudit:
     auto_corrected: bool
 
 
+# Upper bound on memoized check_tool_permission results
+PERMISSION_CACHE_SIZE = 1024
+
+# Minimum seconds between stat() calls on the settings file
+CONFIG_CHECK_INTERVAL = 1.0
+
+
+class BashPatternTrie:
+    """Prefix trie over Bash(...) permission patterns from settings.json
+
+    "Bash(git push:*)" matches every command starting with "git push";
+    "Bash(git status)" matches that exact command only. The most specific
+    matching pattern decides, with deny winning over allow for the same
+    pattern. Lookups take O(len(command)).
+    """
+
+    __slots__ = ("_root",)
+
+    # Node layout: [children, prefix decision, exact decision]
+    _CHILDREN, _PREFIX, _EXACT = 0, 1, 2
+
+    def __init__(self, allow: List[str], deny: List[str]):
+        self._root: list = [{}, None, None]
+        for patterns, decision in ((allow, True), (deny, False)):
+            for pattern in patterns:
+                command = self.parse_pattern(pattern)
+                if command is not None:
+                    self._insert(command, decision)
+
+    @staticmethod
+    def parse_pattern(pattern: str) -> Optional[str]:
+        """Extract the command from a Bash(...) pattern, or None for other tools"""
+        if isinstance(pattern, str) and pattern.startswith("Bash(") and pattern.endswith(")"):
+            return pattern[5:-1]
+        return None
+
+    def _insert(self, command: str, decision: bool) -> None:
+        if command.endswith(":*"):
+            command, slot = command[:-2], self._PREFIX
+        else:
+            slot = self._EXACT
+
+        node = self._root
+        for char in command:
+            children = node[self._CHILDREN]
+            if char not in children:
+                children[char] = [{}, None, None]
+            node = children[char]
+
+        # Deny wins when the same pattern is both allowed and denied
+        node[slot] = decision if node[slot] is None else node[slot] and decision
+
+    def match(self, command: str) -> Optional[bool]:
+        """Return the decision of the most specific pattern matching command, if any"""
+        node = self._root
+        decision = node[self._PREFIX]
+        for char in command:
+            node = node[self._CHILDREN].get(char)
+            if node is None:
+                return decision
+            if node[self._PREFIX] is not None:
+                decision = node[self._PREFIX]
+        if node[self._EXACT] is not None:
+            return node[self._EXACT]
+        return decision
+
+
+@dataclass(frozen=True)
+class PermissionDecisionTable:
+    """Role x tool permissions compiled into bitsets plus a Bash pattern trie
+
+    Role hierarchy inheritance is flattened at compile time, so a check is a
+    dictionary lookup and a bit test, or a trie walk for Bash(...) commands.
+    """
+
+    tool_bits: Mapping[str, int]
+    role_masks: Mapping[str, int]
+    wildcard_roles: FrozenSet[str]
+    bash_patterns: BashPatternTrie
+
+    @classmethod
+    def compile(
+        cls,
+        role_permissions: Mapping[str, List[str]],
+        role_hierarchy: Mapping[str, List[str]],
+        settings: Mapping[str, Any],
+    ) -> "PermissionDecisionTable":
+        tool_bits: Dict[str, int] = {}
+        direct_masks: Dict[str, int] = {}
+        for role, tools in role_permissions.items():
+            mask = 0
+            for tool in tools:
+                if tool != "*":
+                    mask |= 1 << tool_bits.setdefault(tool, len(tool_bits))
+            direct_masks[role] = mask
+
+        role_masks: Dict[str, int] = {}
+        wildcard_roles = set()
+        for role in set(role_permissions) | set(role_hierarchy):
+            inherited = [role, *role_hierarchy.get(role, [])]
+            role_masks[role] = 0
+            for member in inherited:
+                role_masks[role] |= direct_masks.get(member, 0)
+                if "*" in role_permissions.get(member, []):
+                    wildcard_roles.add(role)
+
+        permissions = settings.get("permissions", {}) if isinstance(settings, Mapping) else {}
+        if not isinstance(permissions, Mapping):
+            permissions = {}
+        bash_patterns = BashPatternTrie(
+            allow=list(permissions.get("allow", []) or []),
+            deny=list(permissions.get("deny", []) or []),
+        )
+
+        return cls(
+            tool_bits=tool_bits,
+            role_masks=role_masks,
+            wildcard_roles=frozenset(wildcard_roles),
+            bash_patterns=bash_patterns,
+        )
+
+    def _has_tool(self, role: str, tool_name: str) -> bool:
+        bit = self.tool_bits.get(tool_name)
+        return bit is not None and bool(self.role_masks.get(role, 0) >> bit & 1)
+
+    def is_permitted(self, role: str, tool_name: str) -> bool:
+        """Decide whether role may use tool_name"""
+        if tool_name.startswith("Bash("):
+            can_use_bash = role in self.wildcard_roles or self._has_tool(role, "Bash")
+            command = tool_name[5:-1] if tool_name.endswith(")") else tool_name[5:]
+            decision = self.bash_patterns.match(command)
+            if decision is False:
+                return False
+            if can_use_bash:
+                return True
+
+        if role in self.wildcard_roles:
+            return True
+        return self._has_tool(role, tool_name)
+
+
 class UnifiedPermissionManager:
     """
     Production-ready permission management system that addresses Claude Code
@@ -125,10 +268,17 @@ class UnifiedPermissionManager:
         "default": PermissionMode.DEFAULT,
     }
 
+    # Default tool permissions by role
+    ROLE_PERMISSIONS = {
+        "admin": ["*"],  # All tools
+        "developer": ["Task", "Read", "Write", "Edit", "Bash", "AskUserQuestion"],
+        "user": ["Task", "Read", "AskUserQuestion"],
+    }
+
     def __init__(self, config_path: Optional[str] = None, enable_logging: bool = True):
         self.config_path = config_path or ".claude/settings.json"
         self.enable_logging = enable_logging
-        self.permission_cache: Dict[str, Any] = {}
+        self.permission_cache: "OrderedDict[str, bool]" = OrderedDict()
         self.audit_log: List[PermissionAudit] = []
         self.stats = {
             "validations_performed": 0,
@@ -146,8 +296,64 @@ class UnifiedPermissionManager:
 
         # Load and validate current configuration
         self.config = self._load_configuration()
+        # Configuration as last read from or written to disk, to detect unsaved edits
+        self._saved_config = copy.deepcopy(self.config)
         self._validate_all_permissions()
 
+        # Compiled permission decisions, rebuilt when the settings file changes
+        self._permission_table: Optional[PermissionDecisionTable] = None
+        self._table_hierarchy: Optional[Tuple[Dict[str, List[str]], int]] = None
+        self._config_signature = self._get_config_signature()
+        self._config_checked_at = time.monotonic()
+
+    def _get_config_signature(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the settings file, or None if it is missing"""
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_permission_table(self) -> PermissionDecisionTable:
+        """Return the compiled decision table, rebuilding it if its inputs changed
+
+        The settings file is stat()ed at most once per CONFIG_CHECK_INTERVAL;
+        when it changed on disk it is reloaded and revalidated before
+        recompiling. If ``self.config`` holds edits that were not saved, they
+        are kept and the file change is ignored until the next save.
+        """
+        now = time.monotonic()
+        if now - self._config_checked_at >= CONFIG_CHECK_INTERVAL:
+            self._config_checked_at = now
+            signature = self._get_config_signature()
+            if signature != self._config_signature:
+                self._config_signature = signature
+                if self.config != self._saved_config:
+                    if self.enable_logging:
+                        logger.warning(
+                            f"{self.config_path} changed on disk; keeping unsaved in-memory configuration changes"
+                        )
+                else:
+                    self.config = self._load_configuration()
+                    self._saved_config = copy.deepcopy(self.config)
+                    self._validate_all_permissions()
+                    self._permission_table = None
+
+        hierarchy = (self.role_hierarchy, len(self.role_hierarchy))
+        if self._table_hierarchy is None or (
+            self._table_hierarchy[0] is not hierarchy[0] or self._table_hierarchy[1] != hierarchy[1]
+        ):
+            self._permission_table = None
+
+        if self._permission_table is None:
+            self._permission_table = PermissionDecisionTable.compile(
+                self.ROLE_PERMISSIONS, self.role_hierarchy, self.config
+            )
+            self._table_hierarchy = hierarchy
+            self.permission_cache.clear()
+
+        return self._permission_table
+
     def _load_configuration(self) -> Dict[str, Any]:
         """Load configuration from file with error handling"""
         try:
@@ -324,26 +530,27 @@ class UnifiedPermissionManager:
         Check if a user role is permitted to use a specific tool.
 
         Implements unified permission checking with role hierarchy support.
+        Bash(...) commands matching a permissions.deny pattern in the settings
+        file are refused for every role.
         """
         self.stats["validations_performed"] += 1
 
+        table = self._get_permission_table()
+
         # Check cache first
         cache_key = f"{user_role}:{tool_name}:{operation}"
-        if cache_key in self.permission_cache:
-            return self.permission_cache[cache_key]
+        cached = self.permission_cache.get(cache_key)
+        if cached is not None:
+            self.permission_cache.move_to_end(cache_key)
+            return cached
 
-        # Check direct permissions
-        permitted = self._check_direct_permission(user_role, tool_name, operation)
+        # Role hierarchy is flattened into the compiled table
+        permitted = table.is_permitted(user_role, tool_name)
 
-        # If not directly permitted, check role hierarchy
-        if not permitted:
-            for subordinate_role in self.role_hierarchy.get(user_role, []):
-                if self._check_direct_permission(subordinate_role, tool_name, operation):
-                    permitted = True
-                    break
-
-        # Cache the result
+        # Cache the result (bounded, least recently used entries evicted first)
         self.permission_cache[cache_key] = permitted
+        if len(self.permission_cache) > PERMISSION_CACHE_SIZE:
+            self.permission_cache.popitem(last=False)
 
         if not permitted:
             self.stats["permission_denied"] += 1
@@ -354,14 +561,7 @@ class UnifiedPermissionManager:
 
     def _check_direct_permission(self, role: str, tool_name: str, operation: str) -> bool:
         """Check direct permissions for a specific role"""
-        # Default permissions by role
-        role_permissions = {
-            "admin": ["*"],  # All tools
-            "developer": ["Task", "Read", "Write", "Edit", "Bash", "AskUserQuestion"],
-            "user": ["Task", "Read", "AskUserQuestion"],
-        }
-
-        allowed_tools = role_permissions.get(role, [])
+        allowed_tools = self.ROLE_PERMISSIONS.get(role, [])
 
         # Wildcard permission
         if "*" in allowed_tools:
@@ -591,6 +791,9 @@ class UnifiedPermissionManager:
             # Save updated configuration
             with open(self.config_path, "w", encoding="utf-8") as f:
                 json.dump(self.config, f, indent=2, ensure_ascii=False)
+            # Our own write is not an external change to reload
+            self._saved_config = copy.deepcopy(self.config)
+            self._config_signature = self._get_config_signature()
 
             if self.enable_logging:
                 logger.info(f"Saved configuration to {self.config_path}")
@@ -12,22 +12,43 @@ Key Features:
 - Collaboration pattern analysis
 - Productivity metrics and insights
 - User experience optimization recommendations
+
+Storage Model:
+- Actions are kept in memory as compact __slots__ records and flushed in
+  batches to day-partitioned, dictionary-encoded columnar segments
+- Per-user daily aggregates (commands, tools, errors) are maintained
+  incrementally so pattern queries never rescan raw events
+- Only a bounded window of recent actions is retained in memory
 """
 
 import json
 import logging
+import os
+import shutil
 import statistics
 import uuid
 from collections import Counter, defaultdict, deque
 from dataclasses import asdict, dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Buffered actions written per columnar segment
+SEGMENT_FLUSH_THRESHOLD = 500
+
+# Days of partitions and aggregates retained on disk and in memory
+ACTION_RETENTION_DAYS = 90
+
+# Recent actions kept per session (state analysis only needs the tail)
+SESSION_ACTION_WINDOW = 1000
+
+# Dictionary-encoded segment columns
+_SEGMENT_DICT_COLUMNS = ("action_type", "user_id", "session_id", "tool", "command")
+
 
 class UserActionType(Enum):
     """Types of user actions tracked"""
@@ -101,6 +122,8 @@ class UserSession:
     git_branch: str = ""
     modified_files: Set[str] = field(default_factory=set)
     tools_used: Set[str] = field(default_factory=set)
+    total_actions: int = 0
+    successful_actions: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -137,6 +160,308 @@ class UserPreferences:
     last_updated: datetime = field(default_factory=datetime.now)
 
 
+class ActionRecord:
+    """Compact in-memory action record used for segment storage"""
+
+    __slots__ = (
+        "timestamp",
+        "action_type",
+        "user_id",
+        "session_id",
+        "tool",
+        "command",
+        "duration_ms",
+        "success",
+    )
+
+    def __init__(
+        self,
+        timestamp: float,
+        action_type: str,
+        user_id: str,
+        session_id: str,
+        tool: Optional[str] = None,
+        command: Optional[str] = None,
+        duration_ms: Optional[float] = None,
+        success: bool = True,
+    ):
+        self.timestamp = timestamp
+        self.action_type = action_type
+        self.user_id = user_id
+        self.session_id = session_id
+        self.tool = tool
+        self.command = command
+        self.duration_ms = duration_ms
+        self.success = success
+
+    @classmethod
+    def from_action(cls, action: UserAction) -> "ActionRecord":
+        """Create a compact record from a full UserAction"""
+        tool = action.action_data.get("tool")
+        command = action.action_data.get("command")
+        return cls(
+            timestamp=action.timestamp.timestamp(),
+            action_type=action.action_type.value,
+            user_id=action.user_id,
+            session_id=action.session_id,
+            tool=str(tool) if tool is not None else None,
+            command=str(command) if command is not None else None,
+            duration_ms=action.duration_ms,
+            success=action.success,
+        )
+
+    @property
+    def is_error(self) -> bool:
+        """Whether this action counts as an error"""
+        return not self.success or self.action_type == UserActionType.ERROR_OCCURRED.value
+
+
+class DailyActionAggregate:
+    """Incrementally maintained per-user, per-day action aggregate"""
+
+    __slots__ = ("actions", "errors", "commands", "tools")
+
+    def __init__(self) -> None:
+        self.actions = 0
+        self.errors = 0
+        self.commands: Counter = Counter()
+        self.tools: Counter = Counter()
+
+    def add(self, record: ActionRecord) -> None:
+        """Fold one action into the aggregate"""
+        self.actions += 1
+        if record.is_error:
+            self.errors += 1
+        if record.action_type == UserActionType.COMMAND_EXECUTION.value:
+            if record.command:
+                self.commands[record.command] += 1
+            if record.tool:
+                self.tools[record.tool] += 1
+
+    def merge(self, other: "DailyActionAggregate") -> None:
+        """Merge another aggregate into this one"""
+        self.actions += other.actions
+        self.errors += other.errors
+        self.commands.update(other.commands)
+        self.tools.update(other.tools)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "actions": self.actions,
+            "errors": self.errors,
+            "commands": dict(self.commands),
+            "tools": dict(self.tools),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DailyActionAggregate":
+        """Create aggregate from serialized dictionary"""
+        aggregate = cls()
+        aggregate.actions = data.get("actions", 0)
+        aggregate.errors = data.get("errors", 0)
+        aggregate.commands.update(data.get("commands", {}))
+        aggregate.tools.update(data.get("tools", {}))
+        return aggregate
+
+
+class ActionSegmentStore:
+    """
+    Day-partitioned columnar storage for user actions
+
+    Layout::
+
+        <root>/<YYYY-MM-DD>/segment-<n>.json   # columnar, dictionary-encoded
+        <root>/<YYYY-MM-DD>/aggregates.json    # per-user daily aggregates
+
+    Records are buffered and written in batches; aggregates are updated on
+    every append, so queries cost O(days x distinct keys) regardless of how
+    many raw events were recorded.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        flush_threshold: int = SEGMENT_FLUSH_THRESHOLD,
+        retention_days: int = ACTION_RETENTION_DAYS,
+    ):
+        self.root = root
+        self.flush_threshold = max(1, flush_threshold)
+        self.retention_days = retention_days
+
+        self._buffer: List[ActionRecord] = []
+        # day → user_id → aggregate
+        self._aggregates: Dict[str, Dict[str, DailyActionAggregate]] = {}
+        self._dirty_days: Set[str] = set()
+
+    def append(self, record: ActionRecord) -> None:
+        """Buffer a record and update rolling aggregates"""
+        day = date.fromtimestamp(record.timestamp).isoformat()
+        users = self._aggregates.setdefault(day, {})
+        aggregate = users.get(record.user_id)
+        if aggregate is None:
+            aggregate = users[record.user_id] = DailyActionAggregate()
+        aggregate.add(record)
+        self._dirty_days.add(day)
+
+        self._buffer.append(record)
+        if len(self._buffer) >= self.flush_threshold:
+            self.flush()
+
+    def aggregate(self, user_id: Optional[str] = None, days: int = 30) -> DailyActionAggregate:
+        """
+        Merge daily aggregates for the last N days
+
+        Args:
+            user_id: Restrict to one user (None for all users)
+            days: Number of days to include (including today)
+
+        Returns:
+            Merged aggregate
+        """
+        cutoff = (date.today() - timedelta(days=days)).isoformat()
+        merged = DailyActionAggregate()
+
+        for day, users in self._aggregates.items():
+            if day < cutoff:
+                continue
+            if user_id is None:
+                for aggregate in users.values():
+                    merged.merge(aggregate)
+            elif user_id in users:
+                merged.merge(users[user_id])
+
+        return merged
+
+    def flush(self) -> None:
+        """Write buffered records as columnar segments, one per day partition"""
+        if not self._buffer and not self._dirty_days:
+            return
+
+        by_day: Dict[str, List[ActionRecord]] = defaultdict(list)
+        for record in self._buffer:
+            by_day[date.fromtimestamp(record.timestamp).isoformat()].append(record)
+        # Drop the buffer even on failure so memory stays bounded
+        self._buffer = []
+        dirty_days, self._dirty_days = self._dirty_days, set()
+
+        try:
+            for day, records in by_day.items():
+                partition = self.root / day
+                partition.mkdir(parents=True, exist_ok=True)
+                segment_index = sum(1 for _ in partition.glob("segment-*.json"))
+                self._write_json(partition / f"segment-{segment_index:05d}.json", self._encode_segment(records))
+
+            for day in dirty_days:
+                aggregates = {user: agg.to_dict() for user, agg in self._aggregates.get(day, {}).items()}
+                partition = self.root / day
+                partition.mkdir(parents=True, exist_ok=True)
+                self._write_json(partition / "aggregates.json", aggregates)
+
+            logger.debug(f"Flushed {sum(len(r) for r in by_day.values())} actions to {self.root}")
+
+        except Exception as e:
+            logger.error(f"Error flushing action segments: {e}")
+
+    def load(self) -> None:
+        """Load persisted daily aggregates within the retention window and prune older partitions"""
+        if not self.root.exists():
+            return
+
+        cutoff = (date.today() - timedelta(days=self.retention_days)).isoformat()
+
+        for partition in sorted(self.root.iterdir()):
+            if not partition.is_dir():
+                continue
+
+            if partition.name < cutoff:
+                shutil.rmtree(partition, ignore_errors=True)
+                continue
+
+            aggregates_file = partition / "aggregates.json"
+            if not aggregates_file.exists():
+                continue
+
+            try:
+                with open(aggregates_file, "r") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Skipping unreadable aggregates {aggregates_file}: {e}")
+                continue
+
+            self._aggregates[partition.name] = {
+                user_id: DailyActionAggregate.from_dict(agg) for user_id, agg in data.items()
+            }
+
+    def iter_actions(self, day: str) -> Iterator[ActionRecord]:
+        """
+        Iterate over persisted actions of one day partition
+
+        Args:
+            day: Partition date in ISO format (YYYY-MM-DD)
+
+        Yields:
+            ActionRecord instances in write order
+        """
+        partition = self.root / day
+        if not partition.exists():
+            return
+
+        for segment_file in sorted(partition.glob("segment-*.json")):
+            with open(segment_file, "r") as f:
+                segment = json.load(f)
+            yield from self._decode_segment(segment)
+
+    @staticmethod
+    def _encode_segment(records: List[ActionRecord]) -> Dict[str, Any]:
+        """Encode records column by column, dictionary-encoding string columns"""
+        dictionaries: Dict[str, List[Optional[str]]] = {name: [] for name in _SEGMENT_DICT_COLUMNS}
+        indexes: Dict[str, Dict[Optional[str], int]] = {name: {} for name in _SEGMENT_DICT_COLUMNS}
+        columns: Dict[str, List[Any]] = {
+            name: [] for name in ("timestamp", "duration_ms", "success", *_SEGMENT_DICT_COLUMNS)
+        }
+
+        for record in records:
+            columns["timestamp"].append(record.timestamp)
+            columns["duration_ms"].append(record.duration_ms)
+            columns["success"].append(1 if record.success else 0)
+            for name in _SEGMENT_DICT_COLUMNS:
+                value = getattr(record, name)
+                index = indexes[name].get(value)
+                if index is None:
+                    index = indexes[name][value] = len(dictionaries[name])
+                    dictionaries[name].append(value)
+                columns[name].append(index)
+
+        return {"version": 1, "count": len(records), "dictionaries": dictionaries, "columns": columns}
+
+    @staticmethod
+    def _decode_segment(segment: Dict[str, Any]) -> Iterator[ActionRecord]:
+        """Decode a columnar segment back into records"""
+        dictionaries = segment["dictionaries"]
+        columns = segment["columns"]
+
+        for i in range(segment["count"]):
+            yield ActionRecord(
+                timestamp=columns["timestamp"][i],
+                action_type=dictionaries["action_type"][columns["action_type"][i]],
+                user_id=dictionaries["user_id"][columns["user_id"][i]],
+                session_id=dictionaries["session_id"][columns["session_id"][i]],
+                tool=dictionaries["tool"][columns["tool"][i]],
+                command=dictionaries["command"][columns["command"][i]],
+                duration_ms=columns["duration_ms"][i],
+                success=bool(columns["success"][i]),
+            )
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        """Write compact JSON atomically via temporary file and rename"""
+        temp_path = path.with_name(f".{path.name}.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+
 class UserBehaviorAnalytics:
     """Main user behavior analytics system"""
 
@@ -149,6 +474,7 @@ class UserBehaviorAnalytics:
         self.active_sessions: Dict[str, UserSession] = {}
         self.user_preferences: Dict[str, UserPreferences] = {}
         self.action_history: deque = deque(maxlen=10000)
+        self.action_store = ActionSegmentStore(self.storage_path / "actions")
 
         # Analysis caches
         self._pattern_cache: Dict[str, Any] = {}
@@ -181,13 +507,21 @@ class UserBehaviorAnalytics:
             tags=self._extract_action_tags(action_type, action_data),
         )
 
-        # Store action
+        # Store action (bounded recent window + columnar store with aggregates)
         self.action_history.append(action)
+        self.action_store.append(ActionRecord.from_action(action))
 
         # Update session if active
         if session_id in self.active_sessions:
             session = self.active_sessions[session_id]
             session.actions.append(action)
+            session.total_actions += 1
+            if success:
+                session.successful_actions += 1
+
+            # Keep only the recent tail; amortized O(1) trimming
+            if len(session.actions) > 2 * SESSION_ACTION_WINDOW:
+                del session.actions[:-SESSION_ACTION_WINDOW]
 
             # Update session metrics
             if action_type == UserActionType.COMMAND_EXECUTION:
@@ -315,20 +649,10 @@ class UserBehaviorAnalytics:
             if productivity_scores:
                 patterns["avg_productivity_score"] = statistics.mean(productivity_scores)
 
-            # Command usage
-            all_commands = []
-            all_tools = []
-
-            for session in user_sessions:
-                for action in session.actions:
-                    if action.action_type == UserActionType.COMMAND_EXECUTION:
-                        if "command" in action.action_data:
-                            all_commands.append(action.action_data["command"])
-                        if "tool" in action.action_data:
-                            all_tools.append(action.action_data["tool"])
-
-            patterns["most_used_commands"] = dict(Counter(all_commands).most_common(10))
-            patterns["most_used_tools"] = dict(Counter(all_tools).most_common(10))
+            # Command usage from pre-aggregated daily counters
+            usage = self.action_store.aggregate(user_id, days)
+            patterns["most_used_commands"] = dict(usage.commands.most_common(10))
+            patterns["most_used_tools"] = dict(usage.tools.most_common(10))
 
             # Peak productivity hours
             hour_productivity = defaultdict(list)
@@ -383,20 +707,10 @@ class UserBehaviorAnalytics:
                 "Long session durations detected. Consider taking regular breaks for sustained productivity."
             )
 
-        # Error pattern analysis
-        recent_actions = [
-            action
-            for action in self.action_history
-            if action.user_id == user_id and action.timestamp >= datetime.now() - timedelta(days=days)
-        ]
-
-        error_actions = [
-            action
-            for action in recent_actions
-            if action.action_type == UserActionType.ERROR_OCCURRED or not action.success
-        ]
+        # Error pattern analysis from pre-aggregated daily counters
+        usage = self.action_store.aggregate(user_id, days)
 
-        if len(error_actions) > len(recent_actions) * 0.1:  # > 10% error rate
+        if usage.errors > usage.actions * 0.1:  # > 10% error rate
             insights["efficiency_recommendations"].append(
                 "High error rate detected. Consider additional training or tool familiarization."
             )
@@ -593,9 +907,12 @@ class UserBehaviorAnalytics:
         if not session.actions:
             return 0.0
 
-        # Base score from success rate
-        successful_actions = sum(1 for action in session.actions if action.success)
-        success_rate = successful_actions / len(session.actions)
+        # Base score from success rate (session counters cover trimmed actions)
+        if session.total_actions:
+            success_rate = session.successful_actions / session.total_actions
+        else:
+            successful_actions = sum(1 for action in session.actions if action.success)
+            success_rate = successful_actions / len(session.actions)
         base_score = success_rate * 50
 
         # Duration factor (optimal session duration)
@@ -645,11 +962,17 @@ class UserBehaviorAnalytics:
 
             logger.info(f"Loaded preferences for {len(self.user_preferences)} users")
 
+            # Load rolling action aggregates
+            self.action_store.load()
+
         except Exception as e:
             logger.error(f"Error loading analytics data: {e}")
 
     def _save_data(self) -> None:
         """Save analytics data to storage"""
+        # Flush buffered actions into columnar segments
+        self.action_store.flush()
+
         try:
             # Save user preferences
             prefs_data = {}
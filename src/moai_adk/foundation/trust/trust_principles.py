@@ -15,11 +15,34 @@ Features:
 - Complete audit trails
 """
 
+import hashlib
+import json
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+from moai_adk.utils.code_analysis import (
+    Signature,
+    analyze_source,
+    file_signature,
+    get_analysis_session,
+    read_source,
+    run_file_tasks,
+)
+
+# Session record namespace for per-file principle scan results
+PRINCIPLES_RECORD = "trust-principles"
+
+# Hardcoded secret patterns (basic), checked per file by validate_secured
+SECRET_PATTERNS = [
+    r'password\s*=\s*["\'][^"\']+["\']',
+    r'api_key\s*=\s*["\'][^"\']+["\']',
+    r'secret\s*=\s*["\'][^"\']+["\']',
+    r'token\s*=\s*["\'][^"\']+["\']',
+]
 
 
 class TrustPrinciple(Enum):
@@ -123,6 +146,75 @@ class TrustPrinciplesValidator:
             "version_tracking": r"v\d+\.\d+\.\d+|\d+\.\d+\.\d+",
         }
 
+    def _scan_content(self, content: str) -> Dict[str, Any]:
+        """
+        Run every per-file pattern check on one file's content
+
+        Returns:
+            JSON-serializable record with pattern hits and counts
+        """
+        security_matches = {}
+        for pattern_name, pattern in self.security_patterns.items():
+            matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
+            if matches:
+                security_matches[pattern_name] = len(matches)
+
+        return {
+            "test_patterns": sum(
+                1 for pattern in self.test_patterns.values() if re.search(pattern, content, re.MULTILINE | re.DOTALL)
+            ),
+            "unified_patterns": sum(
+                1 for pattern in self.unified_patterns.values() if re.search(pattern, content, re.MULTILINE)
+            ),
+            # Class starting with lowercase
+            "naming_violation": bool(re.search(r"class\s+[a-z]", content)),
+            "error_handling": len(re.findall(r"except\s+\w+:", content)),
+            "logging": len(re.findall(r"logger\.\w+|logging\.\w+", content)),
+            "security_matches": security_matches,
+            "secret_patterns": sum(1 for pattern in SECRET_PATTERNS if re.search(pattern, content, re.IGNORECASE)),
+        }
+
+    def _pattern_fingerprint(self) -> str:
+        """Digest of the patterns used by _scan_content, identifying its cached records"""
+        patterns = [self.test_patterns, self.unified_patterns, self.security_patterns, SECRET_PATTERNS]
+        return hashlib.sha256(json.dumps(patterns, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+    def _file_records(self, project_dir: Path, max_workers: Optional[int] = 1) -> List[Tuple[Path, Dict[str, Any]]]:
+        """
+        Get per-file scan records for all Python files in the project
+
+        Records are cached in the shared analysis session, so the four
+        principle validators scan each file once. Records made with other scan
+        patterns are discarded. Missing records are computed by
+        _scan_file_worker with this validator's patterns, in a process pool
+        when max_workers allows.
+
+        Args:
+            project_dir: Project directory
+            max_workers: Worker processes (1 for serial, None for CPU count)
+
+        Returns:
+            List of (file path, record) in file index order
+        """
+        session = get_analysis_session(project_dir)
+        python_files = session.files(".py")
+        session.set_record_fingerprint(PRINCIPLES_RECORD, self._pattern_fingerprint())
+
+        missing = [str(path) for path in python_files if session.get_record(path, PRINCIPLES_RECORD) is None]
+        worker = partial(_scan_file_worker, self)
+        for key, signature, metrics, scan in run_file_tasks(worker, missing, max_workers):
+            if signature is None:
+                continue
+            if metrics is not None:
+                session.put_metrics(key, signature, metrics)
+            session.put_record(key, PRINCIPLES_RECORD, signature, scan)
+
+        records: List[Tuple[Path, Dict[str, Any]]] = []
+        for path in python_files:
+            record = session.get_record(path, PRINCIPLES_RECORD)
+            records.append((path, record if record is not None else {"error": f"Cannot read {path}"}))
+        return records
+
     def validate_test_first(self, project_path: str) -> PrincipleScore:
         """Validate Test First principle"""
         issues = []
@@ -131,7 +223,8 @@ class TrustPrinciplesValidator:
 
         try:
             project_dir = Path(project_path)
-            python_files = list(project_dir.rglob("*.py"))
+            records = self._file_records(project_dir)
+            python_files = [file_path for file_path, _ in records]
 
             test_files = [f for f in python_files if f.name.startswith("test_")]
             source_files = [f for f in python_files if not f.name.startswith("test_")]
@@ -143,16 +236,13 @@ class TrustPrinciplesValidator:
             total_test_patterns = 0
             found_test_patterns = 0
 
-            for file_path in python_files:
-                try:
-                    content = file_path.read_text(encoding="utf-8")
+            for file_path, record in records:
+                if "error" in record:
+                    issues.append(f"Error analyzing {file_path}: {record['error']}")
+                    continue
 
-                    for pattern_name, pattern in self.test_patterns.items():
-                        total_test_patterns += 1
-                        if re.search(pattern, content, re.MULTILINE | re.DOTALL):
-                            found_test_patterns += 1
-                except Exception as e:
-                    issues.append(f"Error analyzing {file_path}: {str(e)}")
+                total_test_patterns += len(self.test_patterns)
+                found_test_patterns += record["test_patterns"]
 
             pattern_coverage = found_test_patterns / max(total_test_patterns, 1)
 
@@ -212,7 +302,8 @@ class TrustPrinciplesValidator:
 
         try:
             project_dir = Path(project_path)
-            python_files = list(project_dir.rglob("*.py"))
+            session = get_analysis_session(project_dir)
+            python_files = session.files(".py")
 
             total_functions = 0
             long_functions = 0
@@ -223,52 +314,30 @@ class TrustPrinciplesValidator:
 
             for file_path in python_files:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
-                    content.split("\n")
+                    file_metrics = session.metrics(file_path)
+                    if file_metrics is None:
+                        raise ValueError("file is not readable as UTF-8 text")
+                    if file_metrics.parse_error:
+                        raise SyntaxError(file_metrics.parse_error)
 
                     # Analyze functions
-                    function_matches = re.finditer(r"def\s+(\w+)\([^)]*\):", content)
-                    for match in function_matches:
+                    for func in file_metrics.functions:
                         total_functions += 1
 
-                        # Count lines in function
-                        func_start = match.start()
-                        func_lines = 0
-                        indent_level = None
-
-                        for i, line in enumerate(content[func_start:].split("\n")[1:], 1):
-                            if line.strip() == "":
-                                continue
-
-                            current_indent = len(line) - len(line.lstrip())
-                            if indent_level is None:
-                                indent_level = current_indent
-                            elif current_indent <= indent_level and line.strip():
-                                break
-                            func_lines += 1
-
-                        if func_lines > 50:
+                        if func.length > 50:
                             long_functions += 1
-                            issues.append(f"Long function in {file_path.name}: {match.group(1)} ({func_lines} lines)")
+                            issues.append(f"Long function in {file_path.name}: {func.name} ({func.length} lines)")
 
-                        # Check for docstring
-                        func_content = content[func_start : func_start + 1000]  # Check next 1000 chars
-                        if '"""' in func_content.split("\n")[1:5]:
+                        if func.has_docstring:
                             functions_with_docstrings += 1
 
-                        # Check for type hints
-                        if "->" in match.group(0) or ":" in match.group(0):
+                        if func.has_type_hints:
                             functions_with_type_hints += 1
 
                     # Analyze classes
-                    class_matches = re.finditer(r"class\s+(\w+)[\(\:]:", content)
-                    for match in class_matches:
+                    for cls in file_metrics.classes:
                         total_classes += 1
-
-                        # Check for docstring
-                        class_start = match.start()
-                        class_content = content[class_start : class_start + 500]  # Check next 500 chars
-                        if '"""' in class_content.split("\n")[1:3]:
+                        if cls.has_docstring:
                             classes_with_docstrings += 1
 
                 except Exception as e:
@@ -337,39 +406,25 @@ class TrustPrinciplesValidator:
 
         try:
             project_dir = Path(project_path)
-            python_files = list(project_dir.rglob("*.py"))
+            records = self._file_records(project_dir)
 
             unified_patterns_found = 0
             total_patterns = len(self.unified_patterns)
-            file_count = len(python_files)
+            file_count = len(records)
 
             naming_violations = 0
             error_handling_count = 0
             logging_count = 0
 
-            for file_path in python_files:
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-
-                    # Check unified patterns
-                    for pattern_name, pattern in self.unified_patterns.items():
-                        if re.search(pattern, content, re.MULTILINE):
-                            unified_patterns_found += 1
-
-                    # Check naming violations
-                    if re.search(r"class\s+[a-z]", content):  # Class starting with lowercase
-                        naming_violations += 1
-
-                    # Count error handling
-                    error_matches = re.findall(r"except\s+\w+:", content)
-                    error_handling_count += len(error_matches)
+            for file_path, record in records:
+                if "error" in record:
+                    issues.append(f"Error analyzing {file_path}: {record['error']}")
+                    continue
 
-                    # Count logging usage
-                    logging_matches = re.findall(r"logger\.\w+|logging\.\w+", content)
-                    logging_count += len(logging_matches)
-
-                except Exception as e:
-                    issues.append(f"Error analyzing {file_path}: {str(e)}")
+                unified_patterns_found += record["unified_patterns"]
+                naming_violations += int(record["naming_violation"])
+                error_handling_count += record["error_handling"]
+                logging_count += record["logging"]
 
             # Calculate scores
             pattern_coverage = unified_patterns_found / (total_patterns * file_count)
@@ -432,42 +487,30 @@ class TrustPrinciplesValidator:
 
         try:
             project_dir = Path(project_path)
-            python_files = list(project_dir.rglob("*.py"))
+            records = self._file_records(project_dir)
+            python_files = [file_path for file_path, _ in records]
 
             security_issues = []
             security_patterns_found = 0
             high_risk_patterns = 0
 
-            for file_path in python_files:
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-
-                    # Check for security patterns
-                    for pattern_name, pattern in self.security_patterns.items():
-                        matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-                        if matches:
-                            security_patterns_found += len(matches)
-
-                            if pattern_name in ["sql_injection", "secret_management"]:
-                                high_risk_patterns += len(matches)
-                                for match in matches:
-                                    security_issues.append(f"High-risk pattern in {file_path.name}: {pattern_name}")
-
-                    # Check for hardcoded secrets (basic pattern)
-                    secret_patterns = [
-                        r'password\s*=\s*["\'][^"\']+["\']',
-                        r'api_key\s*=\s*["\'][^"\']+["\']',
-                        r'secret\s*=\s*["\'][^"\']+["\']',
-                        r'token\s*=\s*["\'][^"\']+["\']',
-                    ]
-
-                    for pattern in secret_patterns:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            security_issues.append(f"Potential hardcoded secret in {file_path.name}")
-                            high_risk_patterns += 1
+            for file_path, record in records:
+                if "error" in record:
+                    issues.append(f"Error analyzing {file_path}: {record['error']}")
+                    continue
 
-                except Exception as e:
-                    issues.append(f"Error analyzing {file_path}: {str(e)}")
+                # Check for security patterns
+                for pattern_name, match_count in record["security_matches"].items():
+                    security_patterns_found += match_count
+
+                    if pattern_name in ["sql_injection", "secret_management"]:
+                        high_risk_patterns += match_count
+                        security_issues.extend([f"High-risk pattern in {file_path.name}: {pattern_name}"] * match_count)
+
+                # Check for hardcoded secrets (basic pattern)
+                for _ in range(record["secret_patterns"]):
+                    security_issues.append(f"Potential hardcoded secret in {file_path.name}")
+                    high_risk_patterns += 1
 
             # Calculate security score
             if high_risk_patterns > 0:
@@ -531,15 +574,29 @@ class TrustPrinciplesValidator:
             metrics=metrics,
         )
 
-    def assess_project(self, project_path: str) -> TrustAssessment:
-        """Perform complete TRUST assessment"""
+    def assess_project(self, project_path: str, max_workers: Optional[int] = 1) -> TrustAssessment:
+        """
+        Perform complete TRUST assessment
+
+        Args:
+            project_path: Project directory
+            max_workers: Worker processes for per-file analysis (1 for serial,
+                None for CPU count). Results are identical in both modes.
+
+        Returns:
+            TrustAssessment
+        """
         principle_scores = {}
 
+        # Scan every file once (in parallel when requested); validators reduce the records
+        self._file_records(Path(project_path), max_workers)
+
         # Validate each principle
         principle_scores[TrustPrinciple.TEST_FIRST] = self.validate_test_first(project_path)
         principle_scores[TrustPrinciple.READABLE] = self.validate_readable(project_path)
         principle_scores[TrustPrinciple.UNIFIED] = self.validate_unified(project_path)
         principle_scores[TrustPrinciple.SECURED] = self.validate_secured(project_path)
+        get_analysis_session(project_path).save()
 
         # Calculate overall score
         overall_score = 0.0
@@ -674,3 +731,29 @@ def generate_trust_report(project_path: str = ".") -> str:
     validator = TrustPrinciplesValidator()
     assessment = validator.assess_project(project_path)
     return validator.generate_report(assessment)
+
+
+def _scan_file_worker(
+    validator: TrustPrinciplesValidator, path: str
+) -> Tuple[str, Optional[Signature], Optional[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Compute the per-file record used by all principle validators
+
+    Runs in worker processes (with a pickled copy of the validator) for
+    parallel assessments and in-process with the validator itself for serial
+    ones, so both modes produce identical records.
+
+    Args:
+        validator: Validator whose patterns are scanned for
+        path: File to scan
+
+    Returns:
+        Tuple of (path, file signature, FileMetrics dict or None, scan record)
+    """
+    signature = file_signature(path)
+    content = read_source(path)
+    if content is None:
+        return path, signature, None, {"error": f"Cannot read {path} as UTF-8 text"}
+
+    metrics, _ = analyze_source(content, path)
+    return path, signature, metrics.to_dict(), validator._scan_content(content)
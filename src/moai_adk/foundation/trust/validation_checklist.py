@@ -16,12 +16,13 @@ Features:
 - Enterprise-grade reporting
 """
 
-import ast
 import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from moai_adk.utils.code_analysis import FileMetrics, get_analysis_session
 
 
 class ChecklistType(Enum):
@@ -820,6 +821,23 @@ class TRUSTValidationChecklist:
         else:
             return False, {"error": f"Unknown validation rule: {rule}"}
 
+    def _read_source(self, project_dir: Path, file_path: Path) -> str:
+        """Read a file once per run through the shared analysis session"""
+        content = get_analysis_session(project_dir).read(file_path)
+        if content is None:
+            raise ValueError(f"Cannot read {file_path} as UTF-8 text")
+        return content
+
+    def _iter_metrics(self, project_dir: Path, pattern: str = "*.py") -> List[Tuple[Path, FileMetrics]]:
+        """Get per-file metrics (single AST pass per file) for matching Python files"""
+        session = get_analysis_session(project_dir)
+        results = []
+        for file_path in session.files(".py", pattern=pattern):
+            metrics = session.metrics(file_path)
+            if metrics is not None and metrics.parse_error is None:
+                results.append((file_path, metrics))
+        return results
+
     def _check_test_coverage(self, project_dir: Path, rule: str) -> Tuple[bool, Dict[str, Any]]:
         """Check test coverage ratio"""
         try:
@@ -827,7 +845,7 @@ class TRUSTValidationChecklist:
             target_ratio = float(rule.split(">=")[-1].strip())
 
             # Simple coverage check - count test files vs source files
-            python_files = list(project_dir.rglob("*.py"))
+            python_files = get_analysis_session(project_dir).files(".py")
             test_files = [f for f in python_files if f.name.startswith("test_")]
             source_files = [
                 f
@@ -854,8 +872,8 @@ class TRUSTValidationChecklist:
                 return False, {"error": "No tests directory found"}
 
             # Check for proper test organization
-            init_files = list(test_dir.rglob("__init__.py"))
-            test_modules = [f for f in test_dir.rglob("test_*.py")]
+            init_files = get_analysis_session(project_dir).files(".py", under=test_dir, pattern="__init__.py")
+            test_modules = get_analysis_session(project_dir).files(".py", under=test_dir, pattern="test_*.py")
 
             return len(test_modules) > 0 and len(init_files) > 0, {
                 "result": "Test structure valid",
@@ -869,11 +887,11 @@ class TRUSTValidationChecklist:
     def _check_integration_tests(self, project_dir: Path) -> Tuple[bool, Dict[str, Any]]:
         """Check for integration tests"""
         try:
-            python_files = list(project_dir.rglob("*.py"))
+            python_files = get_analysis_session(project_dir).files(".py")
 
             integration_tests = []
             for file_path in python_files:
-                content = file_path.read_text(encoding="utf-8")
+                content = self._read_source(project_dir, file_path)
                 if re.search(
                     r"integration|@integration_test|test_integration",
                     content,
@@ -893,26 +911,19 @@ class TRUSTValidationChecklist:
         try:
             target_ratio = float(rule.split(">=")[-1].strip())
 
-            python_files = list(project_dir.rglob("test_*.py"))
+            python_files = get_analysis_session(project_dir).files(".py", pattern="test_*.py")
             if not python_files:
                 return False, {"error": "No test files found"}
 
             total_functions = 0
             docstringed_functions = 0
 
-            for file_path in python_files:
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    tree = ast.parse(content)
-
-                    for node in ast.walk(tree):
-                        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                            if node.name.startswith("test_"):
-                                total_functions += 1
-                                if ast.get_docstring(node):
-                                    docstringed_functions += 1
-                except Exception:
-                    continue
+            for _, metrics in self._iter_metrics(project_dir, "test_*.py"):
+                for func in metrics.functions:
+                    if func.name.startswith("test_"):
+                        total_functions += 1
+                        if func.has_docstring:
+                            docstringed_functions += 1
 
             coverage = docstringed_functions / max(total_functions, 1)
             return coverage >= target_ratio, {
@@ -927,14 +938,14 @@ class TRUSTValidationChecklist:
     def _check_assertion_quality(self, project_dir: Path) -> Tuple[bool, Dict[str, Any]]:
         """Check assertion quality"""
         try:
-            python_files = list(project_dir.rglob("test_*.py"))
+            python_files = get_analysis_session(project_dir).files(".py", pattern="test_*.py")
 
             meaningful_assertions = 0
             total_assertions = 0
 
             for file_path in python_files:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
+                    content = self._read_source(project_dir, file_path)
 
                     # Look for meaningful assertions
                     meaningful_patterns = [
@@ -973,14 +984,14 @@ class TRUSTValidationChecklist:
     def _check_test_data_isolation(self, project_dir: Path) -> Tuple[bool, Dict[str, Any]]:
         """Check test data isolation"""
         try:
-            python_files = list(project_dir.rglob("test_*.py"))
+            python_files = get_analysis_session(project_dir).files(".py", pattern="test_*.py")
 
             isolation_patterns = 0
             fixtures_count = 0
 
             for file_path in python_files:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
+                    content = self._read_source(project_dir, file_path)
 
                     # Look for isolation patterns
                     isolation_patterns += len(re.findall(r"@pytest\.fixture|setUp|tearDown", content))
@@ -1000,14 +1011,14 @@ class TRUSTValidationChecklist:
     def _check_mock_usage(self, project_dir: Path) -> Tuple[bool, Dict[str, Any]]:
         """Check mock usage appropriateness"""
         try:
-            python_files = list(project_dir.rglob("test_*.py"))
+            python_files = get_analysis_session(project_dir).files(".py", pattern="test_*.py")
 
             mock_usage = 0
             test_functions = 0
 
             for file_path in python_files:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
+                    content = self._read_source(project_dir, file_path)
 
                     mock_usage += len(re.findall(r"mock\.|Mock\(|@patch\(", content))
                     test_functions += len(re.findall(r"def\s+test_", content))
@@ -1029,13 +1040,13 @@ class TRUSTValidationChecklist:
     def _check_performance_tests(self, project_dir: Path) -> Tuple[bool, Dict[str, Any]]:
         """Check for performance tests"""
         try:
-            python_files = list(project_dir.rglob("*.py"))
+            python_files = get_analysis_session(project_dir).files(".py")
 
             performance_tests = 0
 
             for file_path in python_files:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
+                    content = self._read_source(project_dir, file_path)
 
                     performance_patterns = [
                         r"performance|benchmark|@mark\.slow|@pytest\.mark\.performance",
@@ -1098,8 +1109,8 @@ class TRUSTValidationChecklist:
             for pattern in ci_patterns:
                 if pattern.endswith("/"):
                     if (project_dir / pattern).exists():
-                        ci_files.extend(list((project_dir / pattern).rglob("*.yml")))
-                        ci_files.extend(list((project_dir / pattern).rglob("*.yaml")))
+                        workflow_dir = project_dir / pattern
+                        ci_files.extend(get_analysis_session(project_dir).files(".yml", ".yaml", under=workflow_dir))
                 else:
                     if (project_dir / pattern).exists():
                         ci_files.append(Path(pattern))
@@ -1116,51 +1127,12 @@ class TRUSTValidationChecklist:
         try:
             max_length = int(rule.split("<=")[-1].strip())
 
-            python_files = list(project_dir.rglob("*.py"))
             long_functions = 0
             total_functions = 0
 
-            for file_path in python_files:
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        lines = f.readlines()
-
-                    in_function = False
-                    function_lines = 0
-                    function_indent = 0
-
-                    for line_num, line in enumerate(lines, 1):
-                        stripped = line.strip()
-
-                        if stripped.startswith("def ") or stripped.startswith("async def "):
-                            if in_function:
-                                total_functions += 1
-                                if function_lines > max_length:
-                                    long_functions += 1
-
-                            in_function = True
-                            function_lines = 1
-                            function_indent = len(line) - len(line.lstrip())
-
-                        elif in_function:
-                            if stripped and len(line) - len(line.lstrip()) <= function_indent:
-                                total_functions += 1
-                                if function_lines > max_length:
-                                    long_functions += 1
-                                in_function = False
-                            else:
-                                function_lines += 1
-                        elif stripped and not line.startswith("#"):
-                            # Not in function, regular code
-                            pass
-
-                    if in_function:
-                        total_functions += 1
-                        if function_lines > max_length:
-                            long_functions += 1
-
-                except Exception:
-                    continue
+            for _, metrics in self._iter_metrics(project_dir):
+                total_functions += len(metrics.functions)
+                long_functions += sum(1 for func in metrics.functions if func.length > max_length)
 
             pass_ratio = (total_functions - long_functions) / max(total_functions, 1)
             return pass_ratio >= 0.9, {
@@ -1177,44 +1149,12 @@ class TRUSTValidationChecklist:
         try:
             max_length = int(rule.split("<=")[-1].strip())
 
-            python_files = list(project_dir.rglob("*.py"))
             long_classes = 0
             total_classes = 0
 
-            for file_path in python_files:
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        lines = f.readlines()
-
-                    in_class = False
-                    class_lines = 0
-
-                    for line_num, line in enumerate(lines, 1):
-                        stripped = line.strip()
-
-                        if stripped.startswith("class "):
-                            if in_class:
-                                total_classes += 1
-                                if class_lines > max_length:
-                                    long_classes += 1
-
-                            in_class = True
-                            class_lines = 1
-                        elif in_class and stripped and not line.startswith(" "):
-                            total_classes += 1
-                            if class_lines > max_length:
-                                long_classes += 1
-                            in_class = False
-                        elif in_class:
-                            class_lines += 1
-
-                    if in_class:
-                        total_classes += 1
-                        if class_lines > max_length:
-                            long_classes += 1
-
-                except Exception:
-                    continue
+            for _, metrics in self._iter_metrics(project_dir):
+                total_classes += len(metrics.classes)
+                long_classes += sum(1 for cls in metrics.classes if cls.length > max_length)
 
             pass_ratio = (total_classes - long_classes) / max(total_classes, 1)
             return pass_ratio >= 0.95, {
@@ -1229,14 +1169,14 @@ class TRUSTValidationChecklist:
     def _check_naming_conventions(self, project_dir: Path) -> Tuple[bool, Dict[str, Any]]:
         """Check naming conventions consistency"""
         try:
-            python_files = list(project_dir.rglob("*.py"))
+            python_files = get_analysis_session(project_dir).files(".py")
 
             violations = 0
             total_checks = 0
 
             for file_path in python_files:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
+                    content = self._read_source(project_dir, file_path)
 
                     # Check for snake_case functions and variables
                     snake_case_violations = len(re.findall(r"def\s+[A-Z]", content))
@@ -1265,24 +1205,13 @@ class TRUSTValidationChecklist:
         try:
             target_ratio = float(rule.split(">=")[-1].strip())
 
-            python_files = list(project_dir.rglob("*.py"))
             total_items = 0
             docstringed_items = 0
 
-            for file_path in python_files:
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-
-                    tree = ast.parse(content)
-
-                    for node in ast.walk(tree):
-                        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                            total_items += 1
-                            if ast.get_docstring(node):
-                                docstringed_items += 1
-                except Exception:
-                    continue
+            for _, metrics in self._iter_metrics(project_dir):
+                items = metrics.functions + metrics.classes
+                total_items += len(items)
+                docstringed_items += sum(1 for item in items if item.has_docstring)
 
             coverage = docstringed_items / max(total_items, 1)
             return coverage >= target_ratio, {
@@ -1299,26 +1228,12 @@ class TRUSTValidationChecklist:
         try:
             target_ratio = float(rule.split(">=")[-1].strip())
 
-            python_files = list(project_dir.rglob("*.py"))
             total_functions = 0
             hinted_functions = 0
 
-            for file_path in python_files:
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-
-                    tree = ast.parse(content)
-
-                    for node in ast.walk(tree):
-                        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                            total_functions += 1
-                            if node.returns or any(
-                                isinstance(arg, ast.arg) and arg.annotation for arg in node.args.args
-                            ):
-                                hinted_functions += 1
-                except Exception:
-                    continue
+            for _, metrics in self._iter_metrics(project_dir):
+                total_functions += len(metrics.functions)
+                hinted_functions += sum(1 for func in metrics.functions if func.has_type_hints)
 
             coverage = hinted_functions / max(total_functions, 1)
             return coverage >= target_ratio, {
@@ -1446,7 +1361,7 @@ class TRUSTValidationChecklist:
 
     def _check_documentation(self, project_dir: Path) -> Tuple[bool, Dict[str, Any]]:
         """Check documentation"""
-        doc_files = list(project_dir.rglob("*.md")) + list(project_dir.rglob("*.rst"))
+        doc_files = get_analysis_session(project_dir).files(".md", ".rst")
         return len(doc_files) > 0, {
             "result": len(doc_files),
             "documentation_files": len(doc_files),
@@ -1500,13 +1415,30 @@ class TRUSTValidationChecklist:
 
         return recommendations
 
-    def execute_all_checklists(self, project_path: str) -> Dict[ChecklistType, ChecklistReport]:
-        """Execute all TRUST checklists"""
+    def execute_all_checklists(
+        self, project_path: str, max_workers: Optional[int] = 1
+    ) -> Dict[ChecklistType, ChecklistReport]:
+        """
+        Execute all TRUST checklists
+
+        Args:
+            project_path: Project directory
+            max_workers: Worker processes for per-file analysis (1 for serial,
+                None for CPU count). Results are identical in both modes.
+
+        Returns:
+            Reports by checklist type
+        """
         reports = {}
 
+        # Analyze every Python file up front (in parallel when requested)
+        session = get_analysis_session(project_path)
+        session.prefetch(session.files(".py"), max_workers)
+
         for checklist_type in ChecklistType:
             reports[checklist_type] = self.execute_checklist(project_path, checklist_type)
 
+        session.save()
         return reports
 
     def generate_summary_report(self, reports: Dict[ChecklistType, ChecklistReport]) -> str:
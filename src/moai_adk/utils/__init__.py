@@ -2,7 +2,7 @@
 MoAI-ADK utility module
 """
 
-from .logger import SensitiveDataFilter, setup_logger
+from .logger import SensitiveDataFilter, redact_sensitive_data, setup_logger, stop_queue_listener
 from .timeout import CrossPlatformTimeout, TimeoutError, timeout_context
 from .toon_utils import (
     compare_formats,
@@ -17,6 +17,8 @@ from .toon_utils import (
 __all__ = [
     "SensitiveDataFilter",
     "setup_logger",
+    "redact_sensitive_data",
+    "stop_queue_listener",
     "CrossPlatformTimeout",
     "TimeoutError",
     "timeout_context",
@@ -0,0 +1,700 @@
+"""
+Code Analysis Session
+
+Shared file-content and per-file metrics cache for TRUST validation.
+
+TRUST checks (TRUSTValidationChecklist, TrustPrinciplesValidator and
+TrustChecker) used to glob, read and ``ast.parse`` every Python file once per
+check. An ``AnalysisSession`` reads each file once, parses it once and
+computes all per-file metrics (function/class lengths, docstrings, type
+hints, parameter counts, cyclomatic complexity) in a single AST visitor pass.
+
+Entries are keyed by (path, mtime, size). Metrics are persisted as JSON under
+``.moai/cache`` for MoAI projects, so unchanged files are not re-parsed by the
+next run. Named per-file records also depend on the configuration that
+produced them (e.g. scan patterns); the cache header stores a fingerprint per
+record kind, and records made with another configuration are discarded.
+
+Per-file work is independent, so uncached files can be analyzed in a process
+pool (``prefetch`` / ``run_file_tasks``). Workers return plain dicts and the
+parent merges them in input order, so serial and parallel runs produce the
+same results.
+
+The cache also records the project's file list and the git commit it was
+built at. ``sync_git_changes`` uses them for incremental runs: only files git
+reports as changed are revalidated, and cached results are reused for the
+rest without walking or stat-ing the tree.
+"""
+
+import ast
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, TypeVar, Union
+
+from moai_adk.utils.file_index import ProjectFileIndex, get_file_index, is_excluded
+from moai_adk.utils.git_changes import changed_paths, head_commit
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+CACHE_FILE = Path(".moai") / "cache" / "trust-analysis.json"
+MAX_CACHED_SESSIONS = 8
+# Minimum files per worker process before a pool is worth its start-up cost
+MIN_FILES_PER_WORKER = 32
+
+T = TypeVar("T")
+
+
+@dataclass
+class FunctionMetrics:
+    """Metrics for one function or method"""
+
+    name: str
+    lineno: int
+    length: int
+    params: int
+    complexity: int
+    has_docstring: bool
+    has_type_hints: bool
+    is_async: bool = False
+
+
+@dataclass
+class ClassMetrics:
+    """Metrics for one class"""
+
+    name: str
+    lineno: int
+    length: int
+    has_docstring: bool
+
+
+@dataclass
+class FileMetrics:
+    """Per-file metrics computed in a single AST pass"""
+
+    line_count: int
+    functions: List[FunctionMetrics] = field(default_factory=list)
+    classes: List[ClassMetrics] = field(default_factory=list)
+    parse_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FileMetrics":
+        """Create from a dictionary produced by to_dict"""
+        return cls(
+            line_count=data["line_count"],
+            functions=[FunctionMetrics(**f) for f in data.get("functions", [])],
+            classes=[ClassMetrics(**c) for c in data.get("classes", [])],
+            parse_error=data.get("parse_error"),
+        )
+
+
+# Node types that add a branch to McCabe complexity (elif is a nested If)
+_BRANCH_NODES = (ast.If, ast.While, ast.For, ast.ExceptHandler, ast.With)
+
+
+def cyclomatic_complexity(node: ast.AST) -> int:
+    """
+    Calculate cyclomatic complexity (McCabe complexity) of a function node.
+
+    Args:
+        node: Function AST node
+
+    Returns:
+        Cyclomatic complexity (1 + branches + extra boolean operands)
+    """
+    complexity = 1
+    for child in ast.walk(node):
+        if isinstance(child, _BRANCH_NODES):
+            complexity += 1
+        elif isinstance(child, ast.BoolOp):
+            complexity += len(child.values) - 1
+    return complexity
+
+
+class _MetricsVisitor(ast.NodeVisitor):
+    """
+    Collect function and class metrics in one traversal.
+
+    Complexity is accumulated on a stack of open function frames, so a branch
+    counts towards every enclosing function, matching cyclomatic_complexity().
+    """
+
+    def __init__(self) -> None:
+        self.functions: List[FunctionMetrics] = []
+        self.classes: List[ClassMetrics] = []
+        self._frames: List[List[int]] = []
+
+    def _visit_function(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        frame = [1]
+        self._frames.append(frame)
+        self.generic_visit(node)
+        self._frames.pop()
+
+        args = node.args.args
+        self.functions.append(
+            FunctionMetrics(
+                name=node.name,
+                lineno=node.lineno,
+                length=(node.end_lineno or node.lineno) - node.lineno + 1,
+                params=len(args),
+                complexity=frame[0],
+                has_docstring=bool(ast.get_docstring(node)),
+                has_type_hints=node.returns is not None or any(arg.annotation for arg in args),
+                is_async=isinstance(node, ast.AsyncFunctionDef),
+            )
+        )
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes.append(
+            ClassMetrics(
+                name=node.name,
+                lineno=node.lineno,
+                length=(node.end_lineno or node.lineno) - node.lineno + 1,
+                has_docstring=bool(ast.get_docstring(node)),
+            )
+        )
+        self.generic_visit(node)
+
+    def _add_complexity(self, weight: int) -> None:
+        for frame in self._frames:
+            frame[0] += weight
+
+    def _visit_branch(self, node: ast.AST) -> None:
+        self._add_complexity(1)
+        self.generic_visit(node)
+
+    visit_If = _visit_branch
+    visit_While = _visit_branch
+    visit_For = _visit_branch
+    visit_ExceptHandler = _visit_branch
+    visit_With = _visit_branch
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        self._add_complexity(len(node.values) - 1)
+        self.generic_visit(node)
+
+
+def analyze_source(content: str, filename: str = "<unknown>") -> Tuple[FileMetrics, Optional[ast.Module]]:
+    """
+    Parse source once and compute its metrics.
+
+    Args:
+        content: Python source code
+        filename: File name used in syntax error messages
+
+    Returns:
+        Tuple of (metrics, parsed tree or None on syntax error)
+    """
+    line_count = len(content.splitlines())
+    try:
+        tree = ast.parse(content, filename=filename)
+    except (SyntaxError, ValueError) as e:
+        return FileMetrics(line_count=line_count, parse_error=str(e)), None
+
+    visitor = _MetricsVisitor()
+    visitor.visit(tree)
+    visitor.functions.sort(key=lambda f: f.lineno)
+    return FileMetrics(line_count=line_count, functions=visitor.functions, classes=visitor.classes), tree
+
+
+Signature = Tuple[int, int]
+
+
+def file_signature(path: Union[str, Path]) -> Optional[Signature]:
+    """Get the (mtime_ns, size) cache key of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_source(path: Union[str, Path]) -> Optional[str]:
+    """Read a file as UTF-8 text, returning None if it cannot be read or decoded"""
+    try:
+        return Path(path).read_bytes().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _metrics_worker(path: str) -> Tuple[str, Optional[Signature], Optional[Dict[str, Any]]]:
+    """Process-pool worker: compute metrics for one file"""
+    signature = file_signature(path)
+    content = read_source(path)
+    if signature is None or content is None:
+        return path, signature, None
+    metrics, _ = analyze_source(content, path)
+    return path, signature, metrics.to_dict()
+
+
+def run_file_tasks(worker: Callable[[str], T], paths: Sequence[str], max_workers: Optional[int] = 1) -> List[T]:
+    """
+    Run a per-file worker over paths, in a process pool when worthwhile.
+
+    Results are returned in the order of ``paths`` regardless of the number of
+    workers, so reductions over them are deterministic.
+
+    Args:
+        worker: Picklable module-level function taking a file path
+        paths: File paths to process
+        max_workers: Worker processes (1 for serial, None for CPU count)
+
+    Returns:
+        Worker results in path order
+    """
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = max(1, min(workers, len(paths) // MIN_FILES_PER_WORKER))
+
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunksize = max(1, len(paths) // (workers * 4))
+                return list(executor.map(worker, paths, chunksize=chunksize))
+        except (OSError, RuntimeError) as e:
+            # Process pools are unavailable in some sandboxes; fall back to serial
+            logger.warning(f"Parallel analysis unavailable, running serially: {e}")
+
+    return [worker(path) for path in paths]
+
+
+class _Entry:
+    """
+    Cached analysis results for one file version
+
+    Metrics are kept in whichever form they arrived in (FileMetrics or the
+    JSON dict from the cache file / a worker) and converted on first use, so
+    loading and saving a large cache does not convert untouched entries.
+    """
+
+    __slots__ = ("signature", "_metrics", "_data", "records")
+
+    def __init__(self, signature: Signature, data: Optional[Dict[str, Any]] = None):
+        self.signature = signature
+        self._metrics: Optional[FileMetrics] = None
+        self._data = data
+        self.records: Dict[str, Any] = {}
+
+    @property
+    def has_metrics(self) -> bool:
+        return self._metrics is not None or self._data is not None
+
+    @property
+    def metrics(self) -> Optional[FileMetrics]:
+        if self._metrics is None and self._data is not None:
+            self._metrics = FileMetrics.from_dict(self._data)
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, metrics: Optional[FileMetrics]) -> None:
+        self._metrics = metrics
+        self._data = None
+
+    def metrics_dict(self) -> Optional[Dict[str, Any]]:
+        if self._data is None and self._metrics is not None:
+            self._data = self._metrics.to_dict()
+        return self._data
+
+
+def _default_cache_path(root: Path) -> Optional[Path]:
+    """
+    Find the cache file for a root inside a MoAI project.
+
+    The root itself may be the project, or a subdirectory (e.g. 'src') of a
+    git repository whose top level is the project.
+    """
+    if (root / ".moai").is_dir():
+        return root / CACHE_FILE
+
+    for parent in root.parents:
+        if (parent / ".git").exists():
+            if (parent / ".moai").is_dir():
+                slug = root.relative_to(parent).as_posix().replace("/", "-")
+                return parent / CACHE_FILE.with_name(f"{CACHE_FILE.stem}-{slug}{CACHE_FILE.suffix}")
+            break
+    return None
+
+
+def _rel_path(root: Path, path: Union[str, Path]) -> str:
+    """Get a '/'-separated path relative to root (fast path for paths under root)"""
+    path = str(path)
+    prefix = os.path.join(str(root), "")
+    rel_path = path[len(prefix) :] if path.startswith(prefix) else os.path.relpath(path, root)
+    return rel_path.replace(os.sep, "/")
+
+
+class AnalysisSession:
+    """
+    Reads, parses and measures each file of a project at most once.
+
+    Besides FileMetrics, callers can attach named per-file records (e.g. regex
+    scan results) that share the same (mtime, size) invalidation and are
+    persisted alongside the metrics.
+    """
+
+    def __init__(self, root: Union[str, Path], cache_path: Optional[Path] = None):
+        """
+        Initialize the session.
+
+        Args:
+            root: Project root directory
+            cache_path: Metrics cache file. Defaults to .moai/cache/trust-analysis.json
+                when the root is a MoAI project (or trust-analysis-<subdir>.json for a
+                subdirectory of one); otherwise metrics are kept in memory only.
+        """
+        self.root = Path(os.path.abspath(root))
+        if cache_path is None:
+            cache_path = _default_cache_path(self.root)
+        self.cache_path = cache_path
+
+        # path → (signature, value)
+        self._contents: Dict[str, Tuple[Signature, Optional[str]]] = {}
+        self._trees: Dict[str, Tuple[Signature, Optional[ast.Module]]] = {}
+        self._entries: Dict[str, _Entry] = {}
+        # record kind → fingerprint of the configuration its records were computed with
+        self._fingerprints: Dict[str, str] = {}
+        self._dirty = False
+
+        # Project file list and git state recorded with the persisted cache
+        self._known_files: Optional[List[str]] = None
+        self._git_head: Optional[str] = None
+        self._git_dirty: List[str] = []
+        # Incremental mode (see sync_git_changes): file list and entries trusted without stat
+        self._index: Optional[ProjectFileIndex] = None
+        self._trusted: Set[str] = set()
+        self._lock = threading.RLock()
+        self._load_cache()
+
+    @property
+    def incremental(self) -> bool:
+        """Whether cached results for unchanged files are trusted (see sync_git_changes)"""
+        return self._index is not None
+
+    def files(self, *extensions: str, **filters: Any) -> List[Path]:
+        """Get project files from the shared file index (see ProjectFileIndex.files)"""
+        index = self._index if self._index is not None else get_file_index(self.root)
+        return index.files(*extensions, **filters)
+
+    def sync_git_changes(self, base: Optional[str] = None) -> bool:
+        """
+        Switch to incremental mode for files git reports as unchanged.
+
+        Files changed since the commit recorded with the cache, changed in the
+        working tree, or uncommitted when the cache was written are
+        revalidated as usual. All other cached results are reused without
+        touching the file system, and the file list is derived from the cached
+        list instead of walking the tree, so results match a full run.
+
+        Args:
+            base: Also treat files changed on the branch (``base...HEAD``) as
+                changed. If the cache has no recorded commit, it is assumed to
+                match base (e.g. a cache restored from a CI run on the base branch).
+
+        Returns:
+            True if incremental mode is active; False if a full scan is needed
+            (no cached file list, no commit to diff against, or git unavailable)
+        """
+        with self._lock:
+            since = self._git_head
+            if self._known_files is None or (since is None and base is None):
+                self.reset_incremental()
+                return False
+
+            changed = changed_paths(self.root, base=base, since=since)
+            if changed is None:
+                self.reset_incremental()
+                return False
+            changed.update(self._git_dirty)
+
+            files = set(self._known_files)
+            for rel_path in changed:
+                if not is_excluded(rel_path) and os.path.isfile(os.path.join(self.root, rel_path)):
+                    files.add(rel_path)
+                else:
+                    files.discard(rel_path)
+
+            changed_keys = {os.path.join(str(self.root), *rel_path.split("/")) for rel_path in changed}
+            self._trusted = {key for key in self._entries if key not in changed_keys}
+            self._index = ProjectFileIndex.from_files(self.root, files)
+            if head_commit(self.root) != since:
+                # Record the new commit even if no file needs re-analysis
+                self._dirty = True
+            return True
+
+    def reset_incremental(self) -> None:
+        """Leave incremental mode: revalidate every file by (mtime, size) again"""
+        with self._lock:
+            self._index = None
+            self._trusted = set()
+
+    def _current_entry(self, key: str) -> Optional[_Entry]:
+        """Get the cached entry for a file if it matches the file's current version"""
+        entry = self._entries.get(key)
+        if entry is None or key in self._trusted:
+            return entry
+        signature = file_signature(key)
+        return entry if signature is not None and entry.signature == signature else None
+
+    def read(self, path: Union[str, Path]) -> Optional[str]:
+        """
+        Read a file as UTF-8 text, once per (mtime, size).
+
+        Returns:
+            File content, or None if the file cannot be read or decoded
+        """
+        key = str(path)
+        signature = file_signature(key)
+        if signature is None:
+            return None
+
+        with self._lock:
+            cached = self._contents.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+            content = read_source(key)
+            self._contents[key] = (signature, content)
+            return content
+
+    def tree(self, path: Union[str, Path]) -> Optional[ast.Module]:
+        """Get the parsed AST of a file, or None if it cannot be read or parsed"""
+        key = str(path)
+        signature = file_signature(key)
+        with self._lock:
+            cached = self._trees.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            self._analyze(key)
+            cached = self._trees.get(key)
+            return cached[1] if cached else None
+
+    def _entry(self, key: str, signature: Signature) -> _Entry:
+        """Get the entry for the current file version, replacing a stale one"""
+        entry = self._entries.get(key)
+        if entry is None or entry.signature != signature:
+            entry = self._entries[key] = _Entry(signature)
+        return entry
+
+    def metrics(self, path: Union[str, Path]) -> Optional[FileMetrics]:
+        """
+        Get per-file metrics, from the cache when the file is unchanged.
+
+        Returns:
+            FileMetrics, or None if the file cannot be read or decoded
+        """
+        key = str(path)
+        with self._lock:
+            entry = self._current_entry(key)
+            if entry is not None and entry.has_metrics:
+                return entry.metrics
+            return self._analyze(key)
+
+    def _analyze(self, key: str) -> Optional[FileMetrics]:
+        content = self.read(key)
+        if content is None or key not in self._contents:
+            return None
+        signature = self._contents[key][0]
+
+        metrics, tree = analyze_source(content, key)
+        self._trees[key] = (signature, tree)
+        self._entry(key, signature).metrics = metrics
+        self._dirty = True
+        return metrics
+
+    def get_record(self, path: Union[str, Path], kind: str) -> Optional[Any]:
+        """Get a named per-file record if it was stored for the current file version"""
+        with self._lock:
+            entry = self._current_entry(str(path))
+            return entry.records.get(kind) if entry is not None else None
+
+    def set_record_fingerprint(self, kind: str, fingerprint: str) -> None:
+        """
+        Declare the configuration that records of a kind are computed with.
+
+        Records of the kind stored under a different fingerprint (in this
+        session or in the persisted cache) are discarded.
+
+        Args:
+            kind: Record namespace (e.g. 'trust-principles')
+            fingerprint: Stable digest of the configuration (e.g. scan patterns)
+        """
+        with self._lock:
+            if self._fingerprints.get(kind) == fingerprint:
+                return
+            for entry in self._entries.values():
+                entry.records.pop(kind, None)
+            self._fingerprints[kind] = fingerprint
+            self._dirty = True
+
+    def put_record(self, path: Union[str, Path], kind: str, signature: Signature, value: Any) -> None:
+        """
+        Store a named, JSON-serializable per-file record.
+
+        Args:
+            path: File path
+            kind: Record namespace (e.g. 'trust-principles')
+            signature: File signature the record was computed from
+            value: Record value
+        """
+        with self._lock:
+            self._entry(str(path), signature).records[kind] = value
+            self._dirty = True
+
+    def put_metrics(
+        self, path: Union[str, Path], signature: Signature, metrics: Union[FileMetrics, Dict[str, Any]]
+    ) -> None:
+        """Store metrics computed elsewhere (e.g. a FileMetrics dict from a worker process)"""
+        with self._lock:
+            entry = self._entry(str(path), signature)
+            if isinstance(metrics, FileMetrics):
+                entry.metrics = metrics
+            else:
+                entry.metrics = None
+                entry._data = metrics
+            self._dirty = True
+
+    def prefetch(self, paths: Sequence[Union[str, Path]], max_workers: Optional[int] = 1) -> None:
+        """
+        Compute metrics for all uncached paths, in parallel when requested.
+
+        Args:
+            paths: Files to analyze
+            max_workers: Worker processes (1 for serial, None for CPU count)
+        """
+        with self._lock:
+            stale = []
+            for path in paths:
+                entry = self._current_entry(str(path))
+                if entry is None or not entry.has_metrics:
+                    stale.append(str(path))
+
+        for key, signature, data in run_file_tasks(_metrics_worker, stale, max_workers):
+            if signature is not None and data is not None:
+                self.put_metrics(key, signature, data)
+
+    def _load_cache(self) -> None:
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return
+            for rel_path, item in data.get("files", {}).items():
+                entry = _Entry((item["mtime_ns"], item["size"]), item.get("metrics"))
+                entry.records = item.get("records", {})
+                self._entries[os.path.join(str(self.root), rel_path)] = entry
+            self._fingerprints = data.get("fingerprints", {})
+
+            self._known_files = data.get("index")
+            git_state = data.get("git") or {}
+            self._git_head = git_state.get("head")
+            self._git_dirty = git_state.get("dirty", [])
+        except (IOError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable analysis cache {self.cache_path}: {e}")
+            self._entries.clear()
+            self._fingerprints = {}
+            self._known_files = None
+
+    def _snapshot_files(self) -> Optional[List[str]]:
+        """Get the project file list to record, or None if no complete listing is at hand"""
+        if self._index is not None:
+            index = self._index
+        else:
+            index = get_file_index(self.root)
+            if not index.complete:
+                return None
+        return sorted(_rel_path(self.root, path) for path in index.all_files())
+
+    def save(self) -> None:
+        """
+        Persist metrics and records for files that still exist (no-op without a cache path).
+
+        Inside a git repository, the file list, HEAD commit and uncommitted paths
+        are recorded too, so the next run can use sync_git_changes.
+        """
+        with self._lock:
+            if self.cache_path is None or not self._dirty:
+                return
+
+            files = {}
+            for key, entry in self._entries.items():
+                if self._current_entry(key) is entry:
+                    files[_rel_path(self.root, key)] = {
+                        "mtime_ns": entry.signature[0],
+                        "size": entry.signature[1],
+                        "metrics": entry.metrics_dict(),
+                        "records": entry.records,
+                    }
+
+            data: Dict[str, Any] = {"version": CACHE_VERSION, "fingerprints": self._fingerprints, "files": files}
+            head = head_commit(self.root)
+            dirty = changed_paths(self.root) if head else None
+            known_files = self._snapshot_files() if dirty is not None else None
+            if known_files is not None and dirty is not None:
+                data["index"] = known_files
+                data["git"] = {"head": head, "dirty": sorted(dirty)}
+
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        # json.dumps uses the C encoder; json.dump to a file does not
+                        f.write(json.dumps(data))
+                    os.replace(temp_path, self.cache_path)
+                except Exception:
+                    os.unlink(temp_path)
+                    raise
+                self._dirty = False
+            except (IOError, OSError) as e:
+                logger.warning(f"Failed to save analysis cache {self.cache_path}: {e}")
+
+
+_sessions: "OrderedDict[str, AnalysisSession]" = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def get_analysis_session(root: Union[str, Path]) -> AnalysisSession:
+    """
+    Get the shared analysis session for a project root.
+
+    Sessions are kept for the most recently used roots; entries inside a
+    session are revalidated by (mtime, size) on every access.
+
+    Args:
+        root: Project root directory
+
+    Returns:
+        AnalysisSession for the root
+    """
+    key = os.path.abspath(root)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = AnalysisSession(key)
+            while len(_sessions) > MAX_CACHED_SESSIONS:
+                _sessions.popitem(last=False)
+        else:
+            _sessions.move_to_end(key)
+        return session
+
+
+def clear_analysis_sessions() -> None:
+    """Drop all cached sessions."""
+    with _sessions_lock:
+        _sessions.clear()
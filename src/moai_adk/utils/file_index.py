@@ -0,0 +1,374 @@
+"""
+Project File Index
+
+A single, ignore-aware walk of a project tree shared by language detection
+and TRUST validation.
+
+The tree is walked once with ``os.scandir``, skipping a built-in list of
+tool/dependency directories and anything matched by ``.gitignore`` files.
+Files are bucketed by extension as the walk proceeds, and the walk itself is
+lazy: an existence query such as ``has_extension(".rs")`` stops as soon as a
+match is found, and later queries resume from where the walk stopped.
+
+Indexes are cached per root and revalidated by directory (and ``.gitignore``)
+mtimes, so repeated callers in one process share a single walk.
+"""
+
+import fnmatch
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
+
+# Directories never worth indexing: VCS metadata, virtualenvs, dependency
+# trees and tool caches
+DEFAULT_EXCLUDES = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".venv",
+        "venv",
+        ".env",
+        "node_modules",
+        "__pycache__",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".eggs",
+        "site-packages",
+    }
+)
+
+GITIGNORE = ".gitignore"
+
+
+class _IgnoreRule:
+    """One parsed .gitignore line, relative to the directory that declared it."""
+
+    __slots__ = ("base", "regex", "negated", "dir_only", "anchored")
+
+    def __init__(self, base: str, regex: Pattern[str], negated: bool, dir_only: bool, anchored: bool):
+        self.base = base
+        self.regex = regex
+        self.negated = negated
+        self.dir_only = dir_only
+        self.anchored = anchored
+
+    def matches(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.anchored:
+            if self.base:
+                if not rel_path.startswith(self.base + "/"):
+                    return False
+                rel_path = rel_path[len(self.base) + 1 :]
+            return self.regex.fullmatch(rel_path) is not None
+        return self.regex.fullmatch(name) is not None
+
+
+def _translate(pattern: str) -> Pattern[str]:
+    """Translate a gitignore glob into a regex over '/'-separated paths."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(re.escape("["))
+                i += 1
+            else:
+                body = pattern[i + 1 : end].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(parts))
+
+
+def parse_gitignore(text: str, base: str = "") -> List[_IgnoreRule]:
+    """
+    Parse .gitignore content into rules.
+
+    Args:
+        text: Content of a .gitignore file
+        base: Directory of the .gitignore, relative to the index root ('' for the root)
+
+    Returns:
+        Rules in file order (later rules take precedence)
+    """
+    rules = []
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if not line or line.startswith("#"):
+            continue
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        if line.startswith("\\"):
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+
+        # A slash anywhere but the end anchors the pattern to its directory
+        anchored = "/" in line
+        line = line.lstrip("/")
+        rules.append(_IgnoreRule(base, _translate(line), negated, dir_only, anchored))
+    return rules
+
+
+def _is_ignored(rules: Sequence[_IgnoreRule], rel_path: str, name: str, is_dir: bool) -> bool:
+    ignored = False
+    for rule in rules:
+        if rule.matches(rel_path, name, is_dir):
+            ignored = not rule.negated
+    return ignored
+
+
+def _normalize_extension(extension: str) -> str:
+    """Accept 'py', '.py' or '*.py' and return '.py'."""
+    extension = extension.lower().lstrip("*")
+    return extension if extension.startswith(".") else f".{extension}"
+
+
+def _walk_order_key(rel_path: str) -> Tuple[Tuple[int, str], ...]:
+    """
+    Sort key that orders '/'-separated relative paths the way the index walks them.
+
+    Within a directory, files come first (by name), then subdirectories (by name).
+    """
+    parts = rel_path.split("/")
+    return tuple((1, part) for part in parts[:-1]) + ((0, parts[-1]),)
+
+
+def is_excluded(rel_path: str, excludes: frozenset = DEFAULT_EXCLUDES) -> bool:
+    """Check whether a '/'-separated relative file path lies in an excluded directory."""
+    return any(part in excludes for part in rel_path.split("/")[:-1])
+
+
+class ProjectFileIndex:
+    """
+    Lazily built, ignore-aware index of the files under a project root.
+    """
+
+    def __init__(self, root: Union[str, Path], excludes: Optional[frozenset] = None):
+        """
+        Initialize the index (no I/O happens until the first query).
+
+        Args:
+            root: Project root directory
+            excludes: Directory names to skip (defaults to DEFAULT_EXCLUDES)
+        """
+        self.root = Path(root)
+        self.excludes = DEFAULT_EXCLUDES if excludes is None else excludes
+        self._by_extension: Dict[str, List[Path]] = {}
+        # Directory (and .gitignore) path → st_mtime_ns observed during the walk
+        self._mtimes: Dict[str, int] = {}
+        self._walker: Optional[Iterator[None]] = self._walk()
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_files(cls, root: Union[str, Path], rel_paths: Iterable[str]) -> "ProjectFileIndex":
+        """
+        Create a complete index from known file paths, without walking the tree.
+
+        Args:
+            root: Project root directory
+            rel_paths: '/'-separated file paths relative to root
+
+        Returns:
+            Index listing the files in walk order
+        """
+        index = cls(root)
+        index._walker = None
+        for rel_path in sorted(rel_paths, key=_walk_order_key):
+            extension = os.path.splitext(rel_path)[1].lower()
+            path = Path(os.path.join(str(index.root), *rel_path.split("/")))
+            index._by_extension.setdefault(extension, []).append(path)
+        return index
+
+    @property
+    def complete(self) -> bool:
+        """Whether the whole tree has been walked."""
+        return self._walker is None
+
+    def _walk(self) -> Iterator[None]:
+        """Walk the tree depth-first, yielding after each directory."""
+        stack: List[Tuple[str, str, List[_IgnoreRule]]] = [(str(self.root), "", [])]
+
+        while stack:
+            directory, rel_dir, rules = stack.pop()
+            try:
+                self._mtimes[directory] = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            gitignore = os.path.join(directory, GITIGNORE)
+            if any(entry.name == GITIGNORE for entry in entries):
+                try:
+                    self._mtimes[gitignore] = os.stat(gitignore).st_mtime_ns
+                    with open(gitignore, encoding="utf-8", errors="ignore") as f:
+                        rules = rules + parse_gitignore(f.read(), rel_dir)
+                except OSError:
+                    pass
+
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if name in self.excludes or _is_ignored(rules, rel_path, name, True):
+                        continue
+                    subdirs.append((entry.path, rel_path, rules))
+                elif not _is_ignored(rules, rel_path, name, False):
+                    extension = os.path.splitext(name)[1].lower()
+                    self._by_extension.setdefault(extension, []).append(Path(entry.path))
+
+            # Reverse so that directories are visited in name order
+            stack.extend(reversed(subdirs))
+            yield
+
+    def _advance(self) -> bool:
+        """Walk one more directory; return False when the walk is complete."""
+        if self._walker is None:
+            return False
+        try:
+            next(self._walker)
+            return True
+        except StopIteration:
+            self._walker = None
+            return False
+
+    def _build(self) -> None:
+        with self._lock:
+            while self._advance():
+                pass
+
+    def has_extension(self, *extensions: str) -> bool:
+        """
+        Check whether any indexed file has one of the extensions.
+
+        Stops walking as soon as a match is found.
+
+        Args:
+            extensions: Extensions such as '.py', 'py' or '*.py'
+
+        Returns:
+            True if at least one matching file exists
+        """
+        wanted = [_normalize_extension(ext) for ext in extensions]
+        with self._lock:
+            while True:
+                if any(self._by_extension.get(ext) for ext in wanted):
+                    return True
+                if not self._advance():
+                    return False
+
+    def files(
+        self,
+        *extensions: str,
+        under: Optional[Union[str, Path]] = None,
+        pattern: Optional[str] = None,
+    ) -> List[Path]:
+        """
+        Get indexed files with the given extensions.
+
+        Args:
+            extensions: Extensions such as '.py', 'py' or '*.py'
+            under: Only return files below this directory
+            pattern: Only return files whose name matches this glob (e.g. 'test_*.py')
+
+        Returns:
+            Matching file paths in walk order
+        """
+        self._build()
+
+        result: List[Path] = []
+        for ext in extensions:
+            result.extend(self._by_extension.get(_normalize_extension(ext), []))
+
+        if under is not None:
+            prefix = os.path.join(os.path.abspath(under), "")
+            result = [path for path in result if str(path).startswith(prefix)]
+        if pattern is not None:
+            result = [path for path in result if fnmatch.fnmatchcase(path.name, pattern)]
+        return result
+
+    def all_files(self) -> List[Path]:
+        """Get every indexed file (walks the whole tree)."""
+        self._build()
+        return [path for paths in self._by_extension.values() for path in paths]
+
+    def is_fresh(self) -> bool:
+        """Check that no walked directory or .gitignore has changed since the walk."""
+        with self._lock:
+            for path, mtime in self._mtimes.items():
+                try:
+                    if os.stat(path).st_mtime_ns != mtime:
+                        return False
+                except OSError:
+                    return False
+            return True
+
+
+_index_cache: Dict[str, ProjectFileIndex] = {}
+_index_cache_lock = threading.Lock()
+
+
+def get_file_index(root: Union[str, Path]) -> ProjectFileIndex:
+    """
+    Get the shared file index for a project root.
+
+    A cached index is reused while its directory mtimes are unchanged;
+    otherwise a new index is created.
+
+    Args:
+        root: Project root directory
+
+    Returns:
+        ProjectFileIndex for the root
+    """
+    key = os.path.abspath(root)
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is None or not index.is_fresh():
+            index = _index_cache[key] = ProjectFileIndex(key)
+        return index
+
+
+def clear_file_index_cache() -> None:
+    """Drop all cached indexes."""
+    with _index_cache_lock:
+        _index_cache.clear()
@@ -0,0 +1,95 @@
+"""
+Git Change Detection
+
+Lightweight ``git`` subprocess helpers used by incremental analysis to ask
+which files changed since a commit, instead of re-checking every file.
+
+All paths are returned relative to the directory the commands run in (git's
+``--relative`` view), so a subdirectory of a repository can be analyzed on
+its own. Every helper returns None when git is unavailable or the command
+fails, and callers fall back to a full scan.
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+from typing import List, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+GIT_COMMAND_TIMEOUT = 10  # seconds
+
+
+def run_git(cwd: Union[str, Path], *args: str) -> Optional[str]:
+    """
+    Run a git command and return its stdout.
+
+    Args:
+        cwd: Working directory for the command
+        args: git arguments
+
+    Returns:
+        Command output, or None if git is unavailable or the command failed
+    """
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=str(cwd),
+            capture_output=True,
+            text=True,
+            timeout=GIT_COMMAND_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"git {' '.join(args)} failed: {e}")
+        return None
+
+    if result.returncode != 0:
+        logger.debug(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+        return None
+    return result.stdout
+
+
+def _split_paths(output: str) -> List[str]:
+    return [path for path in output.split("\0") if path]
+
+
+def head_commit(cwd: Union[str, Path]) -> Optional[str]:
+    """Get the commit id of HEAD, or None outside a repository (or before the first commit)"""
+    output = run_git(cwd, "rev-parse", "--verify", "--quiet", "HEAD")
+    return output.strip() if output else None
+
+
+def changed_paths(cwd: Union[str, Path], base: Optional[str] = None, since: Optional[str] = None) -> Optional[Set[str]]:
+    """
+    Get files changed on the branch and in the working tree.
+
+    The result is the union of:
+    - ``git diff --name-only base...HEAD`` (branch changes since the merge base), if base is given
+    - ``git diff --name-only since`` (commits and working tree since a commit), if since is given,
+      otherwise ``git diff --name-only HEAD`` (staged and unstaged changes)
+    - untracked files that are not ignored
+
+    Renames are reported as a deletion plus an addition, so both paths appear.
+
+    Args:
+        cwd: Directory to report changes for (paths are relative to it)
+        base: Base ref for branch changes (e.g. 'origin/main')
+        since: Commit whose content the caller already knows
+
+    Returns:
+        Paths relative to cwd ('/'-separated), or None if any git command failed
+    """
+    commands = [
+        ["diff", "--name-only", "--relative", "--no-renames", "-z", since or "HEAD"],
+        ["ls-files", "--others", "--exclude-standard", "-z"],
+    ]
+    if base:
+        commands.append(["diff", "--name-only", "--relative", "--no-renames", "-z", f"{base}...HEAD"])
+
+    paths: Set[str] = set()
+    for command in commands:
+        output = run_git(cwd, *command)
+        if output is None:
+            return None
+        paths.update(_split_paths(output))
+    return paths
@@ -5,13 +5,58 @@ SPEC requirements:
 - Store logs at .moai/logs/moai.log
 - Mask sensitive data: API Key, Email, Password
 - Log levels: development (DEBUG), test (INFO), production (WARNING)
+- Optional queue-based pipeline that moves formatting and file I/O off the caller's thread
 """
 
+import atexit
+import copy
 import logging
+import logging.handlers
 import os
+import queue
 import re
 from pathlib import Path
 
+REDACTED = "***REDACTED***"
+
+# All sensitive-data patterns combined into one precompiled alternation
+_REDACTION_PATTERN = re.compile(
+    r"(?P<api_key>sk-[a-zA-Z0-9]+)"
+    r"|(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)"
+    r"|(?i:(?P<keyword>password|passwd|pwd)[\s:=]+\S+)"
+)
+
+# Lowercase literals, at least one of which every match contains
+_PASSWORD_LITERALS = ("pass", "pwd")
+
+# Queue listeners started by setup_logger(use_queue=True), by logger name
+_queue_listeners: dict[str, logging.handlers.QueueListener] = {}
+
+
+def _redact_match(match: re.Match) -> str:
+    keyword = match.group("keyword")
+    return f"{keyword}: {REDACTED}" if keyword else REDACTED
+
+
+def redact_sensitive_data(message: str) -> str:
+    """
+    Mask API keys, email addresses and passwords in a message.
+
+    Messages without "sk-", "@" or a password keyword are returned as-is
+    without running the regular expression.
+
+    Args:
+        message: Text to mask.
+
+    Returns:
+        Message with sensitive values replaced by ***REDACTED***.
+    """
+    if "sk-" not in message and "@" not in message:
+        lowered = message.lower()
+        if not any(literal in lowered for literal in _PASSWORD_LITERALS):
+            return message
+    return _REDACTION_PATTERN.sub(_redact_match, message)
+
 
 class SensitiveDataFilter(logging.Filter):
     """
@@ -35,6 +80,7 @@ class SensitiveDataFilter(logging.Filter):
         API Key: ***REDACTED***
     """
 
+    # Reference patterns; filtering uses the combined _REDACTION_PATTERN
     PATTERNS = [
         (r"sk-[a-zA-Z0-9]+", "***REDACTED***"),  # API Key
         (
@@ -48,26 +94,38 @@ class SensitiveDataFilter(logging.Filter):
         """
         Mask sensitive data in the log record message.
 
+        Attached to handlers, so it only runs for records that passed the
+        logger and handler level checks.
+
         Args:
             record: Log record to inspect.
 
         Returns:
             True to keep the record.
         """
-        message = record.getMessage()
-        for pattern, replacement in self.PATTERNS:
-            message = re.sub(pattern, replacement, message)
-
-        record.msg = message
+        record.msg = redact_sensitive_data(record.getMessage())
         record.args = ()  # Clear args so getMessage() returns msg unchanged
 
         return True
 
 
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener's handlers."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args and mask on the caller's thread, as the synchronous
+        # filters do, so handlers reached through propagation never see raw
+        # values; the listener gets its own copy and only formats and writes
+        record.msg = redact_sensitive_data(record.getMessage())
+        record.args = None
+        return copy.copy(record)
+
+
 def setup_logger(
     name: str,
     log_dir: str | None = None,
     level: int | None = None,
+    use_queue: bool = False,
 ) -> logging.Logger:
     """
     Configure and return a logger instance.
@@ -80,9 +138,13 @@ def setup_logger(
             Default: .moai/logs (created automatically).
         level: Logging level (logging.DEBUG, INFO, WARNING, etc.).
             Default: derived from the MOAI_ENV environment variable.
+        use_queue: Route records through a QueueHandler so formatting and
+            writing run on a background QueueListener thread.
+            Default: False (handlers run on the caller's thread).
 
     Returns:
-        Configured Logger object with console and file handlers.
+        Configured Logger object with console and file handlers
+        (or a single QueueHandler feeding them when use_queue is True).
 
     Log level per environment (MOAI_ENV):
         - development: DEBUG (emit all logs)
@@ -107,6 +169,8 @@ def setup_logger(
         - Log files are written using UTF-8 encoding.
         - Sensitive data (API Key, Email, Password) is automatically masked.
         - Existing handlers are removed to prevent duplicates.
+        - With use_queue, call stop_queue_listener(name) to flush pending
+          records; all listeners are also stopped at interpreter exit.
     """
     if level is None:
         env = os.getenv("MOAI_ENV", "").lower()
@@ -119,6 +183,7 @@ def setup_logger(
 
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    stop_queue_listener(name)
     logger.handlers.clear()  # Remove existing handlers to avoid duplicates
 
     if log_dir is None:
@@ -135,13 +200,50 @@ def setup_logger(
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
     console_handler.addFilter(SensitiveDataFilter())
-    logger.addHandler(console_handler)
 
     log_file = log_path / "moai.log"
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
     file_handler.addFilter(SensitiveDataFilter())
-    logger.addHandler(file_handler)
+
+    if not use_queue:
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+        return logger
+
+    record_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _DeferredFormatQueueHandler(record_queue)
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(record_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    _queue_listeners[name] = listener
 
     return logger
+
+
+def stop_queue_listener(name: str) -> None:
+    """
+    Stop the background listener of a queue-based logger.
+
+    Blocks until queued records are written, then closes the listener's
+    handlers. Does nothing for loggers set up without use_queue.
+
+    Args:
+        name: Logger name passed to setup_logger.
+    """
+    listener = _queue_listeners.pop(name, None)
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_queue_listeners() -> None:
+    for name in list(_queue_listeners):
+        stop_queue_listener(name)
@@ -0,0 +1,110 @@
+"""
+TRUST Parallel Assessment Performance Tests
+
+Benchmarks serial against process-parallel TRUST assessment of a synthetic
+project and checks that both modes produce identical results.
+
+The default run uses 5000 files; set MOAI_BENCH_FILES to change the project
+size. The speedup assertion only applies on machines with at least 4 CPUs.
+"""
+
+import os
+import time
+
+from moai_adk.foundation.trust.trust_principles import TrustPrinciplesValidator
+from moai_adk.foundation.trust.validation_checklist import TRUSTValidationChecklist
+from moai_adk.utils.code_analysis import clear_analysis_sessions
+from moai_adk.utils.file_index import clear_file_index_cache
+
+FILE_COUNT = int(os.environ.get("MOAI_BENCH_FILES", "5000"))
+# At least two workers so the process-pool path is exercised even on one CPU
+PARALLEL_WORKERS = max(2, min(os.cpu_count() or 1, 8))
+
+MODULE_TEMPLATE = '''"""Synthetic module {index}."""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Service{index}:
+    """Service {index}."""
+
+    def run(self, items: list, limit: int = 3) -> int:
+        """Run the service."""
+        total = 0
+        for item in items:
+            if item and total < limit:
+                total += 1
+        try:
+            logger.info("processed %d", total)
+        except ValueError:
+            pass
+        return total
+'''
+
+TEST_TEMPLATE = '''"""Tests for module {index}."""
+
+import pytest
+
+
+def test_run_{index}():
+    """Test run."""
+    assert Service{index}().run([1, 2]) == 2
+'''
+
+
+def _build_project(root):
+    for index in range(FILE_COUNT):
+        package = root / "src" / f"pkg{index // 100}"
+        package.mkdir(parents=True, exist_ok=True)
+        if index % 4 == 0:
+            (package / f"test_module{index}.py").write_text(TEST_TEMPLATE.format(index=index))
+        else:
+            (package / f"module{index}.py").write_text(MODULE_TEMPLATE.format(index=index))
+
+
+def _fresh_caches():
+    clear_analysis_sessions()
+    clear_file_index_cache()
+
+
+def _timed(func, *args, **kwargs):
+    _fresh_caches()
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+class TestTrustParallelPerformance:
+    """Performance tests for parallel TRUST assessment"""
+
+    def test_parallel_assessment_matches_serial(self, tmp_path):
+        """Parallel assessment should give identical scores, faster on multi-core machines"""
+        _build_project(tmp_path)
+        validator = TrustPrinciplesValidator()
+
+        serial, serial_s = _timed(validator.assess_project, str(tmp_path), max_workers=1)
+        parallel, parallel_s = _timed(validator.assess_project, str(tmp_path), max_workers=PARALLEL_WORKERS)
+
+        print(f"\n📊 {FILE_COUNT} files, {PARALLEL_WORKERS} workers")
+        print(f"⚡ Serial: {serial_s:.2f}s, parallel: {parallel_s:.2f}s")
+
+        assert parallel.principle_scores == serial.principle_scores
+        assert parallel.overall_score == serial.overall_score
+        if (os.cpu_count() or 1) >= 4:
+            assert parallel_s * 1.5 < serial_s, f"No parallel speedup: {parallel_s:.2f}s vs {serial_s:.2f}s"
+
+    def test_parallel_checklists_match_serial(self, tmp_path):
+        """Parallel checklist execution should give identical reports"""
+        _build_project(tmp_path)
+        checklist = TRUSTValidationChecklist()
+
+        serial, serial_s = _timed(checklist.execute_all_checklists, str(tmp_path), max_workers=1)
+        parallel, parallel_s = _timed(checklist.execute_all_checklists, str(tmp_path), max_workers=PARALLEL_WORKERS)
+
+        print(f"\n⚡ Checklists serial: {serial_s:.2f}s, parallel: {parallel_s:.2f}s")
+
+        for checklist_type, report in serial.items():
+            assert [r.passed for r in parallel[checklist_type].results] == [r.passed for r in report.results]
+            assert parallel[checklist_type].total_score == report.total_score
@@ -0,0 +1,67 @@
+"""
+TrustPrinciplesValidator pattern configuration tests
+
+Per-file scan records must be computed with the validator's own patterns,
+in serial and parallel runs, and must not be reused by a validator
+configured with different patterns.
+"""
+
+from moai_adk.foundation.trust.trust_principles import PRINCIPLES_RECORD, TrustPrinciplesValidator
+from moai_adk.utils.code_analysis import clear_analysis_sessions, get_analysis_session
+from moai_adk.utils.file_index import clear_file_index_cache
+
+FILE_COUNT = 64
+
+MODULE_SOURCE = '''
+def handler(request):
+    """Handle a request"""
+    audit_marker(request)
+    return request
+'''
+
+
+def _build_project(root):
+    for index in range(FILE_COUNT):
+        (root / f"module{index}.py").write_text(MODULE_SOURCE)
+
+
+def _custom_validator():
+    validator = TrustPrinciplesValidator()
+    validator.security_patterns = {"audit_marker": r"audit_marker\("}
+    return validator
+
+
+def _audit_hits(project_dir):
+    session = get_analysis_session(project_dir)
+    return sum(
+        session.get_record(path, PRINCIPLES_RECORD)["security_matches"].get("audit_marker", 0)
+        for path in session.files(".py")
+    )
+
+
+class TestPatternConfiguration:
+    def setup_method(self):
+        clear_analysis_sessions()
+        clear_file_index_cache()
+
+    def test_serial_run_uses_custom_patterns(self, tmp_path):
+        _build_project(tmp_path)
+
+        _custom_validator().assess_project(str(tmp_path), max_workers=1)
+
+        assert _audit_hits(tmp_path) == FILE_COUNT
+
+    def test_parallel_run_uses_custom_patterns(self, tmp_path):
+        _build_project(tmp_path)
+
+        _custom_validator().assess_project(str(tmp_path), max_workers=2)
+
+        assert _audit_hits(tmp_path) == FILE_COUNT
+
+    def test_records_from_other_patterns_are_not_reused(self, tmp_path):
+        _build_project(tmp_path)
+        TrustPrinciplesValidator().assess_project(str(tmp_path))
+
+        _custom_validator().assess_project(str(tmp_path))
+
+        assert _audit_hits(tmp_path) == FILE_COUNT
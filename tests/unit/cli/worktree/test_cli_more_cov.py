@@ -28,7 +28,7 @@ from moai_adk.cli.worktree.exceptions import (
     GitOperationError,
     MergeConflictError,
 )
-from moai_adk.cli.worktree.models import WorktreeInfo
+from moai_adk.cli.worktree.models import SyncResult, WorktreeInfo
 
 
 class TestNewWorktreeCommand:
@@ -474,6 +474,41 @@ class TestSyncWorktreeCommand:
         assert result.exit_code == 0
         assert "Syncing" in result.output
 
+    @patch("moai_adk.cli.worktree.cli.get_manager")
+    def test_sync_all_streams_batched_results(self, mock_get_manager):
+        """Test that --all prints each batched sync result and a summary."""
+        # Arrange
+        runner = CliRunner()
+        mock_manager = MagicMock()
+        mock_get_manager.return_value = mock_manager
+
+        now = "2025-01-01T12:00:00Z"
+        mock_manager.list.return_value = [
+            WorktreeInfo(f"SPEC-00{index}", Path(f"/tmp/SPEC-00{index}"), f"feature/SPEC-00{index}", now, now, "active")
+            for index in range(1, 4)
+        ]
+        mock_manager.sync_all.return_value = iter(
+            [
+                SyncResult(spec_id="SPEC-002", status="synced"),
+                SyncResult(spec_id="SPEC-001", status="skipped", conflicts=["a.py", "b.py"]),
+                SyncResult(spec_id="SPEC-003", status="failed", error="boom"),
+            ]
+        )
+
+        # Act
+        result = runner.invoke(worktree, ["sync", "--all", "--skip-conflicts", "-j", "4"])
+
+        # Assert
+        assert result.exit_code == 0
+        call_kwargs = mock_manager.sync_all.call_args[1]
+        assert call_kwargs["skip_conflicts"] is True
+        assert call_kwargs["max_workers"] == 4
+        mock_manager.sync.assert_not_called()
+        assert "SPEC-002 (merge)" in result.output
+        assert "SPEC-001 (skipped: 2 predicted conflict(s))" in result.output
+        assert "SPEC-003 (failed: boom)" in result.output
+        assert "1 synced, 1 failed, 1 skipped" in result.output
+
     @patch("moai_adk.cli.worktree.cli.get_manager")
     def test_sync_all_no_worktrees(self, mock_get_manager):
         """Test syncing all when no worktrees exist."""
@@ -793,3 +793,174 @@ class TestWorktreeManagerIntegration:
             # Assert
             assert len(worktrees) == 3
             assert all(w.spec_id in specs for w in worktrees)
+
+
+class TestWorktreeManagerPredictConflicts:
+    """Test WorktreeManager.predict_conflicts method."""
+
+    @patch("moai_adk.cli.worktree.manager.predict_merges")
+    @patch("moai_adk.cli.worktree.manager.Repo")
+    def test_predict_conflicts_for_all_worktrees(self, mock_repo_class, mock_predict):
+        """Test that every worktree branch is checked against the base branch in one batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_path = Path(tmpdir)
+            worktree_root = Path(tmpdir) / "worktrees"
+
+            mock_repo = MagicMock()
+            mock_repo.working_dir = str(repo_path)
+            mock_repo.git.rev_parse.side_effect = Exception("no remote")
+            mock_repo_class.return_value = mock_repo
+
+            manager = WorktreeManager(repo_path, worktree_root)
+            for spec_id in ("SPEC-A-001", "SPEC-B-001"):
+                manager.registry.register(
+                    WorktreeInfo(
+                        spec_id=spec_id,
+                        path=worktree_root / spec_id,
+                        branch=f"feature/{spec_id}",
+                        created_at=datetime.now().isoformat() + "Z",
+                        last_accessed=datetime.now().isoformat() + "Z",
+                        status="active",
+                    ),
+                    project_name=manager.project_name,
+                )
+            mock_predict.return_value = ["prediction-a", "prediction-b"]
+
+            result = manager.predict_conflicts("main")
+
+            assert result == {"SPEC-A-001": "prediction-a", "SPEC-B-001": "prediction-b"}
+            mock_predict.assert_called_once_with(
+                str(repo_path),
+                [("feature/SPEC-A-001", "main"), ("feature/SPEC-B-001", "main")],
+                max_workers=None,
+            )
+            # Nothing is checked out or merged
+            mock_repo.git.merge.assert_not_called()
+            mock_repo.git.checkout.assert_not_called()
+
+
+class TestWorktreeManagerSyncAll:
+    """Test WorktreeManager.sync_all method."""
+
+    @staticmethod
+    def _register(manager, worktree_root, spec_ids):
+        for spec_id in spec_ids:
+            manager.registry.register(
+                WorktreeInfo(
+                    spec_id=spec_id,
+                    path=worktree_root / spec_id,
+                    branch=f"feature/{spec_id}",
+                    created_at="2025-01-01T00:00:00Z",
+                    last_accessed="2025-01-01T00:00:00Z",
+                    status="active",
+                ),
+                project_name=manager.project_name,
+            )
+
+    @patch("moai_adk.cli.worktree.manager.Repo")
+    def test_sync_all_fetches_once_and_merges_each_worktree(self, mock_repo_class):
+        """Test that origin is fetched once in the main repo and every checkout is merged."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_path = Path(tmpdir)
+            worktree_root = Path(tmpdir) / "worktrees"
+
+            main_repo = MagicMock()
+            worktree_repos = {}
+
+            def open_repo(path):
+                if Path(path) == repo_path:
+                    return main_repo
+                return worktree_repos.setdefault(Path(path).name, MagicMock())
+
+            mock_repo_class.side_effect = open_repo
+            manager = WorktreeManager(repo_path, worktree_root)
+            self._register(manager, worktree_root, ["SPEC-A-001", "SPEC-B-001", "SPEC-C-001"])
+
+            results = list(manager.sync_all("main", max_workers=3))
+
+            assert sorted(result.spec_id for result in results) == ["SPEC-A-001", "SPEC-B-001", "SPEC-C-001"]
+            assert all(result.status == "synced" for result in results)
+            main_repo.remotes.origin.fetch.assert_called_once()
+            main_repo.git.rev_parse.assert_called_once_with("origin/main")
+            for worktree_repo in worktree_repos.values():
+                worktree_repo.remotes.origin.fetch.assert_not_called()
+                worktree_repo.git.rev_parse.assert_not_called()
+                worktree_repo.git.merge.assert_called_once_with("origin/main")
+            assert manager.registry.get("SPEC-A-001", manager.project_name).last_accessed != "2025-01-01T00:00:00Z"
+
+    @patch("moai_adk.cli.worktree.manager.predict_merges")
+    @patch("moai_adk.cli.worktree.manager.Repo")
+    def test_sync_all_skips_predicted_conflicts(self, mock_repo_class, mock_predict):
+        """Test that worktrees predicted to conflict are reported and left untouched."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_path = Path(tmpdir)
+            worktree_root = Path(tmpdir) / "worktrees"
+
+            main_repo = MagicMock()
+            main_repo.working_dir = str(repo_path)
+            main_repo.git.rev_parse.side_effect = [Exception("no remote"), "sha"]
+            worktree_repo = MagicMock()
+            mock_repo_class.side_effect = lambda path: main_repo if Path(path) == repo_path else worktree_repo
+
+            manager = WorktreeManager(repo_path, worktree_root)
+            self._register(manager, worktree_root, ["SPEC-A-001", "SPEC-B-001"])
+            conflict = MagicMock(path="src/app.py")
+            mock_predict.return_value = [MagicMock(conflicts=[conflict]), MagicMock(conflicts=[])]
+
+            results = {result.spec_id: result for result in manager.sync_all("main", skip_conflicts=True)}
+
+            mock_predict.assert_called_once_with(
+                str(repo_path),
+                [("feature/SPEC-A-001", "main"), ("feature/SPEC-B-001", "main")],
+                max_workers=None,
+            )
+            assert results["SPEC-A-001"].status == "skipped"
+            assert results["SPEC-A-001"].conflicts == ["src/app.py"]
+            assert results["SPEC-B-001"].status == "synced"
+            worktree_repo.git.merge.assert_called_once_with("main")
+
+    @patch("moai_adk.cli.worktree.manager.Repo")
+    def test_sync_all_reports_conflicts_and_failures(self, mock_repo_class):
+        """Test that per-worktree errors become results instead of stopping the batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_path = Path(tmpdir)
+            worktree_root = Path(tmpdir) / "worktrees"
+
+            main_repo = MagicMock()
+            conflicted_repo = MagicMock()
+            conflicted_repo.git.merge.side_effect = [Exception("CONFLICT"), None]
+            conflicted_repo.git.status.return_value = "UU README.md"
+            broken_repo = MagicMock()
+            broken_repo.git.merge.side_effect = Exception("fatal: not something we can merge")
+            broken_repo.git.status.return_value = ""
+            repos = {"SPEC-A-001": conflicted_repo, "SPEC-B-001": broken_repo}
+            mock_repo_class.side_effect = lambda path: main_repo if Path(path) == repo_path else repos[Path(path).name]
+
+            manager = WorktreeManager(repo_path, worktree_root)
+            self._register(manager, worktree_root, ["SPEC-A-001", "SPEC-B-001"])
+
+            results = {result.spec_id: result for result in manager.sync_all("main")}
+
+            assert results["SPEC-A-001"].status == "conflict"
+            assert results["SPEC-A-001"].conflicts == ["README.md"]
+            assert results["SPEC-B-001"].status == "failed"
+            assert "not something we can merge" in results["SPEC-B-001"].error
+            assert manager.registry.get("SPEC-A-001", manager.project_name).last_accessed == "2025-01-01T00:00:00Z"
+
+    @patch("moai_adk.cli.worktree.manager.Repo")
+    def test_sync_all_missing_base_branch(self, mock_repo_class):
+        """Test that a missing base branch fails the whole batch before any merge."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_path = Path(tmpdir)
+            worktree_root = Path(tmpdir) / "worktrees"
+
+            main_repo = MagicMock()
+            main_repo.git.rev_parse.side_effect = Exception("unknown revision")
+            mock_repo_class.return_value = main_repo
+
+            manager = WorktreeManager(repo_path, worktree_root)
+            self._register(manager, worktree_root, ["SPEC-A-001"])
+
+            with pytest.raises(GitOperationError, match="Base branch 'develop' not found"):
+                list(manager.sync_all("develop"))
+            main_repo.git.merge.assert_not_called()
@@ -6,6 +6,8 @@ file I/O operations, and data validation scenarios.
 """
 
 import json
+import multiprocessing
+import sys
 import pytest
 import tempfile
 from datetime import datetime
@@ -1289,3 +1291,118 @@ class TestEdgeCases:
         finally:
             # Restore permissions for cleanup
             git_file.chmod(0o644)
+
+
+def _info(worktree_root, project, spec_id, branch=None):
+    now = "2025-01-01T00:00:00Z"
+    return WorktreeInfo(
+        spec_id=spec_id,
+        path=worktree_root / project / spec_id,
+        branch=branch or f"feature/{spec_id}",
+        created_at=now,
+        last_accessed=now,
+        status="active",
+    )
+
+
+def _register_many(worktree_root, project, count):
+    registry = WorktreeRegistry(worktree_root)
+    for index in range(count):
+        registry.register(_info(worktree_root, project, f"SPEC-{index:03d}"), project_name=project)
+
+
+class TestConcurrentAccess:
+    """Test locked read-modify-write across registry instances and processes."""
+
+    def test_stale_instance_does_not_lose_updates(self, tmp_path):
+        """Test that a registry loaded before another writer sees and keeps its change."""
+        first = WorktreeRegistry(tmp_path)
+        second = WorktreeRegistry(tmp_path)
+
+        first.register(_info(tmp_path, "app", "SPEC-001"), project_name="app")
+        second.register(_info(tmp_path, "app", "SPEC-002"), project_name="app")
+
+        saved = json.loads(first.registry_path.read_text())
+        assert set(saved) == {"SPEC-001", "SPEC-002"}
+        assert [info.spec_id for info in first.list_all("app")] == ["SPEC-001", "SPEC-002"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fork start method")
+    def test_parallel_processes_keep_every_entry(self, tmp_path):
+        """Test that writers in several processes never overwrite each other."""
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=_register_many, args=(tmp_path, f"project-{index}", 15)) for index in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        registry = WorktreeRegistry(tmp_path)
+        for index in range(4):
+            assert len(registry.list_all(f"project-{index}")) == 15
+
+    def test_save_replaces_atomically(self, tmp_path):
+        """Test that saving leaves no temporary files behind and swaps the file in one step."""
+        registry = WorktreeRegistry(tmp_path)
+        inode = registry.registry_path.stat().st_ino
+
+        registry.register(_info(tmp_path, "app", "SPEC-001"), project_name="app")
+
+        assert registry.registry_path.stat().st_ino != inode
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_sync_with_git_only_writes_changes(self, tmp_path):
+        """Test that sync_with_git skips the write when nothing changed and keeps concurrent additions."""
+        registry = WorktreeRegistry(tmp_path)
+        kept = _info(tmp_path, "app", "SPEC-001")
+        gone = _info(tmp_path, "app", "SPEC-002")
+        registry.register(kept, project_name="app")
+        registry.register(gone, project_name="app")
+        mock_repo = MagicMock()
+        mock_repo.git.worktree.return_value = f"worktree {kept.path}\nworktree {gone.path}"
+
+        signature = registry._disk_signature()
+        registry.sync_with_git(mock_repo)
+        assert registry._disk_signature() == signature
+
+        # Another terminal registers a worktree after this registry was loaded
+        WorktreeRegistry(tmp_path).register(_info(tmp_path, "app", "SPEC-003"), project_name="app")
+        mock_repo.git.worktree.return_value = f"worktree {kept.path}\nworktree {tmp_path / 'app' / 'SPEC-003'}"
+        registry.sync_with_git(mock_repo)
+
+        assert sorted(json.loads(registry.registry_path.read_text())) == ["SPEC-001", "SPEC-003"]
+
+
+class TestIndexedLookups:
+    """Test project and path indexes."""
+
+    def test_lookups_by_project_and_path(self, tmp_path):
+        """Test that get, list_all and find_by_path use the indexes and follow updates."""
+        registry = WorktreeRegistry(tmp_path)
+        registry.register(_info(tmp_path, "api", "SPEC-001"), project_name="api")
+        registry.register(_info(tmp_path, "web", "SPEC-001"), project_name="web")
+        registry.register(_info(tmp_path, "web", "SPEC-002"), project_name="web")
+
+        assert registry.get("SPEC-001", project_name="web").path == tmp_path / "web" / "SPEC-001"
+        assert [info.spec_id for info in registry.list_all("web")] == ["SPEC-001", "SPEC-002"]
+        assert registry.find_by_path(tmp_path / "api" / "SPEC-001").spec_id == "SPEC-001"
+
+        registry.register(_info(tmp_path, "web", "SPEC-001", branch="feature/renamed"), project_name="web")
+        registry.unregister("SPEC-002", project_name="web")
+
+        assert [info.branch for info in registry.list_all("web")] == ["feature/renamed"]
+        assert registry.get("SPEC-002", project_name="web") is None
+        assert registry.find_by_path(tmp_path / "web" / "SPEC-002") is None
+        assert registry.get("SPEC-001", project_name="api").branch == "feature/SPEC-001"
+
+    def test_direct_data_assignment_rebuilds_index(self, tmp_path):
+        """Test that replacing _data wholesale invalidates the indexes."""
+        registry = WorktreeRegistry(tmp_path)
+        registry.register(_info(tmp_path, "app", "SPEC-001"), project_name="app")
+        assert len(registry.list_all("app")) == 1
+
+        registry._data = {}
+
+        assert registry.list_all("app") == []
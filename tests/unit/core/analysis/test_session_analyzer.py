@@ -19,7 +19,7 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
-from moai_adk.core.analysis.session_analyzer import SessionAnalyzer
+from moai_adk.core.analysis.session_analyzer import SessionAnalyzer, _analyze_file
 
 
 class TestSessionAnalyzerInitialization:
@@ -519,3 +519,104 @@ class TestSessionAnalyzerIntegration:
             with patch.object(analyzer, "claude_projects", claude_projects):
                 analyzer.parse_sessions()
                 assert analyzer.patterns["total_sessions"] >= 1
+
+
+class TestSessionAnalyzerIncremental:
+    """Tests for checkpointed and parallel session analysis."""
+
+    def _write_jsonl(self, path, summaries):
+        with open(path, "a", encoding="utf-8") as f:
+            for summary in summaries:
+                f.write(json.dumps({"type": "summary", "summary": summary}) + "\n")
+
+    def test_checkpoint_reads_only_appended_bytes(self):
+        """Test that a second run only analyzes lines appended since the first."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            claude_projects = Path(tmpdir) / "projects"
+            project_dir = claude_projects / "test-project"
+            project_dir.mkdir(parents=True)
+            checkpoint = Path(tmpdir) / "checkpoint.json"
+            session_file = project_dir / "session.jsonl"
+            self._write_jsonl(session_file, ["Run tests", "Fix build error"])
+
+            first = SessionAnalyzer()
+            with patch.object(first, "claude_projects", claude_projects):
+                first.parse_sessions(checkpoint_path=checkpoint, max_workers=1)
+            assert first.patterns["total_sessions"] == 2
+
+            saved = json.loads(checkpoint.read_text())
+            offset = saved["files"][str(session_file)]["offset"]
+            assert offset == session_file.stat().st_size
+
+            self._write_jsonl(session_file, ["Deploy release"])
+
+            second = SessionAnalyzer()
+            with patch.object(second, "claude_projects", claude_projects):
+                with patch("moai_adk.core.analysis.session_analyzer._analyze_file", wraps=_analyze_file) as spy:
+                    second.parse_sessions(checkpoint_path=checkpoint, max_workers=1)
+
+            spy.assert_called_once_with((str(session_file), offset))
+            assert second.patterns["total_sessions"] == 3
+            assert second.patterns["failed_sessions"] == 1
+            assert second.patterns["tool_usage"]["summary_deploy"] == 1
+            assert second.patterns["tool_usage"]["summary_test"] == 1
+
+    def test_unchanged_files_are_not_reopened(self):
+        """Test that unchanged files are served from the checkpoint."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            claude_projects = Path(tmpdir) / "projects"
+            project_dir = claude_projects / "test-project"
+            project_dir.mkdir(parents=True)
+            checkpoint = Path(tmpdir) / "checkpoint.json"
+            (project_dir / "session-001.json").write_text(
+                json.dumps({"events": [{"type": "tool_call", "toolName": "Read"}]})
+            )
+
+            first = SessionAnalyzer()
+            with patch.object(first, "claude_projects", claude_projects):
+                first.parse_sessions(checkpoint_path=checkpoint)
+
+            second = SessionAnalyzer()
+            with patch.object(second, "claude_projects", claude_projects):
+                with patch("moai_adk.core.analysis.session_analyzer._analyze_file") as spy:
+                    second.parse_sessions(checkpoint_path=checkpoint)
+
+            spy.assert_not_called()
+            assert second.patterns["tool_usage"]["Read"] == 1
+            assert second.patterns["total_sessions"] == 1
+
+    def test_incomplete_trailing_line_is_deferred(self):
+        """Test that a partially written JSONL line is read on the next run."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_file = Path(tmpdir) / "session.jsonl"
+            self._write_jsonl(session_file, ["Run tests"])
+            complete_size = session_file.stat().st_size
+            with open(session_file, "a", encoding="utf-8") as f:
+                f.write('{"type": "summary", "summ')
+
+            result = _analyze_file((str(session_file), 0))
+
+            assert result["offset"] == complete_size
+            assert result["partial"]["total_sessions"] == 1
+
+    def test_parallel_matches_serial(self):
+        """Test that process-pool analysis produces the same patterns as serial."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            claude_projects = Path(tmpdir)
+            for i in range(12):
+                project_dir = claude_projects / f"project-{i}"
+                project_dir.mkdir()
+                self._write_jsonl(project_dir / "session.jsonl", [f"Test {i}", "Check error"])
+                (project_dir / f"session-{i}.json").write_text(
+                    json.dumps({"events": [{"type": "tool_call", "toolName": f"Tool{i % 3}", "command": "ls -la"}]})
+                )
+
+            serial = SessionAnalyzer()
+            parallel = SessionAnalyzer()
+            with patch.object(serial, "claude_projects", claude_projects):
+                serial.parse_sessions(max_workers=1)
+            with patch.object(parallel, "claude_projects", claude_projects):
+                parallel.parse_sessions(max_workers=3)
+
+            assert parallel.get_metrics() == serial.get_metrics()
+            assert serial.patterns["total_sessions"] == 36
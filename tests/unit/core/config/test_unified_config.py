@@ -0,0 +1,168 @@
+"""Tests for change detection, lookup caching and snapshots in UnifiedConfigManager."""
+
+import os
+import time
+
+import pytest
+import yaml
+
+from moai_adk.core.config import unified
+from moai_adk.core.config.unified import UnifiedConfigManager
+
+CONFIG_YAML = """\
+project:
+  name: Demo
+hooks:
+  timeout_ms: 3000
+  enabled: true
+"""
+
+
+def _manager(config_path, stat_interval=0.0):
+    """Create a manager outside the process-wide singleton."""
+    manager = object.__new__(UnifiedConfigManager)
+    manager.stat_interval = stat_interval
+    manager._initialize(config_path)
+    return manager
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML)
+    return path
+
+
+def _fail_parse(*args, **kwargs):
+    raise AssertionError("config was parsed instead of loaded from the snapshot")
+
+
+class TestLookups:
+    def test_get_uses_memoized_lookups(self, config_path, monkeypatch):
+        manager = _manager(config_path)
+        calls = []
+        original = manager._lookup
+        monkeypatch.setattr(manager, "_lookup", lambda key: calls.append(key) or original(key))
+
+        for _ in range(3):
+            assert manager.get("hooks.timeout_ms") == 3000
+            assert manager.get("hooks.missing", "fallback") == "fallback"
+
+        assert calls == ["hooks.timeout_ms", "hooks.missing"]
+
+    def test_set_and_update_invalidate_lookups(self, config_path):
+        manager = _manager(config_path)
+        assert manager.get("hooks.timeout_ms") == 3000
+
+        manager.set("hooks.timeout_ms", 5000)
+        assert manager.get("hooks.timeout_ms") == 5000
+
+        manager.update({"hooks": {"timeout_ms": 7000}})
+        assert manager.get("hooks.timeout_ms") == 7000
+
+
+class TestChangeDetection:
+    def test_stat_is_throttled(self, config_path):
+        manager = _manager(config_path, stat_interval=3600)
+        assert manager.get("project.name") == "Demo"
+
+        config_path.write_text(CONFIG_YAML.replace("Demo", "Changed-Name"))
+
+        assert manager.get("project.name") == "Demo"
+        manager._last_checked = 0.0
+        assert manager.get("project.name") == "Changed-Name"
+
+    def test_interval_from_environment(self, config_path, monkeypatch):
+        monkeypatch.setenv(unified.CONFIG_STAT_INTERVAL_ENV, "0.25")
+
+        assert _manager(config_path, stat_interval=5).stat_interval == 0.25
+
+    def test_save_does_not_trigger_reload(self, config_path, monkeypatch):
+        manager = _manager(config_path)
+        manager.set("project.name", "Saved")
+        assert manager.save(backup=False)
+
+        monkeypatch.setattr(unified.yaml, "safe_load", _fail_parse)
+        assert manager.get("project.name") == "Saved"
+
+
+class TestSnapshot:
+    def test_second_process_loads_snapshot(self, config_path, monkeypatch):
+        _manager(config_path)
+        assert (config_path.parent / ".config.yaml.snapshot").exists()
+
+        monkeypatch.setattr(unified.yaml, "safe_load", _fail_parse)
+        assert _manager(config_path).get("hooks.timeout_ms") == 3000
+
+    def test_project_snapshot_is_kept_in_cache_directory(self, tmp_path):
+        config_dir = tmp_path / ".moai" / "config"
+        config_dir.mkdir(parents=True)
+        config_path = config_dir / "config.yaml"
+        config_path.write_text(CONFIG_YAML)
+
+        manager = _manager(config_path)
+
+        assert manager.snapshot_path == tmp_path / ".moai" / "cache" / "config" / "config.yaml.snapshot"
+        assert manager.snapshot_path.exists()
+        assert [path.name for path in config_dir.iterdir()] == ["config.yaml"]
+
+    def test_touched_file_reuses_snapshot_by_hash(self, config_path, monkeypatch):
+        _manager(config_path)
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+        monkeypatch.setattr(unified.yaml, "safe_load", _fail_parse)
+        assert _manager(config_path).get("project.name") == "Demo"
+
+    def test_changed_content_is_parsed(self, config_path):
+        _manager(config_path)
+        config_path.write_text(CONFIG_YAML.replace("3000", "4000"))
+
+        assert _manager(config_path).get("hooks.timeout_ms") == 4000
+
+    def test_corrupt_snapshot_falls_back_to_parse(self, config_path):
+        manager = _manager(config_path)
+        manager.snapshot_path.write_bytes(b"not a snapshot")
+
+        assert _manager(config_path).get("project.name") == "Demo"
+
+    def test_unmarshalable_values_skip_snapshot(self, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("project:\n  created: 2024-01-01\n")
+
+        manager = _manager(config_path)
+
+        assert str(manager.get("project.created")) == "2024-01-01"
+        assert not manager.snapshot_path.exists()
+
+
+def test_snapshot_and_lookup_benchmark(tmp_path):
+    config = {f"section{i}": {f"key{j}": {"value": j, "items": list(range(5))} for j in range(40)} for i in range(40)}
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(config))
+    _manager(config_path)
+    snapshot = _manager(config_path).snapshot_path.read_bytes()
+
+    start = time.perf_counter()
+    manager = object.__new__(UnifiedConfigManager)
+    manager._config_path = config_path
+    manager._parse(config_path.read_text())
+    parse_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    manager = _manager(config_path)
+    snapshot_ms = (time.perf_counter() - start) * 1000
+
+    manager.stat_interval = unified.CONFIG_STAT_INTERVAL
+    start = time.perf_counter()
+    for _ in range(10000):
+        manager.get("section20.key20.value")
+    lookup_us = (time.perf_counter() - start) * 1e6 / 10000
+
+    print(
+        f"\n⚡ Config cold start: snapshot {snapshot_ms:.2f}ms vs YAML parse {parse_ms:.2f}ms "
+        f"({len(snapshot)} bytes); get() {lookup_us:.2f}µs"
+    )
+
+    assert manager.get("section20.key20.value") == 20
+    assert snapshot_ms < parse_ms
@@ -0,0 +1,206 @@
+"""Tests for ref-based checkpoints under refs/moai/checkpoints."""
+
+import os
+import time
+
+import git
+import pytest
+
+from moai_adk.core.git import checkpoint_store
+from moai_adk.core.git.checkpoint_store import CHECKPOINT_REF_PREFIX, RefCheckpointStore
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+    (tmp_path / "tracked.txt").write_text("v1")
+    (tmp_path / "stable.txt").write_text("unchanged")
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    repo.index.add(["tracked.txt", "stable.txt", ".gitignore"])
+    repo.index.commit("Initial commit")
+    return repo
+
+
+def _path(repo, name):
+    return os.path.join(repo.working_tree_dir, name)
+
+
+def _read(repo, name):
+    with open(_path(repo, name)) as f:
+        return f.read()
+
+
+def _write(repo, name, content):
+    with open(_path(repo, name), "w") as f:
+        f.write(content)
+
+
+class TestCreate:
+    def test_captures_worktree_index_and_untracked_files(self, repo):
+        _write(repo, "tracked.txt", "staged")
+        repo.index.add(["tracked.txt"])
+        _write(repo, "tracked.txt", "unstaged")
+        _write(repo, "new.txt", "untracked")
+        _write(repo, "ignored.log", "ignored")
+        store = RefCheckpointStore(repo)
+
+        checkpoint_id = store.create("delete")
+
+        ref = f"{CHECKPOINT_REF_PREFIX}{checkpoint_id}"
+        assert checkpoint_id.startswith("before-delete-")
+        assert repo.git.show(f"{ref}:tracked.txt") == "unstaged"
+        assert repo.git.show(f"{ref}:new.txt") == "untracked"
+        assert repo.git.show(f"{ref}^2:tracked.txt") == "staged"
+        assert "ignored.log" not in repo.git.ls_tree("-r", "--name-only", ref).split()
+        assert repo.git.rev_parse(f"{ref}^1") == repo.head.commit.hexsha
+
+    def test_leaves_branches_index_and_worktree_alone(self, repo):
+        _write(repo, "new.txt", "untracked")
+        store = RefCheckpointStore(repo)
+
+        store.create("refactor")
+
+        assert [head.name for head in repo.heads] == [repo.active_branch.name]
+        assert repo.git.status("--porcelain") == "?? new.txt"
+
+    def test_same_second_checkpoints_get_distinct_ids(self, repo):
+        store = RefCheckpointStore(repo)
+
+        first = store.create("merge")
+        second = store.create("merge")
+
+        assert first != second
+        assert store.exists(first) and store.exists(second)
+
+
+class TestRestore:
+    def test_rewrites_only_changed_paths(self, repo):
+        store = RefCheckpointStore(repo)
+        checkpoint_id = store.create("delete")
+        _write(repo, "tracked.txt", "v2")
+        repo.index.add(["tracked.txt"])
+        repo.index.commit("Update")
+        _write(repo, "added-later.txt", "new")
+        stable_mtime = os.stat(_path(repo, "stable.txt")).st_mtime_ns
+        head = repo.head.commit.hexsha
+
+        restored = store.restore(checkpoint_id)
+
+        assert restored == ["added-later.txt", "tracked.txt"]
+        assert _read(repo, "tracked.txt") == "v1"
+        assert not os.path.exists(_path(repo, "added-later.txt"))
+        assert os.stat(_path(repo, "stable.txt")).st_mtime_ns == stable_mtime
+        assert repo.head.commit.hexsha == head
+        assert repo.git.show(":tracked.txt") == "v1"
+
+    def test_restores_staged_state(self, repo):
+        _write(repo, "tracked.txt", "staged")
+        repo.index.add(["tracked.txt"])
+        store = RefCheckpointStore(repo)
+        checkpoint_id = store.create("delete")
+        repo.git.reset("--hard")
+
+        store.restore(checkpoint_id)
+
+        assert _read(repo, "tracked.txt") == "staged"
+        assert repo.git.show(":tracked.txt") == "staged"
+
+    def test_legacy_branch_checkpoint(self, repo):
+        repo.create_head("before-delete-20240101-000000")
+        _write(repo, "tracked.txt", "v2")
+
+        RefCheckpointStore(repo).restore("before-delete-20240101-000000")
+
+        assert _read(repo, "tracked.txt") == "v1"
+
+    def test_legacy_branch_on_merge_commit_leaves_index_alone(self, repo):
+        main_branch = repo.active_branch
+        side = repo.create_head("side")
+        side.checkout()
+        _write(repo, "side.txt", "side")
+        repo.index.add(["side.txt"])
+        repo.index.commit("Side change")
+        main_branch.checkout()
+        _write(repo, "main.txt", "main")
+        repo.index.add(["main.txt"])
+        repo.index.commit("Main change")
+        repo.git.merge("--no-ff", "-m", "Merge side", "side")
+        repo.create_head("before-merge-20240101-000000")
+        _write(repo, "tracked.txt", "v2")
+
+        RefCheckpointStore(repo).restore("before-merge-20240101-000000")
+
+        assert _read(repo, "tracked.txt") == "v1"
+        assert repo.git.diff("--cached", "--name-only") == ""
+
+    def test_without_pathspec_file_support(self, repo, monkeypatch):
+        monkeypatch.setattr(checkpoint_store, "PATHSPEC_FROM_FILE_GIT_VERSION", (99, 0))
+        monkeypatch.setattr(checkpoint_store, "PATHS_PER_COMMAND", 1)
+        _write(repo, "tracked.txt", "staged")
+        _write(repo, "stable.txt", "changed")
+        repo.index.add(["tracked.txt", "stable.txt"])
+        store = RefCheckpointStore(repo)
+        checkpoint_id = store.create("delete")
+        repo.git.reset("--hard")
+        _write(repo, "added-later.txt", "new")
+
+        restored = store.restore(checkpoint_id)
+
+        assert restored == ["added-later.txt", "stable.txt", "tracked.txt"]
+        assert _read(repo, "tracked.txt") == "staged"
+        assert _read(repo, "stable.txt") == "changed"
+        assert repo.git.show(":tracked.txt") == "staged"
+        assert not os.path.exists(_path(repo, "added-later.txt"))
+        assert not any(name.endswith(".index") for name in os.listdir(repo.git_dir))
+
+    def test_legacy_branch_reports_deleted_untracked_files(self, repo, caplog):
+        repo.create_head("before-delete-20240101-000000")
+        _write(repo, "notes.txt", "untracked")
+
+        with caplog.at_level("WARNING", logger=checkpoint_store.__name__):
+            restored = RefCheckpointStore(repo).restore("before-delete-20240101-000000")
+
+        assert restored == ["notes.txt"]
+        assert not os.path.exists(_path(repo, "notes.txt"))
+        assert "deletes 1 untracked file(s) it does not contain: notes.txt" in caplog.text
+
+    def test_unknown_checkpoint_raises(self, repo):
+        with pytest.raises(ValueError, match="Checkpoint not found"):
+            RefCheckpointStore(repo).restore("before-missing")
+
+
+class TestPrune:
+    def test_keeps_most_recent_checkpoints(self, repo):
+        store = RefCheckpointStore(repo, max_checkpoints=3)
+
+        created = [store.create(f"op{index}") for index in range(5)]
+
+        assert store.list_checkpoints() == created[2:]
+
+    def test_expires_old_checkpoints(self, repo, monkeypatch):
+        store = RefCheckpointStore(repo, expire_seconds=60)
+        store.create("delete")
+        monkeypatch.setattr(checkpoint_store.time, "time", lambda: time.time_ns() / 1e9 + 120)
+
+        assert len(store.prune()) == 1
+        assert store.list_checkpoints() == []
+
+
+def test_checkpoint_cost_with_many_branches(repo):
+    for index in range(300):
+        repo.create_head(f"feature/{index}")
+    store = RefCheckpointStore(repo)
+
+    start = time.perf_counter()
+    for index in range(5):
+        store.create(f"op{index}")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\n⚡ 5 checkpoints next to 300 branches: {elapsed_ms:.2f}ms")
+
+    assert len(repo.heads) == 301
+    assert len(store.list_checkpoints()) == 5
+    assert elapsed_ms < 10000, f"Checkpoint creation too slow: {elapsed_ms:.2f}ms"
@@ -20,6 +20,7 @@ from moai_adk.core.git.conflict_detector import (
     ConflictSeverity,
     ConflictFile,
 )
+from moai_adk.core.git.merge_prediction import MergePrediction, PredictedConflict
 
 
 class TestGitConflictDetectorInitialization:
@@ -73,53 +74,71 @@ class TestConflictDetection:
 
     def test_can_merge_success_no_conflicts(self, detector):
         """Test can_merge when merge succeeds without conflicts."""
-        detector.repo = MagicMock()
-        detector.repo.active_branch.name = "main"
-        detector.git = MagicMock()
+        with patch("moai_adk.core.git.conflict_detector.predict_merge") as mock_predict:
+            mock_predict.return_value = MergePrediction(base="main", branch="feature", tree="a" * 40)
 
-        result = detector.can_merge("feature", "main")
+            result = detector.can_merge("feature", "main")
 
-        assert result["can_merge"] is True
-        assert result["conflicts"] == []
+            assert result["can_merge"] is True
+            assert result["conflicts"] == []
+            mock_predict.assert_called_once_with(Path("/test/repo"), "main", "feature")
 
     def test_can_merge_with_conflicts(self, detector):
         """Test can_merge when merge has conflicts."""
-        detector.repo = MagicMock()
-        detector.repo.active_branch.name = "main"
-        detector.git = MagicMock()
-        detector.git.merge.side_effect = Exception("CONFLICT")
-
-        with patch.object(detector, "_detect_conflicted_files") as mock_detect:
-            mock_detect.return_value = [
-                ConflictFile("file.py", ConflictSeverity.HIGH, "code", 1, "Conflict in file.py")
-            ]
+        with patch("moai_adk.core.git.conflict_detector.predict_merge") as mock_predict:
+            mock_predict.return_value = MergePrediction(
+                base="main",
+                branch="feature",
+                conflicts=[
+                    PredictedConflict("README.md", "contents", 1),
+                    PredictedConflict("src/file.py", "modify/delete", 0),
+                ],
+            )
 
             result = detector.can_merge("feature", "main")
 
             assert result["can_merge"] is False
-            assert len(result["conflicts"]) == 1
+            assert [c.path for c in result["conflicts"]] == ["src/file.py", "README.md"]
+            assert result["conflicts"][0].severity == ConflictSeverity.HIGH
+            assert "modify/delete" in result["conflicts"][0].description
 
-    def test_can_merge_branch_checkout(self, detector):
-        """Test that can_merge checks out correct branch."""
+    def test_can_merge_does_not_touch_checkout(self, detector):
+        """Test that can_merge neither checks out nor merges in the working tree."""
         detector.repo = MagicMock()
         detector.repo.active_branch.name = "develop"
         detector.git = MagicMock()
 
-        detector.can_merge("feature", "main")
+        with patch("moai_adk.core.git.conflict_detector.predict_merge") as mock_predict:
+            mock_predict.return_value = MergePrediction(base="main", branch="feature")
+            detector.can_merge("feature", "main")
 
-        detector.git.checkout.assert_called()
+        detector.git.checkout.assert_not_called()
+        detector.git.merge.assert_not_called()
 
     def test_can_merge_error_handling(self, detector):
         """Test error handling in can_merge."""
-        detector.repo = MagicMock()
-        # Make active_branch raise exception
-        type(detector.repo).active_branch = PropertyMock(side_effect=Exception("Git error"))
-        detector.git = MagicMock()
+        with patch("moai_adk.core.git.conflict_detector.predict_merge") as mock_predict:
+            mock_predict.return_value = MergePrediction(base="main", branch="feature", error="bad revision")
+
+            result = detector.can_merge("feature", "main")
+
+            assert result["can_merge"] is False
+            assert "bad revision" in result["error"]
+
+    def test_can_merge_many(self, detector):
+        """Test batch merge checks keep input order."""
+        with patch("moai_adk.core.git.conflict_detector.predict_merges") as mock_predict:
+            mock_predict.return_value = [
+                MergePrediction(base="main", branch="b"),
+                MergePrediction(base="main", branch="a", conflicts=[PredictedConflict("x.py", "contents", 2)]),
+            ]
 
-        result = detector.can_merge("feature", "main")
+            results = detector.can_merge_many(["b", "a"], "main")
 
-        assert result["can_merge"] is False
-        assert "error" in result
+            assert list(results) == ["b", "a"]
+            assert results["b"]["can_merge"] is True
+            assert results["a"]["conflicts"][0].lines_conflicting == 2
+            mock_predict.assert_called_once_with(Path("/test/repo"), [("main", "b"), ("main", "a")], max_workers=None)
 
     def test_detect_conflicted_files_empty(self, detector):
         """Test detecting conflicted files when none exist."""
@@ -0,0 +1,133 @@
+"""Tests for side-effect-free merge prediction against real git repositories."""
+
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from moai_adk.core.git import merge_prediction
+from moai_adk.core.git.merge_prediction import predict_merge, predict_merges
+
+requires_write_tree = pytest.mark.skipif(
+    not merge_prediction.git_supports_write_tree(), reason="git merge-tree --write-tree requires git >= 2.38"
+)
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+def _commit(cwd: Path, message: str) -> None:
+    _git(cwd, "add", "-A")
+    _git(cwd, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """main and feature branches with content, add/add and modify/delete conflicts plus a clean merge"""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "shared.txt").write_text("one\ntwo\nthree\nfour\nfive\n")
+    (tmp_path / "both.txt").write_text("a\nb\nc\n")
+    (tmp_path / "removed.txt").write_text("old\n")
+    _commit(tmp_path, "base")
+
+    _git(tmp_path, "checkout", "-q", "-b", "feature")
+    (tmp_path / "shared.txt").write_text("ONE\ntwo\nthree\nfour\nfive\n")
+    (tmp_path / "both.txt").write_text("a\nfeature\nc\n")
+    (tmp_path / "removed.txt").write_text("changed\n")
+    (tmp_path / "added.txt").write_text("feature\n")
+    _commit(tmp_path, "feature")
+
+    _git(tmp_path, "checkout", "-q", "-b", "clean", "main")
+    (tmp_path / "other.txt").write_text("clean\n")
+    _commit(tmp_path, "clean")
+
+    _git(tmp_path, "checkout", "-q", "main")
+    (tmp_path / "shared.txt").write_text("one\ntwo\nthree\nfour\nFIVE\n")
+    (tmp_path / "both.txt").write_text("a\nmain\nc\n")
+    (tmp_path / "removed.txt").unlink()
+    (tmp_path / "added.txt").write_text("main\n")
+    _commit(tmp_path, "main")
+    return tmp_path
+
+
+def _summary(prediction):
+    return sorted((conflict.path, conflict.kind, conflict.markers) for conflict in prediction.conflicts)
+
+
+EXPECTED_CONFLICTS = [
+    ("added.txt", "add/add", 1),
+    ("both.txt", "contents", 1),
+    ("removed.txt", "modify/delete", 0),
+]
+
+
+class TestPredictMerge:
+    """Conflict prediction without touching the working tree."""
+
+    @requires_write_tree
+    def test_merge_tree_reports_conflicts(self, repo: Path):
+        head = _git(repo, "rev-parse", "HEAD")
+        status = _git(repo, "status", "--porcelain")
+
+        prediction = predict_merge(repo, "main", "feature")
+
+        assert not prediction.can_merge
+        assert prediction.tree is not None
+        assert _summary(prediction) == EXPECTED_CONFLICTS
+        # Nothing changed in the checkout
+        assert _git(repo, "rev-parse", "HEAD") == head
+        assert _git(repo, "status", "--porcelain") == status
+        assert not (repo / ".git" / "MERGE_HEAD").exists()
+
+    def test_read_tree_fallback_matches(self, repo: Path, monkeypatch):
+        monkeypatch.setattr(merge_prediction, "git_supports_write_tree", lambda: False)
+
+        prediction = predict_merge(repo, "main", "feature")
+
+        assert _summary(prediction) == EXPECTED_CONFLICTS
+        assert _git(repo, "status", "--porcelain") == ""
+
+    @pytest.mark.parametrize("write_tree", [True, False])
+    def test_clean_merge(self, repo: Path, monkeypatch, write_tree):
+        if write_tree and not merge_prediction.git_supports_write_tree():
+            pytest.skip("git merge-tree --write-tree requires git >= 2.38")
+        monkeypatch.setattr(merge_prediction, "git_supports_write_tree", lambda: write_tree)
+
+        prediction = predict_merge(repo, "main", "clean")
+
+        assert prediction.can_merge
+        assert prediction.conflicts == []
+
+    def test_unknown_branch_is_an_error(self, repo: Path):
+        prediction = predict_merge(repo, "main", "does-not-exist")
+
+        assert not prediction.can_merge
+        assert prediction.error
+
+
+class TestPredictMerges:
+    """Batched predictions."""
+
+    def test_results_in_input_order(self, repo: Path):
+        predictions = predict_merges(repo, [("main", "feature"), ("main", "clean"), ("feature", "main")], max_workers=3)
+
+        assert [(p.base, p.branch) for p in predictions] == [("main", "feature"), ("main", "clean"), ("feature", "main")]
+        assert [p.can_merge for p in predictions] == [False, True, False]
+
+    def test_many_branches_in_parallel(self, repo: Path):
+        branches = []
+        for index in range(16):
+            branch = f"spec-{index}"
+            _git(repo, "branch", branch, "feature" if index % 2 else "clean")
+            branches.append(branch)
+
+        start = time.perf_counter()
+        predictions = predict_merges(repo, [("main", branch) for branch in branches])
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n⚡ {len(branches)} merge predictions: {elapsed_ms:.2f}ms")
+
+        assert [p.can_merge for p in predictions] == [index % 2 == 0 for index in range(16)]
+        assert _git(repo, "status", "--porcelain") == ""
@@ -0,0 +1,103 @@
+"""
+MetricsCollector Query Performance Tests
+
+Benchmarks indexed get_metrics queries against a linear scan-filter-sort over
+the same samples, spread across 100 tenants.
+
+The default run uses 100k samples to keep the suite fast; set
+MOAI_BENCH_SAMPLES=1000000 to reproduce the 1M-sample benchmark.
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+from moai_adk.core.realtime_monitoring_dashboard import MetricData, MetricsCollector, MetricType
+
+SAMPLE_COUNT = int(os.environ.get("MOAI_BENCH_SAMPLES", "100000"))
+TENANT_COUNT = 100
+QUERY_ROUNDS = 20
+
+
+def _build_collector():
+    collector = MetricsCollector(buffer_size=SAMPLE_COUNT)
+    samples = []
+    base = datetime.now() - timedelta(hours=2)
+    types = (MetricType.CPU_USAGE, MetricType.RESPONSE_TIME)
+
+    for i in range(SAMPLE_COUNT):
+        metric = MetricData(
+            timestamp=base + timedelta(milliseconds=7 * i),
+            metric_type=types[i % 2],
+            value=float(i % 100),
+            tags={"region": f"r{i % 5}"},
+            component=f"component{i % 10}",
+            tenant_id=f"tenant{i % TENANT_COUNT}",
+        )
+        collector.add_metric(metric)
+        samples.append(metric)
+
+    return collector, samples
+
+
+def _scan(samples, tenant_id, start_time, tags, limit):
+    """Reference implementation: filter every sample, then sort."""
+    metrics = [
+        m
+        for m in samples
+        if m.tenant_id == tenant_id
+        and m.metric_type == MetricType.CPU_USAGE
+        and m.timestamp >= start_time
+        and all(m.tags.get(k) == v for k, v in tags.items())
+    ]
+    metrics.sort(key=lambda m: m.timestamp, reverse=True)
+    return metrics[:limit]
+
+
+class TestMetricsQueryPerformance:
+    """Performance tests for indexed MetricsCollector queries"""
+
+    def test_indexed_tenant_query_matches_scan(self):
+        """Indexed newest-first limit queries should return exactly what a scan returns"""
+        collector, samples = _build_collector()
+        start_time = samples[SAMPLE_COUNT // 2].timestamp
+        tags = {"region": "r3"}
+
+        tenant_ids = [f"tenant{round_index * 5 + 3}" for round_index in range(QUERY_ROUNDS)]
+
+        start = time.perf_counter()
+        indexed = [
+            collector.get_metrics(
+                metric_type=MetricType.CPU_USAGE,
+                tenant_id=tenant_id,
+                start_time=start_time,
+                tags=tags,
+                limit=50,
+            )
+            for tenant_id in tenant_ids
+        ]
+        indexed_ms = (time.perf_counter() - start) * 1000 / QUERY_ROUNDS
+
+        start = time.perf_counter()
+        expected = [_scan(samples, tenant_id, start_time, tags, 50) for tenant_id in tenant_ids]
+        scan_ms = (time.perf_counter() - start) * 1000 / QUERY_ROUNDS
+
+        print(f"\n📊 {SAMPLE_COUNT} samples / {TENANT_COUNT} tenants")
+        print(f"⚡ Indexed query: {indexed_ms:.3f}ms, linear scan: {scan_ms:.2f}ms")
+
+        # Timings are informational only; wall-clock thresholds are too noisy for CI
+        assert indexed == expected
+        assert any(indexed)
+
+    def test_latest_sample_lookup(self):
+        """limit=1 lookups should return the newest stored sample"""
+        collector, samples = _build_collector()
+
+        start = time.perf_counter()
+        for _ in range(QUERY_ROUNDS):
+            latest = collector.get_metrics(metric_type=MetricType.RESPONSE_TIME, limit=1)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / QUERY_ROUNDS
+
+        print(f"\n⚡ Latest sample lookup: {elapsed_ms:.3f}ms")
+
+        assert latest == [samples[-1]]
@@ -0,0 +1,265 @@
+"""
+Metrics Store Tests
+
+Test cases for time-bucketed metric series and DDSketch percentiles.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from moai_adk.core.performance.metrics_store import (
+    DDSketch,
+    SeriesSummary,
+    TimeBucketedSeries,
+    TimeSortedBuffer,
+    merge_newest,
+)
+
+
+class TestDDSketch:
+    """Test suite for the DDSketch quantile sketch."""
+
+    def test_empty_sketch_returns_none(self):
+        """Test that quantiles of an empty sketch are None."""
+        assert DDSketch().quantile(0.5) is None
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test that quantiles stay within the configured relative error."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(3, 1) for _ in range(20000)]
+        sketch = DDSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.9, 0.95, 0.99):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            estimate = sketch.quantile(q)
+            assert abs(estimate - exact) / exact <= 0.021
+
+    def test_quantiles_never_under_estimate(self):
+        """Test that quantiles report bucket upper bounds."""
+        sketch = DDSketch()
+        for value in range(1, 101):
+            sketch.add(float(value))
+
+        assert sketch.quantile(0.95) >= 95.0
+        assert sketch.quantile(0.99) >= 99.0
+        assert sketch.quantile(1.0) == 100.0
+
+    def test_merge_equals_single_sketch(self):
+        """Test that merged sketches match a sketch fed all values."""
+        left, right, combined = DDSketch(), DDSketch(), DDSketch()
+        for value in range(-50, 200):
+            (left if value % 2 else right).add(float(value))
+            combined.add(float(value))
+
+        left.merge(right)
+
+        assert left.count == combined.count
+        for q in (0.1, 0.5, 0.9):
+            assert left.quantile(q) == combined.quantile(q)
+
+    def test_merge_rejects_different_accuracy(self):
+        """Test that sketches with different accuracy cannot be merged."""
+        other = DDSketch(relative_accuracy=0.02)
+        other.add(1.0)
+
+        with pytest.raises(ValueError):
+            DDSketch(relative_accuracy=0.01).merge(other)
+
+
+class TestTimeBucketedSeries:
+    """Test suite for sparse time-bucketed series."""
+
+    def test_summarize_range(self):
+        """Test that range summaries only include overlapping buckets."""
+        series = TimeBucketedSeries(bucket_seconds=60, capacity=10)
+        base = 6000.0
+        for minute in range(5):
+            series.add(base + minute * 60, float(minute))
+
+        stats = series.summarize(base + 120, base + 240).to_statistics()
+
+        assert stats["count"] == 3
+        assert stats["min"] == 2.0
+        assert stats["max"] == 4.0
+        assert stats["average"] == 3.0
+
+    def test_expires_old_buckets(self):
+        """Test that buckets beyond capacity are dropped and late samples rejected."""
+        series = TimeBucketedSeries(bucket_seconds=60, capacity=3)
+        for minute in range(6):
+            series.add(minute * 60.0, 1.0)
+
+        assert [p["timestamp"] for p in series.points()] == [180.0, 240.0, 300.0]
+        assert series.add(0.0, 1.0) is False
+
+    def test_only_occupied_buckets_are_allocated(self):
+        """Test that a long retention window does not preallocate buckets."""
+        series = TimeBucketedSeries(bucket_seconds=60, capacity=7 * 24 * 60)
+        for hour in range(3):
+            series.add(hour * 3600.0, 1.0)
+        series.add(600.0, 2.0)
+
+        assert len(series._buckets) == 4
+        assert [p["timestamp"] for p in series.points()] == [0.0, 600.0, 3600.0, 7200.0]
+        assert series.summarize(500.0, 4000.0).count == 2
+
+    def test_points_report_bucket_aggregates(self):
+        """Test per-bucket count, average, min and max."""
+        series = TimeBucketedSeries(bucket_seconds=10, capacity=6)
+        for value in (1.0, 2.0, 6.0):
+            series.add(100.0, value)
+
+        (point,) = series.points()
+
+        assert point == {"timestamp": 100.0, "count": 3.0, "average": 3.0, "min": 1.0, "max": 6.0}
+
+    def test_summary_merge_matches_exact_moments(self):
+        """Test that merged summaries keep exact count, mean and standard deviation."""
+        now = datetime.now().timestamp()
+        first = TimeBucketedSeries()
+        second = TimeBucketedSeries()
+        values = [10.0, 20.0, 30.0, 40.0]
+        for i, value in enumerate(values):
+            (first if i < 2 else second).add(now, value)
+
+        summary = SeriesSummary()
+        summary.merge(first.summarize())
+        summary.merge(second.summarize())
+        stats = summary.to_statistics()
+
+        assert stats["count"] == 4
+        assert stats["average"] == 25.0
+        assert stats["std_dev"] == pytest.approx(12.909944, rel=1e-6)
+
+
+class TestMetricsCollectorSeries:
+    """Test suite for bucketed statistics in the monitoring dashboard collector."""
+
+    def test_statistics_respect_window(self):
+        """Test that get_statistics only covers the requested minutes."""
+        from moai_adk.core.realtime_monitoring_dashboard import MetricData, MetricsCollector, MetricType
+
+        collector = MetricsCollector()
+        now = datetime.now()
+        collector.add_metric(MetricData(now - timedelta(hours=2), MetricType.CPU_USAGE, 90.0, component="system"))
+        collector.add_metric(MetricData(now, MetricType.CPU_USAGE, 10.0, component="system"))
+
+        assert collector.get_statistics(MetricType.CPU_USAGE, component="system", minutes=10)["count"] == 1
+        assert collector.get_statistics(MetricType.CPU_USAGE, component="system", minutes=180)["count"] == 2
+
+    def test_statistics_merge_components_and_tenants(self):
+        """Test that omitted component or tenant filters merge all matching series."""
+        from moai_adk.core.realtime_monitoring_dashboard import MetricData, MetricsCollector, MetricType
+
+        collector = MetricsCollector()
+        now = datetime.now()
+        collector.add_metric(MetricData(now, MetricType.CPU_USAGE, 10.0, component="api", tenant_id="t1"))
+        collector.add_metric(MetricData(now, MetricType.CPU_USAGE, 30.0, component="db", tenant_id="t2"))
+
+        assert collector.get_statistics(MetricType.CPU_USAGE)["average"] == 20.0
+        assert collector.get_statistics(MetricType.CPU_USAGE, tenant_id="t2")["average"] == 30.0
+
+    def test_get_series_returns_bucket_points(self):
+        """Test chart series come from bucket aggregates."""
+        from moai_adk.core.realtime_monitoring_dashboard import MetricData, MetricsCollector, MetricType
+
+        collector = MetricsCollector(bucket_seconds=60)
+        bucket_start = datetime.fromtimestamp((datetime.now().timestamp() // 60) * 60)
+        for value in (1.0, 3.0):
+            collector.add_metric(MetricData(bucket_start, MetricType.RESPONSE_TIME, value, component="a"))
+        collector.add_metric(MetricData(bucket_start, MetricType.RESPONSE_TIME, 5.0, component="b"))
+
+        points = collector.get_series(MetricType.RESPONSE_TIME)
+
+        assert len(points) == 1
+        assert points[0]["count"] == 3
+        assert points[0]["average"] == 3.0
+        assert points[0]["max"] == 5.0
+
+    def test_get_metrics_uses_indexes(self):
+        """Test indexed tenant, component, tag and time filters return newest first."""
+        from moai_adk.core.realtime_monitoring_dashboard import MetricData, MetricsCollector, MetricType
+
+        collector = MetricsCollector()
+        base = datetime.now() - timedelta(minutes=30)
+        for i in range(30):
+            collector.add_metric(
+                MetricData(
+                    base + timedelta(minutes=i),
+                    MetricType.CPU_USAGE if i % 2 else MetricType.MEMORY_USAGE,
+                    float(i),
+                    tags={"region": "eu" if i % 3 == 0 else "us"},
+                    component=f"node{i % 2}",
+                    tenant_id=f"t{i % 5}",
+                )
+            )
+
+        by_tag = collector.get_metrics(metric_type=MetricType.CPU_USAGE, tags={"region": "eu"})
+        by_tenant = collector.get_metrics(tenant_id="t1", start_time=base + timedelta(minutes=10), limit=2)
+        by_component = collector.get_metrics(component="node0", end_time=base + timedelta(minutes=4))
+
+        assert [m.value for m in by_tag] == [27.0, 21.0, 15.0, 9.0, 3.0]
+        assert [m.value for m in by_tenant] == [26.0, 21.0]
+        assert [m.value for m in by_component] == [4.0, 2.0, 0.0]
+        assert collector.get_metrics(tags={"region": "apac"}) == []
+
+
+class TestTimeSortedBuffer:
+    """Test suite for timestamp-sorted sample buffers."""
+
+    def _item(self, ts):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(timestamp=ts)
+
+    def test_late_samples_are_inserted_in_order(self):
+        """Test that out-of-order appends keep the buffer sorted."""
+        buffer = TimeSortedBuffer()
+        for ts in (1, 5, 3, 4, 2):
+            buffer.append(self._item(ts))
+
+        assert [item.timestamp for item in buffer] == [1, 2, 3, 4, 5]
+        assert buffer[0].timestamp == 1
+        assert buffer[-1].timestamp == 5
+
+    def test_maxlen_evicts_oldest(self):
+        """Test that exceeding maxlen evicts the oldest sample."""
+        buffer = TimeSortedBuffer(maxlen=3)
+        evicted = [buffer.append(self._item(ts)) for ts in range(5)]
+
+        assert len(buffer) == 3
+        assert [item.timestamp for item in buffer] == [2, 3, 4]
+        assert [item.timestamp for item in evicted if item] == [0, 1]
+
+    def test_range_queries_and_eviction(self):
+        """Test inclusive range iteration and cutoff eviction."""
+        buffer = TimeSortedBuffer()
+        for ts in range(3000):
+            buffer.append(self._item(ts))
+
+        assert [item.timestamp for item in buffer.iter_range(10, 12)] == [10, 11, 12]
+        assert [item.timestamp for item in buffer.iter_newest(10, 12)] == [12, 11, 10]
+
+        evicted = buffer.evict_before(2000)
+
+        assert len(evicted) == 2000
+        assert len(buffer) == 1000
+        assert buffer[0].timestamp == 2000
+        assert list(buffer.iter_range(0, 1999)) == []
+
+    def test_merge_newest_with_limit_and_predicate(self):
+        """Test newest-first merging across buffers."""
+        even, odd = TimeSortedBuffer(), TimeSortedBuffer()
+        for ts in range(20):
+            (even if ts % 2 == 0 else odd).append(self._item(ts))
+
+        merged = merge_newest([even, odd], start=5, limit=4)
+        filtered = merge_newest([even, odd], end=10, predicate=lambda item: item.timestamp % 3 == 0)
+
+        assert [item.timestamp for item in merged] == [19, 18, 17, 16]
+        assert [item.timestamp for item in filtered] == [9, 6, 3, 0]
@@ -219,6 +219,28 @@ class TestLanguageDetector:
             # Assert - Rust should be detected first due to priority
             assert result == "rust"
 
+    def test_detect_ignores_dependency_and_ignored_directories(self):
+        """Test detect skips node_modules, virtualenvs and .gitignore'd paths."""
+        # Arrange
+        detector = LanguageDetector()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir)
+            (path / "node_modules" / "pkg").mkdir(parents=True)
+            (path / "node_modules" / "pkg" / "index.js").write_text("")
+            (path / ".venv").mkdir()
+            (path / ".venv" / "site.py").write_text("")
+            (path / "vendor").mkdir()
+            (path / "vendor" / "lib.rb").write_text("")
+            (path / ".gitignore").write_text("vendor/\n")
+            (path / "main.go").write_text("")
+
+            # Act
+            result = detector.detect_multiple(path)
+
+            # Assert
+            assert result == ["go"]
+
     def test_detect_multiple_returns_list(self):
         """Test detect_multiple returns list of detected languages."""
         # Arrange
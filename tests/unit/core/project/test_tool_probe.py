@@ -0,0 +1,135 @@
+"""Tests for concurrent, cached tool version probing."""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from moai_adk.core.project import tool_probe
+from moai_adk.core.project.checker import SystemChecker
+from moai_adk.core.project.tool_probe import probe_tool_versions
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell scripts as fake tools")
+
+
+def _fake_tool(directory: Path, name: str, output: str, delay: float = 0.0, exit_code: int = 0) -> str:
+    path = directory / name
+    sleep = f"sleep {delay}\n" if delay else ""
+    path.write_text(f"#!/bin/sh\n{sleep}echo '{output}'\nexit {exit_code}\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+class TestProbeToolVersions:
+    """Concurrent probing and the mtime-keyed cache."""
+
+    def test_probes_run_concurrently(self, tmp_path):
+        tools = {
+            f"tool{index}": _fake_tool(tmp_path, f"tool{index}", f"tool{index} 1.{index}", 0.3) for index in range(8)
+        }
+
+        start = time.perf_counter()
+        versions = probe_tool_versions(tools, cache_path=tmp_path / "cache.json")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n⚡ {len(tools)} version probes (0.3s each): {elapsed_ms:.2f}ms")
+
+        assert versions == {f"tool{index}": f"tool{index} 1.{index}" for index in range(8)}
+        assert elapsed_ms < 2000, f"Probes ran sequentially: {elapsed_ms:.2f}ms"
+
+    def test_cache_reused_until_executable_changes(self, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        path = _fake_tool(tmp_path, "node", "v20.0.0")
+
+        assert probe_tool_versions({"node": path}, cache_path=cache_path) == {"node": "v20.0.0"}
+
+        with patch.object(tool_probe, "_run_probes") as run_probes:
+            assert probe_tool_versions({"node": path}, cache_path=cache_path) == {"node": "v20.0.0"}
+        run_probes.assert_not_called()
+
+        # Upgrading the tool changes its mtime and invalidates the entry
+        _fake_tool(tmp_path, "node", "v22.1.0")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert probe_tool_versions({"node": path}, cache_path=cache_path) == {"node": "v22.1.0"}
+
+        entries = json.loads(cache_path.read_text())["tools"]
+        assert entries[path]["version"] == "v22.1.0"
+
+    def test_cache_follows_retargeted_symlink(self, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        old = _fake_tool(tmp_path, "python3.11", "Python 3.11.9")
+        new = _fake_tool(tmp_path, "python3.12", "Python 3.12.4")
+        stat = os.stat(old)
+        os.utime(new, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        link = tmp_path / "python"
+        link.symlink_to(old)
+
+        assert probe_tool_versions({"python": str(link)}, cache_path=cache_path) == {"python": "Python 3.11.9"}
+
+        link.unlink()
+        link.symlink_to(new)
+        assert probe_tool_versions({"python": str(link)}, cache_path=cache_path) == {"python": "Python 3.12.4"}
+
+    def test_cache_entries_expire(self, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        path = _fake_tool(tmp_path, "python", "Python 3.11.9")
+        probe_tool_versions({"python": path}, cache_path=cache_path)
+
+        # A version-manager shim switches versions without touching the shim file
+        expired = time.time() + tool_probe.CACHE_TTL + 1
+        with patch.object(tool_probe.time, "time", return_value=expired):
+            with patch.object(tool_probe, "_run_probes", return_value=["Python 3.12.4"]) as run_probes:
+                assert probe_tool_versions({"python": path}, cache_path=cache_path) == {"python": "Python 3.12.4"}
+        run_probes.assert_called_once_with([path], tool_probe.PROBE_TIMEOUT)
+
+    def test_refresh_ignores_cache(self, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        path = _fake_tool(tmp_path, "go", "go1.22")
+        probe_tool_versions({"go": path}, cache_path=cache_path)
+
+        with patch.object(tool_probe, "_run_probes", return_value=["go1.23"]) as run_probes:
+            assert probe_tool_versions({"go": path}, refresh=True, cache_path=cache_path) == {"go": "go1.23"}
+        run_probes.assert_called_once_with([path], tool_probe.PROBE_TIMEOUT)
+
+    def test_failures_and_timeouts_are_none(self, tmp_path):
+        tools = {
+            "broken": _fake_tool(tmp_path, "broken", "error", exit_code=1),
+            "slow": _fake_tool(tmp_path, "slow", "slow 1.0", delay=5),
+            "missing": str(tmp_path / "missing"),
+        }
+
+        versions = probe_tool_versions(tools, timeout=0.5, cache_path=tmp_path / "cache.json")
+
+        assert versions == {"broken": None, "slow": None, "missing": None}
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        cache_path.write_text("{not json")
+        path = _fake_tool(tmp_path, "ruby", "ruby 3.3.0")
+
+        assert probe_tool_versions({"ruby": path}, cache_path=cache_path) == {"ruby": "ruby 3.3.0"}
+
+
+class TestSystemCheckerPrefetch:
+    """SystemChecker answers get_tool_version from prefetched results."""
+
+    def test_prefetch_serves_get_tool_version(self, tmp_path):
+        checker = SystemChecker()
+        path = _fake_tool(tmp_path, "cargo", "cargo 1.80.0")
+
+        with patch("shutil.which", side_effect=lambda tool: path if tool == "cargo" else None) as mock_which:
+            with patch.object(tool_probe, "default_cache_path", return_value=tmp_path / "cache.json"):
+                versions = checker.prefetch_tool_versions(["cargo", "rustfmt", "cargo"])
+
+            with patch("subprocess.run") as mock_run:
+                assert checker.get_tool_version("cargo") == "cargo 1.80.0"
+            mock_run.assert_not_called()
+
+        assert versions == {"cargo": "cargo 1.80.0"}
+        # PATH lookups are memoized per checker
+        assert mock_which.call_count == 2
@@ -0,0 +1,123 @@
+"""
+Incremental TrustChecker Tests
+
+Checks that git-driven incremental validation reuses cached per-file results
+for unchanged files and still reports the same project-level results as a
+full scan.
+"""
+
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from moai_adk.core.quality.trust_checker import TrustChecker
+from moai_adk.utils.code_analysis import clear_analysis_sessions, get_analysis_session
+from moai_adk.utils.file_index import clear_file_index_cache
+
+FILE_COUNT = 500
+
+MODULE_TEMPLATE = '''"""Module {index}."""
+
+
+def handler_{index}(a, b, c):
+    """Handle request {index}."""
+    if a and b or c:
+        return a
+    return b
+'''
+
+LONG_FUNCTION = "def long_function(a, b, c, d, e, f):\n" + "".join(f"    x{i} = {i}\n" for i in range(60))
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_project(tmp_path: Path) -> Path:
+    """A committed MoAI project with FILE_COUNT modules under src/"""
+    (tmp_path / ".moai").mkdir()
+    for index in range(FILE_COUNT):
+        package = tmp_path / "src" / f"pkg{index // 50}"
+        package.mkdir(parents=True, exist_ok=True)
+        (package / f"module{index}.py").write_text(MODULE_TEMPLATE.format(index=index))
+
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "src")
+    _git(tmp_path, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def _validate(checker: TrustChecker, src_path: Path) -> list:
+    return [
+        (result.passed, result.message, result.details)
+        for result in (
+            checker.validate_file_size(src_path),
+            checker.validate_function_size(src_path),
+            checker.validate_param_count(src_path),
+            checker.validate_complexity(src_path),
+        )
+    ]
+
+
+def _new_process():
+    """Drop in-memory state, as a new CLI or pre-commit run would start with"""
+    clear_analysis_sessions()
+    clear_file_index_cache()
+
+
+class TestIncrementalTrustChecker:
+    """Incremental validation driven by git changes"""
+
+    def test_incremental_matches_full_run(self, git_project: Path):
+        """Changed, added, deleted and untracked files are reflected as in a full run"""
+        src_path = git_project / "src"
+        _validate(TrustChecker(), src_path)
+
+        (src_path / "pkg0" / "module0.py").write_text(LONG_FUNCTION)
+        (src_path / "pkg1" / "module50.py").unlink()
+        (src_path / "pkg9" / "new_module.py").write_text(LONG_FUNCTION.replace("long_function", "added"))
+        _new_process()
+
+        start = time.perf_counter()
+        incremental = _validate(TrustChecker(incremental=True), src_path)
+        incremental_ms = (time.perf_counter() - start) * 1000
+        session = get_analysis_session(src_path)
+
+        (git_project / ".moai" / "cache" / "trust-analysis-src.json").unlink()
+        _new_process()
+        full = _validate(TrustChecker(), src_path)
+
+        print(f"\n⚡ Incremental run over {FILE_COUNT} files: {incremental_ms:.2f}ms")
+
+        assert session.incremental
+        assert incremental == full
+        assert "long_function" in full[1][2] and "added" in full[1][2]
+        # Only the changed files were read
+        assert sorted(Path(key).name for key in session._contents) == ["module0.py", "new_module.py"]
+
+    def test_reverted_uncommitted_change_is_rechecked(self, git_project: Path):
+        """A file that was dirty when the cache was written is re-checked after a revert"""
+        src_path = git_project / "src"
+        module = src_path / "pkg0" / "module0.py"
+        original = module.read_text()
+
+        module.write_text(LONG_FUNCTION)
+        assert not _validate(TrustChecker(), src_path)[1][0]
+
+        module.write_text(original)
+        _new_process()
+
+        assert _validate(TrustChecker(incremental=True), src_path)[1][0]
+
+    def test_falls_back_to_full_scan_without_cache(self, git_project: Path):
+        """Without a persisted cache, incremental mode scans everything"""
+        src_path = git_project / "src"
+
+        results = _validate(TrustChecker(incremental=True), src_path)
+
+        assert not get_analysis_session(src_path).incremental
+        assert all(passed for passed, _, _ in results)
+        assert (git_project / ".moai" / "cache" / "trust-analysis-src.json").exists()
@@ -0,0 +1,98 @@
+"""
+ConfidenceScoringSystem Performance Tests
+
+The PostToolUse auto-spec hook scores the file that was just edited, so
+scoring must stay within a fixed latency budget even for large modules.
+
+Performance Targets:
+- 5k-line file with many classes and methods: < 1000ms for a full score
+"""
+
+import time
+
+from moai_adk.core.spec.confidence_scoring import ConfidenceScoringSystem
+
+LATENCY_BUDGET_MS = 1000
+
+CLASS_TEMPLATE = '''
+
+class Service{index}:
+    """Service {index} handles api requests."""
+
+    def handle(self, request, token=None):
+        """Handle a request.
+
+        Args:
+            request: Incoming request
+        Returns:
+            Response payload
+        """
+        if request and token or request is None:
+            for item in request:
+                with open(item) as f:
+                    return f.read()
+        return None
+
+    def validate(self, payload):
+        # Validate the payload
+        try:
+            return bool(payload)
+        except ValueError:
+            return False
+'''
+
+
+def _write_large_module(tmp_path, line_count=5000):
+    content = '"""Large module.\n\nProvides services and manages api handlers.\n"""\n\nimport os\n'
+    index = 0
+    while content.count("\n") < line_count:
+        content += CLASS_TEMPLATE.format(index=index)
+        index += 1
+
+    file_path = tmp_path / "large_module.py"
+    file_path.write_text(content)
+    return file_path, index
+
+
+class TestConfidenceScoringPerformance:
+    """Latency tests for single-pass confidence scoring"""
+
+    def test_large_file_within_latency_budget(self, tmp_path):
+        """Scoring a 5k-line file should stay within the hook latency budget"""
+        file_path, class_count = _write_large_module(tmp_path)
+        system = ConfidenceScoringSystem()
+
+        start = time.perf_counter()
+        confidence, analysis = system.calculate_confidence_score(str(file_path))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n⚡ {class_count} classes / 5000 lines scored in {elapsed_ms:.2f}ms")
+
+        assert 0.0 <= confidence <= 1.0
+        assert analysis["structure_analysis"]["details"]["class_ratio"] == 1.0
+        assert elapsed_ms < LATENCY_BUDGET_MS, f"Scoring too slow: {elapsed_ms:.2f}ms"
+
+    def test_methods_and_functions_counted_once(self, tmp_path):
+        """Methods are counted per enclosing class; only non-method defs are functions"""
+        file_path = tmp_path / "module.py"
+        file_path.write_text(
+            "def top():\n"
+            "    def inner():\n"
+            "        pass\n"
+            "\n"
+            "class Outer:\n"
+            "    def method(self):\n"
+            "        pass\n"
+            "\n"
+            "    class Inner:\n"
+            "        def nested(self):\n"
+            "            pass\n"
+        )
+        system = ConfidenceScoringSystem()
+
+        scores = system.analyze_code_structure(str(file_path))
+
+        # top and inner are functions; method and nested are methods
+        assert scores["function_ratio"] == 2 / 20
+        # method (Outer) + nested (Outer and Inner)
+        assert scores["method_ratio"] == 3 / 50
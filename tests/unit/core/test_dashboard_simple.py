@@ -229,19 +229,6 @@ class TestMetricsCollector(unittest.TestCase):
         self.assertEqual(stats["count"], 0)
         self.assertIsNone(stats["average"])
 
-    def test_percentile_calculation(self):
-        """Test percentile calculation."""
-        # Arrange
-        collector = MetricsCollector()
-        values = [1.0, 2.0, 3.0, 4.0, 5.0]
-
-        # Act
-        p95 = collector._percentile(values, 95)
-
-        # Assert
-        self.assertGreater(p95, 0)
-        self.assertLessEqual(p95, 5.0)
-
 
 class TestAlertManager(unittest.TestCase):
     """Test AlertManager class."""
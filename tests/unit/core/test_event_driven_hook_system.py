@@ -17,6 +17,7 @@ Tests cover:
 import asyncio
 import json
 import logging
+import sqlite3
 import time
 import uuid
 from datetime import datetime, timedelta
@@ -35,8 +36,11 @@ from moai_adk.core.event_driven_hook_system import (
     InMemoryMessageBroker,
     MessageBrokerType,
     MessageBroker,
+    OverflowPolicy,
+    PriorityDispatcher,
     RedisMessageBroker,
     ResourceIsolationLevel,
+    SQLiteMessageBroker,
     ResourcePool,
     WorkflowEvent,
     get_event_system,
@@ -407,8 +411,9 @@ class TestInMemoryMessageBroker:
     @pytest.mark.asyncio
     async def test_queue_size_limit(self, broker):
         """Test queue respects max size limit"""
-        small_broker = InMemoryMessageBroker(max_queue_size=3)
+        small_broker = InMemoryMessageBroker(max_queue_size=3, overflow_policy=OverflowPolicy.REJECT)
 
+        results = []
         for i in range(5):
             event = Event(
                 event_id=f"test_{i}",
@@ -417,10 +422,11 @@ class TestInMemoryMessageBroker:
                 timestamp=datetime.now(),
                 payload={"index": i},
             )
-            await small_broker.publish("test_topic", event)
+            results.append(await small_broker.publish("test_topic", event))
 
-        # Queue should only have last 3 messages
-        assert len(small_broker.queues["test_topic"]) == 3
+        # Queue keeps the first 3 messages and rejects the rest
+        assert results == [True, True, True, False, False]
+        assert [event.payload["index"] for event in small_broker.queues["test_topic"]] == [0, 1, 2]
 
     def test_get_stats(self, broker):
         """Test getting broker statistics"""
@@ -925,6 +931,324 @@ class TestEventProcessor:
 # =============================================================================
 
 
+def _queued_event(index: int, priority: EventPriority = EventPriority.NORMAL) -> Event:
+    return Event(
+        event_id=f"evt_{priority.name}_{index}",
+        event_type=EventType.HOOK_EXECUTION_COMPLETED,
+        priority=priority,
+        timestamp=datetime.now(),
+        payload={"index": index},
+    )
+
+
+class TestBrokerBackpressure:
+    """Bounded queues and subscriber buffers apply backpressure"""
+
+    @pytest.mark.asyncio
+    async def test_blocked_publisher_resumes_when_consumer_takes(self):
+        broker = InMemoryMessageBroker(max_queue_size=1, publish_timeout=5.0)
+        assert await broker.publish("topic", _queued_event(0))
+
+        publisher = asyncio.create_task(broker.publish("topic", _queued_event(1)))
+        await asyncio.sleep(0.01)
+        assert not publisher.done()
+
+        assert broker.take("topic").payload["index"] == 0
+        assert await asyncio.wait_for(publisher, 1.0) is True
+        assert broker._stats["blocked_publishes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_blocked_publisher_rejected_after_timeout(self):
+        broker = InMemoryMessageBroker(max_queue_size=1, publish_timeout=0.05)
+        await broker.publish("topic", _queued_event(0))
+
+        assert await broker.publish("topic", _queued_event(1)) is False
+        assert broker._stats["rejected_publishes"] == 1
+        assert len(broker.queues["topic"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_nowait_rejects_instead_of_blocking(self):
+        broker = InMemoryMessageBroker(max_queue_size=1, publish_timeout=5.0)
+        await broker.publish("topic", _queued_event(0))
+
+        assert await asyncio.wait_for(broker.publish_nowait("topic", _queued_event(1)), 0.5) is False
+        assert broker._stats["blocked_publishes"] == 0
+        assert broker._stats["rejected_publishes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_subscriber_delivery_uses_one_task(self):
+        broker = InMemoryMessageBroker()
+        received = []
+
+        async def callback(event):
+            received.append(event.payload["index"])
+
+        await broker.subscribe("topic", callback)
+        baseline = len(asyncio.all_tasks())
+        for index in range(200):
+            await broker.publish("topic", _queued_event(index))
+
+        assert len(asyncio.all_tasks()) <= baseline + 1
+        await asyncio.sleep(0.05)
+        assert received == list(range(200))
+        assert broker._stats["messages_delivered"] == 200
+
+
+class TestPriorityDispatcher:
+    """Wake-on-publish, weighted fair draining and per-class concurrency"""
+
+    @pytest.mark.asyncio
+    async def test_wakes_on_publish_without_polling(self):
+        broker = InMemoryMessageBroker()
+        handled = asyncio.Event()
+        dispatcher = PriorityDispatcher(broker, lambda event: handled.set())
+        runner = asyncio.create_task(dispatcher.run())
+        await asyncio.sleep(0.01)
+
+        start = time.perf_counter()
+        await broker.publish("hook_execution_normal", _queued_event(0))
+        await asyncio.wait_for(handled.wait(), 1.0)
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+
+        print(f"\n⚡ Publish-to-dispatch latency: {latency_ms:.2f}ms")
+        assert latency_ms < 50, f"Dispatch latency too high: {latency_ms:.2f}ms"
+
+    @pytest.mark.asyncio
+    async def test_weighted_fair_draining(self):
+        broker = InMemoryMessageBroker()
+        order = []
+        dispatcher = PriorityDispatcher(
+            broker,
+            lambda event: order.append(event.priority),
+            concurrency_limits={priority: 100 for priority in EventPriority},
+        )
+        for index in range(20):
+            await broker.publish("system_events", _queued_event(index, EventPriority.CRITICAL))
+            await broker.publish("analytics", _queued_event(index, EventPriority.BULK))
+
+        assert dispatcher.dispatch_ready() == 40
+        assert dispatcher.get_stats()["by_priority"] == {"CRITICAL": 20, "BULK": 20}
+        await asyncio.sleep(0)
+        # First round: 8 critical, then one bulk event before the next critical batch
+        assert order[:9] == [EventPriority.CRITICAL] * 8 + [EventPriority.BULK]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_per_priority(self):
+        broker = InMemoryMessageBroker()
+        active = {"now": 0, "max": 0}
+
+        async def handler(event):
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+
+        dispatcher = PriorityDispatcher(broker, handler, concurrency_limits={EventPriority.NORMAL: 3})
+        runner = asyncio.create_task(dispatcher.run())
+        for index in range(12):
+            await broker.publish("hook_execution_normal", _queued_event(index))
+
+        for _ in range(100):
+            if dispatcher.get_stats()["events_dispatched"] == 12 and active["now"] == 0:
+                break
+            await asyncio.sleep(0.01)
+
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+
+        assert dispatcher.get_stats()["events_dispatched"] == 12
+        assert active["max"] == 3
+
+
+class TestSQLiteMessageBroker:
+    """Durable SQLite broker: batching, leases, acks and redelivery"""
+
+    @pytest.fixture
+    def sqlite_broker(self, tmp_path):
+        broker = SQLiteMessageBroker(tmp_path / "broker.db")
+        yield broker
+        broker._conn.close()
+
+    @pytest.mark.asyncio
+    async def test_publish_burst_is_one_transaction(self, sqlite_broker):
+        results = await asyncio.gather(*(sqlite_broker.publish("topic", _queued_event(i)) for i in range(100)))
+
+        assert all(results)
+        stats = sqlite_broker.get_stats()
+        assert stats["publish_batches"] == 1
+        assert stats["total_queued_messages"] == 100
+
+    @pytest.mark.asyncio
+    async def test_take_orders_by_priority_then_enqueue_time(self, sqlite_broker):
+        await sqlite_broker.publish("topic", _queued_event(0, EventPriority.LOW))
+        await sqlite_broker.publish("topic", _queued_event(1, EventPriority.CRITICAL))
+        await sqlite_broker.publish("topic", _queued_event(2, EventPriority.CRITICAL))
+
+        taken = [sqlite_broker.take("topic") for _ in range(4)]
+
+        assert [event.event_id for event in taken[:3]] == ["evt_CRITICAL_1", "evt_CRITICAL_2", "evt_LOW_0"]
+        assert taken[3] is None
+
+    @pytest.mark.asyncio
+    async def test_unacked_event_redelivered_after_visibility_timeout(self, tmp_path):
+        broker = SQLiteMessageBroker(tmp_path / "broker.db", visibility_timeout=0.05)
+        try:
+            await broker.publish("topic", _queued_event(0))
+            first = broker.take("topic")
+            assert broker.take("topic") is None
+
+            await asyncio.sleep(0.06)
+            second = broker.take("topic")
+            assert second.event_id == first.event_id
+            assert broker.ack(second)
+            await asyncio.sleep(0.06)
+            assert broker.take("topic") is None
+            assert broker.get_stats()["messages_redelivered"] == 1
+        finally:
+            await broker.close()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_event_ids_keep_separate_leases(self, sqlite_broker):
+        await sqlite_broker.publish("topic", _queued_event(0))
+        await sqlite_broker.publish("topic", _queued_event(0))
+
+        first = sqlite_broker.take("topic")
+        second = sqlite_broker.take("topic")
+        assert first.event_id == second.event_id
+        assert sqlite_broker.get_stats()["leased_messages"] == 2
+
+        assert sqlite_broker.ack(first)
+        assert sqlite_broker.ack(second)
+        assert not sqlite_broker.ack(second)
+        assert sqlite_broker.get_stats()["total_queued_messages"] == 0
+
+    @pytest.mark.asyncio
+    async def test_events_survive_reopen(self, tmp_path):
+        broker = SQLiteMessageBroker(tmp_path / "broker.db")
+        await broker.create_queue("topic", {"max_size": 2})
+        hook_event = HookExecutionEvent(
+            event_id="hook_1",
+            event_type=EventType.HOOK_EXECUTION_REQUEST,
+            priority=EventPriority.HIGH,
+            timestamp=datetime.now(),
+            payload={},
+            hook_path="/hooks/check.py",
+            hook_event_type=HookEvent.PRE_TOOL_USE,
+            execution_context={"tool": "Bash"},
+        )
+        assert await broker.publish("topic", hook_event)
+        assert await broker.publish("topic", _queued_event(1))
+        assert await broker.publish("topic", _queued_event(2)) is False
+        await broker.close()
+
+        reopened = SQLiteMessageBroker(tmp_path / "broker.db")
+        try:
+            restored = reopened.take("topic")
+            assert isinstance(restored, HookExecutionEvent)
+            assert restored.hook_path == "/hooks/check.py"
+            assert restored.hook_event_type == HookEvent.PRE_TOOL_USE
+            assert restored.execution_context == {"tool": "Bash"}
+            assert reopened.capacity("topic") == 2
+        finally:
+            await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_locked_database_does_not_block_event_loop(self, sqlite_broker):
+        await sqlite_broker.publish("topic", _queued_event(0))
+        leased = sqlite_broker.take("topic")
+        other = sqlite3.connect(str(sqlite_broker.db_path), isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            start = time.perf_counter()
+            publisher = asyncio.create_task(sqlite_broker.publish("topic", _queued_event(1)))
+            await asyncio.sleep(0.1)
+            assert sqlite_broker.ack(leased)
+            assert sqlite_broker.take("topic") is None
+            assert time.perf_counter() - start < 1.0
+            assert not publisher.done()
+        finally:
+            other.execute("COMMIT")
+            other.close()
+
+        assert await asyncio.wait_for(publisher, 1.0) is True
+        assert sqlite_broker.take("topic").event_id == "evt_NORMAL_1"
+        assert sqlite_broker.get_stats()["total_queued_messages"] == 1
+
+    @pytest.mark.asyncio
+    async def test_subscriber_acks_and_failures_are_retried(self, sqlite_broker):
+        received = []
+        failed_once = set()
+
+        async def callback(event):
+            if event.event_id not in failed_once:
+                failed_once.add(event.event_id)
+                raise RuntimeError("transient")
+            received.append(event.event_id)
+
+        sub_id = await sqlite_broker.subscribe("topic", callback)
+        await sqlite_broker.publish("topic", _queued_event(0))
+
+        for _ in range(100):
+            if received:
+                break
+            await asyncio.sleep(0.01)
+
+        assert received == ["evt_NORMAL_0"]
+        assert sqlite_broker.get_stats()["total_queued_messages"] == 0
+        assert await sqlite_broker.unsubscribe(sub_id)
+
+    @pytest.mark.asyncio
+    async def test_throughput_against_in_memory_broker(self, sqlite_broker):
+        count = 2000
+        events = [_queued_event(i) for i in range(count)]
+
+        async def publish_and_drain(broker):
+            start = time.perf_counter()
+            await asyncio.gather(*(broker.publish("topic", event) for event in events))
+            drained = 0
+            while (event := broker.take("topic")) is not None:
+                if isinstance(broker, SQLiteMessageBroker):
+                    broker.ack(event)
+                drained += 1
+            assert drained == count
+            return count / (time.perf_counter() - start)
+
+        memory_rate = await publish_and_drain(InMemoryMessageBroker())
+        sqlite_rate = await publish_and_drain(sqlite_broker)
+
+        print(f"\n⚡ Publish+consume: in-memory {memory_rate:,.0f}/s, SQLite {sqlite_rate:,.0f}/s")
+        assert sqlite_rate > 500, f"SQLite broker too slow: {sqlite_rate:.0f} events/s"
+
+    @pytest.mark.asyncio
+    async def test_event_system_on_sqlite_broker(self, tmp_path):
+        system = EventDrivenHookSystem(
+            message_broker_type=MessageBrokerType.SQLITE,
+            enable_persistence=False,
+            persistence_path=tmp_path,
+        )
+        await system.start()
+        try:
+            for index in range(3):
+                await system.publish_hook_execution_event(f"/hook{index}.py", HookEvent.SESSION_START, {})
+
+            for _ in range(100):
+                if system._system_metrics["events_processed"] == 3:
+                    break
+                await asyncio.sleep(0.05)
+
+            assert system._system_metrics["hook_executions"] == 3
+            assert system._system_metrics["events_processed"] == 3
+        finally:
+            await system.stop()
+
+        # stop() closes the broker's database connection
+        with pytest.raises(sqlite3.ProgrammingError):
+            system.message_broker.get_stats()
+
+
 class TestEventDrivenHookSystem:
     """Test EventDrivenHookSystem main class"""
 
@@ -1134,6 +1458,26 @@ class TestEventDrivenHookSystem:
         # Hook should be marked as executed
         assert system._system_metrics["hook_executions"] >= 0
 
+    @pytest.mark.asyncio
+    async def test_hook_execution_request_does_not_block_on_full_queue(self, system):
+        """The completion event is rejected instead of holding the dispatcher slot"""
+        await system.message_broker.create_queue("hook_execution_normal", {"max_size": 1})
+        await system.message_broker.publish("hook_execution_normal", _queued_event(0))
+        event = HookExecutionEvent(
+            event_id="exec_full",
+            event_type=EventType.HOOK_EXECUTION_REQUEST,
+            priority=EventPriority.NORMAL,
+            timestamp=datetime.now(),
+            payload={},
+            hook_path="/path/to/hook.py",
+            hook_event_type=HookEvent.SESSION_START,
+        )
+
+        await asyncio.wait_for(system._handle_hook_execution_request(event), 1.0)
+
+        assert system.message_broker._stats["blocked_publishes"] == 0
+        assert system.message_broker._stats["rejected_publishes"] == 1
+
     @pytest.mark.asyncio
     async def test_handle_hook_execution_completed(self, system):
         """Test hook execution completed handler"""
@@ -1292,15 +1636,15 @@ class TestEventDrivenHookSystem:
             payload={"data": "test"},
         )
 
-        system._pending_events["test_123"] = event
-        system._processed_events.add("test_456")
+        system._record_pending(event)
+        system._record_processed("test_456")
 
         await system._persist_events()
 
-        # Check files were created
-        assert (system.persistence_path / "pending_events.json").exists()
-        assert (system.persistence_path / "processed_events.json").exists()
+        # Check the journal and metrics snapshot were written
+        assert list((system.persistence_path / "journal").glob("segment-*.jsonl"))
         assert (system.persistence_path / "system_metrics.json").exists()
+        assert system._journal.pending_records == 0
 
     @pytest.mark.asyncio
     async def test_load_persisted_events(self, system):
@@ -1314,8 +1658,8 @@ class TestEventDrivenHookSystem:
             payload={"data": "test"},
         )
 
-        system._pending_events["test_123"] = event
-        system._processed_events.add("test_456")
+        system._record_pending(event)
+        system._record_processed("test_456")
 
         await system._persist_events()
 
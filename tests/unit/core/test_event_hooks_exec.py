@@ -23,6 +23,7 @@ from moai_adk.core.event_driven_hook_system import (
     HookExecutionEvent,
     WorkflowEvent,
     InMemoryMessageBroker,
+    OverflowPolicy,
 )
 from moai_adk.core.jit_enhanced_hook_manager import HookEvent
 
@@ -285,7 +286,7 @@ class TestInMemoryMessageBroker:
     @pytest.mark.asyncio
     async def test_publish_to_full_queue(self):
         """Test publishing when queue is at max capacity."""
-        broker = InMemoryMessageBroker(max_queue_size=2)
+        broker = InMemoryMessageBroker(max_queue_size=2, overflow_policy=OverflowPolicy.REJECT)
         topic = "test_topic"
 
         event1 = Event(
@@ -310,14 +311,15 @@ class TestInMemoryMessageBroker:
             payload={},
         )
 
-        await broker.publish(topic, event1)
-        await broker.publish(topic, event2)
-        await broker.publish(topic, event3)
+        assert await broker.publish(topic, event1) is True
+        assert await broker.publish(topic, event2) is True
+        assert await broker.publish(topic, event3) is False
 
-        # Queue should only have last 2 events
+        # Full queue rejects new events instead of dropping queued ones
         assert len(broker.queues[topic]) == 2
-        assert broker.queues[topic][0].event_id == "evt-016"
-        assert broker.queues[topic][1].event_id == "evt-017"
+        assert broker.queues[topic][0].event_id == "evt-015"
+        assert broker.queues[topic][1].event_id == "evt-016"
+        assert broker._stats["rejected_publishes"] == 1
 
     @pytest.mark.asyncio
     async def test_subscribe_to_topic(self):
@@ -0,0 +1,229 @@
+"""Tests for the append-only event journal and processed-id window."""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from moai_adk.core.event_driven_hook_system import (
+    Event,
+    EventDrivenHookSystem,
+    EventPriority,
+    EventType,
+    HookExecutionEvent,
+    MessageBrokerType,
+)
+from moai_adk.core.event_journal import EventJournal, ProcessedEventWindow
+from moai_adk.core.jit_enhanced_hook_manager import HookEvent
+
+
+class TestProcessedEventWindow:
+    """Bounded, time-windowed deduplication set."""
+
+    def test_set_semantics(self):
+        window = ProcessedEventWindow()
+        window.add("a")
+        window.add("b")
+        window.discard("a")
+
+        assert "a" not in window
+        assert "b" in window
+        assert list(window) == ["b"]
+
+    def test_evicts_oldest_beyond_max_size(self):
+        window = ProcessedEventWindow(max_size=3)
+        for index in range(5):
+            window.add(f"event-{index}")
+
+        assert len(window) == 3
+        assert list(window) == ["event-2", "event-3", "event-4"]
+
+    def test_prune_drops_ids_outside_window(self):
+        window = ProcessedEventWindow(window_seconds=60)
+        now = time.time()
+        window.add("old", now - 120)
+        window.add("recent", now - 10)
+
+        assert window.prune(now) == 1
+        assert list(window) == ["recent"]
+
+
+class TestEventJournal:
+    """Segmented appends, replay and compaction."""
+
+    def test_replay_returns_records_in_order(self, tmp_path):
+        journal = EventJournal(tmp_path, fsync=False)
+        for index in range(5):
+            journal.append({"op": "complete", "event_id": str(index)})
+        journal.close()
+
+        assert [record["event_id"] for record in EventJournal(tmp_path).replay()] == ["0", "1", "2", "3", "4"]
+
+    def test_appends_are_flushed_in_batches(self, tmp_path):
+        journal = EventJournal(tmp_path, flush_batch_size=10, fsync=False)
+        for index in range(25):
+            journal.append({"op": "complete", "event_id": str(index)})
+
+        assert journal.get_stats()["flushes"] == 2
+        assert journal.pending_records == 5
+
+    def test_torn_last_line_is_skipped(self, tmp_path):
+        journal = EventJournal(tmp_path, fsync=False)
+        journal.append({"op": "complete", "event_id": "ok"})
+        journal.close()
+        segment = next(tmp_path.glob("segment-*.jsonl"))
+        with open(segment, "a") as f:
+            f.write('{"op": "compl')
+
+        assert list(EventJournal(tmp_path).replay()) == [{"op": "complete", "event_id": "ok"}]
+
+    def test_torn_last_line_is_cut_off_on_reopen(self, tmp_path):
+        journal = EventJournal(tmp_path, fsync=False)
+        journal.append({"op": "a"})
+        journal.close()
+        segment = next(tmp_path.glob("segment-*.jsonl"))
+        with open(segment, "a") as f:
+            f.write('{"op":"torn"')
+
+        reopened = EventJournal(tmp_path, fsync=False)
+        reopened.append({"op": "after-restart"})
+        reopened.close()
+
+        assert list(EventJournal(tmp_path).replay()) == [{"op": "a"}, {"op": "after-restart"}]
+
+    def test_segment_holding_only_a_torn_line_is_emptied(self, tmp_path):
+        (tmp_path / "segment-000001.jsonl").write_text('{"op":"torn"')
+
+        journal = EventJournal(tmp_path, fsync=False)
+        journal.append({"op": "after-restart"})
+        journal.close()
+
+        assert list(EventJournal(tmp_path).replay()) == [{"op": "after-restart"}]
+
+    def test_rotation_and_compaction(self, tmp_path):
+        journal = EventJournal(tmp_path, segment_max_bytes=200, compact_threshold_bytes=1000, fsync=False)
+        for index in range(100):
+            journal.append({"op": "complete", "event_id": f"event-{index:03d}"})
+            journal.flush()
+
+        assert journal.get_stats()["segments"] > 1
+        assert journal.needs_compaction()
+
+        journal.compact(lambda: iter([{"op": "complete", "event_id": "event-099"}]))
+        journal.append({"op": "complete", "event_id": "event-100"})
+        journal.close()
+
+        assert journal.get_stats()["segments"] == 1
+        assert [record["event_id"] for record in journal.replay()] == ["event-099", "event-100"]
+
+
+class TestEventSystemRecovery:
+    """Crash recovery through the journal."""
+
+    @staticmethod
+    def _system(path):
+        return EventDrivenHookSystem(
+            message_broker_type=MessageBrokerType.MEMORY,
+            enable_persistence=True,
+            persistence_path=path,
+        )
+
+    @staticmethod
+    def _event(event_id):
+        return HookExecutionEvent(
+            event_id=event_id,
+            event_type=EventType.HOOK_EXECUTION_REQUEST,
+            priority=EventPriority.HIGH,
+            timestamp=datetime.now(),
+            payload={},
+            hook_path="hooks/check.py",
+            hook_event_type=HookEvent.PRE_TOOL_USE,
+        )
+
+    @pytest.mark.asyncio
+    async def test_unprocessed_events_are_recovered_and_requeued(self, tmp_path):
+        system = self._system(tmp_path)
+        system._record_pending(self._event("done"))
+        system._record_pending(self._event("lost"))
+        system._record_processed("done")
+        await system._wait_for_journal()
+        # Simulate a crash: no stop(), no snapshot
+
+        recovered = self._system(tmp_path)
+        await recovered._load_persisted_events()
+
+        assert set(recovered._pending_events) == {"lost"}
+        assert "done" in recovered._processed_events
+        assert isinstance(recovered._pending_events["lost"], HookExecutionEvent)
+        assert recovered._pending_events["lost"].hook_event_type == HookEvent.PRE_TOOL_USE
+
+        await recovered._setup_message_queues()
+        await recovered._requeue_recovered_events()
+        assert recovered.message_broker.take("hook_execution_high").event_id == "lost"
+
+    @pytest.mark.asyncio
+    async def test_journal_writes_run_off_the_event_loop(self, tmp_path):
+        system = self._system(tmp_path)
+        writer_threads = []
+        write_batch = system._journal.write_batch
+
+        def recording_write_batch(data):
+            writer_threads.append(threading.get_ident())
+            write_batch(data)
+
+        system._journal.write_batch = recording_write_batch
+        system._record_pending(self._event("queued"))
+        system._flush_journal()
+        await system._wait_for_journal()
+
+        assert writer_threads and threading.get_ident() not in writer_threads
+        assert [record["op"] for record in system._journal.replay()] == ["enqueue"]
+
+    @pytest.mark.asyncio
+    async def test_redelivered_event_is_not_processed_twice(self, tmp_path):
+        system = self._system(tmp_path)
+        event = self._event("once")
+        system._record_processed("once")
+
+        await system._dispatch_event(event)
+
+        assert system._duplicate_events_skipped == 1
+        assert system.event_processor.get_stats()["events_processed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_only_journaled_events_are_completed(self, tmp_path):
+        system = self._system(tmp_path)
+        system._record_pending(self._event("requested"))
+        follow_up = Event(
+            event_id="follow-up",
+            event_type=EventType.HOOK_EXECUTION_COMPLETED,
+            priority=EventPriority.NORMAL,
+            timestamp=datetime.now(),
+            payload={},
+        )
+
+        await system._dispatch_event(self._event("requested"))
+        await system._dispatch_event(follow_up)
+        await system._wait_for_journal()
+
+        records = [(record["op"], record.get("event_id")) for record in system._journal.replay()]
+        assert records == [("enqueue", None), ("complete", "requested")]
+        assert "follow-up" not in system._processed_events
+
+    @pytest.mark.asyncio
+    async def test_journal_append_cost_independent_of_backlog(self, tmp_path):
+        system = self._system(tmp_path)
+        for index in range(5000):
+            system._pending_events[f"backlog-{index}"] = self._event(f"backlog-{index}")
+
+        start = time.perf_counter()
+        for index in range(1000):
+            system._record_pending(self._event(f"new-{index}"))
+        await system._wait_for_journal()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n⚡ Journaled 1000 events over a 5000-event backlog: {elapsed_ms:.2f}ms")
+
+        assert system._journal.get_stats()["records_appended"] == 1000
+        assert elapsed_ms < 2000, f"Journal appends too slow: {elapsed_ms:.2f}ms"
@@ -0,0 +1,138 @@
+"""
+EnhancedInputValidationMiddleware Performance Tests
+
+Every tool call passes through the middleware, so validation must stay cheap
+for the common case of input that already matches the tool schema.
+
+Performance Targets:
+- Exact-match input: zero-copy fast path, no mapping or normalization passes
+- Aliased / unknown keys: schema tables and fuzzy matches are reused, not rebuilt
+"""
+
+import os
+import time
+from unittest.mock import DEFAULT, patch
+
+from moai_adk.core.input_validation_middleware import EnhancedInputValidationMiddleware, ToolParameter
+
+ITERATIONS = int(os.environ.get("MOAI_BENCH_SAMPLES", "5000"))
+
+# Slow-path passes the fast path must skip for exact-match input
+SLOW_PATH_METHODS = (
+    "_map_parameters",
+    "_validate_required_parameters",
+    "_validate_parameter_values",
+    "_normalize_parameter_formats",
+)
+
+EXACT_INPUTS = {
+    "Grep": {
+        "pattern": "def ",
+        "output_mode": "content",
+        "path": "src",
+        "case_sensitive": False,
+        "context_lines": 2,
+    },
+    "Glob": {"pattern": "**/*.py", "path": "src", "recursive": True},
+    "Read": {"file_path": "/tmp/file.txt", "offset": 0, "limit": 100},
+    "Bash": {"command": "ls -la", "timeout": 10000, "working_directory": "/tmp"},
+    "Task": {"subagent_type": "expert-backend", "prompt": "Review the code", "debug": False},
+    "Write": {"file_path": "/tmp/out.txt", "content": "data", "create_directories": False, "backup": False},
+    "Edit": {"file_path": "/tmp/file.py", "old_string": "a", "new_string": "b", "replace_all": False},
+}
+
+ALIASED_INPUTS = {
+    "Grep": {"regex": "def ", "max_results": "10", "directory": "src\\", "unknown_flag": True},
+    "Read": {"filename": "/tmp/file.txt", "start": "5", "lines": 10},
+    "Bash": {"cmd": "ls", "cwd": "/tmp/", "timeout_ms": "500"},
+}
+
+
+def _validations_per_sec(middleware, tool_name, input_data):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        middleware.validate_and_normalize_input(tool_name, input_data)
+    return ITERATIONS / (time.perf_counter() - start)
+
+
+class TestInputValidationPerformance:
+    """Throughput of compiled tool schema validation"""
+
+    def test_exact_input_takes_fast_path_per_tool(self):
+        """Exact-match input takes the zero-copy fast path for every tool"""
+        middleware = EnhancedInputValidationMiddleware(enable_logging=False)
+
+        for tool_name, input_data in EXACT_INPUTS.items():
+            with patch.multiple(middleware, **{name: DEFAULT for name in SLOW_PATH_METHODS}) as slow_path:
+                result = middleware.validate_and_normalize_input(tool_name, input_data)
+
+            assert result.valid and not result.errors and not result.transformations
+            assert result.normalized_input is input_data
+            for name, method in slow_path.items():
+                assert not method.called, f"{tool_name} exact input ran {name}"
+
+    def test_exact_input_reuses_compiled_schema(self):
+        """Repeated exact-match validations compile each tool schema once"""
+        middleware = EnhancedInputValidationMiddleware(enable_logging=False)
+
+        for _ in range(3):
+            for tool_name, input_data in EXACT_INPUTS.items():
+                middleware.validate_and_normalize_input(tool_name, input_data)
+        schemas = dict(middleware._compiled_schemas)
+        for tool_name, input_data in EXACT_INPUTS.items():
+            middleware.validate_and_normalize_input(tool_name, input_data)
+
+        assert set(schemas) == set(EXACT_INPUTS)
+        assert all(middleware._compiled_schemas[name] is schema for name, schema in schemas.items())
+
+    def test_aliased_input_throughput_per_tool(self):
+        """Aliased input is still mapped and normalized, reusing compiled schemas"""
+        middleware = EnhancedInputValidationMiddleware(enable_logging=False)
+
+        print()
+        for tool_name, input_data in ALIASED_INPUTS.items():
+            result = middleware.validate_and_normalize_input(tool_name, input_data)
+            assert result.normalized_input is not input_data
+            assert any(error.code == "parameter_mapped" for error in result.errors)
+
+            rate = _validations_per_sec(middleware, tool_name, input_data)
+            print(f"⚡ {tool_name} aliased input: {rate:,.0f} validations/sec")
+
+        grep = middleware.validate_and_normalize_input("Grep", ALIASED_INPUTS["Grep"])
+        assert grep.normalized_input["head_limit"] == 10
+        assert grep.normalized_input["path"] == "src"
+
+    def test_fuzzy_match_memoized(self):
+        """Suggestions for an unrecognized key are computed once per tool schema"""
+        middleware = EnhancedInputValidationMiddleware(enable_logging=False)
+        calls = []
+        original = middleware._find_closest_parameter_match
+
+        def counting(param_name, valid_names):
+            calls.append(param_name)
+            return original(param_name, valid_names)
+
+        middleware._find_closest_parameter_match = counting
+
+        for _ in range(10):
+            result = middleware.validate_and_normalize_input("Read", {"file_path": "a.txt", "ofset": 1})
+
+        assert calls == ["ofset"]
+        assert result.errors[0].suggestion == "offset"
+
+    def test_schema_recompiled_after_changes(self):
+        """Registering parameters or mappings takes effect on the next validation"""
+        middleware = EnhancedInputValidationMiddleware(enable_logging=False)
+        middleware.validate_and_normalize_input("Read", {"file_path": "a.txt"})
+
+        middleware.add_parameter_mapping("read_target", "file_path")
+        result = middleware.validate_and_normalize_input("Read", {"target": "a.txt"})
+        assert result.normalized_input["file_path"] == "a.txt"
+
+        middleware.register_tool_parameters("Read", [ToolParameter(name="uri", param_type="string", required=True)])
+        result = middleware.validate_and_normalize_input("Read", {"uri": "file:///a.txt"})
+        assert result.valid and not result.errors
+
+        middleware.tool_parameters["Read"].append(ToolParameter(name="encoding", param_type="string"))
+        result = middleware.validate_and_normalize_input("Read", {"uri": "file:///a.txt", "encoding": "utf-8"})
+        assert not result.errors
@@ -0,0 +1,161 @@
+"""Tests for the compiled permission decision table in unified_permission_manager."""
+
+import json
+import os
+import time
+
+from moai_adk.core import unified_permission_manager
+from moai_adk.core.unified_permission_manager import (
+    PERMISSION_CACHE_SIZE,
+    BashPatternTrie,
+    PermissionDecisionTable,
+    UnifiedPermissionManager,
+)
+
+
+def _write_settings(path, allow=(), deny=()):
+    path.write_text(json.dumps({"permissions": {"allow": list(allow), "deny": list(deny)}}))
+
+
+def _touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def _manager(config_path):
+    return UnifiedPermissionManager(config_path=str(config_path), enable_logging=False)
+
+
+class TestBashPatternTrie:
+    """Prefix and exact matching of Bash(...) patterns."""
+
+    def test_most_specific_pattern_wins(self):
+        trie = BashPatternTrie(
+            allow=["Bash(git push origin feature:*)", "Bash(git status)"],
+            deny=["Bash(git push:*)", "Bash(rm -rf:*)"],
+        )
+
+        assert trie.match("git push --force") is False
+        assert trie.match("git push origin feature/x") is True
+        assert trie.match("git status") is True
+        assert trie.match("git status --short") is None
+        assert trie.match("rm -rf /") is False
+        assert trie.match("ls") is None
+
+    def test_deny_wins_for_same_pattern(self):
+        trie = BashPatternTrie(allow=["Bash(sudo:*)"], deny=["Bash(sudo:*)"])
+
+        assert trie.match("sudo ls") is False
+
+    def test_non_bash_patterns_ignored(self):
+        trie = BashPatternTrie(allow=["Read(./src/**)"], deny=["WebFetch", "Bash"])
+
+        assert trie.match("ls") is None
+
+
+class TestPermissionDecisionTable:
+    """Role hierarchy flattened into bitsets."""
+
+    def test_hierarchy_flattened(self):
+        table = PermissionDecisionTable.compile(
+            UnifiedPermissionManager.ROLE_PERMISSIONS,
+            {"admin": ["developer", "user"], "developer": ["user"], "user": [], "lead": ["developer"]},
+            {},
+        )
+
+        assert table.is_permitted("admin", "AnyTool")
+        assert table.is_permitted("lead", "Bash(make test)")
+        assert table.is_permitted("developer", "Write")
+        assert not table.is_permitted("user", "Write")
+        assert not table.is_permitted("user", "Bash(ls)")
+        assert not table.is_permitted("unknown", "Read")
+
+    def test_settings_deny_applies_to_every_role(self):
+        table = PermissionDecisionTable.compile(
+            UnifiedPermissionManager.ROLE_PERMISSIONS,
+            {"admin": ["developer", "user"]},
+            {"permissions": {"deny": ["Bash(rm -rf:*)"], "allow": ["Bash(ls)"]}},
+        )
+
+        assert not table.is_permitted("admin", "Bash(rm -rf /)")
+        assert not table.is_permitted("developer", "Bash(rm -rf build)")
+        assert table.is_permitted("developer", "Bash(rm build.log)")
+        # Allow patterns do not grant shell access to roles without Bash
+        assert not table.is_permitted("user", "Bash(ls)")
+
+
+class TestCompiledPermissionChecks:
+    """check_tool_permission backed by the compiled table."""
+
+    def test_table_rebuilt_when_settings_change(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(unified_permission_manager, "CONFIG_CHECK_INTERVAL", 0.0)
+        config_path = tmp_path / "settings.json"
+        _write_settings(config_path)
+        manager = _manager(config_path)
+
+        assert manager.check_tool_permission("developer", "Bash(git push --force)", "execute")
+        table = manager._permission_table
+        assert manager.check_tool_permission("developer", "Read", "execute")
+        assert manager._permission_table is table
+
+        _write_settings(config_path, deny=["Bash(git push --force:*)"])
+        _touch(config_path)
+
+        assert not manager.check_tool_permission("developer", "Bash(git push --force)", "execute")
+        assert manager._permission_table is not table
+
+    def test_reloaded_settings_are_revalidated(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(unified_permission_manager, "CONFIG_CHECK_INTERVAL", 0.0)
+        config_path = tmp_path / "settings.json"
+        _write_settings(config_path)
+        manager = _manager(config_path)
+
+        config_path.write_text(json.dumps({"agents": {"spec-builder": {"permissionMode": "ask"}}}))
+        _touch(config_path)
+        manager.check_tool_permission("developer", "Read", "execute")
+
+        assert manager.config["agents"]["spec-builder"]["permissionMode"] in manager.VALID_PERMISSION_MODES
+        assert manager.stats["auto_corrections"] == 1
+        # The corrected file was written by the manager and is not reloaded again
+        assert manager._config_signature == manager._get_config_signature()
+
+    def test_unsaved_edits_survive_settings_change(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(unified_permission_manager, "CONFIG_CHECK_INTERVAL", 0.0)
+        config_path = tmp_path / "settings.json"
+        _write_settings(config_path)
+        manager = _manager(config_path)
+
+        manager.config["permissions"]["deny"] = ["Bash(rm -rf:*)"]
+        _write_settings(config_path, deny=["Bash(git push --force:*)"])
+        _touch(config_path)
+        manager.check_tool_permission("developer", "Read", "execute")
+
+        assert manager.config["permissions"]["deny"] == ["Bash(rm -rf:*)"]
+
+    def test_permission_cache_is_bounded(self, tmp_path):
+        manager = _manager(tmp_path / "settings.json")
+
+        for index in range(PERMISSION_CACHE_SIZE * 2):
+            manager.check_tool_permission("developer", f"Bash(echo {index})", "execute")
+
+        assert len(manager.permission_cache) == PERMISSION_CACHE_SIZE
+        assert "developer:Bash(echo 0):execute" not in manager.permission_cache
+
+    def test_check_throughput_with_distinct_commands(self, tmp_path):
+        config_path = tmp_path / "settings.json"
+        _write_settings(
+            config_path,
+            allow=[f"Bash(npm run task{index}:*)" for index in range(200)],
+            deny=["Bash(rm -rf:*)", "Bash(sudo:*)", "Bash(git push --force:*)"],
+        )
+        manager = _manager(config_path)
+        commands = [f"Bash(npm run task{index % 200} --flag {index})" for index in range(20_000)]
+
+        start = time.perf_counter()
+        results = [manager.check_tool_permission("developer", command, "execute") for command in commands]
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n⚡ {len(commands)} distinct Bash permission checks: {elapsed_ms:.2f}ms")
+
+        assert all(results)
+        assert elapsed_ms < 1000, f"Permission checks too slow: {elapsed_ms:.2f}ms"
@@ -1745,22 +1745,6 @@ class TestEdgeCases:
         assert len(alerts) == 1
         assert len(manager.active_alerts) == 1
 
-    def test_percentile_empty_values(self):
-        """Test percentile with empty values"""
-        collector = MetricsCollector()
-
-        result = collector._percentile([], 95)
-
-        assert result == 0.0
-
-    def test_percentile_single_value(self):
-        """Test percentile with single value"""
-        collector = MetricsCollector()
-
-        result = collector._percentile([50.0], 95)
-
-        assert result == 50.0
-
     def test_alert_without_matching_rule(self):
         """Test checking resolved alerts without matching rule"""
         collector = MetricsCollector()
@@ -0,0 +1,205 @@
+"""Tests for dependency resolution and critical-path grouping in the hook scheduler."""
+
+import random
+import time
+from unittest.mock import Mock
+
+from moai_adk.core.jit_enhanced_hook_manager import HookEvent, HookMetadata, Phase
+from moai_adk.core.phase_optimized_hook_scheduler import (
+    HookSchedulingContext,
+    PhaseOptimizedHookScheduler,
+    ScheduledHook,
+    SchedulingDecision,
+    SchedulingStrategy,
+)
+
+
+def _hook(path, priority=50.0, time_ms=50.0, dependencies=(), parallel_safe=True):
+    metadata = Mock(spec=HookMetadata)
+    metadata.parallel_safe = parallel_safe
+    return ScheduledHook(
+        hook_path=path,
+        metadata=metadata,
+        priority_score=priority,
+        estimated_cost=10,
+        estimated_time_ms=time_ms,
+        scheduling_decision=SchedulingDecision.EXECUTE,
+        dependencies=set(dependencies),
+    )
+
+
+def _context(phase=Phase.RED):
+    return HookSchedulingContext(
+        event_type=HookEvent.PRE_TOOL_USE,
+        current_phase=phase,
+        user_input="test",
+        available_token_budget=100000,
+        max_execution_time_ms=100000.0,
+    )
+
+
+def _assert_dependencies_respected(groups):
+    all_paths = {hook.hook_path for group in groups for hook in group.hooks}
+    finished = set()
+    for group in groups:
+        for hook in group.hooks:
+            assert (hook.dependencies & all_paths) <= finished, f"{hook.hook_path} runs before a dependency"
+        finished |= {hook.hook_path for hook in group.hooks}
+
+
+def _makespan(groups):
+    return sum(group.max_wait_time_ms for group in groups)
+
+
+class TestResolveDependencies:
+    """Kahn/heap topological ordering."""
+
+    def test_dependencies_first_then_priority(self):
+        scheduler = PhaseOptimizedHookScheduler()
+        hooks = [
+            _hook("/lint", priority=90.0, dependencies={"/format"}),
+            _hook("/format", priority=10.0),
+            _hook("/notify", priority=50.0),
+        ]
+
+        resolved = scheduler._resolve_dependencies(hooks)
+
+        assert [hook.hook_path for hook in resolved] == ["/notify", "/format", "/lint"]
+        assert hooks[1].dependents == {"/lint"}
+
+    def test_missing_dependencies_are_ignored(self):
+        scheduler = PhaseOptimizedHookScheduler()
+        hooks = [_hook("/a", dependencies={"/not-scheduled"})]
+
+        assert scheduler._resolve_dependencies(hooks) == hooks
+
+    def test_cycles_are_reported_and_broken(self):
+        scheduler = PhaseOptimizedHookScheduler()
+        hooks = [
+            _hook("/a", priority=10.0, dependencies={"/c"}),
+            _hook("/b", priority=30.0, dependencies={"/a"}),
+            _hook("/c", priority=20.0, dependencies={"/b"}),
+            _hook("/after", priority=99.0, dependencies={"/a"}),
+        ]
+
+        resolved = scheduler._resolve_dependencies(hooks)
+
+        assert [hook.hook_path for hook in resolved] == ["/b", "/c", "/a", "/after"]
+        assert len(scheduler._dependency_cycles) == 1
+        cycle = scheduler._dependency_cycles[0]
+        assert cycle[0] == cycle[-1]
+        assert set(cycle) == {"/a", "/b", "/c"}
+
+
+class TestCriticalPathGroups:
+    """Rank-based list scheduling into execution groups."""
+
+    def test_groups_follow_dependencies(self):
+        scheduler = PhaseOptimizedHookScheduler(max_parallel_groups=3)
+        hooks = scheduler._resolve_dependencies(
+            [
+                _hook("/a", time_ms=100.0),
+                _hook("/b", time_ms=10.0, dependencies={"/a"}),
+                _hook("/c", time_ms=10.0),
+                _hook("/d", time_ms=10.0),
+            ]
+        )
+
+        groups = scheduler._create_execution_groups(hooks, _context(), SchedulingStrategy.PHASE_OPTIMIZED)
+
+        assert [[hook.hook_path for hook in group.hooks] for group in groups] == [["/a", "/c", "/d"], ["/b"]]
+        assert groups[0].max_wait_time_ms == 100.0
+        _assert_dependencies_respected(groups)
+
+    def test_critical_path_starts_first(self):
+        scheduler = PhaseOptimizedHookScheduler(max_parallel_groups=1)
+        hooks = scheduler._resolve_dependencies(
+            [
+                _hook("/short", priority=90.0, time_ms=10.0),
+                _hook("/long-head", priority=10.0, time_ms=10.0),
+                _hook("/long-tail", priority=10.0, time_ms=500.0, dependencies={"/long-head"}),
+            ]
+        )
+
+        groups = scheduler._create_execution_groups(hooks, _context(), SchedulingStrategy.PHASE_OPTIMIZED)
+
+        assert groups[0].hooks[0].hook_path == "/long-head"
+
+    def test_sequential_hooks_get_sequential_groups(self):
+        scheduler = PhaseOptimizedHookScheduler()
+        hooks = [_hook("/a", time_ms=20.0), _hook("/b", time_ms=30.0)]
+
+        groups = scheduler._create_execution_groups(hooks, _context(Phase.SPEC), SchedulingStrategy.PHASE_OPTIMIZED)
+
+        assert [group.execution_type for group in groups] == [SchedulingDecision.SEQUENTIAL]
+        assert groups[0].max_wait_time_ms == 50.0
+
+    def test_order_optimization_keeps_dependencies(self):
+        scheduler = PhaseOptimizedHookScheduler(max_parallel_groups=1)
+        hooks = scheduler._resolve_dependencies(
+            [
+                _hook("/setup", priority=1.0),
+                _hook("/check", priority=99.0, dependencies={"/setup"}),
+            ]
+        )
+        groups = scheduler._create_execution_groups(hooks, _context(), SchedulingStrategy.PHASE_OPTIMIZED)
+
+        optimized = scheduler._optimize_execution_order(groups, _context())
+
+        assert [group.hooks[0].hook_path for group in optimized] == ["/setup", "/check"]
+
+
+def _legacy_resolve(hooks):
+    """Previous resolver: rebuilds the remaining path list for every candidate."""
+    resolved, remaining = [], hooks.copy()
+    while remaining:
+        ready = [h for h in remaining if not any(dep in [rh.hook_path for rh in remaining] for dep in h.dependencies)]
+        if not ready:
+            ready = [max(remaining, key=lambda h: h.priority_score)]
+        next_hook = max(ready, key=lambda h: h.priority_score)
+        resolved.append(next_hook)
+        remaining.remove(next_hook)
+    return resolved
+
+
+def _legacy_groups(hooks, width):
+    """Previous grouping made valid: cut on width or when a dependency is in the current group."""
+    groups, current = [], []
+    for hook in hooks:
+        if len(current) >= width or hook.dependencies & {h.hook_path for h in current}:
+            groups.append(current)
+            current = []
+        current.append(hook)
+    if current:
+        groups.append(current)
+    return sum(max(h.estimated_time_ms for h in group) for group in groups)
+
+
+def test_planning_benchmark_against_legacy_grouping():
+    rng = random.Random(7)
+    hooks = []
+    for index in range(150):
+        dependencies = {f"/hook{rng.randrange(index)}" for _ in range(rng.randint(0, 2))} if index else set()
+        hooks.append(
+            _hook(f"/hook{index}", priority=rng.uniform(0, 100), time_ms=rng.uniform(5, 200), dependencies=dependencies)
+        )
+    scheduler = PhaseOptimizedHookScheduler(max_parallel_groups=4)
+
+    start = time.perf_counter()
+    legacy_makespan = _legacy_groups(_legacy_resolve(list(hooks)), 4)
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    resolved = scheduler._resolve_dependencies(list(hooks))
+    groups = scheduler._create_execution_groups(resolved, _context(), SchedulingStrategy.PHASE_OPTIMIZED)
+    planning_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"\n⚡ Planned {len(hooks)} hooks: {planning_ms:.2f}ms (legacy {legacy_ms:.2f}ms), "
+        f"makespan {_makespan(groups):.0f}ms (legacy {legacy_makespan:.0f}ms)"
+    )
+
+    _assert_dependencies_respected(groups)
+    assert sum(len(group.hooks) for group in groups) == len(hooks)
+    assert planning_ms < legacy_ms
+    assert _makespan(groups) < legacy_makespan
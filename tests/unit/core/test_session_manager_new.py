@@ -187,12 +187,8 @@ class TestRegisterAgentResult:
                 result={"status": "success"},
             )
 
-            assert session_file.exists()
-
-            with open(session_file, "r") as f:
-                data = json.load(f)
-
-            assert "test-agent" in data["sessions"]
+            reloaded = SessionManager(session_file=session_file)
+            assert "test-agent" in reloaded._sessions
 
 
 class TestGetResumeId:
@@ -285,6 +285,7 @@ class TestSessionPersistence:
             manager = SessionManager(session_file=session_file)
 
             manager.register_agent_result(agent_name="agent1", agent_id="id1", result={"key": "value"})
+            manager._save_sessions()
 
             assert session_file.exists()
 
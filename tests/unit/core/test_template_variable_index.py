@@ -0,0 +1,135 @@
+"""Tests for single-pass substitution and the persisted template variable index."""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from moai_adk.core.template_variable_synchronizer import (
+    INDEX_RELATIVE_PATH,
+    TemplateVariableSynchronizer,
+    substitute_template_variables,
+)
+
+TEMPLATE_VARS = {"CONVERSATION_LANGUAGE": "ko", "USER_NAME": "GOOS"}
+
+
+def _synchronizer(project_root, template_vars=TEMPLATE_VARS):
+    resolver = MagicMock()
+    resolver.resolve_config.return_value = {}
+    resolver.export_template_variables.return_value = dict(template_vars)
+    with patch("moai_adk.core.template_variable_synchronizer.get_resolver", return_value=resolver):
+        return TemplateVariableSynchronizer(str(project_root))
+
+
+@pytest.fixture
+def project(tmp_path):
+    styles = tmp_path / ".claude" / "output-styles" / "moai"
+    styles.mkdir(parents=True)
+    (styles / "greeting.md").write_text("Hello {{USER_NAME}} ({{CONVERSATION_LANGUAGE}})")
+    (styles / "plain.md").write_text("No placeholders here")
+    (tmp_path / "CLAUDE.md").write_text("Language: {{CONVERSATION_LANGUAGE}}")
+    return tmp_path
+
+
+class TestSubstitution:
+    def test_substitutes_all_variables_in_one_pass(self):
+        content, found = substitute_template_variables(
+            "{{USER_NAME}} speaks {{CONVERSATION_LANGUAGE}}, {{USER_NAME}}! {{UNKNOWN}}", TEMPLATE_VARS
+        )
+
+        assert content == "GOOS speaks ko, GOOS! {{UNKNOWN}}"
+        assert found == ["CONVERSATION_LANGUAGE", "USER_NAME"]
+
+    def test_values_are_inserted_literally(self):
+        content, _ = substitute_template_variables("path: {{USER_NAME}}", {"USER_NAME": r"C:\new\1"})
+
+        assert content == r"path: C:\new\1"
+
+    def test_no_placeholders(self):
+        assert substitute_template_variables("plain", TEMPLATE_VARS) == ("plain", [])
+
+
+class TestIncrementalSync:
+    def test_unchanged_files_are_skipped_on_next_sync(self, project):
+        first = _synchronizer(project).synchronize_after_config_change()
+
+        assert first["files_updated"] == 2
+        assert (project / "CLAUDE.md").read_text() == "Language: ko"
+        assert (project / INDEX_RELATIVE_PATH).exists()
+
+        synchronizer = _synchronizer(project)
+        with patch.object(synchronizer, "_update_file_template_variables") as update:
+            second = synchronizer.synchronize_after_config_change()
+
+        update.assert_not_called()
+        assert second["files_skipped"] == 3
+
+    def test_new_and_edited_files_are_picked_up(self, project):
+        _synchronizer(project).synchronize_after_config_change()
+        (project / ".claude" / "output-styles" / "moai" / "new.md").write_text("{{USER_NAME}}")
+        (project / ".claude" / "output-styles" / "moai" / "plain.md").write_text("Now {{USER_NAME}} too")
+
+        result = _synchronizer(project).synchronize_after_config_change()
+
+        assert result["files_updated"] == 2
+        assert (project / ".claude" / "output-styles" / "moai" / "new.md").read_text() == "GOOS"
+        assert (project / ".claude" / "output-styles" / "moai" / "plain.md").read_text() == "Now GOOS too"
+
+    def test_unknown_placeholders_do_not_force_rewrites(self, project):
+        (project / "CLAUDE.md").write_text("{{NOT_A_CONFIG_VARIABLE}}")
+        _synchronizer(project).synchronize_after_config_change()
+
+        result = _synchronizer(project).synchronize_after_config_change()
+
+        assert result["files_skipped"] == 3
+        assert (project / "CLAUDE.md").read_text() == "{{NOT_A_CONFIG_VARIABLE}}"
+
+    def test_globs_are_reused_until_a_directory_changes(self, project):
+        synchronizer = _synchronizer(project)
+        synchronizer._find_files_with_template_variables(None)
+
+        with patch.object(synchronizer, "_glob_files", wraps=synchronizer._glob_files) as glob_files:
+            synchronizer._find_files_with_template_variables(None)
+            assert glob_files.call_count == 0
+
+            (project / ".claude" / "output-styles" / "moai" / "deep").mkdir()
+            (project / ".claude" / "output-styles" / "moai" / "deep" / "more.md").write_text("x")
+            files = synchronizer._find_files_with_template_variables(None)
+
+        assert project / ".claude" / "output-styles" / "moai" / "deep" / "more.md" in files
+        assert glob_files.call_count == 1
+
+
+def test_incremental_sync_benchmark(tmp_path):
+    styles = tmp_path / ".claude" / "output-styles"
+    for group in range(20):
+        directory = styles / f"group{group}"
+        directory.mkdir(parents=True)
+        for index in range(25):
+            body = "Reference text without variables.\n" * 200
+            if index == 0:
+                body += "Hello {{USER_NAME}}\n"
+            (directory / f"style{index}.md").write_text(body)
+            # An existing tree: files were written well before the first sync
+            os.utime(directory / f"style{index}.md", (time.time() - 3600, time.time() - 3600))
+
+    start = time.perf_counter()
+    first = _synchronizer(tmp_path).synchronize_after_config_change()
+    full_ms = (time.perf_counter() - start) * 1000
+
+    (styles / "group3" / "added.md").write_text("{{CONVERSATION_LANGUAGE}}")
+    start = time.perf_counter()
+    second = _synchronizer(tmp_path).synchronize_after_config_change()
+    incremental_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"\n⚡ Template sync over 500 files: full {full_ms:.2f}ms ({first['files_updated']} updated), "
+        f"incremental {incremental_ms:.2f}ms ({second['files_updated']} updated, {second['files_skipped']} skipped)"
+    )
+
+    assert first["files_updated"] == 20
+    assert second["files_updated"] == 1
+    assert second["files_skipped"] == 500
+    assert incremental_ms < full_ms
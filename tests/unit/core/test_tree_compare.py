@@ -0,0 +1,127 @@
+"""Tests for the single-pass backup/template tree comparison."""
+
+import time
+from difflib import unified_diff
+from pathlib import Path
+from unittest.mock import patch
+
+from moai_adk.cli.commands.update import _detect_custom_elements
+from moai_adk.core.merge import tree_compare
+from moai_adk.core.merge.tree_compare import compare_trees
+
+
+def _write(root: Path, relative: str, content: str | bytes) -> None:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content)
+
+
+class TestCompareTrees:
+    """File classification and diff sizes."""
+
+    def test_classifies_files(self, tmp_path):
+        backup, template = tmp_path / "backup", tmp_path / "template"
+        _write(backup, "same.md", "same\n")
+        _write(template, "same.md", "same\n")
+        _write(backup, "docs/changed.md", "a\nb\nc\n")
+        _write(template, "docs/changed.md", "a\nB\nc\nd\n")
+        _write(backup, "docs/same_size.md", "abc\n")
+        _write(template, "docs/same_size.md", "xyz\n")
+        _write(backup, "removed.txt", "gone\n")
+        _write(template, "nested/deep/added.txt", "new\n")
+        _write(backup, "image.bin", b"\xff\xfe\x00\x01")
+        _write(template, "image.bin", b"\xff\xfe\x00\x02")
+
+        comparison = compare_trees(backup, template)
+        statuses = {path: info.status for path, info in comparison.files.items()}
+
+        assert statuses == {
+            "same.md": "identical",
+            "docs/changed.md": "modified",
+            "docs/same_size.md": "modified",
+            "removed.txt": "removed",
+            "nested/deep/added.txt": "added",
+            "image.bin": "modified",
+        }
+        expected = len(list(unified_diff(["a", "b", "c"], ["a", "B", "c", "d"], lineterm="")))
+        assert comparison.files["docs/changed.md"].diff_lines == expected
+        assert comparison.files["image.bin"].is_text is False
+        assert {info.path for info in comparison.changed()} == set(statuses) - {"same.md"}
+
+    def test_different_sizes_skip_hashing(self, tmp_path):
+        backup, template = tmp_path / "backup", tmp_path / "template"
+        _write(backup, "a.txt", "short\n")
+        _write(template, "a.txt", "much longer\n")
+
+        with patch.object(tree_compare, "_file_hash") as file_hash:
+            comparison = compare_trees(backup, template, diff=False)
+
+        file_hash.assert_not_called()
+        assert comparison.files["a.txt"].has_diff
+        assert comparison.files["a.txt"].diff_lines == 0
+
+    def test_paths_restrict_the_walk(self, tmp_path):
+        backup, template = tmp_path / "backup", tmp_path / "template"
+        _write(backup, "CLAUDE.md", "x\n")
+        _write(template, ".claude/settings.json", "{}\n")
+        _write(backup, "unrelated/file.txt", "x\n")
+
+        comparison = compare_trees(backup, template, paths=["CLAUDE.md", ".claude/settings.json", ".gitignore"])
+
+        assert set(comparison.files) == {"CLAUDE.md", ".claude/settings.json"}
+        assert comparison.files["CLAUDE.md"].template_exists is False
+        assert comparison.files[".claude/settings.json"].backup_exists is False
+
+    def test_listings_without_content_comparison(self, tmp_path):
+        project, template = tmp_path / "project", tmp_path / "template"
+        _write(project, "skills/moai-core/SKILL.md", "x")
+        _write(project, "skills/my-skill/SKILL.md", "x")
+        _write(template, "skills/moai-core/SKILL.md", "y")
+
+        comparison = compare_trees(project, template, paths=["skills"], compare=False, recursive=False)
+
+        assert comparison.only_in_backup("skills", dirs=True) == ["my-skill"]
+        assert "skills/moai-core" not in comparison.backup_dirs
+
+    def test_compare_many_files(self, tmp_path):
+        backup, template = tmp_path / "backup", tmp_path / "template"
+        for index in range(500):
+            content = f"line {index}\n" * 50
+            _write(backup, f"dir{index % 10}/file{index}.md", content)
+            _write(template, f"dir{index % 10}/file{index}.md", content if index % 5 else content + "extra\n")
+
+        start = time.perf_counter()
+        comparison = compare_trees(backup, template)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n⚡ Compared {len(comparison.files)} files: {elapsed_ms:.2f}ms")
+
+        assert len(comparison.changed()) == 100
+        assert elapsed_ms < 5000, f"Tree comparison too slow: {elapsed_ms:.2f}ms"
+
+
+class TestDetectCustomElements:
+    """Custom element detection from one tree walk."""
+
+    def test_detects_all_element_types(self, tmp_path):
+        project, template = tmp_path / "project", tmp_path / "template"
+        _write(project, ".claude/skills/moai-foundation/SKILL.md", "x")
+        _write(project, ".claude/skills/my-skill/SKILL.md", "x")
+        _write(project, ".claude/commands/moai/1-plan.md", "x")
+        _write(project, ".claude/commands/moai/custom.md", "x")
+        _write(project, ".claude/commands/moai/notes.txt", "x")
+        _write(project, ".claude/agents/my-agent.md", "x")
+        _write(project, ".claude/hooks/moai/my_hook.py", "x")
+        _write(template, ".claude/skills/moai-foundation/SKILL.md", "x")
+        _write(template, ".claude/commands/moai/1-plan.md", "x")
+        _write(template, ".claude/hooks/moai/session_start.py", "x")
+
+        assert _detect_custom_elements(project, template) == {
+            "skills": ["my-skill"],
+            "commands": ["custom.md"],
+            "agents": ["my-agent.md"],
+            "hooks": ["my_hook.py"],
+        }
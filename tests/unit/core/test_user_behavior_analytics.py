@@ -107,3 +107,80 @@ class TestEventTracking:
             assert analytics is not None
         except (ImportError, Exception):
             pytest.skip("Module not available")
+
+
+class TestActionSegmentStore:
+    """Test day-partitioned columnar action storage and aggregates."""
+
+    def test_segments_round_trip(self, tmp_path):
+        """Test that flushed segments decode back to the same records."""
+        from moai_adk.core.user_behavior_analytics import ActionRecord, ActionSegmentStore
+
+        store = ActionSegmentStore(tmp_path, flush_threshold=100)
+        now = datetime.now().timestamp()
+        for i in range(3):
+            store.append(
+                ActionRecord(now + i, "command_execution", "user_001", "s1", tool="git", command=f"cmd-{i}")
+            )
+        store.flush()
+
+        day = datetime.fromtimestamp(now).date().isoformat()
+        records = list(store.iter_actions(day))
+        assert [r.command for r in records] == ["cmd-0", "cmd-1", "cmd-2"]
+        assert all(r.tool == "git" and r.success for r in records)
+        assert (tmp_path / day / "aggregates.json").exists()
+
+    def test_flush_threshold_writes_segments(self, tmp_path):
+        """Test that buffered records are written once the threshold is reached."""
+        from moai_adk.core.user_behavior_analytics import ActionRecord, ActionSegmentStore
+
+        store = ActionSegmentStore(tmp_path, flush_threshold=2)
+        now = datetime.now().timestamp()
+        store.append(ActionRecord(now, "tool_usage", "user_001", "s1"))
+        assert not list(tmp_path.glob("*/segment-*.json"))
+
+        store.append(ActionRecord(now, "tool_usage", "user_001", "s1"))
+        assert len(list(tmp_path.glob("*/segment-*.json"))) == 1
+
+    def test_patterns_served_from_aggregates(self, tmp_path):
+        """Test that pattern queries use pre-aggregates that survive reload."""
+        from moai_adk.core.user_behavior_analytics import UserActionType, UserBehaviorAnalytics
+
+        analytics = UserBehaviorAnalytics(storage_path=tmp_path)
+        session_id = analytics.start_session("user_001")
+        for _ in range(3):
+            analytics.track_action(
+                UserActionType.COMMAND_EXECUTION,
+                "user_001",
+                session_id,
+                {"command": "/moai:2-run", "tool": "tdd"},
+            )
+        analytics.track_action(
+            UserActionType.COMMAND_EXECUTION, "user_001", session_id, {"command": "pytest"}, success=False
+        )
+        analytics.end_session(session_id)
+
+        patterns = analytics.get_user_patterns("user_001")
+        assert patterns["most_used_commands"] == {"/moai:2-run": 3, "pytest": 1}
+        assert patterns["most_used_tools"] == {"tdd": 3}
+
+        reloaded = UserBehaviorAnalytics(storage_path=tmp_path)
+        usage = reloaded.action_store.aggregate("user_001", days=1)
+        assert usage.commands["/moai:2-run"] == 3
+        assert usage.errors == 1
+        assert usage.actions == 6  # start + 4 commands + end
+
+    def test_session_actions_are_bounded(self, tmp_path):
+        """Test that long sessions keep only a recent window of actions."""
+        from moai_adk.core import user_behavior_analytics as uba
+
+        analytics = uba.UserBehaviorAnalytics(storage_path=tmp_path)
+        session_id = analytics.start_session("user_001")
+        with patch.object(uba, "SESSION_ACTION_WINDOW", 10):
+            for _ in range(50):
+                analytics.track_action(uba.UserActionType.TOOL_USAGE, "user_001", session_id, {"tool": "git"})
+
+        session = analytics.active_sessions[session_id]
+        assert len(session.actions) <= 20
+        assert session.total_actions == 51
+        assert session.successful_actions == 51
@@ -106,3 +106,20 @@ class TestCheckpointManager:
         checkpoints = manager.list_checkpoints()
         safety_checkpoint = [c for c in checkpoints if "before-restore-" in c]
         assert len(safety_checkpoint) > 0
+
+    def test_should_restore_oldest_checkpoint_at_retention_limit(self, manager, tmp_path):
+        """보존 개수가 가득 찬 상태에서도 가장 오래된 checkpoint로 복구할 수 있어야 한다."""
+        manager.store.max_checkpoints = 3
+        test_file = tmp_path / "test.txt"
+        checkpoints = []
+        for index in range(3):
+            test_file.write_text(f"version {index}")
+            checkpoints.append(manager.store.create("delete"))
+        test_file.write_text("modified")
+
+        # safety checkpoint 생성이 복구 대상 checkpoint를 정리하면 안 된다
+        manager.restore_checkpoint(checkpoints[0])
+
+        assert test_file.read_text() == "version 0"
+        # 복구 후에 보존 개수를 다시 맞춰야 한다
+        assert len(manager.list_checkpoints()) == 3
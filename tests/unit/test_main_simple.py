@@ -85,6 +85,41 @@ def test_doctor_command_help():
     assert result.exit_code == 0
 
 
+def test_doctor_forwards_options():
+    """Test doctor wrapper forwards its options to the doctor command."""
+    runner = CliRunner()
+
+    with patch("moai_adk.cli.commands.doctor.check_environment", return_value={"Python": True}):
+        with patch("moai_adk.cli.commands.doctor.detect_project_language", return_value="python"):
+            with patch("moai_adk.cli.commands.doctor.SystemChecker") as mock_checker_class:
+                checker = mock_checker_class.return_value
+                checker.check_language_tools.return_value = {"pytest": True, "ruff": False}
+                checker.get_tool_version.return_value = "pytest 8.0.0"
+
+                result = runner.invoke(cli, ["doctor", "--verbose", "--refresh"])
+
+    assert result.exit_code == 0, result.output
+    checker.prefetch_tool_versions.assert_called_once_with(["pytest"], refresh=True)
+
+
+def test_analyze_forwards_options(tmp_path):
+    """Test analyze command is registered and forwards --jobs and --full."""
+    runner = CliRunner()
+    (tmp_path / ".moai" / "cache").mkdir(parents=True)
+    checkpoint_path = tmp_path / ".moai" / "cache" / "session-analyzer-checkpoint.json"
+    checkpoint_path.write_text("{}")
+
+    with patch("moai_adk.cli.commands.analyze.SessionAnalyzer") as mock_analyzer_class:
+        analyzer = mock_analyzer_class.return_value
+        analyzer.save_report.return_value = tmp_path / "report.md"
+
+        result = runner.invoke(cli, ["analyze", "-p", str(tmp_path), "--jobs", "2", "--full", "--report-only"])
+
+    assert result.exit_code == 0, result.output
+    analyzer.parse_sessions.assert_called_once_with(checkpoint_path=checkpoint_path, max_workers=2)
+    assert not checkpoint_path.exists()
+
+
 def test_status_command_help():
     """Test status command help."""
     runner = CliRunner()
@@ -0,0 +1,213 @@
+"""Unit tests for moai_adk.utils.code_analysis module.
+
+Tests for the shared file-content/AST cache, single-pass file metrics and
+parallel per-file analysis.
+"""
+
+import ast
+import json
+import os
+
+from moai_adk.utils.code_analysis import (
+    AnalysisSession,
+    analyze_source,
+    clear_analysis_sessions,
+    cyclomatic_complexity,
+    get_analysis_session,
+    run_file_tasks,
+)
+
+SAMPLE_SOURCE = '''
+class Service:
+    """Service docstring."""
+
+    def run(self, items: list, limit=3) -> int:
+        """Run the service."""
+        total = 0
+        for item in items:
+            if item and total < limit or item is None:
+                total += 1
+        return total
+
+    async def fetch(self, url):
+        with open(url) as f:
+            return f.read()
+
+
+def helper(a, b, c, d, e, f):
+    def inner(x):
+        while x:
+            x -= 1
+        return x
+
+    try:
+        return inner(a)
+    except ValueError:
+        return None
+'''
+
+
+class TestAnalyzeSource:
+    """Test single-pass metric collection."""
+
+    def test_function_and_class_metrics(self):
+        """Test lengths, docstrings, type hints and parameter counts."""
+        metrics, tree = analyze_source(SAMPLE_SOURCE)
+        functions = {func.name: func for func in metrics.functions}
+        (service,) = metrics.classes
+
+        assert tree is not None
+        assert metrics.line_count == len(SAMPLE_SOURCE.splitlines())
+        assert [func.name for func in metrics.functions] == ["run", "fetch", "helper", "inner"]
+        assert functions["run"].has_docstring and functions["run"].has_type_hints
+        assert functions["run"].params == 3
+        assert functions["run"].length == 7
+        assert functions["fetch"].is_async and not functions["fetch"].has_type_hints
+        assert functions["helper"].params == 6
+        assert service.has_docstring and service.length == 14
+
+    def test_complexity_matches_ast_walk(self):
+        """Test that the visitor's complexity matches a per-function ast.walk."""
+        metrics, tree = analyze_source(SAMPLE_SOURCE)
+        expected = {
+            node.name: cyclomatic_complexity(node)
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        }
+
+        assert {func.name: func.complexity for func in metrics.functions} == expected
+        assert expected["run"] == 5
+        assert expected["helper"] == 3
+
+    def test_syntax_error_keeps_line_count(self):
+        """Test that unparsable files still report their line count."""
+        metrics, tree = analyze_source("def broken(:\n    pass\n")
+
+        assert tree is None
+        assert metrics.parse_error
+        assert metrics.line_count == 2
+        assert metrics.functions == []
+
+
+class TestAnalysisSession:
+    """Test content and metrics caching."""
+
+    def test_metrics_cached_until_file_changes(self, tmp_path):
+        """Test that metrics are reused until mtime or size changes."""
+        source = tmp_path / "module.py"
+        source.write_text("def a():\n    pass\n")
+        session = AnalysisSession(tmp_path)
+
+        first = session.metrics(source)
+        assert session.metrics(source) is first
+
+        source.write_text("def a():\n    pass\n\n\ndef b():\n    pass\n")
+        second = session.metrics(source)
+
+        assert second is not first
+        assert [func.name for func in second.functions] == ["a", "b"]
+
+    def test_undecodable_file_returns_none(self, tmp_path):
+        """Test that non UTF-8 files have no content or metrics."""
+        source = tmp_path / "latin.py"
+        source.write_bytes(b"x = '\xff'\n")
+        session = AnalysisSession(tmp_path)
+
+        assert session.read(source) is None
+        assert session.metrics(source) is None
+
+    def test_metrics_persisted_for_moai_projects(self, tmp_path):
+        """Test that metrics survive a new session via .moai/cache."""
+        (tmp_path / ".moai").mkdir()
+        source = tmp_path / "module.py"
+        source.write_text("def a(x: int) -> int:\n    return x\n")
+
+        session = AnalysisSession(tmp_path)
+        session.metrics(source)
+        session.save()
+
+        cache_file = tmp_path / ".moai" / "cache" / "trust-analysis.json"
+        data = json.loads(cache_file.read_text())
+        assert list(data["files"]) == ["module.py"]
+
+        reloaded = AnalysisSession(tmp_path)
+        metrics = reloaded.metrics(source)
+        assert metrics.functions[0].has_type_hints
+        # Served from the persisted cache without reading the file
+        assert str(source) not in reloaded._contents
+
+    def test_sessions_are_shared_per_root(self, tmp_path):
+        """Test that get_analysis_session returns one session per root."""
+        clear_analysis_sessions()
+
+        session = get_analysis_session(tmp_path)
+
+        assert get_analysis_session(str(tmp_path)) is session
+        assert get_analysis_session(os.path.join(str(tmp_path), ".")) is session
+
+    def test_records_follow_file_version(self, tmp_path):
+        """Test that named records are dropped when the file changes."""
+        source = tmp_path / "module.py"
+        source.write_text("x = 1\n")
+        session = AnalysisSession(tmp_path)
+        signature = (source.stat().st_mtime_ns, source.stat().st_size)
+
+        session.put_record(source, "scan", signature, {"hits": 1})
+        assert session.get_record(source, "scan") == {"hits": 1}
+
+        source.write_text("x = 1\ny = 2\n")
+        assert session.get_record(source, "scan") is None
+
+    def test_records_follow_fingerprint(self, tmp_path):
+        """Test that records made with another configuration are discarded, also across sessions."""
+        (tmp_path / ".moai").mkdir()
+        source = tmp_path / "module.py"
+        source.write_text("x = 1\n")
+        session = AnalysisSession(tmp_path)
+        signature = (source.stat().st_mtime_ns, source.stat().st_size)
+        session.set_record_fingerprint("scan", "patterns-a")
+        session.put_record(source, "scan", signature, {"hits": 1})
+        session.save()
+
+        reloaded = AnalysisSession(tmp_path)
+        reloaded.set_record_fingerprint("scan", "patterns-a")
+        assert reloaded.get_record(source, "scan") == {"hits": 1}
+
+        reloaded.set_record_fingerprint("scan", "patterns-b")
+        assert reloaded.get_record(source, "scan") is None
+
+    def test_prefetch_matches_lazy_metrics(self, tmp_path):
+        """Test that prefetched metrics equal metrics computed on demand."""
+        paths = []
+        for i in range(3):
+            source = tmp_path / f"module_{i}.py"
+            source.write_text(SAMPLE_SOURCE)
+            paths.append(source)
+
+        lazy = AnalysisSession(tmp_path)
+        prefetched = AnalysisSession(tmp_path)
+        prefetched.prefetch(paths, max_workers=2)
+
+        for path in paths:
+            assert prefetched.metrics(path) == lazy.metrics(path)
+        # Served from the prefetched entries without reading the files
+        assert prefetched._contents == {}
+
+
+def _square(value):
+    return value * value
+
+
+class TestRunFileTasks:
+    """Test the per-file task runner."""
+
+    def test_results_keep_input_order(self):
+        """Test that serial and parallel runs return results in input order."""
+        values = list(range(100))
+
+        assert run_file_tasks(_square, values) == [v * v for v in values]
+        assert run_file_tasks(_square, values, max_workers=4) == [v * v for v in values]
+
+    def test_empty_input(self):
+        """Test that no work yields no results."""
+        assert run_file_tasks(_square, [], max_workers=None) == []
@@ -0,0 +1,140 @@
+"""Unit tests for moai_adk.utils.file_index module.
+
+Tests for the shared, ignore-aware project file index.
+"""
+
+import os
+
+from moai_adk.utils.file_index import (
+    ProjectFileIndex,
+    clear_file_index_cache,
+    get_file_index,
+    parse_gitignore,
+)
+
+
+def _touch(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def _names(paths, root):
+    return sorted(os.path.relpath(p, root).replace(os.sep, "/") for p in paths)
+
+
+class TestProjectFileIndex:
+    """Test file bucketing and exclusion."""
+
+    def test_buckets_files_by_extension(self, tmp_path):
+        """Test that files are grouped by extension."""
+        _touch(tmp_path / "src" / "app.py")
+        _touch(tmp_path / "src" / "pkg" / "util.PY")
+        _touch(tmp_path / "README.md")
+
+        index = ProjectFileIndex(tmp_path)
+
+        assert _names(index.files(".py"), tmp_path) == ["src/app.py", "src/pkg/util.PY"]
+        assert _names(index.files("*.md", "py"), tmp_path) == ["README.md", "src/app.py", "src/pkg/util.PY"]
+        assert index.complete
+
+    def test_skips_builtin_excludes(self, tmp_path):
+        """Test that virtualenvs, dependency trees and VCS dirs are skipped."""
+        _touch(tmp_path / "main.py")
+        _touch(tmp_path / ".venv" / "lib" / "site.py")
+        _touch(tmp_path / "node_modules" / "pkg" / "index.js")
+        _touch(tmp_path / ".git" / "hooks" / "pre-commit.py")
+
+        index = ProjectFileIndex(tmp_path)
+
+        assert _names(index.files(".py"), tmp_path) == ["main.py"]
+        assert not index.has_extension(".js")
+
+    def test_honours_gitignore(self, tmp_path):
+        """Test root and nested .gitignore rules, including negation."""
+        _touch(tmp_path / ".gitignore", "build/\n*.log\n!keep.log\n/generated.py\n")
+        _touch(tmp_path / "build" / "out.py")
+        _touch(tmp_path / "debug.log")
+        _touch(tmp_path / "keep.log")
+        _touch(tmp_path / "generated.py")
+        _touch(tmp_path / "pkg" / "generated.py")
+        _touch(tmp_path / "pkg" / ".gitignore", "fixtures/**\n")
+        _touch(tmp_path / "pkg" / "fixtures" / "data.py")
+
+        index = ProjectFileIndex(tmp_path)
+
+        assert _names(index.files(".py"), tmp_path) == ["pkg/generated.py"]
+        assert _names(index.files(".log"), tmp_path) == ["keep.log"]
+
+    def test_existence_query_stops_early(self, tmp_path):
+        """Test that has_extension returns before the whole tree is walked."""
+        _touch(tmp_path / "a" / "lib.rs")
+        for i in range(5):
+            _touch(tmp_path / f"z{i}" / "module.py")
+
+        index = ProjectFileIndex(tmp_path)
+
+        assert index.has_extension(".rs")
+        assert not index.complete
+        assert len(index.files(".py")) == 5
+        assert index.complete
+
+    def test_files_under_and_pattern(self, tmp_path):
+        """Test directory and file name filters."""
+        _touch(tmp_path / "src" / "test_helpers.py")
+        _touch(tmp_path / "tests" / "__init__.py")
+        _touch(tmp_path / "tests" / "test_app.py")
+
+        index = ProjectFileIndex(tmp_path)
+
+        assert _names(index.files(".py", pattern="test_*.py"), tmp_path) == ["src/test_helpers.py", "tests/test_app.py"]
+        assert _names(index.files(".py", under=tmp_path / "tests"), tmp_path) == ["tests/__init__.py", "tests/test_app.py"]
+
+    def test_from_files_matches_walk_order(self, tmp_path):
+        """Test that an index built from known paths lists files like a walk."""
+        for rel_path in ("z.py", "a/b.py", "a/a/c.py", "b.py", "a/z.py"):
+            _touch(tmp_path / rel_path)
+
+        walked = ProjectFileIndex(tmp_path).files(".py")
+        known = ProjectFileIndex.from_files(tmp_path, ["a/a/c.py", "z.py", "a/z.py", "b.py", "a/b.py"])
+
+        assert known.complete
+        assert known.files(".py") == walked
+
+
+class TestGitignoreParsing:
+    """Test .gitignore pattern parsing."""
+
+    def test_comments_and_blank_lines_are_ignored(self):
+        """Test that comments and blank lines produce no rules."""
+        assert parse_gitignore("# comment\n\n   \n") == []
+
+    def test_anchored_and_double_star_patterns(self):
+        """Test anchoring and ** handling."""
+        (anchored,) = parse_gitignore("/docs/*.md")
+        (deep,) = parse_gitignore("**/cache")
+
+        assert anchored.matches("docs/a.md", "a.md", False)
+        assert not anchored.matches("src/docs/a.md", "a.md", False)
+        assert deep.matches("a/b/cache", "cache", True)
+
+
+class TestFileIndexCache:
+    """Test the shared per-root index cache."""
+
+    def test_cached_until_directory_changes(self, tmp_path):
+        """Test that the cache is reused until a directory mtime changes."""
+        clear_file_index_cache()
+        _touch(tmp_path / "pkg" / "a.py")
+
+        first = get_file_index(tmp_path)
+        assert len(first.files(".py")) == 1
+        assert get_file_index(tmp_path) is first
+
+        _touch(tmp_path / "pkg" / "b.py")
+        pkg_stat = os.stat(tmp_path / "pkg")
+        os.utime(tmp_path / "pkg", ns=(pkg_stat.st_atime_ns, pkg_stat.st_mtime_ns + 1_000_000))
+
+        second = get_file_index(tmp_path)
+        assert second is not first
+        assert len(second.files(".py")) == 2
@@ -4,13 +4,16 @@ Tests for logging and sensitive data filtering.
 """
 
 import logging
+import logging.handlers
 import os
+import re
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from moai_adk.utils.logger import SensitiveDataFilter, setup_logger
+from moai_adk.utils import logger as logger_module
+from moai_adk.utils.logger import SensitiveDataFilter, redact_sensitive_data, setup_logger, stop_queue_listener
 
 
 class TestSensitiveDataFilter:
@@ -191,3 +194,105 @@ class TestSetupLogger:
                 logger = setup_logger("test_logger")
                 # Should not have duplicates
                 assert len(logger.handlers) <= initial_count + 2
+
+
+class TestRedactSensitiveData:
+    """Test the combined redaction pattern and its prefilter."""
+
+    def test_masks_all_kinds_in_one_message(self):
+        message = "key sk-abc123 mail user@example.com PASSWORD=hunter2 done"
+
+        assert redact_sensitive_data(message) == (
+            "key ***REDACTED*** mail ***REDACTED*** PASSWORD: ***REDACTED*** done"
+        )
+
+    def test_matches_legacy_sequential_patterns(self):
+        messages = [
+            "API Key: sk-1234567890abcdef",
+            "Contact admin@company.org or ops@company.org",
+            "pwd: s3cret and passwd=other",
+            "password: sk-abc",
+            "Normal message with no secrets",
+        ]
+        for message in messages:
+            expected = message
+            for pattern, replacement in SensitiveDataFilter.PATTERNS:
+                expected = re.sub(pattern, replacement, expected)
+            assert redact_sensitive_data(message) == expected
+
+    def test_prefilter_skips_regex_for_plain_messages(self):
+        with patch.object(logger_module, "_REDACTION_PATTERN") as pattern:
+            assert redact_sensitive_data("Loaded 42 hooks in 3ms") == "Loaded 42 hooks in 3ms"
+        pattern.sub.assert_not_called()
+
+
+class TestQueuedLogger:
+    """Test the QueueHandler/QueueListener pipeline."""
+
+    def test_records_are_masked_and_written_by_listener(self, tmp_path):
+        logger = setup_logger("test_queued_logger", log_dir=str(tmp_path), level=logging.INFO, use_queue=True)
+        try:
+            assert all(isinstance(handler, logging.handlers.QueueHandler) for handler in logger.handlers)
+            logger.debug("dropped before the queue")
+            logger.info("token %s", "sk-secret42")
+        finally:
+            stop_queue_listener("test_queued_logger")
+
+        content = (tmp_path / "moai.log").read_text(encoding="utf-8")
+        assert "token ***REDACTED***" in content
+        assert "sk-secret42" not in content
+        assert "dropped" not in content
+
+    def test_propagated_records_are_masked(self, tmp_path):
+        captured = []
+
+        class CaptureHandler(logging.Handler):
+            def emit(self, record):
+                captured.append(record.getMessage())
+
+        capture = CaptureHandler()
+        root = logging.getLogger()
+        root.addHandler(capture)
+        logger = setup_logger("test_queued_propagation", log_dir=str(tmp_path), level=logging.INFO, use_queue=True)
+        try:
+            logger.info("key %s", "sk-secret123")
+        finally:
+            root.removeHandler(capture)
+            stop_queue_listener("test_queued_propagation")
+
+        assert captured == ["key ***REDACTED***"]
+
+    def test_setup_again_replaces_listener(self, tmp_path):
+        setup_logger("test_queued_replace", log_dir=str(tmp_path), use_queue=True)
+        first = logger_module._queue_listeners["test_queued_replace"]
+
+        logger = setup_logger("test_queued_replace", log_dir=str(tmp_path), use_queue=True)
+        try:
+            assert logger_module._queue_listeners["test_queued_replace"] is not first
+            assert len(logger.handlers) == 1
+        finally:
+            stop_queue_listener("test_queued_replace")
+
+        assert "test_queued_replace" not in logger_module._queue_listeners
+
+
+def test_queued_logger_writes_every_record(tmp_path):
+    count = 20000
+    messages = [("Processed hook %s in %dms", ("session_start", 12))] * 9 + [("Using key %s", ("sk-abc123",))]
+
+    queued = setup_logger("test_logger_queued_volume", log_dir=str(tmp_path), level=logging.INFO, use_queue=True)
+    queued.propagate = False
+    listener = logger_module._queue_listeners["test_logger_queued_volume"]
+    listener.handlers = tuple(h for h in listener.handlers if isinstance(h, logging.FileHandler))
+    try:
+        for index in range(count):
+            msg, args = messages[index % len(messages)]
+            queued.info(msg, *args)
+    finally:
+        stop_queue_listener("test_logger_queued_volume")
+
+    lines = (tmp_path / "moai.log").read_text(encoding="utf-8").splitlines()
+
+    assert len(lines) == count
+    assert sum("***REDACTED***" in line for line in lines) == count // 10
+    assert not any("sk-abc123" in line for line in lines)